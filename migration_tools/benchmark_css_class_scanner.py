@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+CSS Class Scanner Benchmark
+
+Generates a synthetic TSX corpus and measures CSSScanner throughput (MB/s)
+against the legacy scan, which ran every raw pattern through re.finditer on
+each line. The legacy scan is reproduced here as the baseline.
+
+Usage:
+    python benchmark_css_class_scanner.py [--files N] [--lines N] [--seed N]
+"""
+
+import argparse
+import random
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+from css_class_scanner import CSSScanner
+
+WORDS = ['panel', 'header', 'toolbar', 'btn', 'btn-primary', 'active', 'grid', 'row', 'col',
+         'flex', 'items-center', 'gap-2', 'text-sm', 'hidden', 'selected', 'card', 'title']
+
+
+def generate_tsx(rng: random.Random, lines: int) -> str:
+    """A component file with the constructs the scanner looks for, plus plain code."""
+    out = ["import React from 'react';", "import styles from './Panel.module.css';", ""]
+    for i in range(lines):
+        a, b, c = rng.sample(WORDS, 3)
+        kind = rng.randrange(10)
+        if kind == 0:
+            out.append(f'      <div className="{a} {b} {c}">')
+        elif kind == 1:
+            out.append(f"      <span className={{'{a}'}} data-role=\"{b}\">")
+        elif kind == 2:
+            out.append(f"    el.classList.toggle('{a}', isOpen);")
+        elif kind == 3:
+            out.append(f"    const node = root.querySelector('.{a}');")
+        elif kind == 4:
+            out.append(f"    const cls = `{a} ${{active ? '{b}' : ''}}`;")
+        elif kind == 5:
+            out.append(f"      <section className={{styles.{a}}}>")
+        elif kind == 6:
+            # Long line with a lone backtick (e.g. inside a comment)
+            out.append("    // press ` then " + " ".join(rng.choice(WORDS) for _ in range(40)))
+        else:
+            out.append(f"    const value{i} = compute({a.replace('-', '_')}, {i});")
+    return "\n".join(out) + "\n"
+
+
+def legacy_scan(content: str) -> List[Tuple[int, str, str]]:
+    """Baseline: every raw pattern, re-searched on every line."""
+    scanner = CSSScanner()
+    found = []
+    for line_num, line in enumerate(content.splitlines(keepends=True), 1):
+        for pattern, usage_type in CSSScanner.PATTERNS:
+            for match in re.finditer(pattern, line):
+                if usage_type == 'classList-method':
+                    names = [match.group(2)]
+                elif usage_type in CSSScanner.MULTI_CLASS_TYPES:
+                    names = match.group(1).split()
+                else:
+                    names = [match.group(1)]
+                found.extend((line_num, name, usage_type) for name in names
+                             if scanner._is_valid_class_name(name))
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CSSScanner on a generated TSX corpus")
+    parser.add_argument('--files', type=int, default=200, help="Number of .tsx files (default: 200)")
+    parser.add_argument('--lines', type=int, default=400, help="Lines per file (default: 400)")
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for i in range(args.files):
+            (root / f"Component{i}.tsx").write_text(generate_tsx(rng, args.lines), encoding='utf-8')
+        files = sorted(root.glob('*.tsx'))
+        contents = [f.read_text(encoding='utf-8') for f in files]
+        megabytes = sum(len(c.encode('utf-8')) for c in contents) / 1e6
+
+        start = time.perf_counter()
+        before = [legacy_scan(c) for c in contents]
+        legacy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        scanner = CSSScanner()
+        after = [css_class for f in files for css_class in scanner.scan_file(f)]
+        new_time = time.perf_counter() - start
+
+    # The legacy scan also ran the CSS definition rule on TSX; compare like for like
+    expected = [(n, name, t) for result in before for n, name, t in result if t != 'css-definition']
+    actual = [(c.line_number, c.class_name, c.usage_type) for c in after]
+
+    print(f"Corpus: {len(contents)} files, {megabytes:.2f} MB")
+    print(f"  legacy (per-line, 11 patterns): {legacy_time:.2f}s  {megabytes / legacy_time:.2f} MB/s")
+    print(f"  compiled rules (whole file):    {new_time:.2f}s  {megabytes / new_time:.2f} MB/s")
+    print(f"  speedup: {legacy_time / new_time:.1f}x")
+    print(f"  identical results: {expected == actual} ({len(actual)} classes)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Incremental Gap Analysis Benchmark
+
+Generates a synthetic plugin (web TSX + CSS, desktop AXAML + code-behind) and
+times GapAnalyzer.analyze_plugin without a cache, with a cold cache, with a warm
+cache, and after editing one web component. Every cached run is checked against
+an uncached analysis of the same tree.
+
+Usage:
+    python benchmark_incremental_gap_analysis.py [--components N] [--seed N]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+from gap_analysis_system.analyzer import GapAnalyzer
+from gap_analysis_system.analysis_cache import AnalysisCache
+
+PLUGIN = 'bench-plugin'
+JSX_TAGS = ['div', 'button', 'span', 'p', 'h2', 'h3', 'ul', 'li', 'input', 'select', 'img', 'label', 'form', 'a']
+AXAML_TAGS = ['Border', 'StackPanel', 'Grid', 'TextBlock', 'Button', 'TextBox', 'ComboBox', 'Image', 'ItemsControl']
+WORDS = ['plugin', 'library', 'canvas', 'component', 'preview', 'search', 'filter', 'export', 'import', 'settings',
+         'title', 'details', 'status', 'loading', 'empty', 'error', 'retry', 'save', 'cancel', 'close']
+
+
+def text(rng: random.Random, words: int) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def write_web_component(path: Path, rng: random.Random, name: str):
+    body = []
+    for i in range(rng.randint(20, 60)):
+        tag = rng.choice(JSX_TAGS)
+        body.append(f'      <{tag} className="{name.lower()}-{rng.choice(WORDS)} grid-{i % 3}" '
+                    f'onClick={{() => handle{i}()}}>{text(rng, 3)}</{tag}>')
+    hooks = '\n'.join(f'  const [{w}{i}, set{w}{i}] = useState(null);' for i, w in enumerate(rng.sample(WORDS, 4)))
+    effects = '\n'.join(f'  useEffect(() => {{ window.addEventListener("{w}", () => {{}}); }}, []);'
+                        for w in rng.sample(WORDS, 3))
+    path.write_text(f"""import React, {{ useState, useEffect }} from 'react';
+import './{name}.css';
+
+export function {name}({{ title: string, items: Item[], onSelect: (id: string) => void }}) {{
+{hooks}
+{effects}
+  return (
+    <div className="{name.lower()} grid place-items-center">
+{chr(10).join(body)}
+    </div>
+  );
+}}
+""", encoding='utf-8')
+    rules = [f'.{name.lower()}-{w} {{ display: grid; transition: all 0.2s; box-shadow: 0 1px 2px #0003; }}\n'
+             f'.{name.lower()}-{w}:hover {{ transform: scale(1.02); }}' for w in rng.sample(WORDS, 8)]
+    path.with_suffix('.css').write_text('\n'.join(rules) + '\n', encoding='utf-8')
+
+
+def write_desktop_component(path: Path, rng: random.Random, name: str):
+    body = [f'    <{tag} Classes="{rng.choice(WORDS)}" Text="{text(rng, 3)}" />'
+            for tag in (rng.choice(AXAML_TAGS) for _ in range(rng.randint(20, 60)))]
+    path.write_text(f"""<UserControl xmlns="https://github.com/avaloniaui" x:Class="Bench.{name}">
+  <StackPanel Orientation="Vertical">
+{chr(10).join(body)}
+  </StackPanel>
+</UserControl>
+""", encoding='utf-8')
+    handlers = '\n'.join(f'    private void On{w.capitalize()}(object sender, RoutedEventArgs e) {{ Refresh(); }}'
+                         for w in rng.sample(WORDS, 5))
+    Path(str(path) + '.cs').write_text(f"""namespace Bench;
+public partial class {name} : UserControl
+{{
+    public string Title {{ get; set; }}
+{handlers}
+}}
+""", encoding='utf-8')
+
+
+def analyze(web: str, desktop: str, cache=None):
+    start = time.perf_counter()
+    analysis = GapAnalyzer.analyze_plugin(PLUGIN, web, desktop, cache)
+    elapsed = time.perf_counter() - start
+    return asdict(analysis), elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark incremental gap analysis")
+    parser.add_argument('--components', type=int, default=200, help="Web/desktop component pairs (default: 200)")
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        web = Path(tmp) / 'packages'
+        desktop = Path(tmp) / 'src'
+        ui_dir = web / PLUGIN / 'src' / 'ui'
+        views_dir = desktop / 'RenderX.Plugins.BenchPlugin' / 'Views'
+        ui_dir.mkdir(parents=True)
+        views_dir.mkdir(parents=True)
+        names = [f'{rng.choice(WORDS).capitalize()}Panel{i}' for i in range(args.components)]
+        for name in names:
+            write_web_component(ui_dir / f'{name}.tsx', rng, name)
+            # Most web components have a desktop port
+            if rng.random() < 0.8:
+                write_desktop_component(views_dir / f'{name}.axaml', rng, name)
+        cache_path = os.path.join(tmp, 'gap-cache.json')
+
+        expected, uncached = analyze(str(web), str(desktop))
+        cache = AnalysisCache(cache_path)
+        result, cold = analyze(str(web), str(desktop), cache)
+        cache.save()
+        identical = result == expected
+
+        cache = AnalysisCache(cache_path)
+        result, warm = analyze(str(web), str(desktop), cache)
+        cache.save()
+        identical = identical and result == expected
+        warm_stats = (cache.parse_hits, cache.parse_misses, cache.pair_hits, cache.pair_misses)
+
+        # Edit one web component, then re-run incrementally
+        edited = ui_dir / f'{names[0]}.tsx'
+        edited.write_text(edited.read_text(encoding='utf-8').replace(
+            '</div>\n  );', '  <button className="ai-chat-toggle">🤖 Ask AI</button>\n    </div>\n  );'), encoding='utf-8')
+        expected, _ = analyze(str(web), str(desktop))
+        cache = AnalysisCache(cache_path)
+        result, edit = analyze(str(web), str(desktop), cache)
+        identical = identical and result == expected
+
+        print(f"Plugin: {args.components} web components, {len(list(views_dir.glob('*.axaml')))} desktop components, "
+              f"{len(expected['gaps'])} gaps")
+        print(f"  no cache:     {uncached:.3f}s")
+        print(f"  cold cache:   {cold:.3f}s")
+        print(f"  warm cache:   {warm:.3f}s  (parse {warm_stats[0]} hit/{warm_stats[1]} miss, "
+              f"pairs {warm_stats[2]} hit/{warm_stats[3]} miss)")
+        print(f"  after 1 edit: {edit:.3f}s  (parse {cache.parse_hits} hit/{cache.parse_misses} miss, "
+              f"pairs {cache.pair_hits} hit/{cache.pair_misses} miss)")
+        print(f"  speedup (warm vs no cache): {uncached / warm:.1f}x")
+        print(f"  identical analyses: {identical}")
+
+
+if __name__ == '__main__':
+    main()
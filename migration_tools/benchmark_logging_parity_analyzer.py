@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Logging Parity Analyzer Benchmark
+
+Generates synthetic web and desktop log inventories and times
+LoggingParityAnalyzer.analyze_parity against the legacy matcher, which
+re-normalized and scored every desktop entry of the category for each web
+entry. The legacy matcher is reproduced here as the baseline.
+
+Usage:
+    python benchmark_logging_parity_analyzer.py [--web N] [--desktop N] [--seed N]
+"""
+
+import argparse
+import random
+import time
+from dataclasses import asdict
+from typing import Dict, List
+
+from logging_parity_analyzer import LoggingParityAnalyzer
+
+SUBJECTS = ['plugin', 'sequence', 'beat', 'queue', 'event', 'subscriber', 'movement', 'resource',
+            'conductor', 'handler', 'cache', 'channel', 'route', 'topic', 'manifest', 'symphony',
+            'instrument', 'timer', 'worker', 'session', 'stage', 'panel', 'canvas', 'layer']
+VERBS = ['loaded', 'started', 'executed', 'drained', 'published', 'failed', 'completed', 'released',
+         'registered', 'skipped', 'retried', 'queued', 'mounted', 'unmounted', 'resolved', 'rejected']
+WORDS = [f"{s}{suffix}" for s in SUBJECTS for suffix in ('', 's', 'Id', 'Count', 'State')] + VERBS
+CATEGORIES = ['EventBus', 'Conductor', 'PluginManagement', 'ExecutionQueue', 'SequenceExecution']
+
+
+def generate_logs(rng: random.Random, count: int, web: bool) -> List[Dict]:
+    severities = ['INFO', 'WARN', 'ERROR', 'DEBUG'] if web else ['Information', 'Warning', 'Error', 'Debug']
+    logs = []
+    for i in range(count):
+        words = rng.sample(WORDS, rng.randint(2, 7))
+        words.insert(rng.randrange(len(words) + 1), f"{{id{rng.randrange(50)}}}")
+        words.append(f"code{rng.randrange(count)}")
+        logs.append({
+            'file_path': f"src/{'web' if web else 'desktop'}/Module{i % 40}.{'ts' if web else 'cs'}",
+            'line_number': i,
+            'message': ('🎼 ' if web and i % 3 == 0 else '') + ' '.join(words),
+            'severity': rng.choice(severities),
+            'category': rng.choice(CATEGORIES),
+        })
+    return logs
+
+
+def legacy_find_best_match(analyzer: LoggingParityAnalyzer, web_entry: Dict, desktop_entries: List[Dict]):
+    """Baseline: normalize and score every desktop entry for each web entry."""
+    best_match = None
+    best_similarity = 0.0
+    web_message = analyzer._normalize_message(web_entry['message'])
+    for desktop_entry in desktop_entries:
+        desktop_message = analyzer._normalize_message(desktop_entry['message'])
+        similarity = analyzer._calculate_similarity(web_message, desktop_message)
+        if similarity > best_similarity:
+            best_similarity = similarity
+            best_match = desktop_entry
+    return best_match, best_similarity
+
+
+class LegacyAnalyzer(LoggingParityAnalyzer):
+    def _find_best_match(self, web_entry, desktop_index):
+        return legacy_find_best_match(self, web_entry, desktop_index.entries)
+
+
+def run(analyzer_class, web_logs: List[Dict], desktop_logs: List[Dict]):
+    analyzer = analyzer_class('.')
+    analyzer.web_logs, analyzer.desktop_logs = web_logs, desktop_logs
+    start = time.perf_counter()
+    analyzer.analyze_parity()
+    return analyzer.gaps, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LoggingParityAnalyzer matching")
+    parser.add_argument('--web', type=int, default=5000, help="Web log entries (default: 5000)")
+    parser.add_argument('--desktop', type=int, default=5000, help="Desktop log entries (default: 5000)")
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    web_logs = generate_logs(rng, args.web, web=True)
+    desktop_logs = generate_logs(rng, args.desktop, web=False)
+    # Most desktop messages are ports of a web message, with a word dropped or added
+    for entry in desktop_logs:
+        if rng.random() < 0.6:
+            source = rng.choice(web_logs)
+            entry['category'] = source['category']
+            words = source['message'].lstrip('🎼 ').split()
+            if rng.random() < 0.5:
+                del words[rng.randrange(len(words))]
+            else:
+                words.insert(rng.randrange(len(words) + 1), rng.choice(WORDS))
+            entry['message'] = ' '.join(words)
+
+    legacy_gaps, legacy_time = run(LegacyAnalyzer, web_logs, desktop_logs)
+    gaps, new_time = run(LoggingParityAnalyzer, web_logs, desktop_logs)
+
+    print(f"Inventories: {args.web} web, {args.desktop} desktop entries")
+    print(f"  legacy (all pairs):   {legacy_time:.2f}s")
+    print(f"  indexed candidates:   {new_time:.2f}s")
+    print(f"  speedup: {legacy_time / new_time:.1f}x")
+    print(f"  identical gaps: {[asdict(g) for g in legacy_gaps] == [asdict(g) for g in gaps]} ({len(gaps)} gaps)")
+
+
+if __name__ == '__main__':
+    main()
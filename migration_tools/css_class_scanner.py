@@ -14,14 +14,23 @@ Options:
     --group-by TYPE      : Group by 'file', 'class', or 'package' (default: file)
     --show-usage         : Show where each class is used
     --stats              : Show statistics summary
-    --format FORMAT      : Output format: 'tree', 'flat', or 'json' (default: tree)
+    --format FORMAT      : Output format: 'tree', 'flat', 'json' or 'ndjson' (default: tree);
+                           ndjson streams one occurrence per line to --output while scanning
+    --from-ndjson FILE   : Build the report from a streamed scan instead of scanning
     --min-usage N        : Only show classes used at least N times (default: 1)
 
+Each rule only runs on the file types it applies to. .css/.scss/.less, .html and plain
+.ts/.js files get `.name {` definitions (the latter for injected stylesheets); .tsx/.jsx do
+not, so CSS written inside a TSX/JSX file (e.g. a test's inline <style>) is not reported
+as a definition.
+
 Examples:
     python css_class_scanner.py packages
     python css_class_scanner.py packages --group-by class --stats
     python css_class_scanner.py packages --output css_classes.txt --show-usage
     python css_class_scanner.py packages --min-usage 3 --stats
+    python css_class_scanner.py packages --format ndjson --output css_classes.ndjson
+    python css_class_scanner.py --from-ndjson css_classes.ndjson --group-by class --stats
 """
 
 import os
@@ -29,10 +38,14 @@ import re
 import json
 import argparse
 from pathlib import Path
-from typing import List, Dict, Set, Tuple
+from typing import List, Dict, Iterator, Set, Tuple, Optional
 from collections import defaultdict
 from dataclasses import dataclass, field, asdict
 
+from gap_analysis_system.record_stream import RecordWriter, iter_records
+from gap_analysis_system.source_corpus import SourceCorpus
+from gap_analysis_system.source_positions import LineIndex
+
 
 @dataclass
 class CSSClass:
@@ -89,17 +102,61 @@ class CSSScanner:
         (r'data-[\w-]+\s*=\s*["\']([a-zA-Z_][\w-]*)["\']', 'data-attr'),
     ]
     
+    # The same patterns compiled once, as (regex, usage_type, extensions). They cannot
+    # cross a newline (whitespace is [^\S\n], negated classes exclude \n), so running one
+    # over a whole file finds exactly the matches it finds line by line. Each rule only
+    # runs on the file types it applies to; files of any other type get every rule.
+    # Plain .ts/.js keep the definition rule: they carry injected stylesheets here
+    # (template-literal CSS); only the JSX flavours (.tsx/.jsx) skip it. data-attr also
+    # runs on style sheets, where it matches attribute selectors ([data-theme="dark"]).
+    # Rules stay separate rather than one alternation because they overlap on purpose:
+    # className="a b" is both a className-prop and a utility-classes usage.
+    STYLE_EXTENSIONS = frozenset({'.css', '.scss', '.less'})
+    SCRIPT_EXTENSIONS = frozenset({'.ts', '.tsx', '.js', '.jsx'})
+    MARKUP_EXTENSIONS = frozenset({'.html'})
+    INJECTED_STYLE_EXTENSIONS = frozenset({'.ts', '.js'})
+    RULES = [
+        (re.compile(r'\.([a-zA-Z_][\w-]*)[^\S\n]*\{'), 'css-definition', STYLE_EXTENSIONS | MARKUP_EXTENSIONS | INJECTED_STYLE_EXTENSIONS),
+        (re.compile(r'className[^\S\n]*=[^\S\n]*["\']([^"\'\n]+)["\']'), 'className-prop', SCRIPT_EXTENSIONS | MARKUP_EXTENSIONS),
+        (re.compile(r'className[^\S\n]*=[^\S\n]*\{["\']([^"\'\n]+)["\']\}'), 'className-prop-expr', SCRIPT_EXTENSIONS),
+        (re.compile(r'classList\.(add|remove|toggle)[^\S\n]*\([^\S\n]*["\']([^"\'\n]+)["\']'), 'classList-method', SCRIPT_EXTENSIONS | MARKUP_EXTENSIONS),
+        (re.compile(r'querySelector(?:All)?[^\S\n]*\([^\S\n]*["\']\.([a-zA-Z_][\w-]*)'), 'querySelector', SCRIPT_EXTENSIONS | MARKUP_EXTENSIONS),
+        # Lookahead for the closing backtick first: without it an unclosed backtick retries
+        # every later word on the line (quadratic in line length)
+        (re.compile(r'`(?=[^`\n]*`)[^`\n]*?\b([a-zA-Z_][\w-]*)\b[^`\n]*`'), 'template-literal', SCRIPT_EXTENSIONS | MARKUP_EXTENSIONS),
+        (re.compile(r'styles\.([a-zA-Z_][\w-]*)'), 'css-module', SCRIPT_EXTENSIONS),
+        (re.compile(r'styles\[["\']([^"\'\n]+)["\']\]'), 'css-module-bracket', SCRIPT_EXTENSIONS),
+        (re.compile(r'className[^\S\n]*=[^\S\n]*["\']([^"\'\n]*[^\S\n]+[^"\'\n]*)["\']'), 'utility-classes', SCRIPT_EXTENSIONS | MARKUP_EXTENSIONS),
+        (re.compile(r'class[^\S\n]*=[^\S\n]*["\']([^"\'\n]+)["\']'), 'class-attr', SCRIPT_EXTENSIONS | MARKUP_EXTENSIONS),
+        (re.compile(r'data-[\w-]+[^\S\n]*=[^\S\n]*["\']([a-zA-Z_][\w-]*)["\']'), 'data-attr', STYLE_EXTENSIONS | SCRIPT_EXTENSIONS | MARKUP_EXTENSIONS),
+    ]
+    IGNORED_DIRS = frozenset({
+        'node_modules', '.git', 'dist', 'build', 'coverage',
+        '__pycache__', '.pytest_cache', '.vscode'
+    })
+    KNOWN_EXTENSIONS = STYLE_EXTENSIONS | SCRIPT_EXTENSIONS | MARKUP_EXTENSIONS
+    MULTI_CLASS_TYPES = frozenset({'className-prop', 'className-prop-expr', 'class-attr', 'utility-classes'})
+    FALSE_POSITIVES = frozenset({
+        'return', 'const', 'let', 'var', 'function', 'class', 'import', 'export',
+        'if', 'else', 'for', 'while', 'do', 'switch', 'case', 'break', 'continue',
+        'true', 'false', 'null', 'undefined', 'this', 'super', 'new', 'typeof',
+        'string', 'number', 'boolean', 'object', 'any', 'void', 'never',
+        'styles', 'className', 'classList', 'querySelector', 'querySelectorAll',
+    })
+    
     def __init__(self,
                  extensions: List[str] = None,
                  show_usage: bool = False,
                  group_by: str = 'file',
                  output_format: str = 'tree',
-                 min_usage: int = 1):
+                 min_usage: int = 1,
+                 corpus: Optional[SourceCorpus] = None):
         self.extensions = extensions or ['.css', '.scss', '.less', '.ts', '.tsx', '.js', '.jsx', '.html']
         self.show_usage = show_usage
         self.group_by = group_by
         self.output_format = output_format
         self.min_usage = min_usage
+        self.corpus = corpus  # shared crawl and file contents (see run_all_scanners.py)
         self.css_classes: List[CSSClass] = []
         self.class_usage_count: Dict[str, int] = defaultdict(int)
         
@@ -107,53 +164,58 @@ class CSSScanner:
         """Check if file should be scanned based on extension."""
         return file_path.suffix in self.extensions
     
+    def rules_for(self, extension: str) -> List[Tuple[re.Pattern, str]]:
+        """Rules that apply to files with this extension (all of them for unknown types)."""
+        if extension not in self.KNOWN_EXTENSIONS:
+            return [(regex, usage_type) for regex, usage_type, _ in self.RULES]
+        return [(regex, usage_type) for regex, usage_type, exts in self.RULES if extension in exts]
+    
     def extract_classes_from_line(self, line: str, file_path: str, line_number: int) -> List[CSSClass]:
         """Extract CSS classes from a single line."""
-        classes = []
-        
-        for pattern, usage_type in self.PATTERNS:
-            matches = re.finditer(pattern, line)
-            for match in matches:
+        return self.extract_classes_from_text(line, file_path, first_line=line_number)
+    
+    def extract_classes_from_text(self, content: str, file_path: str, extension: Optional[str] = None,
+                                  first_line: int = 1) -> List[CSSClass]:
+        """Extract CSS classes from a whole file's text in one pass per rule.
+        
+        Results are ordered by line, then rule, then position, as a line-by-line scan would report them.
+        """
+        rules = self.rules_for(extension) if extension else [(r, t) for r, t, _ in self.RULES]
+        line_starts = None
+        found = []  # (line, CSSClass); appended rule by rule, so a stable sort by line keeps rule order
+        
+        for regex, usage_type in rules:
+            for match in regex.finditer(content):
+                if line_starts is None:
+                    line_starts = LineIndex(content)
+                line_number = line_starts.line_of(match.start()) + first_line - 1
                 # Get the class name(s) from the appropriate capture group
                 if usage_type == 'classList-method':
-                    class_name = match.group(2)
-                elif usage_type in ['className-prop', 'className-prop-expr', 'class-attr', 'utility-classes']:
+                    names = [match.group(2)]
+                elif usage_type in self.MULTI_CLASS_TYPES:
                     # These might contain multiple space-separated classes
-                    class_names = match.group(1).split()
-                    for cn in class_names:
-                        cn = cn.strip()
-                        if cn and self._is_valid_class_name(cn):
-                            css_class = CSSClass(
-                                class_name=cn,
-                                file_path=file_path,
-                                line_number=line_number,
-                                context='usage',
-                                usage_type=usage_type
-                            )
-                            classes.append(css_class)
-                            self.class_usage_count[cn] += 1
-                    continue
+                    names = match.group(1).split()
                 else:
-                    class_name = match.group(1)
-                
-                # Validate class name
-                if not self._is_valid_class_name(class_name):
-                    continue
+                    names = [match.group(1)]
                 
                 # Determine if this is a definition or usage
                 context = 'definition' if usage_type == 'css-definition' else 'usage'
                 
-                css_class = CSSClass(
-                    class_name=class_name,
-                    file_path=file_path,
-                    line_number=line_number,
-                    context=context,
-                    usage_type=usage_type
-                )
-                classes.append(css_class)
-                self.class_usage_count[class_name] += 1
-        
-        return classes
+                for class_name in names:
+                    # Validate class name
+                    if not self._is_valid_class_name(class_name):
+                        continue
+                    found.append((line_number, CSSClass(
+                        class_name=class_name,
+                        file_path=file_path,
+                        line_number=line_number,
+                        context=context,
+                        usage_type=usage_type
+                    )))
+                    self.class_usage_count[class_name] += 1
+        
+        found.sort(key=lambda item: item[0])
+        return [css_class for _, css_class in found]
     
     def _is_valid_class_name(self, name: str) -> bool:
         """Check if the class name is valid and not a false positive."""
@@ -161,19 +223,11 @@ class CSSScanner:
             return False
         
         # Filter out common false positives
-        false_positives = {
-            'return', 'const', 'let', 'var', 'function', 'class', 'import', 'export',
-            'if', 'else', 'for', 'while', 'do', 'switch', 'case', 'break', 'continue',
-            'true', 'false', 'null', 'undefined', 'this', 'super', 'new', 'typeof',
-            'string', 'number', 'boolean', 'object', 'any', 'void', 'never',
-            'styles', 'className', 'classList', 'querySelector', 'querySelectorAll',
-        }
-        
-        if name.lower() in false_positives:
+        if name.lower() in self.FALSE_POSITIVES:
             return False
         
         # Must start with letter or underscore
-        if not re.match(r'^[a-zA-Z_]', name):
+        if not (name[0] == '_' or ('a' <= name[0] <= 'z') or ('A' <= name[0] <= 'Z')):
             return False
         
         # Filter out very long names (likely not CSS classes)
@@ -187,35 +241,39 @@ class CSSScanner:
         classes = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                for line_num, line in enumerate(f, 1):
-                    found_classes = self.extract_classes_from_line(
-                        line,
-                        str(file_path),
-                        line_num
-                    )
-                    classes.extend(found_classes)
+            if self.corpus is not None:
+                content = self.corpus.read(file_path, errors='ignore')
+            else:
+                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                    content = f.read()
+            classes = self.extract_classes_from_text(content, str(file_path), file_path.suffix)
         except Exception as e:
             print(f"Warning: Could not scan {file_path}: {e}")
         
         return classes
     
-    def scan_directory(self, directory: Path) -> List[CSSClass]:
-        """Recursively scan a directory for CSS classes."""
-        all_classes = []
+    def iter_files(self, directory: Path) -> Iterator[Path]:
+        """Files under directory that scan_directory reads, in scan order."""
+        if self.corpus is not None:
+            yield from self.corpus.files_under(directory, self.extensions, exclude_dirs=self.IGNORED_DIRS)
+            return
         
         for root, dirs, files in os.walk(directory):
             # Skip common directories
-            dirs[:] = [d for d in dirs if d not in {
-                'node_modules', '.git', 'dist', 'build', 'coverage',
-                '__pycache__', '.pytest_cache', '.vscode'
-            }]
+            dirs[:] = [d for d in dirs if d not in self.IGNORED_DIRS]
             
             for file in files:
                 file_path = Path(root) / file
                 if self.should_scan_file(file_path):
-                    classes = self.scan_file(file_path)
-                    all_classes.extend(classes)
+                    yield file_path
+    
+    def scan_directory(self, directory: Path) -> List[CSSClass]:
+        """Recursively scan a directory for CSS classes."""
+        all_classes = []
+        
+        for file_path in self.iter_files(directory):
+            classes = self.scan_file(file_path)
+            all_classes.extend(classes)
         
         return all_classes
     
@@ -231,14 +289,47 @@ class CSSScanner:
         else:
             self.css_classes = self.scan_directory(scan_path)
         
-        # Filter by minimum usage
+        self._apply_min_usage()
+        return self.css_classes
+    
+    def stream(self, path: str, output_path: str) -> int:
+        """Scan a file or directory, writing each file's classes to output_path as NDJSON as soon as it is scanned.
+        
+        Memory stays flat however large the report is. Every occurrence is written:
+        --min-usage needs the final counts, so load_stream() applies it.
+        Returns the number of occurrences written.
+        """
+        scan_path = Path(path)
+        
+        if not scan_path.exists():
+            raise FileNotFoundError(f"Path not found: {path}")
+        
+        files = [scan_path] if scan_path.is_file() else self.iter_files(scan_path)
+        with RecordWriter(output_path, 'css-classes') as writer:
+            for file_path in files:
+                writer.write_all(asdict(c) for c in self.scan_file(file_path))
+        
+        return writer.count
+    
+    def load_stream(self, stream_path: str) -> List[CSSClass]:
+        """Load the occurrences written by stream() as if they had just been scanned."""
+        self.class_usage_count = defaultdict(int)
+        self.css_classes = []
+        for record in iter_records(stream_path, 'css-classes'):
+            css_class = CSSClass(**record)
+            self.css_classes.append(css_class)
+            self.class_usage_count[css_class.class_name] += 1
+        
+        self._apply_min_usage()
+        return self.css_classes
+    
+    def _apply_min_usage(self):
+        """Filter by minimum usage."""
         if self.min_usage > 1:
             self.css_classes = [
                 c for c in self.css_classes
                 if self.class_usage_count[c.class_name] >= self.min_usage
             ]
-        
-        return self.css_classes
     
     def get_statistics(self) -> Dict:
         """Calculate statistics about CSS classes."""
@@ -546,9 +637,15 @@ def main():
     )
     parser.add_argument(
         "--format",
-        choices=["tree", "flat", "json"],
+        choices=["tree", "flat", "json", "ndjson"],
         default="tree",
-        help="Output format (default: tree)"
+        help="Output format (default: tree); ndjson streams to --output while scanning"
+    )
+    parser.add_argument(
+        "--from-ndjson",
+        type=str,
+        metavar="FILE",
+        help="Generate the report from a streamed scan instead of scanning"
     )
     parser.add_argument(
         "--min-usage",
@@ -558,6 +655,10 @@ def main():
     )
     
     args = parser.parse_args()
+    if args.format == "ndjson" and not args.output:
+        parser.error("--format ndjson requires --output")
+    if args.format == "ndjson" and args.from_ndjson:
+        parser.error("--from-ndjson cannot be combined with --format ndjson")
     
     # Parse extensions
     extensions = None
@@ -573,10 +674,24 @@ def main():
         min_usage=args.min_usage
     )
     
-    # Scan
-    print(f"Scanning directory: {args.path}")
+    if args.format == "ndjson":
+        print(f"Scanning directory: {args.path}")
+        try:
+            count = scanner.stream(args.path, args.output)
+        except Exception as e:
+            print(f"Error: {e}")
+            return 1
+        print(f"Streamed {count} CSS class occurrences to '{args.output}'")
+        return 0
+    
+    # Scan (or load a streamed scan)
     try:
-        classes = scanner.scan(args.path)
+        if args.from_ndjson:
+            print(f"Loading streamed scan: {args.from_ndjson}")
+            classes = scanner.load_stream(args.from_ndjson)
+        else:
+            print(f"Scanning directory: {args.path}")
+            classes = scanner.scan(args.path)
         print(f"Found {len(classes)} CSS class occurrences ({len(set(c.class_name for c in classes))} unique)")
     except Exception as e:
         print(f"Error: {e}")
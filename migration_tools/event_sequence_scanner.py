@@ -15,12 +15,16 @@ Options:
     --show-line-numbers  : Include line numbers in the output
     --show-context       : Show surrounding code context
     --stats              : Show statistics summary
-    --format FORMAT      : Output format: 'tree', 'flat', or 'json' (default: tree)
+    --format FORMAT      : Output format: 'tree', 'flat', 'json' or 'ndjson' (default: tree);
+                           ndjson streams one call per line to --output while scanning
+    --from-ndjson FILE   : Build the report from a streamed scan instead of scanning
 
 Examples:
     python event_sequence_scanner.py packages
     python event_sequence_scanner.py packages --group-by package --stats
     python event_sequence_scanner.py packages --output events.txt --show-context
+    python event_sequence_scanner.py packages --format ndjson --output events.ndjson
+    python event_sequence_scanner.py --from-ndjson events.ndjson --group-by package --stats
 """
 
 import os
@@ -28,10 +32,14 @@ import re
 import json
 import argparse
 from pathlib import Path
-from typing import List, Dict, Set, Tuple
+from typing import List, Dict, Iterator, Set, Tuple, Optional
 from collections import defaultdict
 from dataclasses import dataclass, asdict
 
+from gap_analysis_system.record_stream import RecordWriter, iter_records
+from gap_analysis_system.source_corpus import SourceCorpus
+from gap_analysis_system.source_positions import LineIndex
+
 
 @dataclass
 class EventCall:
@@ -64,37 +72,43 @@ class EventCall:
 class EventSequenceScanner:
     """Scanner to extract EventRouter.publish and conductor.play calls."""
     
-    # Patterns for event publishing and sequence playing
+    # Patterns for event publishing and sequence playing. They run over the whole
+    # file text, so a call split across lines (name on the next line) is found once,
+    # at the line where the call starts; names cannot span lines.
     PATTERNS = {
         'publish': [
             # EventRouter.publish('event', payload)
-            r'EventRouter\.publish\s*\(\s*[\'"`]([^\'"`]+)[\'"`]',
+            r'EventRouter\.publish\s*\(\s*[\'"`]([^\'"`\n]+)[\'"`]',
             # this.eventRouter.publish('event', payload)
-            r'(?:this\.)?eventRouter\.publish\s*\(\s*[\'"`]([^\'"`]+)[\'"`]',
+            r'(?:this\.)?eventRouter\.publish\s*\(\s*[\'"`]([^\'"`\n]+)[\'"`]',
             # router.publish('event', payload)
-            r'router\.publish\s*\(\s*[\'"`]([^\'"`]+)[\'"`]',
+            r'router\.publish\s*\(\s*[\'"`]([^\'"`\n]+)[\'"`]',
         ],
         'play': [
             # conductor.play('sequence')
-            r'conductor\.play\s*\(\s*[\'"`]([^\'"`]+)[\'"`]',
+            r'conductor\.play\s*\(\s*[\'"`]([^\'"`\n]+)[\'"`]',
             # this.conductor.play('sequence')
-            r'(?:this\.)?conductor\.play\s*\(\s*[\'"`]([^\'"`]+)[\'"`]',
+            r'(?:this\.)?conductor\.play\s*\(\s*[\'"`]([^\'"`\n]+)[\'"`]',
             # context.conductor.play('sequence')
-            r'context\.conductor\.play\s*\(\s*[\'"`]([^\'"`]+)[\'"`]',
+            r'context\.conductor\.play\s*\(\s*[\'"`]([^\'"`\n]+)[\'"`]',
         ]
     }
+    COMPILED_PATTERNS = [(call_type, re.compile(pattern))
+                         for call_type, patterns in PATTERNS.items() for pattern in patterns]
     
     def __init__(self,
                  extensions: List[str] = None,
                  show_line_numbers: bool = False,
                  show_context: bool = False,
                  group_by: str = 'type',
-                 output_format: str = 'tree'):
+                 output_format: str = 'tree',
+                 corpus: Optional[SourceCorpus] = None):
         self.extensions = extensions or ['.ts', '.tsx', '.js', '.jsx']
         self.show_line_numbers = show_line_numbers
         self.show_context = show_context
         self.group_by = group_by
         self.output_format = output_format
+        self.corpus = corpus  # shared crawl and file contents (see run_all_scanners.py)
         self.event_calls: List[EventCall] = []
         
     def should_scan_file(self, file_path: Path) -> bool:
@@ -111,109 +125,113 @@ class EventSequenceScanner:
         calls = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
+            if self.corpus is not None:
+                text = self.corpus.read(file_path, errors='ignore')
+            else:
+                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                    text = f.read()
+            
+            # One pass per pattern over the whole text. Several patterns match the same
+            # call (conductor.play also matches this.conductor.play), so a call is keyed
+            # by the offset of its name and kept once.
+            found = {}
+            for call_type, pattern in self.COMPILED_PATTERNS:
+                for match in pattern.finditer(text):
+                    found.setdefault(match.start(1), (match.start(), call_type, match.group(1)))
+            if not found:
+                return calls
             
-            for line_num, line in enumerate(lines, start=1):
+            index = LineIndex(text)
+            last_line = index.line_count - 1 if text.endswith('\n') else index.line_count
+            located = []
+            for start, call_type, name in found.values():
+                line_num = index.line_of(start)
+                line = index.line_text(line_num)
                 # Skip commented lines
                 stripped = line.strip()
                 if stripped.startswith('//') or stripped.startswith('*') or stripped.startswith('/*'):
                     continue
+                located.append((line_num, call_type != 'publish', start, call_type, name, stripped))
+            
+            # Line order, publish calls before play calls on the same line
+            for line_num, _, _, call_type, name, full_line in sorted(located):
+                # Get context if requested (2 lines before, 2 lines after)
+                context_before = []
+                context_after = []
+                if self.show_context:
+                    context_before = [index.line_text(n).rstrip() for n in range(max(1, line_num - 2), line_num)]
+                    context_after = [index.line_text(n).rstrip()
+                                     for n in range(line_num + 1, min(last_line, line_num + 2) + 1)]
                 
-                # Check for multi-line patterns (look ahead up to 5 lines)
-                combined_line = line
-                for i in range(1, min(6, len(lines) - line_num + 1)):
-                    next_line = lines[line_num + i - 1]
-                    if next_line.strip().startswith('//'):
-                        break
-                    combined_line += " " + next_line
-                    # Stop if we find a semicolon or closing brace
-                    if ';' in next_line or (')' in next_line and '{' not in next_line):
-                        break
-                
-                # Check for publish patterns
-                for pattern in self.PATTERNS['publish']:
-                    matches = re.finditer(pattern, combined_line)
-                    for match in matches:
-                        event_name = match.group(1)
-                        
-                        # Get context if requested
-                        context_before = []
-                        context_after = []
-                        if self.show_context:
-                            # Get 2 lines before
-                            for i in range(max(0, line_num - 3), line_num - 1):
-                                if i < len(lines):
-                                    context_before.append(lines[i].rstrip())
-                            # Get 2 lines after
-                            for i in range(line_num, min(len(lines), line_num + 2)):
-                                if i < len(lines):
-                                    context_after.append(lines[i].rstrip())
-                        
-                        calls.append(EventCall(
-                            file_path=str(file_path),
-                            line_number=line_num,
-                            call_type='publish',
-                            event_name=event_name,
-                            full_line=line.strip(),
-                            context_before=context_before,
-                            context_after=context_after
-                        ))
-                
-                # Check for play patterns
-                for pattern in self.PATTERNS['play']:
-                    matches = re.finditer(pattern, combined_line)
-                    for match in matches:
-                        sequence_name = match.group(1)
-                        
-                        # Get context if requested
-                        context_before = []
-                        context_after = []
-                        if self.show_context:
-                            # Get 2 lines before
-                            for i in range(max(0, line_num - 3), line_num - 1):
-                                if i < len(lines):
-                                    context_before.append(lines[i].rstrip())
-                            # Get 2 lines after
-                            for i in range(line_num, min(len(lines), line_num + 2)):
-                                if i < len(lines):
-                                    context_after.append(lines[i].rstrip())
-                        
-                        calls.append(EventCall(
-                            file_path=str(file_path),
-                            line_number=line_num,
-                            call_type='play',
-                            event_name=sequence_name,
-                            full_line=line.strip(),
-                            context_before=context_before,
-                            context_after=context_after
-                        ))
+                calls.append(EventCall(
+                    file_path=str(file_path),
+                    line_number=line_num,
+                    call_type=call_type,
+                    event_name=name,
+                    full_line=full_line,
+                    context_before=context_before,
+                    context_after=context_after
+                ))
                         
         except Exception as e:
             print(f"Warning: Error scanning {file_path}: {e}")
         
         return calls
     
+    def iter_files(self, root_path: Path) -> Iterator[Path]:
+        """Files under root_path that scan_directory reads, in scan order."""
+        if self.corpus is not None:
+            candidates = self.corpus.files_under(root_path, self.extensions)
+        else:
+            candidates = root_path.rglob('*')
+        
+        for file_path in candidates:
+            if file_path.is_file() and self.should_scan_file(file_path):
+                # Skip node_modules, dist, and test files for cleaner results
+                path_str = str(file_path)
+                if 'node_modules' in path_str or '/dist/' in path_str or '\\dist\\' in path_str:
+                    continue
+                yield file_path
+    
     def scan_directory(self, root_path: Path) -> List[EventCall]:
         """Recursively scan directory for event/sequence calls."""
         all_calls = []
         
         print(f"Scanning directory: {root_path}")
         
-        for file_path in root_path.rglob('*'):
-            if file_path.is_file() and self.should_scan_file(file_path):
-                # Skip node_modules, dist, and test files for cleaner results
-                path_str = str(file_path)
-                if 'node_modules' in path_str or '/dist/' in path_str or '\\dist\\' in path_str:
-                    continue
-                
-                calls = self.scan_file(file_path)
-                all_calls.extend(calls)
+        for file_path in self.iter_files(root_path):
+            calls = self.scan_file(file_path)
+            all_calls.extend(calls)
         
         print(f"Found {len(all_calls)} event/sequence calls in {len(set(call.file_path for call in all_calls))} files")
         
         return all_calls
     
+    def stream_json_output(self, root_path: Path, output_path: str) -> int:
+        """Scan root_path, writing each file's calls to output_path as NDJSON as soon as it is scanned.
+        
+        Memory stays flat however large the report is; read_json_stream() loads it back.
+        Returns the number of calls written.
+        """
+        print(f"Scanning directory: {root_path}")
+        
+        files_with_calls = 0
+        with RecordWriter(output_path, 'event-calls', group_by=self.group_by) as writer:
+            for file_path in self.iter_files(root_path):
+                calls = self.scan_file(file_path)
+                if calls:
+                    files_with_calls += 1
+                    writer.write_all(asdict(call) for call in calls)
+        
+        print(f"Found {writer.count} event/sequence calls in {files_with_calls} files")
+        
+        return writer.count
+    
+    def read_json_stream(self, stream_path: str) -> List[EventCall]:
+        """Load the calls written by stream_json_output, so the reports can be generated from them."""
+        self.event_calls = [EventCall(**record) for record in iter_records(stream_path, 'event-calls')]
+        return self.event_calls
+    
     def group_calls(self, calls: List[EventCall]) -> Dict:
         """Group calls according to the grouping strategy."""
         grouped = defaultdict(list)
@@ -459,15 +477,19 @@ class EventSequenceScanner:
         # Scan for event/sequence calls
         self.event_calls = self.scan_directory(path)
         
-        if not self.event_calls:
+        return self.generate_report(self.event_calls)
+    
+    def generate_report(self, calls: List[EventCall]) -> str:
+        """Generate the report for scanned (or streamed) calls in the configured format."""
+        if not calls:
             return "No event or sequence calls found."
         
         # Group calls
-        grouped = self.group_calls(self.event_calls)
+        grouped = self.group_calls(calls)
         
         # Generate output based on format
         if self.output_format == 'json':
-            output = self.generate_json_output(self.event_calls)
+            output = self.generate_json_output(calls)
         elif self.output_format == 'flat':
             output = self.generate_flat_output(grouped)
         else:  # tree
@@ -488,6 +510,8 @@ Examples:
   %(prog)s packages --output events.txt --show-line-numbers  # Save with line numbers
   %(prog)s packages --show-context --output events.txt # Include code context
   %(prog)s packages --format json --output events.json # Export as JSON
+  %(prog)s packages --format ndjson --output events.ndjson  # Stream one call per line
+  %(prog)s --from-ndjson events.ndjson --stats         # Report from a streamed scan
         """
     )
     
@@ -506,11 +530,17 @@ Examples:
                        help='Show surrounding code context')
     parser.add_argument('--stats', action='store_true',
                        help='Show statistics summary')
-    parser.add_argument('--format', choices=['tree', 'flat', 'json'],
+    parser.add_argument('--format', choices=['tree', 'flat', 'json', 'ndjson'],
                        default='tree',
-                       help='Output format (default: tree)')
+                       help='Output format (default: tree); ndjson streams to --output while scanning')
+    parser.add_argument('--from-ndjson', metavar='FILE',
+                       help='Generate the report from a streamed scan instead of scanning')
     
     args = parser.parse_args()
+    if args.format == 'ndjson' and not args.output:
+        parser.error('--format ndjson requires --output')
+    if args.format == 'ndjson' and args.from_ndjson:
+        parser.error('--from-ndjson cannot be combined with --format ndjson')
     
     # Create scanner
     extensions = args.include_ext if args.include_ext else ['.ts', '.tsx', '.js', '.jsx']
@@ -522,8 +552,19 @@ Examples:
         output_format=args.format
     )
     
+    if args.format == 'ndjson':
+        if not Path(args.path).exists():
+            print(f"Error: Path '{args.path}' does not exist.")
+            return
+        count = scanner.stream_json_output(Path(args.path), args.output)
+        print(f"Streamed {count} event/sequence calls to '{args.output}'")
+        return
+    
     # Generate report
-    report = scanner.scan_and_generate_report(args.path)
+    if args.from_ndjson:
+        report = scanner.generate_report(scanner.read_json_stream(args.from_ndjson))
+    else:
+        report = scanner.scan_and_generate_report(args.path)
     
     # Add stats if requested
     if args.stats and scanner.event_calls:
@@ -14,6 +14,8 @@ Options:
     --files-only      : Show only files, not folders
     --folders-only    : Show only folders, not files
     --ignore PATTERN  : Ignore files/folders matching pattern (can be used multiple times)
+    --gitignore FILE  : Exclude paths matched by a .gitignore file (patterns relative to the scanned path)
+    --nested-gitignore: Also apply .gitignore files found in scanned directories
     --output FILE     : Save output to file instead of printing to console
     --size            : Show file sizes
     --sort            : Sort entries alphabetically
@@ -32,19 +34,71 @@ import sys
 import argparse
 import fnmatch
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import List, Optional, Set, Tuple
 import re
 
 
+def _translate_glob(pattern: str) -> str:
+    """Translate one gitignore glob (no leading/trailing slash) to a regex fragment."""
+    parts = []
+    segments = pattern.split('/')
+    last = len(segments) - 1
+    for n, segment in enumerate(segments):
+        if segment == '**':
+            # Leading "**/" and inner "/**/" match zero or more directories,
+            # a trailing "/**" everything inside (but not the directory itself)
+            parts.append('.+' if n == last else '(?:.*/)?')
+            continue
+        i = 0
+        while i < len(segment):
+            c = segment[i]
+            if c == '*':
+                parts.append('[^/]*')
+                while i + 1 < len(segment) and segment[i + 1] == '*':
+                    i += 1
+            elif c == '?':
+                parts.append('[^/]')
+            elif c == '[':
+                negated = segment[i + 1:i + 2] in ('!', '^')
+                # A ']' right after the opening bracket is part of the set
+                end = segment.find(']', i + (3 if negated else 2))
+                if end == -1:
+                    parts.append(re.escape(c))
+                else:
+                    body = segment[i + (2 if negated else 1):end].replace('\\', '\\\\').replace('[', '\\[')
+                    parts.append(('[^' if negated else '[') + body + ']')
+                    i = end
+            elif c == '\\' and i + 1 < len(segment):
+                i += 1
+                parts.append(re.escape(segment[i]))
+            else:
+                parts.append(re.escape(c))
+            i += 1
+        if n != last:
+            parts.append('/')
+    return ''.join(parts)
+
+
 class GitignoreParser:
-    """Parser for .gitignore files with pattern matching logic."""
+    """Parser for .gitignore files with pattern matching logic.
     
-    def __init__(self, gitignore_path: Optional[str] = None):
+    All patterns of one file are compiled into a single regex: one alternative per
+    pattern, last pattern first, so the alternative that matches is the pattern git
+    would apply (the last matching one). Patterns are relative to ``base``, the
+    directory holding the .gitignore ('' for the scan root).
+    """
+    
+    def __init__(self, gitignore_path: Optional[str] = None, base: str = ''):
         self.patterns = []
         self.negation_patterns = []
+        self.base = base.strip('/')
+        self._rules: List[Tuple[str, bool]] = []  # (regex, negated) in file order
+        self._regex = None
+        self._negated: List[bool] = []  # by regex group number
         
         if gitignore_path and os.path.exists(gitignore_path):
             self._load_gitignore(gitignore_path)
+        self._compile()
     
     def _load_gitignore(self, gitignore_path: str):
         """Load patterns from a .gitignore file."""
@@ -61,89 +115,75 @@ class GitignoreParser:
                     if line.startswith('!'):
                         pattern = line[1:].strip()
                         if pattern:
-                            self.negation_patterns.append(self._normalize_pattern(pattern))
+                            self.negation_patterns.append(pattern)
+                            self._rules.append((self._pattern_regex(pattern), True))
                     else:
-                        self.patterns.append(self._normalize_pattern(line))
+                        self.patterns.append(line)
+                        self._rules.append((self._pattern_regex(line), False))
                         
         except Exception as e:
             print(f"Warning: Could not read .gitignore file '{gitignore_path}': {e}")
     
-    def _normalize_pattern(self, pattern: str) -> str:
-        """Normalize gitignore pattern for matching."""
-        # Remove trailing slashes for directory patterns
-        if pattern.endswith('/'):
-            pattern = pattern[:-1]
-        
-        # Convert gitignore patterns to glob-like patterns
-        # Handle ** for recursive matching
-        if '**' in pattern:
-            # Convert ** to match any directory depth
-            pattern = pattern.replace('**', '*')
-        
-        return pattern
+    def _pattern_regex(self, pattern: str) -> str:
+        """Regex for one pattern, matched against a relative path ('/'-terminated for directories)."""
+        if pattern.startswith('\\'):
+            pattern = pattern[1:]  # escaped leading '#' or '!'
+        # A trailing slash only matches directories
+        dir_only = pattern.endswith('/')
+        pattern = pattern.rstrip('/')
+        # A slash anywhere else anchors the pattern to the .gitignore's directory;
+        # otherwise it matches a name at any depth
+        anchored = '/' in pattern
+        pattern = pattern.lstrip('/')
+        prefix = '' if anchored else '(?:.*/)?'
+        return prefix + _translate_glob(pattern) + ('/' if dir_only else '/?') + r'\Z'
     
-    def should_ignore(self, path: str, is_dir: bool = False) -> bool:
+    def _compile(self):
+        if not self._rules:
+            return
+        ordered = self._rules[::-1]
+        self._regex = re.compile('|'.join(f'({regex})' for regex, _ in ordered), re.DOTALL)
+        self._negated = [False] + [negated for _, negated in ordered]
+    
+    def match(self, path: str, is_dir: bool = False) -> Optional[bool]:
         """
-        Check if a path should be ignored based on gitignore patterns.
+        Decide a path against this file's patterns.
         
         Args:
-            path: The relative path to check
+            path: The path relative to the scan root
             is_dir: Whether the path is a directory
             
         Returns:
-            True if the path should be ignored
+            True if ignored, False if re-included by a negation pattern,
+            None if no pattern matches (or the path is outside ``base``)
         """
-        if not self.patterns:
-            return False
+        if self._regex is None:
+            return None
         
         # Normalize path separators
         path = path.replace('\\', '/')
+        if self.base:
+            if not path.startswith(self.base + '/'):
+                return None
+            path = path[len(self.base) + 1:]
         
-        # Check against patterns
-        ignored = False
-        
-        # First check if any pattern matches (ignores the file)
-        for pattern in self.patterns:
-            if self._match_pattern(pattern, path, is_dir):
-                ignored = True
-                break
-        
-        # Then check negation patterns (un-ignores the file)
-        if ignored:
-            for pattern in self.negation_patterns:
-                if self._match_pattern(pattern, path, is_dir):
-                    ignored = False
-                    break
-        
-        return ignored
+        m = self._regex.match(path + '/' if is_dir else path)
+        if m is None:
+            return None
+        return not self._negated[m.lastindex]
     
-    def _match_pattern(self, pattern: str, path: str, is_dir: bool) -> bool:
-        """Check if a pattern matches a path."""
-        # Handle absolute patterns (starting with /)
-        if pattern.startswith('/'):
-            pattern = pattern[1:]
-            # For absolute patterns, match from the beginning
-            return fnmatch.fnmatch(path, pattern) or (is_dir and fnmatch.fnmatch(path + '/', pattern + '/'))
-        
-        # Handle patterns that should match any part of the path
-        path_parts = path.split('/')
-        
-        # Try matching the pattern against the full path
-        if fnmatch.fnmatch(path, pattern):
-            return True
-        
-        # Try matching the pattern against any suffix of the path
-        for i in range(len(path_parts)):
-            sub_path = '/'.join(path_parts[i:])
-            if fnmatch.fnmatch(sub_path, pattern):
-                return True
-        
-        # Try matching against just the filename
-        filename = path_parts[-1]
-        if fnmatch.fnmatch(filename, pattern):
-            return True
+    def should_ignore(self, path: str, is_dir: bool = False) -> bool:
+        """
+        Check if a path should be ignored based on gitignore patterns.
         
-        return False
+        Args:
+            path: The relative path to check
+            is_dir: Whether the path is a directory
+            
+        Returns:
+            True if the path should be ignored
+        """
+        return self.match(path, is_dir) is True
 
 
 class TreeScanner:
@@ -156,7 +196,8 @@ class TreeScanner:
                  show_size: bool = False,
                  sort_entries: bool = False,
                  max_depth: Optional[int] = None,
-                 gitignore_path: Optional[str] = None):
+                 gitignore_path: Optional[str] = None,
+                 nested_gitignore: bool = False):
         self.show_hidden = show_hidden
         self.files_only = files_only
         self.folders_only = folders_only
@@ -166,37 +207,50 @@ class TreeScanner:
         self.sort_entries = sort_entries
         self.max_depth = max_depth
         self.gitignore_parser = GitignoreParser(gitignore_path)
+        self.gitignore_path = os.path.realpath(gitignore_path) if gitignore_path else None
+        self.nested_gitignore = nested_gitignore
         self.root_path = None  # Will be set when scanning starts
+        # Name patterns compiled into one regex each (None: no patterns)
+        self._ignore_regex = self._compile_names(self.ignore_patterns)
+        self._include_regex = self._compile_names(self.include_only_patterns)
+    
+    @staticmethod
+    def _compile_names(patterns: List[str]):
+        if not patterns:
+            return None
+        return re.compile('|'.join(fnmatch.translate(os.path.normcase(p)) for p in patterns))
         
     def should_ignore(self, name: str, full_path: Path = None) -> bool:
         """Check if a file/folder should be ignored based on patterns and gitignore."""
-        # If include_only_patterns is specified, only include files matching those patterns
-        if self.include_only_patterns and full_path and full_path.is_file():
-            matches_include = False
-            for pattern in self.include_only_patterns:
-                if fnmatch.fnmatch(name, pattern):
-                    matches_include = True
-                    break
-            if not matches_include:
-                return True
-        
-        # Check explicit ignore patterns
-        for pattern in self.ignore_patterns:
-            if fnmatch.fnmatch(name, pattern):
-                return True
-        
-        # Check gitignore patterns if we have a full path and root path
+        rel_path = None
+        is_dir = False
         if full_path and self.root_path:
             try:
                 # Get relative path from root
-                rel_path = full_path.relative_to(self.root_path)
-                rel_path_str = str(rel_path).replace('\\', '/')
-                
-                if self.gitignore_parser.should_ignore(rel_path_str, full_path.is_dir()):
-                    return True
+                rel_path = str(full_path.relative_to(self.root_path)).replace('\\', '/')
+                is_dir = full_path.is_dir()
             except (ValueError, OSError):
                 # If we can't get relative path, fall back to name matching
-                pass
+                rel_path = None
+        is_file = bool(full_path) and full_path.is_file()
+        return self._is_excluded(name, rel_path, is_dir, is_file, (self.gitignore_parser,))
+    
+    def _is_excluded(self, name: str, rel_path: Optional[str], is_dir: bool, is_file: bool,
+                     gitignores: Tuple[GitignoreParser, ...]) -> bool:
+        # If include_only_patterns is specified, only include files matching those patterns
+        if self._include_regex and is_file and not self._include_regex.match(os.path.normcase(name)):
+            return True
+        
+        # Check explicit ignore patterns
+        if self._ignore_regex and self._ignore_regex.match(os.path.normcase(name)):
+            return True
+        
+        # Check gitignore patterns, the .gitignore closest to the path first
+        if rel_path is not None:
+            for parser in reversed(gitignores):
+                decision = parser.match(rel_path, is_dir)
+                if decision is not None:
+                    return decision
         
         return False
     
@@ -216,27 +270,43 @@ class TreeScanner:
         except (OSError, PermissionError):
             return " (size unknown)"
     
-    def scan_directory(self, root_path: Path, prefix: str = "", depth: int = 0) -> List[str]:
+    def scan_directory(self, root_path: Path, prefix: str = "", depth: int = 0,
+                       rel_dir: str = "", gitignores: Optional[Tuple[GitignoreParser, ...]] = None) -> List[str]:
         """
         Recursively scan directory and return list of formatted lines.
         
+        Ignored directories are pruned: nothing below them is listed or checked.
+        
         Args:
             root_path: Path to scan
             prefix: Current line prefix for tree formatting
             depth: Current depth level
+            rel_dir: root_path relative to the scan root ('' for the root)
+            gitignores: .gitignore parsers in effect, outermost first
             
         Returns:
             List of formatted strings representing the tree structure
         """
         lines = []
+        if gitignores is None:
+            gitignores = (self.gitignore_parser,)
         
         # Check depth limit
         if self.max_depth is not None and depth > self.max_depth:
             return lines
         
         try:
-            # Get all entries in the directory
-            entries = list(root_path.iterdir())
+            # Get all entries in the directory (DirEntry caches its type, so no extra stat calls)
+            with os.scandir(root_path) as it:
+                entries = list(it)
+            
+            # Patterns of this directory's own .gitignore take precedence over its parents'
+            if self.nested_gitignore:
+                for entry in entries:
+                    if entry.name == '.gitignore' and entry.is_file():
+                        if os.path.realpath(entry.path) != self.gitignore_path:
+                            gitignores = gitignores + (GitignoreParser(entry.path, base=rel_dir),)
+                        break
             
             # Filter entries based on options
             filtered_entries = []
@@ -246,7 +316,8 @@ class TreeScanner:
                     continue
                     
                 # Skip ignored patterns (both explicit and gitignore)
-                if self.should_ignore(entry.name, entry):
+                rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                if self._is_excluded(entry.name, rel_path, entry.is_dir(), entry.is_file(), gitignores):
                     continue
                     
                 # Filter by type if requested
@@ -276,7 +347,7 @@ class TreeScanner:
                 # Format entry name with optional size
                 entry_name = entry.name
                 if self.show_size and entry.is_file():
-                    entry_name += self.get_file_size(entry)
+                    entry_name += self.get_file_size(Path(entry.path))
                 
                 # Add folder indicator
                 if entry.is_dir():
@@ -287,7 +358,8 @@ class TreeScanner:
                 
                 # Recursively process subdirectories
                 if entry.is_dir():
-                    lines.extend(self.scan_directory(entry, next_prefix, depth + 1))
+                    rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                    lines.extend(self.scan_directory(Path(entry.path), next_prefix, depth + 1, rel_path, gitignores))
                     
         except PermissionError:
             lines.append(f"{prefix}├── [Permission Denied]")
@@ -337,6 +409,7 @@ Examples:
   %(prog)s . --ignore "*.pyc" --ignore "node_modules"  # Ignore patterns
   %(prog)s . --gitignore .gitignore           # Use .gitignore for exclusions
   %(prog)s . --gitignore .gitignore --ignore "*.log"   # Combine gitignore and custom patterns
+  %(prog)s . --nested-gitignore              # Honor every .gitignore in the tree
   %(prog)s . --include-only "*.json"         # Show only JSON files
   %(prog)s . --include-only "*.js" --include-only "*.ts"  # Show only JS and TS files
   %(prog)s . --output tree.txt               # Save to file
@@ -359,6 +432,8 @@ Examples:
                        help='Include only files matching pattern (can be used multiple times)')
     parser.add_argument('--gitignore', metavar='FILE',
                        help='Path to .gitignore file to use for exclusions')
+    parser.add_argument('--nested-gitignore', action='store_true',
+                       help='Also apply .gitignore files found in scanned directories')
     parser.add_argument('--output', metavar='FILE',
                        help='Save output to file instead of printing')
     parser.add_argument('--size', action='store_true',
@@ -383,7 +458,8 @@ Examples:
         show_size=args.size,
         sort_entries=args.sort,
         max_depth=args.max_depth,
-        gitignore_path=args.gitignore
+        gitignore_path=args.gitignore,
+        nested_gitignore=args.nested_gitignore
     )
     
     # Scan the directory
@@ -8,7 +8,11 @@ This package organizes the gap analysis functionality into cohesive domain modul
 - web_parser: React/TypeScript/JSX component parsing
 - desktop_parser: Avalonia/C#/AXAML component parsing
 - css_parser: CSS file parsing and analysis
+- source_positions: Offset to line/column/byte lookups for parser matches
+- source_corpus: One crawl and decoded-contents cache shared by the scanners
+- record_stream: NDJSON writer/reader for streamed scanner reports
 - analyzer: Gap detection and analysis logic
+- analysis_cache: Persisted component parses and pair gaps for incremental runs
 - report_generator: Report generation in multiple formats
 - cli: Command-line interface and orchestration
 
@@ -22,7 +26,11 @@ __all__ = [
     "web_parser",
     "desktop_parser",
     "css_parser",
+    "source_positions",
+    "source_corpus",
+    "record_stream",
     "analyzer",
+    "analysis_cache",
     "report_generator",
     "cli"
 ]
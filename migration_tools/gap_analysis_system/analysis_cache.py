@@ -0,0 +1,192 @@
+"""
+Analysis Cache Domain
+
+Persisted per-component parse results and per-pair gaps for incremental runs.
+
+Each parsed component (web TSX, desktop AXAML, CSS file) is stored with the
+files it was parsed from and the paths whose existence it depends on; it is
+reused while all of them are unchanged. The gaps of the pair detectors
+(GapDetector.PAIR_DETECTORS) are stored per web component with a fingerprint
+of the component and its desktop equivalents, so after an edit only the pairs
+with a changed side are compared again.
+
+One cache file can be shared by all plugins: entries are keyed by source path.
+Entries made by a different version of the parsers or detectors are discarded.
+"""
+
+import hashlib
+import json
+import os
+import re
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .models import WebComponent, DesktopComponent, CSSAnalysis, ComponentFeature, Gap
+from .web_parser import WebComponentParser
+from .desktop_parser import DesktopComponentParser
+from .desktop_feature_detector import DesktopFeatureDetector
+from .css_parser import CSSParser
+from .gap_detector import GapDetector
+
+# Modules whose code decides what a cached entry contains
+_CODE_MODULES = ('models', 'web_parser', 'desktop_parser', 'desktop_feature_detector', 'css_parser',
+                 'source_positions', 'gap_detector', 'component_mapping')
+
+
+def _code_version() -> str:
+    digest = hashlib.sha256()
+    package_dir = Path(__file__).parent
+    for module in _CODE_MODULES:
+        digest.update((package_dir / f'{module}.py').read_bytes())
+    return digest.hexdigest()
+
+
+def _to_json(value: Any) -> Any:
+    """asdict() output with sets as sorted lists."""
+    if isinstance(value, dict):
+        return {k: _to_json(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_json(v) for v in value]
+    if isinstance(value, set):
+        return sorted(value)
+    return value
+
+
+def _web_from_json(data: Dict) -> WebComponent:
+    return WebComponent(**dict(data, css_classes=set(data['css_classes']),
+                               features=[ComponentFeature(**f) for f in data['features']]))
+
+
+def _desktop_from_json(data: Dict) -> DesktopComponent:
+    return DesktopComponent(**dict(data, styles=set(data['styles']),
+                                   features=[ComponentFeature(**f) for f in data['features']]))
+
+
+class AnalysisCache:
+    """Component parse results and pair gaps keyed by source path, persisted as JSON between runs."""
+
+    VERSION = 1
+
+    def __init__(self, cache_path: Optional[str]):
+        self.cache_path = cache_path
+        self.code_version = _code_version()
+        self.components: Dict[str, Dict] = {}
+        self.pairs: Dict[str, Dict] = {}
+        self._digests: Dict[str, Optional[str]] = {}
+        self._checked: Set[str] = set()  # component entries validated or written in this run
+        self.parse_hits = 0
+        self.parse_misses = 0
+        self.pair_hits = 0
+        self.pair_misses = 0
+        if cache_path and os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == self.VERSION and data.get('code') == self.code_version:
+                    self.components = data.get('components', {})
+                    self.pairs = data.get('pairs', {})
+            except (OSError, ValueError):
+                pass  # Unreadable cache: start fresh
+
+    def _digest(self, file_path: str) -> Optional[str]:
+        """Content hash of a file (None if it does not exist), computed once per run."""
+        if file_path not in self._digests:
+            try:
+                with open(file_path, 'rb') as f:
+                    self._digests[file_path] = hashlib.sha256(f.read()).hexdigest()
+            except OSError:
+                self._digests[file_path] = None
+        return self._digests[file_path]
+
+    def _is_current(self, entry: Dict) -> bool:
+        return (all(self._digest(path) == digest for path, digest in entry['files'].items())
+                and all(os.path.exists(path) == exists for path, exists in entry['paths'].items()))
+
+    def _parsed(self, key: str, parse: Callable[[], Any], dependencies: Callable[[], Tuple[List[str], List[str]]],
+                to_json: Callable[[Any], Any], from_json: Callable[[Any], Any]) -> Any:
+        self._checked.add(key)
+        entry = self.components.get(key)
+        if entry is not None and self._is_current(entry):
+            self.parse_hits += 1
+            return from_json(entry['data']) if entry['data'] is not None else None
+        self.parse_misses += 1
+        result = parse()
+        files, paths = dependencies()
+        self.components[key] = {
+            'files': {path: self._digest(path) for path in files},
+            'paths': {path: os.path.exists(path) for path in paths},
+            'data': to_json(result) if result is not None else None,
+        }
+        return result
+
+    def web_component(self, file_path: str) -> Optional[WebComponent]:
+        """WebComponentParser.parse_component(file_path), reused while the file and its stylesheet import are unchanged."""
+        def dependencies():
+            paths = []
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    css_import = re.search(WebComponentParser.CSS_IMPORT_PATTERN, f.read())
+                if css_import:
+                    paths.append(str(Path(file_path).parent / css_import.group(1)))
+            except (OSError, UnicodeDecodeError):
+                pass
+            return [file_path], paths
+
+        return self._parsed(f'web:{file_path}', lambda: WebComponentParser.parse_component(file_path),
+                            dependencies, lambda c: _to_json(asdict(c)), _web_from_json)
+
+    def desktop_component(self, axaml_file: str) -> Optional[DesktopComponent]:
+        """DesktopComponentParser.parse_component(axaml_file), reused while the AXAML, its code-behind and the workspace folders are unchanged."""
+        def dependencies():
+            try:
+                paths = [str(p) for p in DesktopFeatureDetector.workspace_data_dirs(axaml_file)]
+            except IndexError:
+                paths = []
+            return [axaml_file, axaml_file + '.cs'], paths
+
+        return self._parsed(f'desktop:{axaml_file}', lambda: DesktopComponentParser.parse_component(axaml_file),
+                            dependencies, lambda c: _to_json(asdict(c)), _desktop_from_json)
+
+    def css_analyses(self, file_path: str) -> List[CSSAnalysis]:
+        """CSSParser.parse_css_file(file_path), reused while the file is unchanged."""
+        return self._parsed(f'css:{file_path}', lambda: CSSParser.parse_css_file(file_path),
+                            lambda: ([file_path], []),
+                            lambda analyses: [asdict(a) for a in analyses],
+                            lambda data: [CSSAnalysis(**a) for a in data])
+
+    def _source_state(self, key: str, component: Any) -> Any:
+        """What a parsed component was derived from: its cache entry's dependencies, or
+        the parsed data itself for a component that did not come through this cache."""
+        if key in self._checked:
+            entry = self.components[key]
+            return [key, entry['files'], entry['paths']]
+        return _to_json(asdict(component))
+
+    def pair_gaps(self, web_comp: WebComponent, desktop_equivalents: List[DesktopComponent]) -> Dict[str, List[Gap]]:
+        """GapDetector.detect_pair_gaps(), reused while neither side of the pair has changed."""
+        sides = [self._source_state(f'web:{web_comp.file_path}', web_comp)]
+        sides.extend(self._source_state(f'desktop:{d.file_path}', d) for d in desktop_equivalents)
+        fingerprint = hashlib.sha256(json.dumps(sides, sort_keys=True).encode('utf-8')).hexdigest()
+        entry = self.pairs.get(web_comp.file_path)
+        if entry is not None and entry['fingerprint'] == fingerprint:
+            self.pair_hits += 1
+            return {name: [Gap(**g) for g in gaps] for name, gaps in entry['gaps'].items()}
+        self.pair_misses += 1
+        result = GapDetector.detect_pair_gaps(web_comp, desktop_equivalents)
+        self.pairs[web_comp.file_path] = {
+            'fingerprint': fingerprint,
+            'gaps': {name: [asdict(g) for g in gaps] for name, gaps in result.items()},
+        }
+        return result
+
+    def save(self) -> None:
+        """Write the entries of files that still exist, including other plugins' (one file serves every plugin)."""
+        if not self.cache_path:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.cache_path)), exist_ok=True)
+        components = {k: v for k, v in self.components.items() if os.path.exists(k.split(':', 1)[1])}
+        pairs = {k: v for k, v in self.pairs.items() if os.path.exists(k)}
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': self.VERSION, 'code': self.code_version,
+                       'components': components, 'pairs': pairs}, f)
@@ -13,6 +13,7 @@ from .manifest_auditor import ManifestAuditor
 from .gap_detector import GapDetector
 from .advanced_gap_detector import AdvancedGapDetector
 from .css_parser import CSSParser
+from .analysis_cache import AnalysisCache
 
 
 class GapAnalyzer:
@@ -20,27 +21,39 @@ class GapAnalyzer:
     FEATURE_MAP_PATH: Optional[Path] = None
 
     @staticmethod
-    def analyze_plugin(plugin_name: str, web_path: str, desktop_path: str) -> PluginAnalysis:
-        """Analyze a specific plugin for gaps by delegating to sub-domains."""
+    def analyze_plugin(plugin_name: str, web_path: str, desktop_path: str,
+                       cache: Optional[AnalysisCache] = None) -> PluginAnalysis:
+        """Analyze a specific plugin for gaps by delegating to sub-domains.
+
+        With a cache, only components whose sources changed are re-parsed and only
+        pairs with a changed side are re-diffed; plugin-wide checks always run.
+        """
         analysis = PluginAnalysis(plugin_name=plugin_name)
 
         # Discover components in file system
-        web_components = ComponentDiscovery.find_web_components(web_path, plugin_name)
-        desktop_components = ComponentDiscovery.find_desktop_components(desktop_path, plugin_name)
+        web_components = ComponentDiscovery.find_web_components(web_path, plugin_name, cache)
+        desktop_components = ComponentDiscovery.find_desktop_components(desktop_path, plugin_name, cache)
 
         analysis.web_components = web_components
         analysis.desktop_components = desktop_components
 
         # Analyze CSS files
-        css_analyses = CSSParser.parse_css_files(web_path, plugin_name)
+        css_analyses = CSSParser.parse_css_files(web_path, plugin_name, cache)
         analysis.css_analysis = css_analyses
 
         # Detect gaps between implementations
+        pair_gaps = None
+        if cache:
+            pair_gaps = [
+                cache.pair_gaps(web_comp, GapDetector._find_desktop_equivalent(web_comp.name, desktop_components))
+                for web_comp in web_components
+            ]
         gaps = GapDetector.detect_gaps(
             web_components,
             desktop_components,
             css_analyses,
-            feature_map_path=GapAnalyzer.FEATURE_MAP_PATH
+            feature_map_path=GapAnalyzer.FEATURE_MAP_PATH,
+            pair_gaps=pair_gaps
         )
         analysis.gaps = gaps
 
@@ -14,6 +14,7 @@ if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
 from .analyzer import GapAnalyzer
+from .analysis_cache import AnalysisCache
 from .report_generator import ReportGenerator
 
 
@@ -51,6 +52,8 @@ Examples:
     parser.add_argument('--recommendations', action='store_true', help='Include recommendations')
     parser.add_argument('--quick-wins', action='store_true', help='Highlight quick wins')
     parser.add_argument('--feature-map', default='migration_tools/feature_map.json', help='Path to feature map JSON file')
+    parser.add_argument('--cache', metavar='FILE',
+                        help='Reuse component parses and pair gaps from unchanged files (one file can serve all plugins)')
     
     args = parser.parse_args()
     
@@ -72,7 +75,12 @@ Examples:
         GapAnalyzer.FEATURE_MAP_PATH = None
 
     # Analyze plugin
-    analysis = GapAnalyzer.analyze_plugin(args.plugin, args.web_packages, args.desktop)
+    cache = AnalysisCache(args.cache) if args.cache else None
+    analysis = GapAnalyzer.analyze_plugin(args.plugin, args.web_packages, args.desktop, cache)
+    if cache:
+        cache.save()
+        print(f"   Analysis cache: {cache.parse_hits} parse hit(s), {cache.parse_misses} miss(es); "
+              f"{cache.pair_hits} pair hit(s), {cache.pair_misses} miss(es)")
     
     # Generate report
     if args.format == 'markdown':
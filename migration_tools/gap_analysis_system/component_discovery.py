@@ -5,9 +5,10 @@ Handles finding and discovering web and desktop components for analysis.
 """
 
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from .models import WebComponent, DesktopComponent
+from .analysis_cache import AnalysisCache
 from .web_parser import WebComponentParser
 from .desktop_parser import DesktopComponentParser
 
@@ -16,15 +17,17 @@ class ComponentDiscovery:
     """Discovers components in web and desktop projects."""
     
     @staticmethod
-    def find_web_components(web_path: str, plugin_name: str) -> List[WebComponent]:
-        """Find all web components for a plugin."""
+    def find_web_components(web_path: str, plugin_name: str,
+                            cache: Optional[AnalysisCache] = None) -> List[WebComponent]:
+        """Find all web components for a plugin (parsed through cache, if given)."""
+        parse = cache.web_component if cache else WebComponentParser.parse_component
         components = []
         
         # Search in packages/<plugin>/src/ui/
         plugin_ui_path = Path(web_path) / plugin_name / 'src' / 'ui'
         if plugin_ui_path.exists():
             for tsx_file in plugin_ui_path.glob('*.tsx'):
-                component = WebComponentParser.parse_component(str(tsx_file))
+                component = parse(str(tsx_file))
                 if component:
                     components.append(component)
         
@@ -47,15 +50,17 @@ class ComponentDiscovery:
                 if any(x in ts_file.name.lower() for x in ['event', 'drag', 'drop']):
                     continue
                     
-                component = WebComponentParser.parse_component(str(ts_file))
+                component = parse(str(ts_file))
                 if component:
                     components.append(component)
                     
         return components
     
     @staticmethod
-    def find_desktop_components(desktop_path: str, plugin_name: str) -> List[DesktopComponent]:
-        """Find all desktop components for a plugin."""
+    def find_desktop_components(desktop_path: str, plugin_name: str,
+                                cache: Optional[AnalysisCache] = None) -> List[DesktopComponent]:
+        """Find all desktop components for a plugin (parsed through cache, if given)."""
+        parse = cache.desktop_component if cache else DesktopComponentParser.parse_component
         components = []
         
         # Search in src/RenderX.Plugins.<Plugin>/
@@ -74,7 +79,7 @@ class ComponentDiscovery:
                 # Skip resource dictionaries
                 if 'ResourceDictionary' in axaml_file.read_text(encoding='utf-8', errors='ignore'):
                     continue
-                component = DesktopComponentParser.parse_component(str(axaml_file))
+                component = parse(str(axaml_file))
                 if component:
                     components.append(component)
                     
@@ -7,23 +7,29 @@ Parses and analyzes CSS files for styling information.
 import os
 import re
 from pathlib import Path
-from typing import List
+from typing import List, Optional, TYPE_CHECKING
 
 from .models import CSSAnalysis
+from .source_positions import LineIndex
+
+if TYPE_CHECKING:
+    from .analysis_cache import AnalysisCache
 
 
 class CSSParser:
     """Parses CSS files and analyzes styling."""
     
     @staticmethod
-    def parse_css_files(web_path: str, plugin_name: str) -> List[CSSAnalysis]:
-        """Parse all CSS files for a plugin."""
+    def parse_css_files(web_path: str, plugin_name: str,
+                        cache: Optional['AnalysisCache'] = None) -> List[CSSAnalysis]:
+        """Parse all CSS files for a plugin (through cache, if given)."""
+        parse = cache.css_analyses if cache else CSSParser.parse_css_file
         css_analyses = []
         
         plugin_ui_path = Path(web_path) / plugin_name / 'src' / 'ui'
         if plugin_ui_path.exists():
             for css_file in plugin_ui_path.glob('*.css'):
-                analyses = CSSParser.parse_css_file(str(css_file))
+                analyses = parse(str(css_file))
                 css_analyses.extend(analyses)
                 
         return css_analyses
@@ -42,6 +48,8 @@ class CSSParser:
             return []
             
         analyses = []
+        index = LineIndex(content)
+        has_keyframes = '@keyframes' in content
         
         # Simple CSS class extraction (not perfect but works for most cases)
         pattern = r'\.([a-zA-Z0-9_-]+)\s*\{([^}]+)\}'
@@ -63,18 +71,22 @@ class CSSParser:
             
             # Check for specific grid/pattern backgrounds (like canvas grid)
             has_pattern_bg = bool(re.search(r'radial-gradient|repeating-linear-gradient|url\(["\']?data:image', props_str))
+            position = index.position(match.start())
             
             analysis = CSSAnalysis(
                 class_name=class_name,
                 properties=properties,
                 file_path=file_path,
                 has_hover=':hover' in content[max(0, match.start()-100):match.end()+100],
-                has_animation='animation' in props_str or '@keyframes' in content,
+                has_animation='animation' in props_str or has_keyframes,
                 has_transition='transition' in props_str,
                 has_transform='transform' in props_str,
                 has_gradient='gradient' in props_str or has_pattern_bg,
                 has_shadow='shadow' in props_str,
-                complexity_score=len(properties)
+                complexity_score=len(properties),
+                line_number=position.line,
+                column=position.column,
+                byte_offset=position.byte_offset
             )
             
             # Add metadata for special patterns
@@ -15,6 +15,12 @@ from .models import ComponentFeature
 class DesktopFeatureDetector:
     """Detects features in Avalonia components."""
 
+    @staticmethod
+    def workspace_data_dirs(file_path: str) -> List[Path]:
+        """Workspace folders whose presence detect_features checks (json-components, catalog)."""
+        workspace_root = Path(file_path).parents[2]  # Go up to workspace root
+        return [workspace_root / 'json-components', workspace_root / 'catalog' / 'json-plugins']
+
     @staticmethod
     def detect_features(axaml_content: str, cs_content: str, file_path: str) -> List[ComponentFeature]:
         """Detect all features in the component code."""
@@ -198,9 +204,9 @@ class DesktopFeatureDetector:
 
         # CRITICAL: Detect missing file loading when JSON component folders exist
         # Check if json-components or catalog folders exist in workspace
-        workspace_root = Path(file_path).parents[2]  # Go up to workspace root
-        json_components_exists = (workspace_root / 'json-components').exists()
-        catalog_exists = (workspace_root / 'catalog' / 'json-plugins').exists()
+        json_components_dir, catalog_dir = DesktopFeatureDetector.workspace_data_dirs(file_path)
+        json_components_exists = json_components_dir.exists()
+        catalog_exists = catalog_dir.exists()
 
         if (json_components_exists or catalog_exists) and 'Library' in file_path:
             # Check if file loading is implemented
@@ -6,7 +6,7 @@ Performs parity checks on components, features, UI elements, layout, styling, an
 """
 
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from .models import Gap, WebComponent, DesktopComponent, CSSAnalysis, PluginAnalysis
 from .advanced_gap_detector import AdvancedGapDetector
@@ -72,26 +72,58 @@ class GapDetector:
         return matches
 
 
+    # Detectors that compare one web component with its desktop equivalent(s); their
+    # gaps only change when one side of the pair does (see AnalysisCache.pair_gaps)
+    PAIR_DETECTORS = (
+        '_detect_feature_gaps',
+        '_detect_ui_element_gaps',
+        '_detect_text_parity_gaps',
+        '_detect_layout_gaps',
+        '_detect_conditional_ui_gaps',
+        '_detect_content_constraint_gaps',
+    )
+
+    @staticmethod
+    def detect_pair_gaps(web_comp: WebComponent,
+                         desktop_equivalents: List[DesktopComponent]) -> Dict[str, List[Gap]]:
+        """Gaps of each pair detector for one web component against its desktop equivalents."""
+        return {name: getattr(GapDetector, name)([web_comp], desktop_equivalents)
+                for name in GapDetector.PAIR_DETECTORS}
+
     @staticmethod
     def detect_gaps(web_components: List[WebComponent],
                    desktop_components: List[DesktopComponent],
                    css_analyses: List[CSSAnalysis],
-                   feature_map_path: Path = None) -> List[Gap]:
-        """Detect gaps between web and desktop implementations."""
+                   feature_map_path: Path = None,
+                   pair_gaps: Optional[List[Dict[str, List[Gap]]]] = None) -> List[Gap]:
+        """Detect gaps between web and desktop implementations.
+
+        pair_gaps holds detect_pair_gaps() for each web component, in order; callers
+        with a cache pass it in so unchanged pairs are not compared again.
+        """
+        if pair_gaps is None:
+            pair_gaps = [
+                GapDetector.detect_pair_gaps(web_comp, GapDetector._find_desktop_equivalent(web_comp.name, desktop_components))
+                for web_comp in web_components
+            ]
+
+        def paired(name: str) -> List[Gap]:
+            return [gap for comp_gaps in pair_gaps for gap in comp_gaps[name]]
+
         gaps = []
 
         # Component existence gaps
         gaps.extend(GapDetector._detect_component_gaps(web_components, desktop_components))
 
         # Feature and parity gaps for matching components
-        gaps.extend(GapDetector._detect_feature_gaps(web_components, desktop_components))
-        gaps.extend(GapDetector._detect_ui_element_gaps(web_components, desktop_components))
-        gaps.extend(GapDetector._detect_text_parity_gaps(web_components, desktop_components))
+        gaps.extend(paired('_detect_feature_gaps'))
+        gaps.extend(paired('_detect_ui_element_gaps'))
+        gaps.extend(paired('_detect_text_parity_gaps'))
         gaps.extend(GapDetector._detect_text_truncation_gaps(desktop_components))
-        gaps.extend(GapDetector._detect_layout_gaps(web_components, desktop_components))
-        gaps.extend(GapDetector._detect_conditional_ui_gaps(web_components, desktop_components))
+        gaps.extend(paired('_detect_layout_gaps'))
+        gaps.extend(paired('_detect_conditional_ui_gaps'))
         gaps.extend(GapDetector._detect_container_layout_gaps(web_components, desktop_components))
-        gaps.extend(GapDetector._detect_content_constraint_gaps(web_components, desktop_components))
+        gaps.extend(paired('_detect_content_constraint_gaps'))
         gaps.extend(AdvancedGapDetector.detect_css_gaps(css_analyses, desktop_components))
         gaps.extend(AdvancedGapDetector.detect_plugin_level_gaps(web_components, desktop_components))
 
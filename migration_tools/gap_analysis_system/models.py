@@ -17,6 +17,7 @@ class ComponentFeature:
     code_snippet: Optional[str] = None
     file_path: Optional[str] = None
     line_number: Optional[int] = None
+    column: Optional[int] = None
 
 
 @dataclass
@@ -73,6 +74,9 @@ class CSSAnalysis:
     has_gradient: bool = False
     has_shadow: bool = False
     complexity_score: int = 0
+    line_number: Optional[int] = None
+    column: Optional[int] = None
+    byte_offset: Optional[int] = None
 
 
 @dataclass
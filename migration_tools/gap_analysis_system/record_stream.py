@@ -0,0 +1,75 @@
+"""
+Record Stream
+
+NDJSON output for the scanners' reports: one JSON object per line, written as
+records are produced, so a report never has to exist as a single string.
+
+The first line is a header naming the stream (and carrying report-level
+settings such as group_by); every following line is one record. Readers
+check the stream name so a CSS stream is never loaded as log messages.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Union
+
+FORMAT_VERSION = 1
+
+
+class RecordWriter:
+    """Writes a header line, then one compact JSON record per line."""
+
+    def __init__(self, path: Union[str, Path], stream: str, **header):
+        self.path = Path(path)
+        self.count = 0
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self._write_line({'stream': stream, 'version': FORMAT_VERSION, **header})
+
+    def _write_line(self, obj: Dict):
+        self._file.write(json.dumps(obj, separators=(',', ':')))
+        self._file.write('\n')
+
+    def write(self, record: Dict):
+        self._write_line(record)
+        self.count += 1
+
+    def write_all(self, records: Iterable[Dict]) -> int:
+        for record in records:
+            self.write(record)
+        return self.count
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self) -> 'RecordWriter':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_header(path: Union[str, Path], stream: str) -> Dict:
+    """Header of a record stream; raises ValueError if it is not a `stream` stream."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return _check_header(f.readline(), path, stream)
+
+
+def iter_records(path: Union[str, Path], stream: str) -> Iterator[Dict]:
+    """Records of a `stream` stream, one at a time, without the header."""
+    with open(path, 'r', encoding='utf-8') as f:
+        _check_header(f.readline(), path, stream)
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _check_header(line: str, path: Union[str, Path], stream: str) -> Dict:
+    try:
+        header = json.loads(line)
+    except json.JSONDecodeError:
+        header = None
+    if not isinstance(header, dict) or header.get('stream') != stream:
+        raise ValueError(f"{path} is not a '{stream}' record stream")
+    if header.get('version') != FORMAT_VERSION:
+        raise ValueError(f"{path}: unsupported record stream version {header.get('version')}")
+    return header
@@ -0,0 +1,124 @@
+"""
+Source Corpus
+
+One crawl of a source tree whose decoded file contents are shared by every
+scanner that reads it. Scanners given a corpus take their file lists from
+files_under() and their text from read() instead of walking and opening the
+tree themselves, so back-to-back scanners read each file from disk once.
+
+Decoded text is kept in an LRU bounded by total characters.
+"""
+
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Union
+
+# Directories no scanner looks into (scanners can exclude more per call)
+IGNORED_DIRS = frozenset({'node_modules', '.git', 'dist', '__pycache__', '.pytest_cache', '.vscode'})
+
+DEFAULT_MAX_CHARS = 512 * 1024 * 1024
+
+
+class SourceCorpus:
+    """Files under one root, crawled once, with an LRU of decoded contents."""
+
+    def __init__(self, root: Union[str, Path], ignored_dirs: Iterable[str] = IGNORED_DIRS,
+                 max_chars: int = DEFAULT_MAX_CHARS):
+        self.root = Path(root)
+        self.ignored_dirs = frozenset(ignored_dirs)
+        self.max_chars = max_chars
+        self._files: Optional[List[Path]] = None
+        # path -> (text decoded with errors='ignore', UnicodeDecodeError of a strict decode or None)
+        self._texts: 'OrderedDict[str, Tuple[str, Optional[UnicodeDecodeError]]]' = OrderedDict()
+        self._chars = 0
+        self.reads = 0
+        self.hits = 0
+
+    @property
+    def files(self) -> List[Path]:
+        """Every file under the root, in walk order (crawled on first use)."""
+        if self._files is None:
+            self._files = []
+            for root, dirs, names in os.walk(self.root):
+                dirs[:] = [d for d in dirs if d not in self.ignored_dirs]
+                self._files.extend(Path(root) / name for name in names)
+        return self._files
+
+    def files_under(self, path: Union[str, Path], extensions: Optional[Iterable[str]] = None,
+                    exclude_dirs: Iterable[str] = ()) -> List[Path]:
+        """Files under path (which must lie inside the root), optionally filtered by suffix.
+
+        Files inside a directory named in exclude_dirs (below path) are skipped.
+        """
+        path = Path(path)
+        if os.path.abspath(path) == os.path.abspath(self.root):
+            prefix = ''
+        else:
+            relative = os.path.relpath(path, self.root)
+            if relative == os.pardir or relative.startswith(os.pardir + os.sep):
+                raise ValueError(f"{path} is outside the corpus root {self.root}")
+            prefix = str(self.root / relative) + os.sep
+        suffixes = tuple(extensions) if extensions is not None else None
+        exclude = frozenset(exclude_dirs)
+        start = len(prefix) if prefix else len(str(self.root)) + 1
+        found = []
+        for file_path in self.files:
+            name = str(file_path)
+            if prefix and not name.startswith(prefix):
+                continue
+            if suffixes is not None and file_path.suffix not in suffixes:
+                continue
+            if exclude and not exclude.isdisjoint(name[start:].split(os.sep)[:-1]):
+                continue
+            found.append(file_path)
+        return found
+
+    def read(self, path: Union[str, Path], errors: str = 'strict') -> str:
+        """Text of a file as open(path, encoding='utf-8', errors=errors).read() returns it.
+
+        Raises OSError if the file cannot be read and, with errors='strict',
+        UnicodeDecodeError if it is not valid UTF-8.
+        """
+        if errors not in ('strict', 'ignore'):
+            raise ValueError(f"unsupported errors mode: {errors}")
+        key = str(path)
+        cached = self._texts.get(key)
+        if cached is not None:
+            self.hits += 1
+            self._texts.move_to_end(key)
+        else:
+            cached = self._load(path)
+            self._texts[key] = cached
+            self._chars += len(cached[0])
+            while self._chars > self.max_chars and len(self._texts) > 1:
+                _, (evicted, _) = self._texts.popitem(last=False)
+                self._chars -= len(evicted)
+        text, error = cached
+        if error is not None and errors == 'strict':
+            raise error
+        return text
+
+    def read_lines(self, path: Union[str, Path], errors: str = 'strict') -> List[str]:
+        """Lines of a file, with their newlines, as readlines() returns them."""
+        lines = self.read(path, errors).split('\n')
+        last = lines.pop()
+        lines = [line + '\n' for line in lines]
+        if last:
+            lines.append(last)
+        return lines
+
+    def _load(self, path: Union[str, Path]) -> Tuple[str, Optional[UnicodeDecodeError]]:
+        with open(path, 'rb') as f:
+            data = f.read()
+        self.reads += 1
+        error = None
+        try:
+            text = data.decode('utf-8')
+        except UnicodeDecodeError as e:
+            error = e
+            text = data.decode('utf-8', errors='ignore')
+        # Universal newlines, as text-mode open() translates them
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text, error
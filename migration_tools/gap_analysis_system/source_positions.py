@@ -0,0 +1,80 @@
+"""
+Source Positions
+
+Maps character offsets in a source text (e.g. regex match positions) to
+line, column and UTF-8 byte offsets. Newline offsets are computed once per
+file; each lookup is a bisect, so locating every match in a file is
+O(matches * log lines) instead of rescanning the prefix per match.
+"""
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class SourcePosition:
+    """A position in a source file."""
+    line: int         # 1-based
+    column: int       # 1-based, in characters
+    offset: int       # 0-based character offset
+    byte_offset: int  # 0-based UTF-8 byte offset
+
+
+class LineIndex:
+    """Precomputed line starts for one source text."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self._lines = text.split('\n')
+        # Character offset at which each line starts
+        self.line_starts: List[int] = list(accumulate((len(line) + 1 for line in self._lines[:-1]), initial=0))
+        self._ascii = text.isascii()
+        self._byte_starts: Optional[List[int]] = None
+
+    @property
+    def line_count(self) -> int:
+        return len(self.line_starts)
+
+    def line_of(self, offset: int) -> int:
+        """1-based line containing a character offset."""
+        return bisect_right(self.line_starts, offset)
+
+    def line_text(self, line: int) -> str:
+        """Text of a 1-based line, without its newline."""
+        return self._lines[line - 1]
+
+    def column_of(self, offset: int) -> int:
+        """1-based column of a character offset."""
+        return offset - self.line_starts[self.line_of(offset) - 1] + 1
+
+    def byte_offset_of(self, offset: int) -> int:
+        """UTF-8 byte offset of a character offset."""
+        if self._ascii:
+            return offset
+        if self._byte_starts is None:
+            self._byte_starts = list(accumulate(
+                (len(line.encode('utf-8')) + 1 for line in self._lines[:-1]), initial=0))
+        line = self.line_of(offset) - 1
+        start = self.line_starts[line]
+        return self._byte_starts[line] + len(self.text[start:offset].encode('utf-8'))
+
+    def position(self, offset: int) -> SourcePosition:
+        line = self.line_of(offset)
+        return SourcePosition(
+            line=line,
+            column=offset - self.line_starts[line - 1] + 1,
+            offset=offset,
+            byte_offset=self.byte_offset_of(offset),
+        )
+
+    def span(self, start: int, end: int) -> Tuple[SourcePosition, SourcePosition]:
+        """Start and end positions of a [start, end) character range."""
+        return self.position(start), self.position(end)
+
+
+def blank_comments(text: str, pattern: str = r'/\*.*?\*/') -> str:
+    """Replace comments with spaces, keeping newlines, so offsets still match the original text."""
+    return re.sub(pattern, lambda m: re.sub(r'[^\n]', ' ', m.group(0)), text, flags=re.DOTALL)
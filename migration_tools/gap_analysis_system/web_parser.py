@@ -10,11 +10,15 @@ from pathlib import Path
 from typing import List, Dict, Optional, Any
 
 from .models import WebComponent, ComponentFeature
+from .source_positions import LineIndex
 
 
 class WebComponentParser:
     """Parses React/TypeScript components."""
     
+    # Stylesheet import; the component's css_file is the imported path if it exists
+    CSS_IMPORT_PATTERN = r'import\s+[\'"](.+\.css)[\'"]'
+    
     @staticmethod
     def parse_component(file_path: str) -> Optional[WebComponent]:
         """Parse a React component file."""
@@ -68,7 +72,7 @@ class WebComponentParser:
             
         # Find CSS file
         css_file = None
-        css_import = re.search(r'import\s+[\'"](.+\.css)[\'"]', content)
+        css_import = re.search(WebComponentParser.CSS_IMPORT_PATTERN, content)
         if css_import:
             css_path = Path(file_path).parent / css_import.group(1)
             if css_path.exists():
@@ -251,117 +255,151 @@ class WebComponentParser:
     def _detect_features(content: str, file_path: str) -> List[ComponentFeature]:
         """Detect features in the component code."""
         features = []
+        index = LineIndex(content)
+        
+        def at(match) -> dict:
+            """Where a detection matched, so the feature links to its source"""
+            position = index.position(match.start())
+            return {'file_path': file_path, 'line_number': position.line, 'column': position.column}
         
         # Detect drag and drop with ghost image
-        if re.search(r'setDragImage|drag.*image|ghost.*image|drag.*preview', content, re.IGNORECASE):
+        match = re.search(r'setDragImage|drag.*image|ghost.*image|drag.*preview', content, re.IGNORECASE)
+        if match:
             features.append(ComponentFeature(
                 name='Drag Ghost Image',
                 description='Implements custom drag preview/ghost image during drag operations',
-                implementation_type='interaction'
+                implementation_type='interaction',
+                **at(match)
             ))
         
         # Detect drag and drop (general)
-        if re.search(r'onDrag|useDrag|Draggable|handleDrag', content, re.IGNORECASE):
+        match = re.search(r'onDrag|useDrag|Draggable|handleDrag', content, re.IGNORECASE)
+        if match:
             features.append(ComponentFeature(
                 name='Drag and Drop',
                 description='Implements drag and drop functionality',
-                implementation_type='interaction'
+                implementation_type='interaction',
+                **at(match)
             ))
             
         # Detect modal/dialog
-        if re.search(r'modal|dialog|backdrop', content, re.IGNORECASE):
+        match = re.search(r'modal|dialog|backdrop', content, re.IGNORECASE)
+        if match:
             features.append(ComponentFeature(
                 name='Modal/Dialog',
                 description='Implements modal or dialog UI pattern',
-                implementation_type='ui'
+                implementation_type='ui',
+                **at(match)
             ))
             
         # Detect animations
-        if re.search(r'transition|animation|transform|@keyframes', content, re.IGNORECASE):
+        match = re.search(r'transition|animation|transform|@keyframes', content, re.IGNORECASE)
+        if match:
             features.append(ComponentFeature(
                 name='Animations',
                 description='Includes animations or transitions',
-                implementation_type='style'
+                implementation_type='style',
+                **at(match)
             ))
             
         # Detect API calls
-        if re.search(r'fetch|axios|api\.|\.get\(|\.post\(', content):
+        match = re.search(r'fetch|axios|api\.|\.get\(|\.post\(', content)
+        if match:
             features.append(ComponentFeature(
                 name='API Integration',
                 description='Makes API calls or network requests',
-                implementation_type='logic'
+                implementation_type='logic',
+                **at(match)
             ))
             
         # Detect form handling
-        if re.search(r'onSubmit|handleSubmit|form|input.*onChange', content):
+        match = re.search(r'onSubmit|handleSubmit|form|input.*onChange', content)
+        if match:
             features.append(ComponentFeature(
                 name='Form Handling',
                 description='Implements form input and submission',
-                implementation_type='interaction'
+                implementation_type='interaction',
+                **at(match)
             ))
             
         # Detect error boundaries
-        if re.search(r'ErrorBoundary|componentDidCatch|getDerivedStateFromError', content):
+        match = re.search(r'ErrorBoundary|componentDidCatch|getDerivedStateFromError', content)
+        if match:
             features.append(ComponentFeature(
                 name='Error Handling',
                 description='Implements error boundary or error handling',
-                implementation_type='logic'
+                implementation_type='logic',
+                **at(match)
             ))
             
         # Detect file upload
-        if re.search(r'FileReader|file.*upload|drop.*file|accept=', content, re.IGNORECASE):
+        match = re.search(r'FileReader|file.*upload|drop.*file|accept=', content, re.IGNORECASE)
+        if match:
             features.append(ComponentFeature(
                 name='File Upload',
                 description='Handles file uploads',
-                implementation_type='interaction'
+                implementation_type='interaction',
+                **at(match)
             ))
             
         # Detect search/filter
-        if re.search(r'search|filter|query', content, re.IGNORECASE):
+        match = re.search(r'search|filter|query', content, re.IGNORECASE)
+        if match:
             features.append(ComponentFeature(
                 name='Search/Filter',
                 description='Implements search or filtering functionality',
-                implementation_type='interaction'
+                implementation_type='interaction',
+                **at(match)
             ))
             
         # Detect virtualization
-        if re.search(r'virtual|infinite.*scroll|lazy.*load', content, re.IGNORECASE):
+        match = re.search(r'virtual|infinite.*scroll|lazy.*load', content, re.IGNORECASE)
+        if match:
             features.append(ComponentFeature(
                 name='Virtualization',
                 description='Implements virtual scrolling or lazy loading',
-                implementation_type='ui'
+                implementation_type='ui',
+                **at(match)
             ))
         
         # Detect JSON component metadata extraction
-        if re.search(r'data-icon|data-description|template\.attributes|metadata\.icon|computePreviewModel|component\?\.template', content):
+        match = re.search(r'data-icon|data-description|template\.attributes|metadata\.icon|computePreviewModel|component\?\.template', content)
+        if match:
             features.append(ComponentFeature(
                 name='JSON Metadata Extraction',
                 description='Extracts metadata (icons, descriptions, attributes) from JSON component definitions',
-                implementation_type='logic'
+                implementation_type='logic',
+                **at(match)
             ))
         
         # Detect dynamic CSS injection
-        if re.search(r'<style>.*cssText|cssVariables|varsToStyle|style\.setProperty', content):
+        match = re.search(r'<style>.*cssText|cssVariables|varsToStyle|style\.setProperty', content)
+        if match:
             features.append(ComponentFeature(
                 name='Dynamic CSS Injection',
                 description='Dynamically injects CSS styles and variables from component data',
-                implementation_type='style'
+                implementation_type='style',
+                **at(match)
             ))
         
         # Detect emoji/icon rendering
-        if re.search(r'emoji|🧩|💡|⚠️|✅|❌|📦|icon.*emoji|component-icon.*\{', content):
+        match = re.search(r'emoji|🧩|💡|⚠️|✅|❌|📦|icon.*emoji|component-icon.*\{', content)
+        if match:
             features.append(ComponentFeature(
                 name='Emoji Icon Display',
                 description='Displays emoji icons extracted from component metadata',
-                implementation_type='ui'
+                implementation_type='ui',
+                **at(match)
             ))
         
         # Detect component card rendering
-        if re.search(r'library-component-item|component-card|card.*style|preview.*model', content, re.IGNORECASE):
+        match = re.search(r'library-component-item|component-card|card.*style|preview.*model', content, re.IGNORECASE)
+        if match:
             features.append(ComponentFeature(
                 name='Component Card Rendering',
                 description='Renders component preview cards with styling from JSON data',
-                implementation_type='ui'
+                implementation_type='ui',
+                **at(match)
             ))
             
         return features
@@ -14,12 +14,16 @@ Options:
     --group-by TYPE      : Group by 'file', 'level', or 'package' (default: file)
     --show-line-numbers  : Include line numbers in the output
     --stats              : Show statistics summary
-    --format FORMAT      : Output format: 'tree', 'flat', or 'json' (default: tree)
+    --format FORMAT      : Output format: 'tree', 'flat', 'json' or 'ndjson' (default: tree);
+                           ndjson streams one message per line to --output while scanning
+    --from-ndjson FILE   : Build the report from a streamed scan instead of scanning
 
 Examples:
     python log_message_scanner.py packages
     python log_message_scanner.py packages --group-by level --stats
     python log_message_scanner.py packages --output log_messages.txt --show-line-numbers
+    python log_message_scanner.py packages --format ndjson --output log_messages.ndjson
+    python log_message_scanner.py --from-ndjson log_messages.ndjson --group-by level --stats
 """
 
 import os
@@ -27,10 +31,13 @@ import re
 import json
 import argparse
 from pathlib import Path
-from typing import List, Dict, Set, Tuple
+from typing import List, Dict, Iterator, Set, Tuple, Optional
 from collections import defaultdict
 from dataclasses import dataclass, asdict
 
+from gap_analysis_system.record_stream import RecordWriter, iter_records
+from gap_analysis_system.source_corpus import SourceCorpus
+
 
 @dataclass
 class LogMessage:
@@ -75,11 +82,13 @@ class LogScanner:
                  extensions: List[str] = None,
                  show_line_numbers: bool = False,
                  group_by: str = 'file',
-                 output_format: str = 'tree'):
+                 output_format: str = 'tree',
+                 corpus: Optional[SourceCorpus] = None):
         self.extensions = extensions or ['.ts', '.tsx', '.js', '.jsx']
         self.show_line_numbers = show_line_numbers
         self.group_by = group_by
         self.output_format = output_format
+        self.corpus = corpus  # shared crawl and file contents (see run_all_scanners.py)
         self.log_messages: List[LogMessage] = []
         
     def should_scan_file(self, file_path: Path) -> bool:
@@ -115,8 +124,11 @@ class LogScanner:
         messages = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
+            if self.corpus is not None:
+                lines = self.corpus.read_lines(file_path, errors='ignore')
+            else:
+                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                    lines = f.readlines()
                 
             for line_num, line in enumerate(lines, start=1):
                 # Skip commented lines
@@ -159,25 +171,59 @@ class LogScanner:
         
         return messages
     
+    def iter_files(self, root_path: Path) -> Iterator[Path]:
+        """Files under root_path that scan_directory reads, in scan order."""
+        if self.corpus is not None:
+            candidates = self.corpus.files_under(root_path, self.extensions)
+        else:
+            candidates = root_path.rglob('*')
+        
+        for file_path in candidates:
+            if file_path.is_file() and self.should_scan_file(file_path):
+                # Skip node_modules and dist folders
+                if 'node_modules' in str(file_path) or '/dist/' in str(file_path) or '\\dist\\' in str(file_path):
+                    continue
+                yield file_path
+    
     def scan_directory(self, root_path: Path) -> List[LogMessage]:
         """Recursively scan directory for log messages."""
         all_messages = []
         
         print(f"Scanning directory: {root_path}")
         
-        for file_path in root_path.rglob('*'):
-            if file_path.is_file() and self.should_scan_file(file_path):
-                # Skip node_modules and dist folders
-                if 'node_modules' in str(file_path) or '/dist/' in str(file_path) or '\\dist\\' in str(file_path):
-                    continue
-                
-                messages = self.scan_file(file_path)
-                all_messages.extend(messages)
+        for file_path in self.iter_files(root_path):
+            messages = self.scan_file(file_path)
+            all_messages.extend(messages)
         
         print(f"Found {len(all_messages)} log messages in {len(set(msg.file_path for msg in all_messages))} files")
         
         return all_messages
     
+    def stream_json_output(self, root_path: Path, output_path: str) -> int:
+        """Scan root_path, writing each file's messages to output_path as NDJSON as soon as it is scanned.
+        
+        Memory stays flat however large the report is; read_json_stream() loads it back.
+        Returns the number of messages written.
+        """
+        print(f"Scanning directory: {root_path}")
+        
+        files_with_messages = 0
+        with RecordWriter(output_path, 'log-messages', group_by=self.group_by) as writer:
+            for file_path in self.iter_files(root_path):
+                messages = self.scan_file(file_path)
+                if messages:
+                    files_with_messages += 1
+                    writer.write_all(asdict(msg) for msg in messages)
+        
+        print(f"Found {writer.count} log messages in {files_with_messages} files")
+        
+        return writer.count
+    
+    def read_json_stream(self, stream_path: str) -> List[LogMessage]:
+        """Load the messages written by stream_json_output, so the reports can be generated from them."""
+        self.log_messages = [LogMessage(**record) for record in iter_records(stream_path, 'log-messages')]
+        return self.log_messages
+    
     def group_messages(self, messages: List[LogMessage]) -> Dict:
         """Group messages according to the grouping strategy."""
         grouped = defaultdict(list)
@@ -355,15 +401,19 @@ class LogScanner:
         # Scan for log messages
         self.log_messages = self.scan_directory(path)
         
-        if not self.log_messages:
+        return self.generate_report(self.log_messages)
+    
+    def generate_report(self, messages: List[LogMessage]) -> str:
+        """Generate the report for scanned (or streamed) messages in the configured format."""
+        if not messages:
             return "No log messages found."
         
         # Group messages
-        grouped = self.group_messages(self.log_messages)
+        grouped = self.group_messages(messages)
         
         # Generate output based on format
         if self.output_format == 'json':
-            output = self.generate_json_output(self.log_messages)
+            output = self.generate_json_output(messages)
         elif self.output_format == 'flat':
             output = self.generate_flat_output(grouped)
         else:  # tree
@@ -383,6 +433,8 @@ Examples:
   %(prog)s packages --group-by package --stats         # Group by package with stats
   %(prog)s packages --output logs.txt --show-line-numbers  # Save with line numbers
   %(prog)s packages --format json --output logs.json   # Export as JSON
+  %(prog)s packages --format ndjson --output logs.ndjson   # Stream one message per line
+  %(prog)s --from-ndjson logs.ndjson --group-by level  # Report from a streamed scan
         """
     )
     
@@ -399,11 +451,17 @@ Examples:
                        help='Include line numbers in output')
     parser.add_argument('--stats', action='store_true',
                        help='Show statistics summary')
-    parser.add_argument('--format', choices=['tree', 'flat', 'json'],
+    parser.add_argument('--format', choices=['tree', 'flat', 'json', 'ndjson'],
                        default='tree',
-                       help='Output format (default: tree)')
+                       help='Output format (default: tree); ndjson streams to --output while scanning')
+    parser.add_argument('--from-ndjson', metavar='FILE',
+                       help='Generate the report from a streamed scan instead of scanning')
     
     args = parser.parse_args()
+    if args.format == 'ndjson' and not args.output:
+        parser.error('--format ndjson requires --output')
+    if args.format == 'ndjson' and args.from_ndjson:
+        parser.error('--from-ndjson cannot be combined with --format ndjson')
     
     # Create scanner
     extensions = args.include_ext if args.include_ext else ['.ts', '.tsx', '.js', '.jsx']
@@ -414,8 +472,19 @@ Examples:
         output_format=args.format
     )
     
+    if args.format == 'ndjson':
+        if not Path(args.path).exists():
+            print(f"Error: Path '{args.path}' does not exist.")
+            return
+        count = scanner.stream_json_output(Path(args.path), args.output)
+        print(f"Streamed {count} log messages to '{args.output}'")
+        return
+    
     # Generate report
-    report = scanner.scan_and_generate_report(args.path)
+    if args.from_ndjson:
+        report = scanner.generate_report(scanner.read_json_stream(args.from_ndjson))
+    else:
+        report = scanner.scan_and_generate_report(args.path)
     
     # Add stats if requested
     if args.stats and scanner.log_messages:
@@ -18,11 +18,18 @@ Usage:
 import json
 from pathlib import Path
 from collections import defaultdict, Counter
-from typing import Dict, List, Tuple, Set
+from typing import Callable, Dict, List, Optional, Tuple, Set
 from dataclasses import dataclass
+from bisect import bisect_right
+import math
 import re
 
 
+EMOJI_PREFIX = re.compile(r'^[🎼🎵🥁📡✅❌⚠️🔴🟡🔵▶️📊📈📝🔄🧹🎭]+\s*')
+TEMPLATE_PARAM = re.compile(r'\{[^}]+\}')
+JS_TEMPLATE_PARAM = re.compile(r'\$\{[^}]+\}')
+
+
 @dataclass
 class ParityGap:
     """Represents a logging gap between web and desktop"""
@@ -40,6 +47,119 @@ class ParityGap:
     recommendation: str = ""
 
 
+def message_similarity(msg1: str, msg2: str, words1: Set[str], words2: Set[str]) -> float:
+    """Similarity of two normalized messages, given their word sets"""
+    if not msg1 or not msg2:
+        return 0.0
+    
+    # Exact match after normalization
+    if msg1 == msg2:
+        return 1.0
+    
+    # Check if one contains the other
+    if msg1 in msg2 or msg2 in msg1:
+        shorter = min(len(msg1), len(msg2))
+        longer = max(len(msg1), len(msg2))
+        return shorter / longer
+    
+    # Simple word overlap
+    if not words1 or not words2:
+        return 0.0
+    
+    intersection = len(words1 & words2)
+    return intersection / (len(words1) + len(words2) - intersection)
+
+
+class MessageIndex:
+    """Log entries indexed for best-match lookup by normalized message.
+    
+    Every message is normalized once and an inverted word -> entries map is built.
+    A lookup scores only entries that can reach the best similarity:
+    
+    - entries where one message contains the other (scored by length ratio) are
+      found directly: entries containing the query by a substring search over all
+      messages, entries inside the query through their second word, which must
+      be a whole word of the query (entries with fewer than three words are
+      checked one by one);
+    - for word overlap, an entry with Jaccard similarity >= t shares at least
+      ceil(t * n) of the query's n words, so it must contain one of the query's
+      n - ceil(t * n) + 1 rarest words. Postings are read rarest word first and
+      the read stops once the best score so far rules out the remaining words.
+    
+    Results equal a scan over all entries, ties included (earliest entry wins).
+    """
+
+    def __init__(self, entries: List[Dict], normalize: Callable[[str], str]):
+        self.entries = entries
+        self.messages = [normalize(entry['message']) for entry in entries]
+        self.words = [set(message.split()) for message in self.messages]
+        self.postings: Dict[str, List[int]] = defaultdict(list)
+        self.by_second_word: Dict[str, List[int]] = defaultdict(list)
+        self.short: List[int] = []
+        for i, (message, words) in enumerate(zip(self.messages, self.words)):
+            for word in words:
+                self.postings[word].append(i)
+            if len(words) >= 3:
+                self.by_second_word[message.split(maxsplit=2)[1]].append(i)
+            elif message:
+                self.short.append(i)
+        # All messages on one line each, to find those containing the query
+        self.text = '\n'.join(self.messages)
+        self.starts = []
+        offset = 0
+        for message in self.messages:
+            self.starts.append(offset)
+            offset += len(message) + 1
+
+    def containing(self, message: str, words: Set[str]) -> Set[int]:
+        """Entries that contain ``message`` or are contained in it"""
+        found = set()
+        pos = self.text.find(message)
+        while pos != -1:
+            i = bisect_right(self.starts, pos) - 1
+            found.add(i)
+            if i + 1 >= len(self.starts):
+                break
+            pos = self.text.find(message, self.starts[i + 1])
+        for word in words:
+            found.update(i for i in self.by_second_word.get(word, ()) if self.messages[i] in message)
+        found.update(i for i in self.short if self.messages[i] in message)
+        return found
+
+    def best_match(self, message: str) -> Tuple[Optional[Dict], float]:
+        """Most similar entry (the earliest on ties) and its similarity"""
+        if not message:
+            return None, 0.0
+        
+        words = set(message.split())
+        best_similarity = 0.0
+        best = -1
+        scored = self.containing(message, words)
+        for i in scored:
+            similarity = message_similarity(message, self.messages[i], words, self.words[i])
+            if similarity > best_similarity or (similarity == best_similarity and similarity > 0 and i < best):
+                best_similarity, best = similarity, i
+        
+        rarest_first = sorted((w for w in words if w in self.postings), key=lambda w: (len(self.postings[w]), w))
+        n = len(words)
+        entry_words = self.words
+        for k, word in enumerate(rarest_first):
+            # Words past the prefix can only add entries scoring below the best so far
+            if k > n - math.ceil(best_similarity * n - 1e-9):
+                break
+            for i in self.postings[word]:
+                if i in scored:
+                    continue
+                scored.add(i)
+                # Neither message contains the other (those were scored above): word overlap only
+                overlap = len(words & entry_words[i])
+                similarity = overlap / (n + len(entry_words[i]) - overlap)
+                if similarity > best_similarity or (similarity == best_similarity and i < best):
+                    best_similarity, best = similarity, i
+        
+        return (self.entries[best] if best >= 0 else None), best_similarity
+
+
 class LoggingParityAnalyzer:
     """Analyzes parity between web and desktop logging"""
 
@@ -162,8 +282,9 @@ class LoggingParityAnalyzer:
             return
         
         # Match web logs to desktop logs
+        desktop_index = MessageIndex(desktop_entries, self._normalize_message)
         for web_entry in web_entries:
-            best_match, similarity = self._find_best_match(web_entry, desktop_entries)
+            best_match, similarity = self._find_best_match(web_entry, desktop_index)
             
             if similarity < 0.3:
                 # No match found - missing in desktop
@@ -201,34 +322,21 @@ class LoggingParityAnalyzer:
                     )
                     self.gaps.append(gap)
 
-    def _find_best_match(self, web_entry: Dict, desktop_entries: List[Dict]) -> Tuple[Dict, float]:
+    def _find_best_match(self, web_entry: Dict, desktop_index: 'MessageIndex') -> Tuple[Dict, float]:
         """Find the best matching desktop log entry for a web entry"""
-        best_match = None
-        best_similarity = 0.0
-        
-        web_message = self._normalize_message(web_entry['message'])
-        
-        for desktop_entry in desktop_entries:
-            desktop_message = self._normalize_message(desktop_entry['message'])
-            similarity = self._calculate_similarity(web_message, desktop_message)
-            
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_match = desktop_entry
-        
-        return best_match, best_similarity
+        return desktop_index.best_match(self._normalize_message(web_entry['message']))
 
     def _normalize_message(self, message: str) -> str:
         """Normalize a log message for comparison"""
         # Remove common prefixes/emojis
-        message = re.sub(r'^[🎼🎵🥁📡✅❌⚠️🔴🟡🔵▶️📊📈📝🔄🧹🎭]+\s*', '', message)
+        message = EMOJI_PREFIX.sub('', message)
         
         # Remove quotes
         message = message.replace('"', '').replace("'", '')
         
         # Remove template parameters {xxx} and ${}
-        message = re.sub(r'\{[^}]+\}', '{param}', message)
-        message = re.sub(r'\$\{[^}]+\}', '{param}', message)
+        message = TEMPLATE_PARAM.sub('{param}', message)
+        message = JS_TEMPLATE_PARAM.sub('{param}', message)
         
         # Normalize whitespace
         message = ' '.join(message.split())
@@ -240,30 +348,7 @@ class LoggingParityAnalyzer:
 
     def _calculate_similarity(self, msg1: str, msg2: str) -> float:
         """Calculate similarity score between two messages"""
-        if not msg1 or not msg2:
-            return 0.0
-        
-        # Exact match after normalization
-        if msg1 == msg2:
-            return 1.0
-        
-        # Check if one contains the other
-        if msg1 in msg2 or msg2 in msg1:
-            shorter = min(len(msg1), len(msg2))
-            longer = max(len(msg1), len(msg2))
-            return shorter / longer
-        
-        # Simple word overlap
-        words1 = set(msg1.split())
-        words2 = set(msg2.split())
-        
-        if not words1 or not words2:
-            return 0.0
-        
-        intersection = words1 & words2
-        union = words1 | words2
-        
-        return len(intersection) / len(union)
+        return message_similarity(msg1, msg2, set(msg1.split()), set(msg2.split()))
 
     def _generate_recommendation(self, web_entry: Dict, desktop_entry: Dict) -> str:
         """Generate a specific recommendation for addressing the gap"""
@@ -14,9 +14,11 @@ import re
 import json
 from pathlib import Path
 from collections import defaultdict, Counter
-from typing import List, Dict, Tuple, Set
+from typing import List, Dict, Tuple, Set, Optional
 from dataclasses import dataclass, asdict
 
+from gap_analysis_system.source_corpus import SourceCorpus
+
 
 @dataclass
 class LogEntry:
@@ -33,9 +35,10 @@ class LogEntry:
 class MusicalConductorLoggingScanner:
     """Scans and analyzes logging in the musical-conductor package"""
 
-    def __init__(self, root_dir: str):
+    def __init__(self, root_dir: str, corpus: Optional[SourceCorpus] = None):
         self.root_dir = Path(root_dir)
         self.packages_dir = self.root_dir / "packages" / "musical-conductor"
+        self.corpus = corpus  # shared crawl and file contents (see run_all_scanners.py)
         self.log_entries: List[LogEntry] = []
         
         # Logging patterns to match
@@ -61,7 +64,10 @@ class MusicalConductorLoggingScanner:
             print(f"❌ Directory not found: {self.packages_dir}")
             return
         
-        ts_files = list(self.packages_dir.rglob("*.ts"))
+        if self.corpus is not None:
+            ts_files = self.corpus.files_under(self.packages_dir, ('.ts',))
+        else:
+            ts_files = list(self.packages_dir.rglob("*.ts"))
         print(f"📁 Found {len(ts_files)} TypeScript files\n")
         
         for file_path in ts_files:
@@ -76,8 +82,11 @@ class MusicalConductorLoggingScanner:
     def _scan_file(self, file_path: Path) -> None:
         """Scan a single file for logging statements"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+            if self.corpus is not None:
+                lines = self.corpus.read_lines(file_path)
+            else:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    lines = f.readlines()
             
             for line_num, line in enumerate(lines, start=1):
                 self._extract_logs_from_line(file_path, line_num, line)
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Run All Scanners
+
+Runs the migration audit scanners back-to-back over one shared SourceCorpus:
+the repository is crawled once and every source file is read and decoded
+once, then served to each scanner from memory.
+
+Usage:
+    python run_all_scanners.py run-all [options]
+    python run_all_scanners.py list
+
+Options (run-all):
+    --root DIR         : Repository root (default: parent of migration_tools)
+    --output-dir DIR   : Where reports are written (default: migration_tools/output)
+    --only NAME        : Run only this scanner (can be used multiple times)
+    --cache-mb N       : Upper bound for decoded file contents kept in memory (default: 512)
+
+Examples:
+    python run_all_scanners.py run-all
+    python run_all_scanners.py run-all --only css-classes --only event-sequences
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List
+
+from gap_analysis_system.source_corpus import SourceCorpus
+from css_class_scanner import CSSScanner, CSSReportGenerator
+from event_sequence_scanner import EventSequenceScanner
+from log_message_scanner import LogScanner
+from musical_conductor_logging_scanner import MusicalConductorLoggingScanner
+from symphony_handler_scanner import SymphonyScanner, SymphonyReportGenerator
+from ui_component_style_scanner import UIScanner, ReportGenerator as UIReportGenerator
+
+
+@dataclass
+class ScannerPlugin:
+    """A scanner run against the shared corpus: run(corpus, root, output_dir) returns the files it wrote."""
+    name: str
+    description: str
+    run: Callable[[SourceCorpus, Path, Path], List[Path]]
+
+
+def _write(path: Path, text: str) -> Path:
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    return path
+
+
+def run_log_messages(corpus: SourceCorpus, root: Path, output_dir: Path) -> List[Path]:
+    scanner = LogScanner(corpus=corpus)
+    report = scanner.scan_and_generate_report(str(root / 'packages'))
+    if scanner.log_messages:
+        report += "\n" + scanner.generate_stats(scanner.log_messages)
+    return [_write(output_dir / 'log_messages.txt', report)]
+
+
+def run_event_sequences(corpus: SourceCorpus, root: Path, output_dir: Path) -> List[Path]:
+    scanner = EventSequenceScanner(corpus=corpus)
+    report = scanner.scan_and_generate_report(str(root / 'packages'))
+    if scanner.event_calls:
+        report += "\n" + scanner.generate_stats(scanner.event_calls)
+    return [_write(output_dir / 'event_sequences.txt', report)]
+
+
+def run_css_classes(corpus: SourceCorpus, root: Path, output_dir: Path) -> List[Path]:
+    scanner = CSSScanner(corpus=corpus)
+    scanner.scan(str(root / 'packages'))
+    generator = CSSReportGenerator(scanner)
+    report = generator.generate_tree_report() + "\n" + generator.generate_statistics_report()
+    return [_write(output_dir / 'css_classes.txt', report)]
+
+
+def run_musical_conductor_logging(corpus: SourceCorpus, root: Path, output_dir: Path) -> List[Path]:
+    scanner = MusicalConductorLoggingScanner(str(root), corpus=corpus)
+    scanner.scan_directory()
+    report_file = output_dir / "musical_conductor_logging_report.md"
+    json_file = output_dir / "musical_conductor_logging_data.json"
+    scanner.generate_report(str(report_file))
+    scanner.export_json(str(json_file))
+    return [report_file, json_file]
+
+
+def run_symphony_handlers(corpus: SourceCorpus, root: Path, output_dir: Path) -> List[Path]:
+    scanner = SymphonyScanner(str(root / 'packages'), corpus=corpus)
+    scanner.scan()
+    generator = SymphonyReportGenerator(scanner)
+    report = generator.generate_report(show_orphans=True, show_stats=True)
+    json_file = output_dir / 'symphony_handlers.json'
+    with open(json_file, 'w', encoding='utf-8') as f:
+        json.dump(generator.export_json(), f, indent=2)
+    return [_write(output_dir / 'symphony_handlers.txt', report), json_file]
+
+
+def run_ui_components(corpus: SourceCorpus, root: Path, output_dir: Path) -> List[Path]:
+    scanner = UIScanner(str(root / 'packages'), str(root / 'src' / 'ui'),
+                        jobs=os.cpu_count() or 1, corpus=corpus)
+    scanner.scan()
+    report = UIReportGenerator(scanner).generate_full_report()
+    return [_write(output_dir / 'ui_component_style_report.txt', report)]
+
+
+SCANNERS = [
+    ScannerPlugin('log-messages', 'Log calls in packages/ (log_message_scanner)', run_log_messages),
+    ScannerPlugin('event-sequences', 'EventRouter.publish / conductor.play calls (event_sequence_scanner)',
+                  run_event_sequences),
+    ScannerPlugin('css-classes', 'CSS class definitions and usages (css_class_scanner)', run_css_classes),
+    ScannerPlugin('musical-conductor-logging', 'musical-conductor logging inventory '
+                  '(musical_conductor_logging_scanner)', run_musical_conductor_logging),
+    ScannerPlugin('symphony-handlers', 'JSON sequence handlers traced to code (symphony_handler_scanner)',
+                  run_symphony_handlers),
+    ScannerPlugin('ui-components', 'UI components and styles (ui_component_style_scanner)', run_ui_components),
+]
+
+
+def run_all(root: Path, output_dir: Path, only: List[str] = None, cache_mb: int = 512) -> int:
+    """Run the selected scanners over one corpus; returns the number of scanners that failed."""
+    plugins = [p for p in SCANNERS if not only or p.name in only]
+    unknown = set(only or ()) - {p.name for p in SCANNERS}
+    if unknown:
+        raise SystemExit(f"Unknown scanner(s): {', '.join(sorted(unknown))}")
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    corpus = SourceCorpus(root, max_chars=cache_mb * 1024 * 1024)
+    start = time.perf_counter()
+    print(f"📁 Crawled {len(corpus.files)} files under {root} in {time.perf_counter() - start:.2f}s\n")
+
+    failed = []
+    for plugin in plugins:
+        print("=" * 70)
+        print(f"  {plugin.name}: {plugin.description}")
+        print("=" * 70)
+        started = time.perf_counter()
+        try:
+            written = plugin.run(corpus, root, output_dir)
+        except Exception as e:
+            # One broken scanner should not cost the reports of the others
+            print(f"❌ {plugin.name} failed: {type(e).__name__}: {e}\n")
+            failed.append(plugin.name)
+            continue
+        print(f"⏱️  {plugin.name} finished in {time.perf_counter() - started:.2f}s")
+        for path in written:
+            print(f"   📄 {path}")
+        print()
+
+    print(f"✅ {len(plugins) - len(failed)} of {len(plugins)} scanner(s) done in {time.perf_counter() - start:.2f}s")
+    if failed:
+        print(f"❌ Failed: {', '.join(failed)}")
+    print(f"   Corpus: {corpus.reads} file(s) read from disk, {corpus.hits} served from memory")
+    return len(failed)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Run the migration scanners over one shared source corpus',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run-all', help='Run every scanner in one pass over the corpus')
+    run_parser.add_argument('--root', default=str(Path(__file__).resolve().parent.parent),
+                            help='Repository root (default: parent of migration_tools)')
+    run_parser.add_argument('--output-dir', default=str(Path(__file__).resolve().parent / 'output'),
+                            help='Directory for reports (default: migration_tools/output)')
+    run_parser.add_argument('--only', action='append', metavar='NAME',
+                            help='Run only this scanner (can be used multiple times)')
+    run_parser.add_argument('--cache-mb', type=int, default=512,
+                            help='Memory bound for decoded file contents in MB (default: 512)')
+
+    subparsers.add_parser('list', help='List the available scanners')
+
+    args = parser.parse_args()
+
+    if args.command == 'list':
+        for plugin in SCANNERS:
+            print(f"{plugin.name:28} {plugin.description}")
+        return
+
+    return 1 if run_all(Path(args.root), Path(args.output_dir), args.only, args.cache_mb) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -16,10 +16,13 @@ Features:
 
 Usage:
     python symphony_handler_scanner.py <directory> [options]
+    python symphony_handler_scanner.py --from-ndjson FILE [options]
 
 Options:
     --output FILE           Save report to file
     --json FILE            Export as JSON
+    --ndjson FILE          Export as NDJSON, one sequence/handler record per line
+    --from-ndjson FILE     Build the report from an NDJSON export instead of scanning
     --group-by MODE        Group by: sequence, package, handler, event
     --show-orphans         Show handlers defined in JSON but not found in code
     --show-unused          Show handler files without JSON references
@@ -32,6 +35,8 @@ Examples:
     python symphony_handler_scanner.py packages --group-by package --stats
     python symphony_handler_scanner.py packages --show-orphans --show-unused
     python symphony_handler_scanner.py packages/canvas-component --trace-depth full
+    python symphony_handler_scanner.py packages --ndjson symphony.ndjson
+    python symphony_handler_scanner.py --from-ndjson symphony.ndjson --group-by handler
 """
 
 import os
@@ -39,10 +44,13 @@ import re
 import json
 import argparse
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional
+from typing import Dict, List, Set, Tuple, Optional, Union
 from dataclasses import dataclass, field, asdict
 from collections import defaultdict
 
+from gap_analysis_system.record_stream import RecordWriter, iter_records, read_header
+from gap_analysis_system.source_corpus import SourceCorpus
+
 @dataclass
 class BeatMetadata:
     """Metadata for a single beat in a symphony movement."""
@@ -88,7 +96,7 @@ class Sequence:
     json_file: str
     title: Optional[str]
     description: Optional[str]
-    trigger: Optional[Dict] = None
+    trigger: Optional[Union[Dict, str]] = None
     movements: List[Movement] = field(default_factory=list)
     total_beats: int = 0
 
@@ -111,17 +119,24 @@ HANDLER_PATTERNS = [
     r'(\w+)\s*\((.*?)\)\s*:\s*Promise<',
     r'(\w+)\s*\((.*?)\)\s*:\s*\w+\s*\{',
 ]
+HANDLER_REGEXES = [re.compile(pattern) for pattern in HANDLER_PATTERNS]
+
+SOURCE_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx')
 
 class SymphonyScanner:
     """Scans directories for JSON sequences and traces handlers to code."""
     
-    def __init__(self, root_dir: str, trace_depth: str = "detailed"):
+    def __init__(self, root_dir: str, trace_depth: str = "detailed", corpus: Optional[SourceCorpus] = None):
         self.root_dir = Path(root_dir)
         self.trace_depth = trace_depth
+        self.corpus = corpus  # shared crawl and file contents (see run_all_scanners.py)
         self.sequences: List[Sequence] = []
         self.handler_implementations: Dict[str, List[HandlerImplementation]] = defaultdict(list)
         self.orphaned_handlers: Set[str] = set()
         self.unused_handlers: Set[str] = set()
+        # Inverted index built in one pass over the source tree (see _build_handler_index)
+        self.handler_index: Optional[Dict[str, List[HandlerImplementation]]] = None
+        self.exported_functions: Optional[Dict[Path, Set[str]]] = None
         
     def scan(self):
         """Scan directory for sequences and handlers."""
@@ -139,9 +154,10 @@ class SymphonyScanner:
         
         print(f"Parsed {len(self.sequences)} sequences with {sum(s.total_beats for s in self.sequences)} total beats")
         
-        # Phase 3: Find handler implementations
+        # Phase 3: Find handler implementations (one read per source file, then map lookups)
         all_handlers = self._collect_all_handlers()
         print(f"Searching for {len(all_handlers)} unique handlers")
+        self._build_handler_index(collect_exports=self.trace_depth == "full")
         
         for handler_name in all_handlers:
             implementations = self._find_handler_implementation(handler_name)
@@ -157,24 +173,62 @@ class SymphonyScanner:
         if self.trace_depth == "full":
             self._find_unused_handlers(all_handlers)
     
+    def load_json_stream(self, stream_path: str):
+        """Restore the results of a scan from SymphonyReportGenerator.stream_json output."""
+        self.root_dir = Path(read_header(stream_path, 'symphony-handlers')['root_dir'])
+        self.sequences = []
+        self.handler_implementations = defaultdict(list)
+        self.orphaned_handlers = set()
+        self.unused_handlers = set()
+        
+        for record in iter_records(stream_path, 'symphony-handlers'):
+            kind = record.pop('type')
+            if kind == 'sequence':
+                movements = [
+                    Movement(**{**mov, 'beats': [BeatMetadata(**beat) for beat in mov['beats']]})
+                    for mov in record.pop('movements')
+                ]
+                self.sequences.append(Sequence(**record, movements=movements))
+            elif kind == 'handler':
+                self.handler_implementations[record['handler']].extend(
+                    HandlerImplementation(**impl) for impl in record['implementations'])
+            elif kind == 'orphaned_handler':
+                self.orphaned_handlers.add(record['handler'])
+            elif kind == 'unused_handler':
+                self.unused_handlers.add(record['handler'])
+    
     def _find_sequence_files(self) -> List[Path]:
         """Find all JSON sequence files in json-sequences directories."""
         json_files = []
         
-        for root, dirs, files in os.walk(self.root_dir):
+        for root, file_path in self._walk_files(('.json',)):
             # Look for json-sequences directories
             if 'json-sequences' in root:
-                for file in files:
-                    if file.endswith('.json'):
-                        json_files.append(Path(root) / file)
+                json_files.append(file_path)
         
         return json_files
     
+    def _walk_files(self, extensions: Tuple[str, ...]):
+        """Yield (directory, file path) for every file under root_dir with one of the extensions."""
+        if self.corpus is not None:
+            for file_path in self.corpus.files_under(self.root_dir, extensions):
+                yield str(file_path.parent), file_path
+            return
+        for root, dirs, files in os.walk(self.root_dir):
+            for file in files:
+                if file.endswith(extensions):
+                    yield root, Path(root) / file
+    
+    def _read(self, file_path: Path) -> str:
+        if self.corpus is not None:
+            return self.corpus.read(file_path)
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    
     def _parse_sequence_file(self, json_file: Path) -> Optional[Sequence]:
         """Parse a JSON sequence file."""
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = json.loads(self._read(json_file))
             
             # Extract package name from path
             parts = json_file.parts
@@ -207,11 +261,15 @@ class SymphonyScanner:
                 # Parse beats
                 beats_data = mov_data.get('beats', [])
                 for beat_data in beats_data:
+                    handler = beat_data.get('handler', '')
+                    if isinstance(handler, dict):
+                        # Newer sequences describe the handler as {"name", "scope", "kind"}
+                        handler = handler.get('name', '')
                     beat = BeatMetadata(
                         beat=beat_data.get('beat', 0),
                         event=beat_data.get('event', ''),
                         title=beat_data.get('title', ''),
-                        handler=beat_data.get('handler', ''),
+                        handler=handler,
                         dynamics=beat_data.get('dynamics'),
                         timing=beat_data.get('timing'),
                         kind=beat_data.get('kind'),
@@ -241,87 +299,114 @@ class SymphonyScanner:
                         handlers.add(beat.handler)
         return handlers
     
+    def _build_handler_index(self, collect_exports: bool = False):
+        """Read every source file once and index all handler-shaped definitions by name.
+
+        Files under src/ or symphonies/ feed the name -> [HandlerImplementation] map.
+        With collect_exports, files under symphonies/ or handlers/ also record their
+        exported function names for _find_unused_handlers in the same pass.
+        """
+        self.handler_index = defaultdict(list)
+        self.exported_functions = {} if collect_exports else None
+        files_indexed = 0
+        
+        for root, file_path in self._walk_files(SOURCE_EXTENSIONS):
+            in_src = 'src' in root or 'symphonies' in root
+            in_handlers = collect_exports and ('symphonies' in root or 'handlers' in root)
+            if not (in_src or in_handlers):
+                continue
+            try:
+                content = self._read(file_path)
+            except Exception:
+                continue  # Skip files with encoding issues
+            files_indexed += 1
+            if in_src:
+                for impl in self._scan_file_handlers(file_path, content):
+                    self.handler_index[impl.handler_name].append(impl)
+            if in_handlers:
+                self.exported_functions[file_path] = self._extract_function_names(file_path, content)
+        
+        definitions = sum(len(impls) for impls in self.handler_index.values())
+        print(f"Indexed {definitions} handler definitions in {files_indexed} source files")
+    
     def _find_handler_implementation(self, handler_name: str) -> List[HandlerImplementation]:
         """Find implementation of a handler in source files."""
-        implementations = []
-        
-        # Search in src directories
-        for root, dirs, files in os.walk(self.root_dir):
-            if 'src' in root or 'symphonies' in root:
-                for file in files:
-                    if file.endswith(('.ts', '.tsx', '.js', '.jsx')):
-                        file_path = Path(root) / file
-                        impls = self._scan_file_for_handler(file_path, handler_name)
-                        implementations.extend(impls)
-        
-        return implementations
+        if self.handler_index is None:
+            self._build_handler_index()
+        return list(self.handler_index.get(handler_name, []))
     
     def _scan_file_for_handler(self, file_path: Path, handler_name: str) -> List[HandlerImplementation]:
         """Scan a single file for handler implementation."""
+        return [impl for impl in self._scan_file_handlers(file_path) if impl.handler_name == handler_name]
+    
+    def _scan_file_handlers(self, file_path: Path, content: Optional[str] = None) -> List[HandlerImplementation]:
+        """Extract every handler-shaped definition in a file (first matching pattern per name and line)."""
         implementations = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                lines = content.split('\n')
+            if content is None:
+                content = self._read(file_path)
+            lines = content.split('\n')
+            class_pos = content.find('class')
+            export_blocks = None
             
             for i, line in enumerate(lines, 1):
-                for pattern in HANDLER_PATTERNS:
-                    match = re.search(pattern, line)
-                    if match:
-                        found_name = match.group(1)
-                        if found_name == handler_name:
-                            params_str = match.group(2) if len(match.groups()) > 1 else ""
-                            
-                            # Determine function type
-                            func_type = "sync-function"
-                            if 'async' in line:
-                                func_type = "async-function"
-                            if '=>' in line:
-                                func_type = "arrow-function"
-                            if 'class' in content[:content.find(line)]:
-                                func_type = "class-method"
-                            
-                            # Check if exported
-                            is_exported = 'export' in line or self._is_in_export_block(content, line)
-                            
-                            # Extract parameters
-                            parameters = [p.strip().split(':')[0].strip() for p in params_str.split(',') if p.strip()]
-                            
-                            # Extract return type
-                            return_type = None
-                            return_match = re.search(r':\s*(Promise<\w+>|\w+)\s*[{=]', line)
-                            if return_match:
-                                return_type = return_match.group(1)
-                            
-                            # Get doc comment if available
-                            doc_comment = self._extract_doc_comment(lines, i - 1)
-                            
-                            impl = HandlerImplementation(
-                                handler_name=handler_name,
-                                file_path=str(file_path),
-                                line_number=i,
-                                function_type=func_type,
-                                signature=line.strip(),
-                                is_exported=is_exported,
-                                parameters=parameters,
-                                return_type=return_type,
-                                doc_comment=doc_comment
-                            )
-                            implementations.append(impl)
-                            break
+                if '(' not in line:
+                    continue  # every pattern needs a parameter list
+                found = set()
+                for regex in HANDLER_REGEXES:
+                    match = regex.search(line)
+                    if not match or match.group(1) in found:
+                        continue
+                    handler_name = match.group(1)
+                    found.add(handler_name)
+                    params_str = match.group(2) if len(match.groups()) > 1 else ""
+                    
+                    # Determine function type
+                    func_type = "sync-function"
+                    if 'async' in line:
+                        func_type = "async-function"
+                    if '=>' in line:
+                        func_type = "arrow-function"
+                    if class_pos != -1 and class_pos + len('class') <= content.find(line):
+                        func_type = "class-method"
+                    
+                    # Check if exported
+                    is_exported = 'export' in line
+                    if not is_exported:
+                        if export_blocks is None:
+                            export_blocks = re.findall(r'export\s*\{[^}]+\}', content, re.DOTALL)
+                        is_exported = any(line in block for block in export_blocks)
+                    
+                    # Extract parameters
+                    parameters = [p.strip().split(':')[0].strip() for p in params_str.split(',') if p.strip()]
+                    
+                    # Extract return type
+                    return_type = None
+                    return_match = re.search(r':\s*(Promise<\w+>|\w+)\s*[{=]', line)
+                    if return_match:
+                        return_type = return_match.group(1)
+                    
+                    # Get doc comment if available
+                    doc_comment = self._extract_doc_comment(lines, i - 1)
+                    
+                    implementations.append(HandlerImplementation(
+                        handler_name=handler_name,
+                        file_path=str(file_path),
+                        line_number=i,
+                        function_type=func_type,
+                        signature=line.strip(),
+                        is_exported=is_exported,
+                        parameters=parameters,
+                        return_type=return_type,
+                        doc_comment=doc_comment
+                    ))
         
         except Exception as e:
             pass  # Skip files with encoding issues
         
         return implementations
     
-    def _is_in_export_block(self, content: str, line: str) -> bool:
-        """Check if a line is within an export block."""
-        # Look for export { ... } patterns
-        export_blocks = re.findall(r'export\s*\{[^}]+\}', content, re.DOTALL)
-        return any(line in block for block in export_blocks)
-    
     def _extract_doc_comment(self, lines: List[str], line_idx: int) -> Optional[str]:
         """Extract JSDoc/TSDoc comment above a function."""
         if line_idx <= 0:
@@ -353,27 +438,23 @@ class SymphonyScanner:
     
     def _find_unused_handlers(self, referenced_handlers: Set[str]):
         """Find handler files that aren't referenced in any sequence."""
-        for root, dirs, files in os.walk(self.root_dir):
-            if 'symphonies' in root or 'handlers' in root:
-                for file in files:
-                    if file.endswith(('.ts', '.tsx', '.js', '.jsx')):
-                        file_path = Path(root) / file
-                        # Extract function names from file
-                        functions = self._extract_function_names(file_path)
-                        for func in functions:
-                            if func not in referenced_handlers:
-                                self.unused_handlers.add(f"{func} ({file_path})")
-    
-    def _extract_function_names(self, file_path: Path) -> Set[str]:
+        if self.exported_functions is None:
+            self._build_handler_index(collect_exports=True)
+        for file_path, functions in self.exported_functions.items():
+            for func in functions:
+                if func not in referenced_handlers:
+                    self.unused_handlers.add(f"{func} ({file_path})")
+    
+    def _extract_function_names(self, file_path: Path, content: Optional[str] = None) -> Set[str]:
         """Extract all exported function names from a file."""
         functions = set()
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            if content is None:
+                content = self._read(file_path)
             
             # Find all function declarations
-            for pattern in HANDLER_PATTERNS:
-                matches = re.finditer(pattern, content)
+            for regex in HANDLER_REGEXES:
+                matches = regex.finditer(content)
                 for match in matches:
                     if 'export' in content[max(0, match.start() - 50):match.start()]:
                         functions.add(match.group(1))
@@ -438,7 +519,10 @@ class SymphonyReportGenerator:
             lines.append(f"│   ├── 🎵 Movements: {len(seq.movements)}")
             lines.append(f"│   ├── 🥁 Total Beats: {seq.total_beats}")
             
-            if seq.trigger:
+            if isinstance(seq.trigger, str):
+                # Some sequences describe their trigger in prose
+                lines.append(f"│   ├── 🎯 Trigger: {seq.trigger}")
+            elif seq.trigger:
                 lines.append(f"│   ├── 🎯 Trigger:")
                 lines.append(f"│   │   ├── Event: {seq.trigger.get('event', 'N/A')}")
                 if 'topic' in seq.trigger:
@@ -694,6 +778,25 @@ class SymphonyReportGenerator:
         except ValueError:
             return path
     
+    def stream_json(self, output_path: str) -> int:
+        """Write the scan results to output_path as NDJSON, one record per line.
+        
+        Records are written one at a time rather than built into one document first, and
+        keep every field, so SymphonyScanner.load_json_stream() can restore the scan.
+        Returns the number of records written.
+        """
+        with RecordWriter(output_path, 'symphony-handlers', root_dir=str(self.scanner.root_dir)) as writer:
+            for seq in self.scanner.sequences:
+                writer.write({'type': 'sequence', **asdict(seq)})
+            for handler, impls in self.scanner.handler_implementations.items():
+                writer.write({'type': 'handler', 'handler': handler,
+                              'implementations': [asdict(impl) for impl in impls]})
+            for handler in sorted(self.scanner.orphaned_handlers):
+                writer.write({'type': 'orphaned_handler', 'handler': handler})
+            for handler in sorted(self.scanner.unused_handlers):
+                writer.write({'type': 'unused_handler', 'handler': handler})
+        return writer.count
+    
     def export_json(self) -> dict:
         """Export scan results as JSON."""
         return {
@@ -735,9 +838,12 @@ def main():
         epilog=__doc__
     )
     
-    parser.add_argument('directory', help='Directory to scan')
+    parser.add_argument('directory', nargs='?', help='Directory to scan')
     parser.add_argument('--output', help='Output file for report')
     parser.add_argument('--json', dest='json_output', help='Export as JSON')
+    parser.add_argument('--ndjson', dest='ndjson_output',
+                       help='Export as NDJSON, one record per line')
+    parser.add_argument('--from-ndjson', help='Build the report from an NDJSON export instead of scanning')
     parser.add_argument('--group-by', choices=['sequence', 'package', 'handler', 'event'],
                        default='sequence', help='Grouping mode')
     parser.add_argument('--show-orphans', action='store_true',
@@ -752,10 +858,15 @@ def main():
                        default='detailed', help='Handler trace depth')
     
     args = parser.parse_args()
+    if not args.directory and not args.from_ndjson:
+        parser.error('a directory to scan or --from-ndjson is required')
     
-    # Scan
-    scanner = SymphonyScanner(args.directory, args.trace_depth)
-    scanner.scan()
+    # Scan (or restore a previous scan)
+    scanner = SymphonyScanner(args.directory or '.', args.trace_depth)
+    if args.from_ndjson:
+        scanner.load_json_stream(args.from_ndjson)
+    else:
+        scanner.scan()
     
     # Generate report
     report_gen = SymphonyReportGenerator(scanner)
@@ -780,6 +891,10 @@ def main():
         with open(args.json_output, 'w', encoding='utf-8') as f:
             json.dump(report_gen.export_json(), f, indent=2)
         print(f"JSON data exported to '{args.json_output}'")
+    
+    if args.ndjson_output:
+        count = report_gen.stream_json(args.ndjson_output)
+        print(f"{count} NDJSON records exported to '{args.ndjson_output}'")
 
 
 if __name__ == '__main__':
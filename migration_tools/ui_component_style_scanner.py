@@ -19,6 +19,8 @@ Options:
     --show-dependencies  : Show import dependencies
     --min-lines N        : Only show files with at least N lines (default: 1)
     --stats              : Show detailed statistics
+    --jobs N             : Worker processes for parsing (default: CPU count)
+    --cache FILE         : Reuse parse results for unchanged files (keyed by content hash)
 
 Examples:
     python ui_component_style_scanner.py --show-sketches --stats
@@ -29,13 +31,18 @@ Examples:
 import os
 import re
 import json
+import hashlib
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Set, Tuple, Optional
+from typing import List, Dict, Set, Tuple, Optional, Union
 from collections import defaultdict
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict
 from datetime import datetime
 
+from gap_analysis_system.source_corpus import SourceCorpus
+from gap_analysis_system.source_positions import LineIndex, blank_comments
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Data Classes
@@ -58,6 +65,8 @@ class CSSClass:
     file_path: str
     theme_variants: List[str] = field(default_factory=list)
     pseudo_states: List[str] = field(default_factory=list)
+    column: int = 1
+    byte_offset: int = 0
 
 @dataclass
 class Component:
@@ -75,6 +84,9 @@ class Component:
     complexity_score: int = 0
     children_components: List[str] = field(default_factory=list)
     used_in: List[str] = field(default_factory=list)  # Files that import this component
+    line_number: int = 0  # Declaration position (0 when no exported declaration was found)
+    column: int = 0
+    byte_offset: int = 0
 
 @dataclass
 class Package:
@@ -95,17 +107,18 @@ class CSSParser:
     """Parses CSS files and extracts style information."""
     
     @staticmethod
-    def parse_css_file(file_path: str) -> List[CSSClass]:
+    def parse_css_file(file_path: str, content: Optional[str] = None) -> List[CSSClass]:
         """Parse a CSS file and extract all class definitions."""
         css_classes = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                lines = content.split('\n')
+            if content is None:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
                 
-            # Remove comments
-            content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
+            # Blank out comments (same length, newlines kept) so match offsets map to the file
+            content = blank_comments(content)
+            index = LineIndex(content)
             
             # Find all CSS rules
             rule_pattern = r'([^{]+)\s*\{([^}]+)\}'
@@ -125,10 +138,9 @@ class CSSParser:
                 # Extract class names from selector
                 class_names = re.findall(r'\.([a-zA-Z0-9_-]+)', selector)
                 
-                # Find line number
-                line_num = 1
-                pos = content[:match.start()].count('\n')
-                line_num = pos + 1
+                # Position of the selector itself (the match also spans preceding whitespace)
+                raw_selector = match.group(1)
+                position = index.position(match.start(1) + len(raw_selector) - len(raw_selector.lstrip()))
                 
                 for class_name in class_names:
                     # Check for theme variants
@@ -146,10 +158,12 @@ class CSSParser:
                     css_class = CSSClass(
                         class_name=class_name,
                         properties=properties,
-                        line_number=line_num,
+                        line_number=position.line,
                         file_path=file_path,
                         theme_variants=theme_variants,
-                        pseudo_states=pseudo_states
+                        pseudo_states=pseudo_states,
+                        column=position.column,
+                        byte_offset=position.byte_offset
                     )
                     css_classes.append(css_class)
                     
@@ -163,18 +177,20 @@ class ComponentParser:
     """Parses React/TypeScript component files."""
     
     @staticmethod
-    def parse_component_file(file_path: str) -> Optional[Component]:
+    def parse_component_file(file_path: str, content: Optional[str] = None) -> Optional[Component]:
         """Parse a component file and extract component information."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                lines = content.split('\n')
+            if content is None:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+            index = LineIndex(content)
                 
             file_name = Path(file_path).stem
             
             # Determine component type and name
             component_name = file_name
             component_type = 'unknown'
+            declaration = None
             
             # Check for function component
             func_pattern = r'export\s+(?:function|const)\s+([A-Z][a-zA-Z0-9]*)'
@@ -182,6 +198,7 @@ class ComponentParser:
             if func_match:
                 component_name = func_match.group(1)
                 component_type = 'function'
+                declaration = func_match
             
             # Check for class component
             class_pattern = r'export\s+class\s+([A-Z][a-zA-Z0-9]*)'
@@ -189,6 +206,7 @@ class ComponentParser:
             if class_match:
                 component_name = class_match.group(1)
                 component_type = 'class'
+                declaration = class_match
                 
             # Extract imports
             imports = []
@@ -222,15 +240,13 @@ class ComponentParser:
                 props_content = props_match.group(1)
                 props = [p.strip().split(':')[0].strip() for p in props_content.split(',')]
             
-            # Extract JSX elements
-            jsx_elements = set()
+            # Extract JSX elements (unique, in order of first use, so results are reproducible)
             jsx_pattern = r'<([A-Z][a-zA-Z0-9]*)'
-            jsx_elements.update(re.findall(jsx_pattern, content))
+            jsx_elements = dict.fromkeys(re.findall(jsx_pattern, content))
             
             # Extract React hooks
-            hooks = set()
             hook_pattern = r'\b(use[A-Z][a-zA-Z0-9]*)\('
-            hooks.update(re.findall(hook_pattern, content))
+            hooks = dict.fromkeys(re.findall(hook_pattern, content))
             
             # Calculate complexity score
             complexity = len(hooks) * 2
@@ -247,10 +263,15 @@ class ComponentParser:
                 props=props,
                 jsx_elements=list(jsx_elements),
                 hooks_used=list(hooks),
-                line_count=len(lines),
+                line_count=index.line_count,
                 complexity_score=complexity,
                 children_components=list(jsx_elements)
             )
+            if declaration:
+                position = index.position(declaration.start(1))
+                component.line_number = position.line
+                component.column = position.column
+                component.byte_offset = position.byte_offset
             
             return component
             
@@ -259,6 +280,105 @@ class ComponentParser:
             return None
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# Parse Cache
+# ═══════════════════════════════════════════════════════════════════════════
+
+COMPONENT_EXTENSIONS = ('.tsx', '.ts', '.jsx', '.js')
+STYLE_EXTENSIONS = ('.css', '.scss', '.less')
+IGNORED_DIRS = {
+    'node_modules', '.git', 'dist', 'build', 'coverage',
+    '__pycache__', '.pytest_cache', '.vscode'
+}
+
+ParseResult = Union[Optional[Component], List[CSSClass]]
+
+
+def parse_source_file(file_path: str, content: Optional[str]) -> ParseResult:
+    """Parse one component or style file (runs in worker processes)."""
+    if file_path.endswith(COMPONENT_EXTENSIONS):
+        return ComponentParser.parse_component_file(file_path, content)
+    return CSSParser.parse_css_file(file_path, content)
+
+
+# Modules whose code decides what a cached parse contains
+_PARSER_SOURCES = (Path(__file__), Path(__file__).parent / 'gap_analysis_system' / 'source_positions.py')
+
+
+def _parser_version() -> str:
+    digest = hashlib.sha256()
+    for source in _PARSER_SOURCES:
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """Per-file parse results keyed by file name and content hash, persisted as JSON between runs."""
+    
+    VERSION = 2
+    
+    def __init__(self, cache_path: Optional[str]):
+        self.cache_path = cache_path
+        self.code_version = _parser_version()
+        self.entries: Dict[str, Dict] = {}
+        self.used: Set[str] = set()
+        self.hits = 0
+        self.misses = 0
+        if cache_path and os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == self.VERSION and data.get('code') == self.code_version:
+                    self.entries = data.get('entries', {})
+            except (OSError, ValueError):
+                pass  # Unreadable cache: start fresh
+    
+    @staticmethod
+    def digest(file_path: str, content: str) -> str:
+        """Key of a parse: the file name (it picks the parser and names unexported
+        components) plus the content."""
+        digest = hashlib.sha256(Path(file_path).name.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(content.encode('utf-8'))
+        return digest.hexdigest()
+    
+    def get(self, digest: str, file_path: str) -> Tuple[bool, ParseResult]:
+        """Cached result for this file name and content, re-pointed at file_path."""
+        entry = self.entries.get(digest)
+        if entry is None:
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        self.used.add(digest)
+        if entry['kind'] == 'component':
+            data = dict(entry['data'], file_path=file_path)
+            data['class_names_used'] = set(data['class_names_used'])
+            return True, Component(**data)
+        if entry['kind'] == 'styles':
+            return True, [CSSClass(**dict(d, file_path=file_path)) for d in entry['data']]
+        return True, None
+    
+    def put(self, digest: str, result: ParseResult) -> None:
+        self.used.add(digest)
+        if isinstance(result, Component):
+            data = asdict(result)
+            data['class_names_used'] = sorted(data['class_names_used'])
+            self.entries[digest] = {'kind': 'component', 'data': data}
+        elif isinstance(result, list):
+            self.entries[digest] = {'kind': 'styles', 'data': [asdict(c) for c in result]}
+        else:
+            self.entries[digest] = {'kind': 'none'}
+    
+    def save(self) -> None:
+        """Write entries seen in this run (stale content hashes are dropped)."""
+        if not self.cache_path:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.cache_path)), exist_ok=True)
+        entries = {k: v for k, v in self.entries.items() if k in self.used}
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': self.VERSION, 'code': self.code_version, 'entries': entries}, f)
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Scanner
 # ═══════════════════════════════════════════════════════════════════════════
@@ -266,24 +386,36 @@ class ComponentParser:
 class UIScanner:
     """Scans directories for UI components and styles."""
     
-    def __init__(self, packages_path: str, ui_path: str):
+    def __init__(self, packages_path: str, ui_path: str, jobs: int = 1,
+                 cache_path: Optional[str] = None, corpus: Optional[SourceCorpus] = None):
         self.packages_path = packages_path
         self.ui_path = ui_path
+        self.jobs = jobs
+        self.corpus = corpus  # shared crawl and file contents (see run_all_scanners.py)
+        self.cache = ParseCache(cache_path)
         self.packages: List[Package] = []
         self.all_components: List[Component] = []
         self.all_styles: List[CSSClass] = []
+        self._seen: Set[str] = set()
         
     def scan(self) -> None:
         """Scan all specified directories."""
         print("🔍 Scanning UI components and styles...")
         
-        # Scan packages
+        # Crawl first: every file is assigned to exactly one package
+        plan: List[Tuple[Package, List[Path]]] = []
         if os.path.exists(self.packages_path):
-            self._scan_packages()
-        
-        # Scan src/ui
+            plan.extend(self._plan_packages())
         if os.path.exists(self.ui_path):
-            self._scan_ui_directory()
+            ui_package = Package(name='ui', path=self.ui_path)
+            plan.append((ui_package, self._crawl([Path(self.ui_path)])))
+        
+        # Then parse all of them in one batch
+        self._parse_plan(plan)
+        self.packages.extend(package for package, _ in plan if package.components or package.styles)
+        self.cache.save()
+        if self.cache.cache_path:
+            print(f"   Parse cache: {self.cache.hits} hit(s), {self.cache.misses} miss(es)")
             
         print(f"✅ Scan complete! Found {len(self.all_components)} components and {len(self.all_styles)} styles.")
         
@@ -310,76 +442,97 @@ class UIScanner:
         usage_count = sum(1 for comp in self.all_components if comp.used_in)
         print(f"✅ Usage tracking complete! {usage_count} components have tracked usage.")
     
-    def _scan_packages(self) -> None:
-        """Scan packages directory."""
+    def _plan_packages(self) -> List[Tuple[Package, List[Path]]]:
+        """Crawl each package's UI roots (src/ui, ui, src)."""
+        plan = []
         packages_dir = Path(self.packages_path)
         
         for package_dir in packages_dir.iterdir():
             if package_dir.is_dir() and not package_dir.name.startswith('.'):
-                package = self._scan_package(package_dir)
-                if package:
-                    self.packages.append(package)
+                package = Package(
+                    name=package_dir.name,
+                    path=str(package_dir)
+                )
+                # src/ui lies inside src; the crawl skips files already visited
+                files = self._crawl([
+                    package_dir / 'src' / 'ui',
+                    package_dir / 'ui',
+                    package_dir / 'src'
+                ])
+                plan.append((package, files))
+        return plan
     
-    def _scan_package(self, package_path: Path) -> Optional[Package]:
-        """Scan a single package."""
-        package = Package(
-            name=package_path.name,
-            path=str(package_path)
-        )
-        
-        # Look for UI components in src/ui or ui directories
-        ui_paths = [
-            package_path / 'src' / 'ui',
-            package_path / 'ui',
-            package_path / 'src'
-        ]
-        
-        for ui_path in ui_paths:
-            if ui_path.exists():
-                self._scan_directory(ui_path, package)
-                
-        if package.components or package.styles:
-            return package
-        return None
+    def _crawl(self, roots: List[Path]) -> List[Path]:
+        """Walk roots once, pruning ignored directories and skipping files seen before."""
+        files = []
+        for root_path in roots:
+            if not root_path.exists():
+                continue
+            for item in self._walk(root_path):
+                key = os.path.realpath(item)
+                if key in self._seen:
+                    continue
+                self._seen.add(key)
+                files.append(item)
+        return files
     
-    def _scan_ui_directory(self) -> None:
-        """Scan src/ui directory as a special package."""
-        ui_package = Package(
-            name='ui',
-            path=self.ui_path
-        )
-        
-        self._scan_directory(Path(self.ui_path), ui_package)
-        
-        if ui_package.components or ui_package.styles:
-            self.packages.append(ui_package)
+    def _walk(self, root_path: Path):
+        if self.corpus is not None:
+            yield from self.corpus.files_under(root_path, exclude_dirs=IGNORED_DIRS)
+            return
+        for root, dirs, names in os.walk(root_path):
+            dirs[:] = [d for d in dirs if d not in IGNORED_DIRS]
+            for name in names:
+                yield Path(root) / name
     
-    def _scan_directory(self, directory: Path, package: Package) -> None:
-        """Recursively scan a directory for components and styles."""
-        for item in directory.rglob('*'):
-            if item.is_file():
+    def _parse_plan(self, plan: List[Tuple[Package, List[Path]]]) -> None:
+        """Parse every component/style file, from the cache or in a worker pool."""
+        pending = []  # (file_path, content, digest) still to parse
+        slots = []    # per parseable file, in crawl order: (package, index into pending or cached result)
+        for package, files in plan:
+            for item in files:
                 package.total_files += 1
-                
-                # Parse component files
-                if item.suffix in ['.tsx', '.ts', '.jsx', '.js']:
-                    component = ComponentParser.parse_component_file(str(item))
-                    if component:
-                        package.components.append(component)
-                        package.total_lines += component.line_count
-                        self.all_components.append(component)
-                
-                # Parse style files
-                elif item.suffix in ['.css', '.scss', '.less']:
-                    styles = CSSParser.parse_css_file(str(item))
-                    package.styles.extend(styles)
-                    self.all_styles.extend(styles)
-                    
-                    # Count lines
-                    try:
+                if not item.name.endswith(COMPONENT_EXTENSIONS + STYLE_EXTENSIONS):
+                    continue
+                try:
+                    if self.corpus is not None:
+                        content = self.corpus.read(item)
+                    else:
                         with open(item, 'r', encoding='utf-8') as f:
-                            package.total_lines += len(f.readlines())
-                    except:
-                        pass
+                            content = f.read()
+                except Exception:
+                    content = None  # the parser reports the read error
+                digest = ParseCache.digest(str(item), content) if content is not None else None
+                found, result = self.cache.get(digest, str(item)) if digest else (False, None)
+                if found:
+                    slots.append((package, item, content, ('cached', result)))
+                else:
+                    slots.append((package, item, content, ('pending', len(pending))))
+                    pending.append((str(item), content, digest))
+        
+        paths = [path for path, _, _ in pending]
+        contents = [content for _, content, _ in pending]
+        if self.jobs > 1 and len(pending) > 1:
+            with ProcessPoolExecutor(max_workers=self.jobs) as pool:
+                parsed = list(pool.map(parse_source_file, paths, contents, chunksize=16))
+        else:
+            parsed = [parse_source_file(path, content) for path, content in zip(paths, contents)]
+        for (_, _, digest), result in zip(pending, parsed):
+            if digest:
+                self.cache.put(digest, result)
+        
+        for package, item, content, (source, value) in slots:
+            result = value if source == 'cached' else parsed[value]
+            if item.name.endswith(COMPONENT_EXTENSIONS):
+                if result:
+                    package.components.append(result)
+                    package.total_lines += result.line_count
+                    self.all_components.append(result)
+            else:
+                package.styles.extend(result)
+                self.all_styles.extend(result)
+                if content is not None:
+                    package.total_lines += content.count('\n') + (1 if content and not content.endswith('\n') else 0)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -1148,11 +1301,15 @@ def main():
                        help='Only show files with at least N lines (default: 1)')
     parser.add_argument('--stats', action='store_true',
                        help='Show detailed statistics')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                       help='Worker processes for parsing (default: CPU count)')
+    parser.add_argument('--cache', metavar='FILE',
+                       help='Cache parse results by file content hash in FILE across runs')
     
     args = parser.parse_args()
     
     # Initialize scanner
-    scanner = UIScanner(args.packages, args.ui)
+    scanner = UIScanner(args.packages, args.ui, jobs=args.jobs, cache_path=args.cache)
     scanner.scan()
     
     # Generate report
@@ -9,14 +9,26 @@ import argparse
 from pathlib import Path
 from collections import defaultdict, Counter
 
+sys.path.insert(0, str(Path(__file__).parent.parent / 'core'))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from ir_stream import open_ir
+from graph_core import ArchGraph
+
 def analyze_ir(ir_path: str) -> dict:
     """
     Analyze IR and extract metrics.
+
+    Accepts graph.json or a streaming .ndjson IR; sections are iterated from
+    disk rather than held in memory as one document.
     """
-    # Load IR
-    with open(ir_path, 'r') as f:
-        ir = json.load(f)
+    return analyze_ir_data(open_ir(ir_path))
 
+
+def analyze_ir_data(ir) -> dict:
+    """
+    Analyze an already loaded IR (dict or IR reader) and extract metrics.
+    """
     files = ir.get("files", [])
     symbols = ir.get("symbols", [])
     calls = ir.get("calls", [])
@@ -93,8 +105,8 @@ def _build_arch_graph(ir):
             nodes.append(sid)
             seen_ids.add(sid)
     idx = {n: i for i, n in enumerate(nodes)}
-    out_edges = [[] for _ in nodes]
-    in_edges = [[] for _ in nodes]
+    src = []
+    dst = []
     call_names = defaultdict(list)
     for c in ir.get("calls", []):
         frm = c.get("frm") or c.get("from")
@@ -104,59 +116,14 @@ def _build_arch_graph(ir):
         name = c.get("name") or to
         call_names[frm].append(name)
         if to and to in idx:
-            fi = idx[frm]
-            ti = idx[to]
-            out_edges[fi].append(ti)
-            in_edges[ti].append(fi)
-    return nodes, idx, out_edges, in_edges, call_names
-
-
-def _tarjan_scc(out_edges):
-    n = len(out_edges)
-    index = 0
-    stack = []
-    onstack = [False] * n
-    indices = [-1] * n
-    low = [0] * n
-    sccs = []
-
-    def strongconnect(v):
-        nonlocal index
-        indices[v] = index
-        low[v] = index
-        index += 1
-        stack.append(v)
-        onstack[v] = True
-        for w in out_edges[v]:
-            if indices[w] == -1:
-                strongconnect(w)
-                low[v] = min(low[v], low[w])
-            elif onstack[w]:
-                low[v] = min(low[v], indices[w])
-        if low[v] == indices[v]:
-            comp = []
-            while True:
-                w = stack.pop()
-                onstack[w] = False
-                comp.append(w)
-                if w == v:
-                    break
-            sccs.append(comp)
-
-    for v in range(n):
-        if indices[v] == -1:
-            strongconnect(v)
-    return sccs
-
-
-def _compute_coupling(nodes, out_edges, in_edges):
-    Ca = [len(in_edges[i]) for i in range(len(nodes))]
-    Ce = [len(out_edges[i]) for i in range(len(nodes))]
-    I = []
-    for i in range(len(nodes)):
-        denom = Ca[i] + Ce[i]
-        I.append((Ce[i] / denom) if denom else 0.0)
-    return Ca, Ce, I
+            src.append(idx[frm])
+            dst.append(idx[to])
+    # CSR adjacency and degree arrays are computed once and shared by every metric
+    return nodes, idx, ArchGraph(len(nodes), src, dst), call_names
+
+
+def _compute_coupling(graph):
+    return graph.fan_in, graph.fan_out, graph.instability
 
 
 def _detect_god_functions(nodes, call_names, symbol_map, threshold_calls=10, threshold_unique=8):
@@ -208,10 +175,9 @@ def _detect_long_parameter_list(ir, threshold_params=6):
     return suspects
 
 
-def _detect_shotgun_surgery(nodes, in_edges, symbol_map, threshold=8):
+def _detect_shotgun_surgery(nodes, fan_in_counts, symbol_map, threshold=8):
     suspects = []
-    for i, n in enumerate(nodes):
-        fan_in = len(in_edges[i])
+    for n, fan_in in zip(nodes, fan_in_counts):
         if fan_in >= threshold:
             sym_info = symbol_map.get(n, {})
             suspects.append({
@@ -223,9 +189,9 @@ def _detect_shotgun_surgery(nodes, in_edges, symbol_map, threshold=8):
     return suspects
 
 
-def _detect_cycles(nodes, out_edges, symbol_map):
+def _detect_cycles(nodes, graph, symbol_map):
     cyc = []
-    for comp in _tarjan_scc(out_edges):
+    for comp in graph.strongly_connected_components():
         if len(comp) > 1:
             cycle_nodes = [nodes[i] for i in comp]
             cycle_with_paths = []
@@ -240,7 +206,7 @@ def _detect_cycles(nodes, out_edges, symbol_map):
     return cyc
 
 
-def _connascence_signals(ir, nodes, call_names, in_edges):
+def _connascence_signals(ir, nodes, call_names, fan_in_counts):
     signals = {"name": [], "value": [], "position": [], "algorithm": [], "timing": []}
 
     # Name connascence
@@ -276,8 +242,7 @@ def _connascence_signals(ir, nodes, call_names, in_edges):
         )
 
     # Algorithm connascence
-    for i, n in enumerate(nodes):
-        fan_in = len(in_edges[i])
+    for n, fan_in in zip(nodes, fan_in_counts):
         if fan_in >= 10:
             signals["algorithm"].append({"symbol": n, "fan_in": fan_in})
 
@@ -290,7 +255,7 @@ def _connascence_signals(ir, nodes, call_names, in_edges):
 
 
 def analyze_architecture_ir(ir: dict) -> dict:
-    nodes, idx, out_edges, in_edges, call_names = _build_arch_graph(ir)
+    nodes, idx, graph, call_names = _build_arch_graph(ir)
 
     # Build symbol map for file path lookups (use first occurrence of each symbol ID)
     symbol_map = {}
@@ -308,7 +273,7 @@ def analyze_architecture_ir(ir: dict) -> dict:
                 "name": s.get("name")
             }
 
-    Ca, Ce, I = _compute_coupling(nodes, out_edges, in_edges)
+    Ca, Ce, I = _compute_coupling(graph)
     coupling = {}
     for i, n in enumerate(nodes):
         sym_info = symbol_map.get(n, {})
@@ -326,10 +291,10 @@ def analyze_architecture_ir(ir: dict) -> dict:
         "anti_patterns": {
             "god_functions": _detect_god_functions(nodes, call_names, symbol_map),
             "long_parameter_list": _detect_long_parameter_list(ir),
-            "shotgun_surgery_risk": _detect_shotgun_surgery(nodes, in_edges, symbol_map),
-            "cycles": _detect_cycles(nodes, out_edges, symbol_map),
+            "shotgun_surgery_risk": _detect_shotgun_surgery(nodes, Ca, symbol_map),
+            "cycles": _detect_cycles(nodes, graph, symbol_map),
         },
-        "connascence": _connascence_signals(ir, nodes, call_names, in_edges),
+        "connascence": _connascence_signals(ir, nodes, call_names, Ca),
     }
 
 
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Graph Core - CSR call graph for architecture metrics
+
+Builds compressed sparse row (CSR) adjacency once from an edge list and
+derives every per-node metric from it:
+
+- fan-out / fan-in (efferent / afferent coupling) via ``bincount``
+- instability Ce / (Ca + Ce) as one vector operation
+- strongly connected components via an iterative Tarjan (no recursion limit)
+
+NumPy is used when installed; otherwise the same arrays are built with the
+standard library, so results are identical either way.
+"""
+from functools import cached_property
+from itertools import accumulate
+from typing import List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional: pure-Python CSR fallback
+    np = None
+
+
+class ArchGraph:
+    """Directed multigraph over node indices, stored as CSR arrays.
+
+    Parallel edges are kept (coupling counts every call), and each node's
+    successors stay in edge-list order, so traversals match the order in
+    which calls appear in the IR.
+    """
+
+    def __init__(self, n: int, src: Sequence[int], dst: Sequence[int]):
+        self.n = n
+        self._src = src
+        self._dst = dst
+        if np is not None:
+            src_a = np.asarray(src, dtype=np.int64)
+            dst_a = np.asarray(dst, dtype=np.int64)
+            fan_out = np.bincount(src_a, minlength=n)
+            fan_in = np.bincount(dst_a, minlength=n)
+            out_order = np.argsort(src_a, kind="stable")
+            self.fan_out: List[int] = fan_out.tolist()
+            self.fan_in: List[int] = fan_in.tolist()
+            self.out_ptr: List[int] = np.concatenate(([0], np.cumsum(fan_out))).tolist()
+            self.out_idx: List[int] = dst_a[out_order].tolist()
+            denom = fan_out + fan_in
+            inst = np.zeros(n, dtype=np.float64)
+            np.divide(fan_out, denom, out=inst, where=denom > 0)
+            self.instability: List[float] = inst.tolist()
+        else:
+            self.fan_out = _bincount(src, n)
+            self.fan_in = _bincount(dst, n)
+            self.out_ptr, self.out_idx = _csr(self.fan_out, src, dst)
+            self.instability = [
+                (o / (o + i)) if (o + i) else 0.0 for o, i in zip(self.fan_out, self.fan_in)
+            ]
+
+    def successors(self, v: int) -> List[int]:
+        return self.out_idx[self.out_ptr[v]:self.out_ptr[v + 1]]
+
+    @cached_property
+    def in_csr(self) -> Tuple[List[int], List[int]]:
+        """Reverse adjacency (indptr, indices); built on first use, metrics do not need it"""
+        if np is not None:
+            dst_a = np.asarray(self._dst, dtype=np.int64)
+            order = np.argsort(dst_a, kind="stable")
+            indptr = np.concatenate(([0], np.cumsum(self.fan_in)))
+            return indptr.tolist(), np.asarray(self._src, dtype=np.int64)[order].tolist()
+        return _csr(self.fan_in, self._dst, self._src)
+
+    def predecessors(self, v: int) -> List[int]:
+        in_ptr, in_idx = self.in_csr
+        return in_idx[in_ptr[v]:in_ptr[v + 1]]
+
+    def strongly_connected_components(self) -> List[List[int]]:
+        """Tarjan's SCC with an explicit stack.
+
+        Emits components (and members, in stack-pop order) exactly as the
+        recursive formulation does, without growing the Python call stack.
+        """
+        n = self.n
+        out_ptr, out_idx = self.out_ptr, self.out_idx
+        index = [-1] * n
+        low = [0] * n
+        onstack = [False] * n
+        stack: List[int] = []
+        sccs: List[List[int]] = []
+        counter = 0
+
+        for root in range(n):
+            if index[root] != -1:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            onstack[root] = True
+            work = [[root, out_ptr[root]]]  # (node, next edge position)
+            while work:
+                frame = work[-1]
+                v, pos = frame
+                if pos < out_ptr[v + 1]:
+                    frame[1] = pos + 1
+                    w = out_idx[pos]
+                    if index[w] == -1:
+                        index[w] = low[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        onstack[w] = True
+                        work.append([w, out_ptr[w]])
+                    elif onstack[w] and index[w] < low[v]:
+                        low[v] = index[w]
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[v] < low[parent]:
+                        low[parent] = low[v]
+                if low[v] == index[v]:
+                    comp = []
+                    while True:
+                        w = stack.pop()
+                        onstack[w] = False
+                        comp.append(w)
+                        if w == v:
+                            break
+                    sccs.append(comp)
+        return sccs
+
+
+def _bincount(values: Sequence[int], n: int) -> List[int]:
+    counts = [0] * n
+    for v in values:
+        counts[v] += 1
+    return counts
+
+
+def _csr(counts: List[int], keys: Sequence[int], vals: Sequence[int]):
+    """Stable counting sort of (key, val) pairs into (indptr, indices)"""
+    indptr = list(accumulate(counts, initial=0))
+    fill = indptr[:-1]
+    indices = [0] * len(keys)
+    for k, v in zip(keys, vals):
+        indices[fill[k]] = v
+        fill[k] += 1
+    return indptr, indices
@@ -11,7 +11,8 @@ Structure:
   │   ├── renderx-web/
   │   │   ├── config.json (codebase configuration)
   │   │   ├── ir/
-  │   │   │   └── graph.json (intermediate representation)
+  │   │   │   ├── graph.json (intermediate representation)
+  │   │   │   └── graph.ogxb (binary IR, memory-mapped by readers)
   │   │   ├── sequences/
   │   │   │   ├── sequences.json
   │   │   │   └── orchestration.json
@@ -26,6 +27,8 @@ Structure:
   │   │   └── manifest.json (artifact manifest)
   │   ├── ographx-self/
   │   └── ...
+  ├── cache/
+  │   └── renderx-web/ (incremental extraction cache)
   └── registry.json (master registry of all artifacts)
 """
 
@@ -35,6 +38,11 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
+try:
+    from ir_binary import write_binary_ir, BINARY_EXT
+except ImportError:  # imported as core.artifact_manager
+    from core.ir_binary import write_binary_ir, BINARY_EXT
+
 
 class ArtifactConfig:
     """Configuration for a codebase to be graphed"""
@@ -73,6 +81,11 @@ class ArtifactManifest:
             "calls": 0,
             "contracts": 0
         }
+        self.cache = {
+            "hits": 0,
+            "misses": 0
+        }
+        self.timings = {}
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -80,7 +93,9 @@ class ArtifactManifest:
             "config": self.config.to_dict(),
             "generated_at": self.generated_at,
             "artifacts": self.artifacts,
-            "statistics": self.statistics
+            "statistics": self.statistics,
+            "cache": self.cache,
+            "timings": self.timings
         }
 
 
@@ -135,6 +150,28 @@ class ArtifactManager:
         """Get the directory for a codebase"""
         return self.base_dir / codebase_name
     
+    def get_cache_dir(self, codebase_name: str) -> Path:
+        """Get the incremental extraction cache directory for a codebase"""
+        return self.base_dir.parent / "cache" / codebase_name
+    
+    def load_cache_stats(self, codebase_name: str) -> Optional[Dict[str, int]]:
+        """Load hit/miss counts written by the last cached extraction"""
+        stats_path = self.get_cache_dir(codebase_name) / "stats.json"
+        if not stats_path.exists():
+            return None
+        with open(stats_path) as f:
+            return json.load(f)
+    
+    def get_binary_ir_path(self, codebase_name: str) -> Path:
+        """Get the binary IR path, next to ir/graph.json"""
+        return self.get_codebase_dir(codebase_name) / "ir" / f"graph{BINARY_EXT}"
+    
+    def write_binary_ir(self, codebase_name: str, ir: Any) -> Path:
+        """Write the binary IR for a codebase from a loaded IR (dict or IRReader)"""
+        out_path = self.get_binary_ir_path(codebase_name)
+        write_binary_ir(ir, str(out_path))
+        return out_path
+    
     def save_manifest(self, codebase_name: str, manifest: ArtifactManifest):
         """Save the artifact manifest for a codebase"""
         codebase_dir = self.get_codebase_dir(codebase_name)
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Call Chains - memoized call-chain expansion for sequence generation
+
+A call chain is the ordered list of call edges reached from an entry point:
+each edge is followed (preorder) by the chain of its target, and repeated
+edges are dropped, keeping the first occurrence.
+
+CallChainIndex computes the chain fragment of every node once and reuses it
+for every entry point that reaches that node, instead of re-walking shared
+subtrees per entry point:
+
+- max_depth=N: one iterative pass per depth level; a node's fragment at
+  budget b is its own calls followed by each target's fragment at b-1, so
+  cycles need no special handling and the chain holds every call made within
+  N+1 hops of the entry point.
+- max_depth=None: one sweep over the strongly connected components in
+  reverse topological order (callees before callers). Nodes outside a cycle
+  concatenate their callees' fragments; nodes inside a cycle walk only their
+  own component and splice in the finished fragments of everything below it.
+  The result equals an unbounded visited-set DFS from each entry point.
+"""
+from itertools import chain as _concat
+from typing import Dict, Generic, List, Mapping, Optional, Sequence, Tuple, TypeVar
+
+E = TypeVar("E")  # any call edge with a ``to`` attribute (target id or empty)
+
+
+class CallChainIndex(Generic[E]):
+    """Call chains for every node of ``call_graph`` (source id -> outgoing edges)"""
+
+    def __init__(self, call_graph: Mapping[str, Sequence[E]], max_depth: Optional[int] = 3):
+        self.max_depth = max_depth
+        self.nodes: List[str] = list(call_graph)
+        self.index: Dict[str, int] = {n: i for i, n in enumerate(self.nodes)}
+        self.edges: List[E] = []
+        self.out: List[Tuple[int, ...]] = []
+        for node in self.nodes:
+            start = len(self.edges)
+            self.edges.extend(call_graph[node])
+            self.out.append(tuple(range(start, len(self.edges))))
+        # Edge target as a node index, or -1 when the target makes no calls (or is unresolved)
+        self.target: List[int] = [self.index.get(e.to, -1) if e.to else -1 for e in self.edges]
+
+        if max_depth is None:
+            self.fragments = self._sweep_components()
+        else:
+            self.fragments = self._sweep_levels(max_depth)
+
+    def chain(self, start_id: str) -> List[E]:
+        """Call chain from ``start_id`` (empty when it makes no calls)"""
+        i = self.index.get(start_id)
+        if i is None:
+            return []
+        edges = self.edges
+        return [edges[k] for k in self.fragments[i]]
+
+    def _expand(self, v: int, below: Sequence[Tuple[int, ...]]) -> Tuple[int, ...]:
+        """v's calls, each followed by its target's fragment from ``below``, first occurrences only"""
+        target = self.target
+        parts = []
+        for k in self.out[v]:
+            parts.append((k,))
+            t = target[k]
+            if t >= 0:
+                parts.append(below[t])
+        return tuple(dict.fromkeys(_concat.from_iterable(parts)))
+
+    def _sweep_levels(self, max_depth: int) -> List[Tuple[int, ...]]:
+        n = len(self.nodes)
+        frags: List[Tuple[int, ...]] = [()] * n  # budget -1: nothing is expanded
+        for _ in range(max_depth + 1):
+            nxt = [self._expand(v, frags) for v in range(n)]
+            if nxt == frags:
+                break  # every chain ends before the depth limit
+            frags = nxt
+        return frags
+
+    def _sweep_components(self) -> List[Tuple[int, ...]]:
+        n = len(self.nodes)
+        frags: List[Tuple[int, ...]] = [()] * n
+        comp_of = [-1] * n
+        # Tarjan emits components callees-first, which is the order fragments are needed in
+        for c, members in enumerate(self._components()):
+            for v in members:
+                comp_of[v] = c
+            if len(members) == 1 and all(self.target[k] != members[0] for k in self.out[members[0]]):
+                frags[members[0]] = self._expand(members[0], frags)
+                continue
+            for v in members:
+                frags[v] = self._walk_component(v, c, comp_of, frags)
+        return frags
+
+    def _walk_component(self, root: int, c: int, comp_of: List[int],
+                        frags: List[Tuple[int, ...]]) -> Tuple[int, ...]:
+        """Preorder walk from root inside component c, splicing in fragments of finished callees"""
+        out, target = self.out, self.target
+        visited = {root}
+        order: List[int] = []
+        stack = [iter(out[root])]
+        while stack:
+            for k in stack[-1]:
+                order.append(k)
+                t = target[k]
+                if t < 0 or t in visited:
+                    continue
+                visited.add(t)
+                if comp_of[t] == c:
+                    stack.append(iter(out[t]))
+                    break
+                order.extend(frags[t])
+            else:
+                stack.pop()
+        return tuple(dict.fromkeys(order))
+
+    def _components(self) -> List[List[int]]:
+        """Strongly connected components (iterative Tarjan), callees before callers"""
+        n = len(self.nodes)
+        out, target = self.out, self.target
+        index = [-1] * n
+        low = [0] * n
+        onstack = [False] * n
+        stack: List[int] = []
+        comps: List[List[int]] = []
+        counter = 0
+        for root in range(n):
+            if index[root] != -1:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            onstack[root] = True
+            work = [(root, iter(out[root]))]
+            while work:
+                v, edges = work[-1]
+                descended = False
+                for k in edges:
+                    w = target[k]
+                    if w < 0:
+                        continue
+                    if index[w] == -1:
+                        index[w] = low[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        onstack[w] = True
+                        work.append((w, iter(out[w])))
+                        descended = True
+                        break
+                    if onstack[w] and index[w] < low[v]:
+                        low[v] = index[w]
+                if descended:
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[v] < low[parent]:
+                        low[parent] = low[v]
+                if low[v] == index[v]:
+                    comp = []
+                    while True:
+                        w = stack.pop()
+                        onstack[w] = False
+                        comp.append(w)
+                        if w == v:
+                            break
+                    comps.append(comp)
+        return comps
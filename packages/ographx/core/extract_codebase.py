@@ -8,7 +8,8 @@ import sys
 import json
 import argparse
 from pathlib import Path
-from ographx_ts import build_ir, emit_ir, emit_sequences, walk_ts_files
+from ographx_ts import emit_ir, SCANNERS
+from ir_stream import IR_FORMATS
 
 def filter_files_for_codebase(root: str, exclude_dirs: list = None) -> list:
     """
@@ -30,21 +31,22 @@ def filter_files_for_codebase(root: str, exclude_dirs: list = None) -> list:
     
     return files
 
-def build_ir_from_roots(root_dirs: list, exclude_dirs: list = None) -> dict:
+def build_ir_from_roots(root_dirs: list, exclude_dirs: list = None, jobs: int = 1, cache=None,
+                        scanner: str = "legacy") -> dict:
     """
     Build IR from multiple root directories.
+    With jobs > 1, files are parsed in a process pool and merged in discovery order.
+    With an ExtractionCache, only files changed since the last run are re-parsed.
     """
-    from ographx_ts import IR, extract_symbols_and_calls
+    from ographx_ts import extract_files, merge_extractions
 
     all_files = []
-    all_symbols = []
-    all_calls = []
-    all_contracts = []
+    all_extractions = []
 
     if exclude_dirs is None:
         exclude_dirs = []
 
-    # Extract from each root directory
+    # Phase 1: extract each root directory file by file
     for root in root_dirs:
         if not os.path.exists(root):
             print(f"[WARN] Root directory not found: {root}")
@@ -54,41 +56,14 @@ def build_ir_from_roots(root_dirs: list, exclude_dirs: list = None) -> dict:
         files = filter_files_for_codebase(root, exclude_dirs)
         print(f"    Found {len(files)} TypeScript files")
 
-        # Process each file
-        for f in files:
-            try:
-                with open(f, 'r', encoding='utf-8', errors='ignore') as fh:
-                    text = fh.read()
-                syms, cs, cts = extract_symbols_and_calls(f, text, root=root)
-                all_symbols.extend(syms)
-                all_calls.extend(cs)
-                all_contracts.extend(cts)
-            except Exception as e:
-                print(f"[WARN] failed to parse {f}: {e}")
-
+        all_extractions.extend(extract_files(files, root, jobs, cache, scanner))
         all_files.extend(files)
 
-    # Global resolution pass: fill empty 'to' using all discovered symbols
-    try:
-        name_to_ids = {}
-        for s in all_symbols:
-            name = getattr(s, 'name', None) or getattr(s, 'id', '')
-            if name:
-                name_to_ids.setdefault(name, []).append(getattr(s, 'id', ''))
-        resolved = 0
-        for c in all_calls:
-            if not getattr(c, 'to', ''):
-                target = name_to_ids.get(getattr(c, 'name', ''), [])
-                if target:
-                    c.to = target[0]
-                    resolved += 1
-        if resolved:
-            print(f"    [resolve] Filled {resolved} empty call targets using global symbol map")
-    except Exception as e:
-        print(f"[WARN] Global resolution pass failed: {e}")
-
-    # Create IR
-    ir = IR(files=all_files, symbols=all_symbols, calls=all_calls, contracts=all_contracts)
+    # Phase 2: resolve calls against the project-wide symbol index and merge
+    ir = merge_extractions(all_files, all_extractions)
+    unresolved = sum(1 for c in ir.calls if not c.to)
+    if unresolved:
+        print(f"    [resolve] {unresolved} call(s) have no matching symbol in the scanned roots")
     return ir
 
 def main():
@@ -97,6 +72,10 @@ def main():
     parser.add_argument("--roots", required=True, help="Root directories (comma-separated)")
     parser.add_argument("--exclude", default="", help="Directories to exclude (comma-separated)")
     parser.add_argument("--out", required=True, help="Output IR file path")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes for parallel extraction (default: 1)")
+    parser.add_argument("--cache-dir", default="", help="Incremental extraction cache directory (disabled if empty)")
+    parser.add_argument("--scanner", choices=SCANNERS, default="legacy", help="Per-file extractor (default: legacy)")
+    parser.add_argument("--format", choices=IR_FORMATS, help="IR output format (default: from --out extension; .ndjson streams)")
     
     args = parser.parse_args()
     
@@ -111,13 +90,22 @@ def main():
     
     # Build IR
     print(f"[*] Building Intermediate Representation for '{args.name}'...")
-    ir = build_ir_from_roots(roots, excludes)
+    cache = None
+    if args.cache_dir:
+        from extraction_cache import ExtractionCache
+        cache = ExtractionCache(args.cache_dir)
+    ir = build_ir_from_roots(roots, excludes, jobs=args.jobs, cache=cache, scanner=args.scanner)
+    if cache is not None:
+        cache.prune(ir.files)
+        cache.save()
 
     print(f"[*] Extracted:")
     print(f"    - Files: {len(ir.files)}")
     print(f"    - Symbols: {len(ir.symbols)}")
     print(f"    - Calls: {len(ir.calls)}")
     print(f"    - Contracts: {len(ir.contracts)}")
+    if cache is not None:
+        print(f"    - Cache: {cache.hits} hit(s), {cache.misses} miss(es)")
     print("")
 
     # Ensure output directory exists
@@ -125,7 +113,7 @@ def main():
 
     # Emit IR
     print(f"[*] Writing IR to {args.out}")
-    emit_ir(ir, args.out)
+    emit_ir(ir, args.out, args.format)
 
     print("")
     print("[OK] Movement 1 Complete: Core Extraction")
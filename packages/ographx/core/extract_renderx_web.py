@@ -48,17 +48,15 @@ def build_ir_from_roots(root_dirs: list, exclude_dirs: list = None) -> dict:
     """
     Build IR from multiple root directories.
     """
-    from ographx_ts import IR, extract_symbols_and_calls
+    from ographx_ts import extract_files, merge_extractions
 
     all_files = []
-    all_symbols = []
-    all_calls = []
-    all_contracts = []
+    all_extractions = []
 
     if exclude_dirs is None:
         exclude_dirs = []
 
-    # Extract from each root directory
+    # Phase 1: extract each root directory file by file
     for root in root_dirs:
         if not os.path.exists(root):
             print(f"[WARN] Root directory not found: {root}")
@@ -68,42 +66,11 @@ def build_ir_from_roots(root_dirs: list, exclude_dirs: list = None) -> dict:
         files = filter_files_for_codebase(root, exclude_dirs)
         print(f"    Found {len(files)} TypeScript files")
 
-        # Process each file
-        for f in files:
-            try:
-                with open(f, 'r', encoding='utf-8', errors='ignore') as fh:
-                    text = fh.read()
-                syms, cs, cts = extract_symbols_and_calls(f, text, root=root)
-                all_symbols.extend(syms)
-                all_calls.extend(cs)
-                all_contracts.extend(cts)
-            except Exception as e:
-                print(f"[WARN] failed to parse {f}: {e}")
-
+        all_extractions.extend(extract_files(files, root))
         all_files.extend(files)
 
-    # Global resolution pass: fill empty 'to' using all discovered symbols
-    try:
-        name_to_ids = {}
-        for s in all_symbols:
-            name = getattr(s, 'name', None) or getattr(s, 'id', '')
-            if name:
-                name_to_ids.setdefault(name, []).append(getattr(s, 'id', ''))
-        resolved = 0
-        for c in all_calls:
-            if not getattr(c, 'to', ''):
-                target = name_to_ids.get(getattr(c, 'name', ''), [])
-                if target:
-                    c.to = target[0]
-                    resolved += 1
-        if resolved:
-            print(f"    [resolve] Filled {resolved} empty call targets using global symbol map")
-    except Exception as e:
-        print(f"[WARN] Global resolution pass failed: {e}")
-
-    # Create IR
-    ir = IR(files=all_files, symbols=all_symbols, calls=all_calls, contracts=all_contracts)
-    return ir
+    # Phase 2: resolve calls against the project-wide symbol index and merge
+    return merge_extractions(all_files, all_extractions)
 
 def main():
     parser = argparse.ArgumentParser(description="Extract codebase to IR")
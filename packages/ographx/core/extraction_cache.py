@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+OgraphX Extraction Cache
+
+Persistent per-file cache for ographx_ts extraction results, so unchanged
+files are not re-read or re-parsed on every run.
+
+Each entry is keyed by file path and validated by size + mtime (fast path,
+no read) and then by a SHA-256 of the content (slow path, read but no parse).
+Entries store the file's symbols, file-local calls, contracts and import
+bindings; cross-file resolution still runs over the merged result.
+
+Structure:
+  .ographx/
+  └── cache/
+      └── <codebase>/
+          ├── extract_index.json (per-file entries)
+          └── stats.json (hit/miss counts of the last run)
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+from ographx_ts import Symbol, CallEdge, Contract, ContractProp, FileExtraction
+
+CACHE_SCHEMA_VERSION = "3"
+INDEX_FILE = "extract_index.json"
+STATS_FILE = "stats.json"
+
+
+def _extractor_version() -> str:
+    """Hash of the extractor sources; a changed extractor invalidates every entry"""
+    core_dir = Path(__file__).parent
+    h = hashlib.sha256()
+    for name in ("ographx_ts.py", "fast_scanner.py"):
+        with open(core_dir / name, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()[:16]
+
+
+def content_hash(path: str) -> str:
+    """SHA-256 of a file's raw bytes"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _symbol_from_dict(d: Dict[str, Any]) -> Symbol:
+    d = dict(d)
+    d["range"] = tuple(d.get("range", (0, 0)))
+    return Symbol(**d)
+
+
+def _contract_from_dict(d: Dict[str, Any]) -> Contract:
+    return Contract(id=d["id"], kind=d.get("kind", "params"),
+                    props=[ContractProp(**p) for p in d.get("props", [])])
+
+
+class ExtractionCache:
+    """Content-hash cache of per-file extraction results"""
+
+    def __init__(self, cache_dir: str = ".ographx/cache"):
+        self.cache_dir = Path(cache_dir)
+        self.index_path = self.cache_dir / INDEX_FILE
+        self.stats_path = self.cache_dir / STATS_FILE
+        self.version = _extractor_version()
+        self.entries: Dict[str, Dict[str, Any]] = self._load_index()
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the index, discarding it if the schema or extractor changed"""
+        if not self.index_path.exists():
+            return {}
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("schema") != CACHE_SCHEMA_VERSION or data.get("extractor") != self.version:
+            return {}
+        return data.get("entries", {})
+
+    def get(self, path: str, root: str, scanner: str = "legacy") -> Optional[FileExtraction]:
+        """Return the cached FileExtraction for path, or None on a miss"""
+        entry = self.entries.get(path)
+        result = None
+        if entry is not None and entry.get("root") == root and entry.get("scanner") == scanner:
+            try:
+                st = os.stat(path)
+                if entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns:
+                    result = entry
+                elif entry["size"] == st.st_size and entry["sha256"] == content_hash(path):
+                    # Touched but unchanged (checkout, copy): refresh the stat key
+                    entry["mtime_ns"] = st.st_mtime_ns
+                    self._dirty = True
+                    result = entry
+            except OSError:
+                result = None
+
+        if result is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return FileExtraction(
+            path=path,
+            symbols=[_symbol_from_dict(s) for s in result["symbols"]],
+            calls=[CallEdge(**c) for c in result["calls"]],
+            contracts=[_contract_from_dict(ct) for ct in result["contracts"]],
+            imports={k: tuple(v) for k, v in result["imports"].items()},
+        )
+
+    def put(self, fx: FileExtraction, root: str, scanner: str = "legacy"):
+        """Record the extraction result for fx.path"""
+        try:
+            st = os.stat(fx.path)
+            digest = content_hash(fx.path)
+        except OSError:
+            return
+        self.entries[fx.path] = {
+            "root": root,
+            "scanner": scanner,
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "sha256": digest,
+            "symbols": [asdict(s) for s in fx.symbols],
+            "calls": [asdict(c) for c in fx.calls],
+            "contracts": [asdict(ct) for ct in fx.contracts],
+            "imports": fx.imports,
+        }
+        self._dirty = True
+
+    def prune(self, live_paths: List[str]):
+        """Drop entries for files that no longer exist in the scanned tree"""
+        live = set(live_paths)
+        stale = [p for p in self.entries if p not in live]
+        for p in stale:
+            del self.entries[p]
+        if stale:
+            self._dirty = True
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+    def save(self):
+        """Persist the index (only when changed) and the last run's hit/miss counts"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        if self._dirty:
+            tmp_path = self.index_path.with_suffix(".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "schema": CACHE_SCHEMA_VERSION,
+                    "extractor": self.version,
+                    "entries": self.entries,
+                }, f)
+            os.replace(tmp_path, self.index_path)
+            self._dirty = False
+        with open(self.stats_path, 'w', encoding='utf-8') as f:
+            json.dump(self.stats(), f, indent=2)
+
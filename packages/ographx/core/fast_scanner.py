@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+OgraphX Fast Scanner — single-pass TypeScript symbol/call scanner
+-----------------------------------------------------------------
+Drop-in alternative to ographx_ts.extract_symbols_and_calls (``--scanner=fast``).
+
+The legacy extractor tries up to five header regexes on every line and
+recounts braces from scratch (``find_blocks``) for every symbol. This scanner
+instead makes one lexical sweep per file that:
+
+- blanks out comments, string/template literals and regex literals (one
+  regex pass), so braces and quotes inside them no longer unbalance blocks;
+- records each line's net code-brace delta, giving a prefix-depth table from
+  which any block end is a single forward lookup instead of a recount.
+
+Candidate header lines and exported classes are found with one whole-text
+regex pass each over the blanked text, so the header regexes only run on
+lines that can possibly match (never inside comments or templates), and
+call sites are collected from each body line exactly once.
+
+Output is the same (symbols, calls, contracts) shape and, for code without
+braces inside strings/comments/regex literals, identical to the legacy extractor
+(see tests/unit/test_fast_scanner.py).
+"""
+import os
+import re
+from itertools import accumulate, repeat
+from operator import sub
+from typing import List, Tuple
+
+from ographx_ts import (
+    FUNC_DECL_RE, FUNC_START_RE, ARROW_PARAMS_RE, NAMED_FUNC_RE, CLASS_DECL_RE,
+    METHOD_RE, CALL_RE, RESERVED,
+    Symbol, CallEdge, Contract,
+    parse_params, normalize_contract_id, collect_header_params, finalize_extraction,
+)
+
+# Comments, string/template literals and regex literals, blanked out before
+# counting braces. A quote glued to a word char is JSX text ("Don't"), not a string.
+_NOISE_RE = re.compile(
+    r"""(?=[/'"`])(?:"""  # cheap first-char gate before trying the alternatives
+    r"""/(?:/[^\n]*|\*[\s\S]*?(?:\*/|$))"""
+    r"""|(?P<regex>/(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[A-Za-z]*)"""
+    r"""|(?<![\w])(?:'[^'\\\n]*(?:\\.[^'\\\n]*)*'?|"[^"\\\n]*(?:\\.[^"\\\n]*)*"?)"""
+    r"""|`[^`\\]*(?:\\[\s\S][^`\\]*)*`?)"""
+)
+# A '/' after one of these (or at the start of the text) begins a regex literal, not a
+# division. '<' and '>' are left out so JSX closing tags ("</div>") stay code.
+_REGEX_PRECEDERS = frozenset('(,=:[!&|?{};+-*%~^')
+_REGEX_KEYWORDS = frozenset(('return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete',
+                             'void', 'throw', 'instanceof', 'yield', 'await'))
+# Marks lines that start inside a multi-line comment or template literal
+_NOT_CODE = '\x00'
+# Lines that can start a symbol header, found in one whole-text pass
+_HEADER_LINE_RE = re.compile(r'^[^\S\n]*(?:export[^\S\n]+)?(?:function|const|var|let|class)[^\S\n]', re.MULTILINE)
+_EXPORTED_CLASS_RE = re.compile(r'^[^\S\n]*export[^\S\n]+class[^\S\n]+([A-Za-z_]\w*)\b', re.MULTILINE)
+
+
+def _blank(m: re.Match) -> str:
+    # Keep the line structure; continuation lines are flagged as not starting in code
+    return ('\n' + _NOT_CODE) * m.group().count('\n')
+
+
+def _regex_allowed(text: str, pos: int) -> bool:
+    """Whether a '/' at pos is in expression position (starts a regex literal)."""
+    k = pos - 1
+    while k >= 0 and text[k] in ' \t\r\n':
+        k -= 1
+    if k < 0 or text[k] in _REGEX_PRECEDERS:
+        return True
+    if not (text[k].isalnum() or text[k] in '_$'):
+        return False
+    word_end = k + 1
+    while k >= 0 and (text[k].isalnum() or text[k] in '_$'):
+        k -= 1
+    return text[k + 1:word_end] in _REGEX_KEYWORDS
+
+
+def strip_noise(text: str) -> str:
+    """Remove comments, string/template literals and regex literals, preserving line breaks."""
+    out = []
+    pos = 0
+    search = _NOISE_RE.search
+    m = search(text)
+    while m:
+        start = m.start()
+        if m.group('regex') is not None and not _regex_allowed(text, start):
+            # A division: only the '/' is consumed, the rest is lexed normally
+            m = search(text, start + 1)
+            continue
+        out.append(text[pos:start])
+        out.append(_blank(m))
+        pos = m.end()
+        m = search(text, pos)
+    out.append(text[pos:])
+    return ''.join(out)
+
+
+class BlockIndex:
+    """Block-end lookup over a prefix code-brace depth computed once per file.
+
+    Same contract as ographx_ts.find_blocks: from the first line at/after
+    ``start`` with a code '{', the block ends on the first line where the
+    running depth returns to zero (or, when a line closes several blocks at
+    once, drops below it). Braces in strings/comments are ignored.
+    """
+
+    def __init__(self, code_lines: List[str]):
+        self.n = len(code_lines)
+        opens = list(map(str.count, code_lines, repeat('{')))
+        closes = map(str.count, code_lines, repeat('}'))
+        self.has_open = list(map(bool, opens))
+        self.prefix = list(accumulate(map(sub, opens, closes), initial=0))
+        # closes_at[i]: first k > i with prefix[k] <= prefix[i] (monotonic stack, one pass)
+        self.closes_at = [len(self.prefix)] * len(self.prefix)
+        stack: List[int] = []
+        for k, depth in enumerate(self.prefix):
+            while stack and self.prefix[stack[-1]] >= depth:
+                self.closes_at[stack.pop()] = k
+            stack.append(k)
+
+    def end(self, start: int) -> int:
+        try:
+            i = self.has_open.index(True, start)
+        except ValueError:
+            return min(start, self.n - 1)
+        # first k > i where the running depth is back to (or below) its value before line i
+        k = self.closes_at[i]
+        return k - 1 if k <= self.n else self.n - 1
+
+
+def _header_lines(text: str) -> List[int]:
+    """0-based indices of lines whose leading keyword can start a symbol header."""
+    out = []
+    line_no = 0
+    last = 0
+    for m in _HEADER_LINE_RE.finditer(text):
+        line_no += text.count('\n', last, m.start())
+        last = m.start()
+        out.append(line_no)
+    return out
+
+
+def scan_symbols_and_calls(path: str, text: str, root: str = "") -> Tuple[List[Symbol], List[CallEdge], List[Contract]]:
+    """Single-pass equivalent of ographx_ts.extract_symbols_and_calls."""
+    lines = text.splitlines()
+    symbols: List[Symbol] = []
+    calls: List[CallEdge] = []
+    contracts: List[Contract] = []
+    if not lines:
+        return finalize_extraction(symbols, calls, contracts)
+
+    # Work on the same line sequence as splitlines() so offsets map to line indices
+    joined = '\n'.join(lines)
+    code = strip_noise(joined)
+    blocks = BlockIndex(code.split('\n'))
+    base = os.path.basename(path)
+    exported_classes = set(_EXPORTED_CLASS_RE.findall(code)) if 'class' in code else set()
+
+    def collect_calls(frm: str, first: int, last: int):
+        for j in range(first, last + 1):
+            for cm in CALL_RE.finditer(lines[j]):
+                callee = cm.group(1)
+                if callee not in RESERVED:
+                    calls.append(CallEdge(frm=frm, to="", name=callee, line=j + 1))
+
+    def add_function(name: str, params_text: str, idx: int, end: int, is_export: bool):
+        cid = normalize_contract_id(name, params_text)
+        contracts.append(Contract(id=cid, props=parse_params(params_text)))
+        sym = Symbol(
+            id=f"{base}::{name}",
+            file=path, kind="function", name=name, exported=is_export,
+            params_contract=cid, range=(idx + 1, end + 1)
+        )
+        symbols.append(sym)
+        collect_calls(sym.id, idx + 1, end)
+
+    resume = 0  # first line not yet consumed by a symbol body
+    for idx in _header_lines(code):
+        if idx < resume:
+            continue
+        stripped = lines[idx].strip()
+        keyword = stripped[6:].lstrip() if stripped.startswith('export') else stripped
+        keyword = keyword.split(None, 1)[0]
+
+        if keyword == 'function':
+            m = FUNC_DECL_RE.match(stripped)
+            if m:
+                params_text = m.group(2) or ""
+            else:
+                m = FUNC_START_RE.match(stripped)
+                if m:
+                    params_text = collect_header_params(lines, idx)
+            if m:
+                end = blocks.end(idx)
+                add_function(m.group(1), params_text, idx, end, stripped.startswith('export'))
+                resume = end + 1
+
+        elif keyword in ('const', 'var', 'let'):
+            m = ARROW_PARAMS_RE.match(stripped) if keyword == 'const' else None
+            if not m:
+                m = NAMED_FUNC_RE.match(stripped)
+            if m:
+                end = blocks.end(idx)
+                add_function(m.group(1), m.group(2) or "", idx, end, stripped.startswith('export'))
+                resume = end + 1
+
+        elif keyword == 'class':
+            m = CLASS_DECL_RE.match(stripped)
+            if m:
+                cls = m.group(1)
+                end = blocks.end(idx)
+                exported = cls in exported_classes
+                symbols.append(Symbol(
+                    id=f"{base}::{cls}",
+                    file=path, kind="class", name=cls, exported=exported,
+                    params_contract=None, range=(idx + 1, end + 1)
+                ))
+                k = idx + 1
+                while k <= end:
+                    ln = lines[k]
+                    # METHOD_RE needs both a '(' and a trailing '{'
+                    mm = METHOD_RE.match(ln) if '(' in ln and '{' in ln else None
+                    if mm:
+                        mname = mm.group(1)
+                        params_text = mm.group(2) or ""
+                        mend = blocks.end(k)
+                        cid = normalize_contract_id(f"{cls}.{mname}", params_text)
+                        contracts.append(Contract(id=cid, props=parse_params(params_text)))
+                        sym = Symbol(
+                            id=f"{base}::{cls}.{mname}",
+                            file=path, kind="method", name=mname, class_name=cls,
+                            exported=exported, params_contract=cid,
+                            range=(k + 1, mend + 1)
+                        )
+                        symbols.append(sym)
+                        collect_calls(sym.id, k + 1, mend)
+                        k = mend + 1
+                    else:
+                        k += 1
+                resume = end + 1
+
+    return finalize_extraction(symbols, calls, contracts)
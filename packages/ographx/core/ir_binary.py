@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+OgraphX Binary IR
+-----------------
+Compact, interned binary form of the IR (``graph.ogxb``), loaded through
+``mmap`` with no parsing: every section is a flat uint32 array viewed in place.
+
+Layout (native byte order, every section 4-byte aligned):
+  header            magic, version, byte-order mark, section counts
+  string offsets    uint32[n_strings + 1]   (into the UTF-8 blob)
+  string blob       bytes                   (all interned strings, padded)
+  files             uint32[n_files]         (string ids)
+  symbols           uint32[n_symbols * 9]   id, file, kind, name, class_name,
+                                            params_contract, start, end, exported
+  calls             uint32[n_calls * 4]     frm, to, name, line
+  contracts         uint32[n_contracts * 2] id, kind
+  contract props    uint32[n_contracts + 1] (CSR offsets into props)
+  props             uint32[n_props * 2]     name, raw
+  out edges         uint32[n_symbols + 1] + uint32[n_edges]  (CSR: caller -> callee)
+  in edges          uint32[n_symbols + 1] + uint32[n_edges]  (CSR: callee -> caller)
+
+Strings such as ``file.ts::Class.method`` are stored once and referenced by
+id; missing values (class_name, params_contract, unresolved ``to``) use NONE.
+Edges connect symbol indices (first occurrence of each symbol id) for calls
+whose caller and callee are both known symbols.
+
+Usage:
+  python ir_binary.py graph.json graph.ogxb      # convert (json or ndjson input)
+  python ir_binary.py --info graph.ogxb
+"""
+import argparse
+import mmap
+import os
+import struct
+from array import array
+from dataclasses import asdict, is_dataclass
+from typing import Any, Dict, Iterator, List, Mapping, Optional
+
+MAGIC = b"OGXIR\0\0\0"
+BINARY_VERSION = 1
+BYTE_ORDER_MARK = 0x01020304
+NONE = 0xFFFFFFFF
+SYMBOL_WIDTH = 9
+CALL_WIDTH = 4
+CONTRACT_WIDTH = 2
+PROP_WIDTH = 2
+BINARY_EXT = ".ogxb"
+
+# magic, then: version, byte-order mark, n_strings, blob_len, n_files,
+# n_symbols, n_calls, n_contracts, n_props, n_edges
+_HEADER = struct.Struct("=8s10I")
+
+assert array('I').itemsize == 4, "uint32 arrays required"
+
+
+def _record(item: Any) -> Dict[str, Any]:
+    return asdict(item) if is_dataclass(item) else item
+
+
+def _pad4(n: int) -> int:
+    return (n + 3) & ~3
+
+
+def _csr(n_nodes: int, src: array, dst: array):
+    """Counting-sort edge lists into CSR (indptr, indices), stable by input order"""
+    indptr = array('I', bytes(4 * (n_nodes + 1)))
+    for s in src:
+        indptr[s + 1] += 1
+    for i in range(n_nodes):
+        indptr[i + 1] += indptr[i]
+    fill = array('I', indptr[:-1])
+    indices = array('I', bytes(4 * len(src)))
+    for s, d in zip(src, dst):
+        indices[fill[s]] = d
+        fill[s] += 1
+    return indptr, indices
+
+
+def write_binary_ir(sections: Mapping[str, Any], out_path: str) -> str:
+    """Write IR sections (dicts or dataclasses; an IRReader or loaded graph.json) as binary IR"""
+    table: Dict[str, int] = {}
+
+    def intern(s: Optional[str]) -> int:
+        if s is None:
+            return NONE
+        sid = table.get(s)
+        if sid is None:
+            sid = table[s] = len(table)
+        return sid
+
+    files = array('I', (intern(f) for f in sections.get("files", [])))
+
+    symbols = array('I')
+    node_of: Dict[int, int] = {}  # symbol string id -> first symbol index
+    for n, s in enumerate(sections.get("symbols", [])):
+        s = _record(s)
+        sid = intern(s.get("id"))
+        node_of.setdefault(sid, n)
+        start, end = (list(s.get("range") or (0, 0)) + [0, 0])[:2]
+        symbols.extend((
+            sid, intern(s.get("file")), intern(s.get("kind")), intern(s.get("name")),
+            intern(s.get("class_name")), intern(s.get("params_contract")),
+            start, end, 1 if s.get("exported") else 0,
+        ))
+    n_symbols = len(symbols) // SYMBOL_WIDTH
+
+    calls = array('I')
+    edge_src = array('I')
+    edge_dst = array('I')
+    for c in sections.get("calls", []):
+        c = _record(c)
+        frm = intern(c.get("frm"))
+        to = intern(c.get("to") or None)
+        calls.extend((frm, to, intern(c.get("name")), c.get("line") or 0))
+        fi = node_of.get(frm)
+        ti = node_of.get(to)
+        if fi is not None and ti is not None:
+            edge_src.append(fi)
+            edge_dst.append(ti)
+
+    contracts = array('I')
+    prop_ptr = array('I', [0])
+    props = array('I')
+    for ct in sections.get("contracts", []):
+        ct = _record(ct)
+        contracts.extend((intern(ct.get("id")), intern(ct.get("kind"))))
+        for p in ct.get("props", []):
+            props.extend((intern(p.get("name")), intern(p.get("raw"))))
+        prop_ptr.append(len(props) // PROP_WIDTH)
+
+    out_ptr, out_idx = _csr(n_symbols, edge_src, edge_dst)
+    in_ptr, in_idx = _csr(n_symbols, edge_dst, edge_src)
+
+    # String table: offsets + one UTF-8 blob (dict preserves interning order)
+    str_offsets = array('I', [0])
+    blob = bytearray()
+    for s in table:
+        blob += s.encode('utf-8')
+        str_offsets.append(len(blob))
+    blob_len = len(blob)
+    blob += b"\0" * (_pad4(blob_len) - blob_len)
+
+    os.makedirs(os.path.dirname(out_path) or '.', exist_ok=True)
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(
+            MAGIC, BINARY_VERSION, BYTE_ORDER_MARK, len(table), blob_len, len(files),
+            n_symbols, len(calls) // CALL_WIDTH, len(contracts) // CONTRACT_WIDTH,
+            len(props) // PROP_WIDTH, len(edge_src),
+        ))
+        str_offsets.tofile(f)
+        f.write(blob)
+        for arr in (files, symbols, calls, contracts, prop_ptr, props, out_ptr, out_idx, in_ptr, in_idx):
+            arr.tofile(f)
+    os.replace(tmp_path, out_path)
+    return out_path
+
+
+class BinaryIR:
+    """Memory-mapped accessor over a binary IR file.
+
+    Loading maps the file and slices typed views; nothing is decoded until a
+    record is read. ``get("symbols")`` etc. yield dicts in the graph.json shape,
+    so scripts written against the JSON IR can iterate it unchanged.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        buf = memoryview(self._mm)
+        (magic, version, bom, n_strings, blob_len, self.n_files, self.n_symbols,
+         self.n_calls, self.n_contracts, n_props, self.n_edges) = _HEADER.unpack_from(buf)
+        if magic != MAGIC:
+            raise ValueError(f"not an OgraphX binary IR: {path}")
+        if version != BINARY_VERSION:
+            raise ValueError(f"unsupported binary IR version {version}: {path}")
+        if bom != BYTE_ORDER_MARK:
+            raise ValueError(f"binary IR written with a different byte order: {path}")
+
+        pos = _HEADER.size
+
+        def u32(count: int) -> memoryview:
+            nonlocal pos
+            view = buf[pos:pos + 4 * count].cast('I')
+            pos += 4 * count
+            return view
+
+        self._str_offsets = u32(n_strings + 1)
+        self._blob = buf[pos:pos + blob_len]
+        pos += _pad4(blob_len)
+        self._files = u32(self.n_files)
+        self._symbols = u32(self.n_symbols * SYMBOL_WIDTH)
+        self._calls = u32(self.n_calls * CALL_WIDTH)
+        self._contracts = u32(self.n_contracts * CONTRACT_WIDTH)
+        self._prop_ptr = u32(self.n_contracts + 1)
+        self._props = u32(n_props * PROP_WIDTH)
+        self._out_ptr = u32(self.n_symbols + 1)
+        self._out_idx = u32(self.n_edges)
+        self._in_ptr = u32(self.n_symbols + 1)
+        self._in_idx = u32(self.n_edges)
+        self._index: Optional[Dict[str, int]] = None
+
+    # --- strings -------------------------------------------------------------
+
+    def string(self, sid: int) -> Optional[str]:
+        if sid == NONE:
+            return None
+        return str(self._blob[self._str_offsets[sid]:self._str_offsets[sid + 1]], 'utf-8')
+
+    # --- records (graph.json shape) -----------------------------------------
+
+    def file(self, i: int) -> str:
+        return self.string(self._files[i])
+
+    def symbol(self, i: int) -> Dict[str, Any]:
+        sid, file, kind, name, cls, pc, start, end, exported = \
+            self._symbols[i * SYMBOL_WIDTH:(i + 1) * SYMBOL_WIDTH]
+        s = self.string
+        return {
+            "id": s(sid), "file": s(file), "kind": s(kind), "name": s(name),
+            "class_name": s(cls), "exported": bool(exported),
+            "params_contract": s(pc), "range": [start, end],
+        }
+
+    def symbol_id(self, i: int) -> str:
+        return self.string(self._symbols[i * SYMBOL_WIDTH])
+
+    def call(self, i: int) -> Dict[str, Any]:
+        frm, to, name, line = self._calls[i * CALL_WIDTH:(i + 1) * CALL_WIDTH]
+        return {"frm": self.string(frm), "to": self.string(to) or "", "name": self.string(name), "line": line}
+
+    def contract(self, i: int) -> Dict[str, Any]:
+        cid, kind = self._contracts[i * CONTRACT_WIDTH:(i + 1) * CONTRACT_WIDTH]
+        props = [
+            {"name": self.string(self._props[p * PROP_WIDTH]), "raw": self.string(self._props[p * PROP_WIDTH + 1])}
+            for p in range(self._prop_ptr[i], self._prop_ptr[i + 1])
+        ]
+        return {"id": self.string(cid), "kind": self.string(kind), "props": props}
+
+    def files(self) -> Iterator[str]:
+        return (self.file(i) for i in range(self.n_files))
+
+    def symbols(self) -> Iterator[Dict[str, Any]]:
+        return (self.symbol(i) for i in range(self.n_symbols))
+
+    def calls(self) -> Iterator[Dict[str, Any]]:
+        return (self.call(i) for i in range(self.n_calls))
+
+    def contracts(self) -> Iterator[Dict[str, Any]]:
+        return (self.contract(i) for i in range(self.n_contracts))
+
+    def get(self, name: str, default: Any = None) -> Any:
+        readers = {"files": (self.files, self.n_files), "symbols": (self.symbols, self.n_symbols),
+                   "calls": (self.calls, self.n_calls), "contracts": (self.contracts, self.n_contracts)}
+        if name not in readers:
+            return default
+        return _Section(*readers[name])
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        return {name: list(self.get(name)) for name in ("files", "symbols", "calls", "contracts")}
+
+    # --- graph ----------------------------------------------------------------
+
+    def index_of(self, symbol_id: str) -> Optional[int]:
+        """Symbol index for an id (first occurrence); builds the lookup on first use"""
+        if self._index is None:
+            self._index = {}
+            for i in range(self.n_symbols):
+                self._index.setdefault(self.symbol_id(i), i)
+        return self._index.get(symbol_id)
+
+    def callees(self, i: int) -> memoryview:
+        return self._out_idx[self._out_ptr[i]:self._out_ptr[i + 1]]
+
+    def callers(self, i: int) -> memoryview:
+        return self._in_idx[self._in_ptr[i]:self._in_ptr[i + 1]]
+
+    def out_degree(self, i: int) -> int:
+        return self._out_ptr[i + 1] - self._out_ptr[i]
+
+    def in_degree(self, i: int) -> int:
+        return self._in_ptr[i + 1] - self._in_ptr[i]
+
+    # --- lifecycle --------------------------------------------------------------
+
+    def close(self):
+        if self._mm is None:
+            return
+        # Views must be released before the map can close
+        for attr in ("_str_offsets", "_blob", "_files", "_symbols", "_calls", "_contracts",
+                     "_prop_ptr", "_props", "_out_ptr", "_out_idx", "_in_ptr", "_in_idx"):
+            getattr(self, attr).release()
+        self._mm.close()
+        self._file.close()
+        self._mm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _Section:
+    """Re-iterable section view with len()"""
+
+    def __init__(self, factory, count: int):
+        self._factory = factory
+        self._count = count
+
+    def __iter__(self):
+        return self._factory()
+
+    def __len__(self) -> int:
+        return self._count
+
+
+def load_binary_ir(path: str) -> BinaryIR:
+    return BinaryIR(path)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Convert an OgraphX IR to the binary (.ogxb) format")
+    ap.add_argument("input", help="graph.json / graph.ndjson (or .ogxb with --info)")
+    ap.add_argument("output", nargs="?", help="Output .ogxb path (default: input with .ogxb extension)")
+    ap.add_argument("--info", action="store_true", help="Print section sizes of a binary IR")
+    args = ap.parse_args()
+
+    if args.info:
+        with BinaryIR(args.input) as bir:
+            print(f"files={bir.n_files} symbols={bir.n_symbols} calls={bir.n_calls} "
+                  f"contracts={bir.n_contracts} edges={bir.n_edges} bytes={os.path.getsize(args.input)}")
+        return
+
+    from ir_stream import open_ir
+    out = args.output or os.path.splitext(args.input)[0] + BINARY_EXT
+    write_binary_ir(open_ir(args.input), out)
+    print(f"[OK] Binary IR written to {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+OgraphX IR Stream
+
+Streaming (NDJSON) form of the IR, so very large graphs can be written and
+consumed without holding the whole document in memory.
+
+Format (one JSON value per line, sections in this order):
+  {"format": "ographx-ir", "version": 1}
+  {"@section": "files", "count": 2}
+  "src/a.ts"
+  "src/b.ts"
+  {"@section": "symbols", "count": 1}
+  {"id": "a.ts::run", ...}
+  {"@section": "calls", "count": 0}
+  {"@section": "contracts", "count": 0}
+
+Readers iterate one section at a time (IRReader.iter_section) or all records
+in a single pass (IRReader.records). IRReader also accepts the legacy
+indented graph.json, which is loaded in full, and open_ir() hands binary
+``.ogxb`` files to ir_binary.BinaryIR, so consumers can switch to ``open_ir``
+without caring which format a step produced.
+"""
+
+import json
+import os
+from dataclasses import asdict, is_dataclass
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+IR_FORMAT = "ographx-ir"
+IR_STREAM_VERSION = 1
+IR_SECTIONS = ("files", "symbols", "calls", "contracts")
+IR_FORMATS = ("json", "ndjson")
+SECTION_KEY = "@section"
+
+
+def _to_record(item: Any) -> Any:
+    return asdict(item) if is_dataclass(item) else item
+
+
+def infer_format(out_path: str) -> str:
+    """Output format implied by a file name (``.ndjson`` → ndjson, else json)"""
+    return "ndjson" if out_path.endswith(".ndjson") else "json"
+
+
+class IRWriter:
+    """Write an IR section by section, one record per line.
+
+    Usage:
+        with IRWriter(path) as w:
+            w.write_section("files", files)
+            w.write_section("symbols", iter_symbols())  # count written as null
+    """
+
+    def __init__(self, out_path: str):
+        os.makedirs(os.path.dirname(out_path) or '.', exist_ok=True)
+        self.out_path = out_path
+        self._f = open(out_path, 'w', encoding='utf-8')
+        self._dump({"format": IR_FORMAT, "version": IR_STREAM_VERSION})
+
+    def _dump(self, value: Any):
+        self._f.write(json.dumps(value, separators=(',', ':')))
+        self._f.write('\n')
+
+    def begin_section(self, name: str, count: Optional[int] = None):
+        if name not in IR_SECTIONS:
+            raise ValueError(f"unknown IR section: {name}")
+        self._dump({SECTION_KEY: name, "count": count})
+
+    def write(self, item: Any):
+        self._dump(_to_record(item))
+
+    def write_section(self, name: str, items: Iterable[Any]):
+        """Write a whole section; the count header is filled in for sized inputs"""
+        self.begin_section(name, len(items) if hasattr(items, '__len__') else None)
+        for item in items:
+            self.write(item)
+
+    def close(self):
+        if not self._f.closed:
+            self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_ir_ndjson(sections: Dict[str, Iterable[Any]], out_path: str):
+    """Write every IR section (dataclasses or dicts) to an NDJSON file"""
+    with IRWriter(out_path) as w:
+        for name in IR_SECTIONS:
+            w.write_section(name, sections.get(name, []))
+
+
+def _is_stream(path: str) -> bool:
+    with open(path, 'r', encoding='utf-8') as f:
+        first = f.readline()
+    try:
+        head = json.loads(first)
+    except ValueError:
+        return False
+    return isinstance(head, dict) and head.get("format") == IR_FORMAT
+
+
+class SectionView:
+    """Re-iterable, lazily read view of one IR section (supports len())"""
+
+    def __init__(self, reader: "IRReader", name: str):
+        self._reader = reader
+        self.name = name
+
+    def __iter__(self) -> Iterator[Any]:
+        return self._reader.iter_section(self.name)
+
+    def __len__(self) -> int:
+        return self._reader.count(self.name)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+
+class IRReader:
+    """Iterator-based reader over an NDJSON (or legacy JSON) IR file.
+
+    Supports the ``ir.get("symbols", [])`` idiom used by the analysis and
+    generator scripts; the returned value is a SectionView, so iterating it
+    streams records from disk instead of materialising the section.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.streaming = _is_stream(path)
+        self._doc: Optional[Dict[str, Any]] = None
+        self._counts: Dict[str, int] = {}
+        if not self.streaming:
+            with open(path, 'r', encoding='utf-8') as f:
+                self._doc = json.load(f)
+
+    def records(self) -> Iterator[Tuple[str, Any]]:
+        """Yield (section, record) for every record in file order (one pass)"""
+        if self._doc is not None:
+            for name in IR_SECTIONS:
+                for item in self._doc.get(name, []):
+                    yield name, item
+            return
+        section = None
+        with open(self.path, 'r', encoding='utf-8') as f:
+            f.readline()  # format header
+            for line in f:
+                if not line.strip():
+                    continue
+                value = json.loads(line)
+                if isinstance(value, dict) and SECTION_KEY in value:
+                    section = value[SECTION_KEY]
+                    if value.get("count") is not None:
+                        self._counts[section] = value["count"]
+                    continue
+                yield section, value
+
+    def iter_section(self, name: str) -> Iterator[Any]:
+        """Yield the records of one section, reading only as far as its end"""
+        if self._doc is not None:
+            yield from self._doc.get(name, [])
+            return
+        seen = False
+        for section, value in self.records():
+            if section == name:
+                seen = True
+                yield value
+            elif seen:
+                return
+
+    def count(self, name: str) -> int:
+        """Number of records in a section (header count, or one counting pass)"""
+        if self._doc is not None:
+            return len(self._doc.get(name, []))
+        if name not in self._counts:
+            self._read_counts()
+        if name not in self._counts:
+            self._counts[name] = sum(1 for _ in self.iter_section(name))
+        return self._counts[name]
+
+    def _read_counts(self):
+        # Section headers carry counts; scan for them without decoding records
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if SECTION_KEY in line:
+                    value = json.loads(line)
+                    if isinstance(value, dict) and SECTION_KEY in value and value.get("count") is not None:
+                        self._counts[value[SECTION_KEY]] = value["count"]
+
+    def get(self, name: str, default: Any = None) -> Any:
+        if name in IR_SECTIONS:
+            return SectionView(self, name)
+        if self._doc is not None:
+            return self._doc.get(name, default)
+        return default
+
+    def __getitem__(self, name: str) -> SectionView:
+        if name not in IR_SECTIONS:
+            raise KeyError(name)
+        return SectionView(self, name)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialise the whole IR (legacy in-memory shape)"""
+        if self._doc is not None:
+            return self._doc
+        doc: Dict[str, Any] = {name: [] for name in IR_SECTIONS}
+        for section, value in self.records():
+            doc.setdefault(section, []).append(value)
+        return doc
+
+
+def open_ir(path: str):
+    """Open an IR file in any format: graph.json, NDJSON or binary (.ogxb)"""
+    try:
+        from ir_binary import BinaryIR, MAGIC
+    except ImportError:  # imported as core.ir_stream
+        from core.ir_binary import BinaryIR, MAGIC
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) == MAGIC:
+            return BinaryIR(path)
+    return IRReader(path)
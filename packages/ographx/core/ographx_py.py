@@ -34,6 +34,8 @@ import sys
 from dataclasses import dataclass, asdict, field
 from typing import List, Dict, Optional, Tuple
 
+from ir_stream import IR_FORMATS, infer_format, write_ir_ndjson
+
 # Ensure UTF-8 output on Windows terminals
 try:
     sys.stdout.reconfigure(encoding='utf-8')
@@ -266,8 +268,17 @@ def build_ir(root: str) -> IR:
         contracts=all_contracts
     )
 
-def emit_ir(ir: IR, out_path: str):
-    """Emit IR as JSON."""
+def emit_ir(ir: IR, out_path: str, fmt: Optional[str] = None):
+    """Emit IR as JSON, or as streaming NDJSON for ``.ndjson`` paths / fmt="ndjson"."""
+    if (fmt or infer_format(out_path)) == "ndjson":
+        write_ir_ndjson({
+            'files': ir.files,
+            'symbols': ir.symbols,
+            'calls': ir.calls,
+            'contracts': ir.contracts,
+        }, out_path)
+        print(f"✓ Emitted IR: {out_path}")
+        return
     data = {
         'files': ir.files,
         'symbols': [asdict(s) for s in ir.symbols],
@@ -283,10 +294,11 @@ def main():
     parser = argparse.ArgumentParser(description='OgraphX PY - Python flow extractor')
     parser.add_argument('--root', default='.', help='Root directory to scan')
     parser.add_argument('--out', required=True, help='Output IR file')
+    parser.add_argument('--format', choices=IR_FORMATS, help='IR output format (default: from --out extension; .ndjson streams)')
     args = parser.parse_args()
     
     ir = build_ir(args.root)
-    emit_ir(ir, args.out)
+    emit_ir(ir, args.out, args.format)
     print(f"✓ Extracted {len(ir.symbols)} symbols, {len(ir.calls)} calls")
 
 if __name__ == '__main__':
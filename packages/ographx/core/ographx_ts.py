@@ -12,8 +12,11 @@ Usage:
 Enhancements (MVP+):
 - Scope-aware resolution: Prioritizes same-file symbols, then imports, then global fallback
 - Import graph awareness: Parses import statements to resolve cross-file targets
+- Two-phase resolution: per-file extraction resolves same-file calls; a project-wide
+  symbol index keyed by (module, exported name) then resolves imports in O(1) per call
 - Generics/union types: Handles T<U>, T<U,V>, T | U type annotations
-- Enriched sequences: Uses DFS to build call chains (depth-limited to 3) instead of just direct calls
+- Enriched sequences: Builds call chains (depth-limited to 3) instead of just direct calls,
+  memoized per callee across entry points (see call_chains.py)
 
 Notes:
 - This is intentionally conservative. It favors correctness over completeness.
@@ -32,9 +35,13 @@ import argparse
 import json
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, asdict, field
 from typing import List, Dict, Optional, Tuple
 
+from ir_stream import IR_FORMATS, infer_format, write_ir_ndjson
+from call_chains import CallChainIndex
+
 FUNC_DECL_RE = re.compile(r'^(?:export\s+)?function\s+([A-Za-z_]\w*)\s*(?:<[^>]+>)?\s*\((.*?)\)\s*(?::\s*[^({]+)?\s*{')
 # Start-only matcher for multi-line function headers
 FUNC_START_RE = re.compile(r'^(?:export\s+)?function\s+([A-Za-z_]\w*)\s*(?:<[^>]+>)?\s*\(')
@@ -48,6 +55,9 @@ METHOD_RE = re.compile(r'^\s*(?:(?:public|private|protected|static|async)\s+)*(?
 EXPORT_RE = re.compile(r'^\s*export\s+')
 CALL_RE = re.compile(r'\b([A-Za-z_]\w*)\s*\(')
 IMPORT_RE = re.compile(r'^\s*import\s+(?:{[^}]*}|[A-Za-z_]\w*)\s+from\s+[\'"]([^\'"]+)[\'"]')
+# Whole-file import statement matcher (handles multi-line named import lists)
+IMPORT_STMT_RE = re.compile(r'^\s*import\s+(?:type\s+)?([\w$\s{},*]+?)\s+from\s+[\'"]([^\'"]+)[\'"]', re.MULTILINE)
+MODULE_EXTS = ('.tsx', '.ts', '.jsx', '.js')
 GENERIC_RE = re.compile(r'<[^>]+>')  # Match generic type parameters
 UNION_RE = re.compile(r'\s*\|\s*')  # Match union type separator
 
@@ -94,6 +104,22 @@ class IR:
     calls: List[CallEdge]
     contracts: List[Contract]
 
+@dataclass
+class FileExtraction:
+    """Per-file extraction result (phase 1): same-file calls resolved, imports parsed."""
+    path: str
+    symbols: List[Symbol] = field(default_factory=list)
+    calls: List[CallEdge] = field(default_factory=list)
+    contracts: List[Contract] = field(default_factory=list)
+    imports: Dict[str, Tuple[str, str]] = field(default_factory=dict)  # local_name -> (module_key, imported_name)
+    error: Optional[str] = None
+
+@dataclass
+class SymbolIndex:
+    """Project-wide symbol table (phase 2 input)."""
+    by_module: Dict[Tuple[str, str], str] = field(default_factory=dict)  # (module_key, name) -> symbol id
+    by_name: Dict[str, List[str]] = field(default_factory=dict)  # name -> symbol ids, in file order
+
 @dataclass
 class ImportInfo:
     """Track imports from a file for scope-aware resolution."""
@@ -203,6 +229,55 @@ def extract_imports(text: str, file_path: str, root: str) -> Dict[str, str]:
                     imports[clean] = rel_path
     return imports
 
+def module_key(path: str) -> str:
+    """Canonical module identity for a source path or resolved import specifier.
+
+    Drops the TS/JS extension and maps ``dir/index`` to ``dir`` so that
+    ``./foo``, ``./foo.ts`` and ``./foo/index.ts`` agree with the file's own key.
+    """
+    key = os.path.normpath(path).replace('\\', '/')
+    for ext in MODULE_EXTS:
+        if key.endswith(ext):
+            key = key[:-len(ext)]
+            break
+    if key.endswith('/index'):
+        key = key[:-len('/index')]
+    return key
+
+def extract_import_bindings(text: str, file_path: str) -> Dict[str, Tuple[str, str]]:
+    """Map each locally bound import name to (module_key, imported_name).
+
+    Only relative imports are bound; package imports cannot resolve into the tree.
+    Default imports are bound to the local name (the usual ``export default function foo``).
+    """
+    bindings: Dict[str, Tuple[str, str]] = {}
+    file_dir = os.path.dirname(file_path)
+    for m in IMPORT_STMT_RE.finditer(text):
+        clause, source = m.group(1), m.group(2)
+        if not source.startswith('.'):
+            continue
+        target = module_key(os.path.join(file_dir, source))
+        named = ''
+        if '{' in clause:
+            head, _, rest = clause.partition('{')
+            named = rest.split('}', 1)[0]
+            clause = head
+        for part in clause.split(','):
+            part = part.strip()
+            if part and not part.startswith('*'):
+                bindings[part] = (target, part)
+        for spec in named.split(','):
+            spec = spec.strip()
+            if spec.startswith('type '):
+                spec = spec[len('type '):].strip()
+            if not spec:
+                continue
+            imported, _, local = spec.partition(' as ')
+            imported = imported.strip()
+            local = local.strip() or imported
+            bindings[local] = (target, imported)
+    return bindings
+
 def find_blocks(lines: List[str], start_idx: int) -> int:
     """Find matching closing brace for a block starting with '{' on or after start_idx.
 
@@ -224,22 +299,46 @@ def find_blocks(lines: List[str], start_idx: int) -> int:
             return j
     return len(lines)-1
 
-def extract_symbols_and_calls(path: str, text: str, root: str = "", imports: Optional[Dict[str, str]] = None) -> Tuple[List[Symbol], List[CallEdge], List[Contract]]:
+def collect_header_params(lines: List[str], idx: int) -> str:
+    """Collect a parameter list that may span lines, starting at the first '(' on lines[idx]."""
+    depth = 0
+    saw_first = False
+    buf = []
+    for k in range(idx, len(lines)):
+        ln = lines[k]
+        for ch in ln:
+            if ch == '(':
+                depth += 1
+                saw_first = True
+                if saw_first and depth == 1:
+                    # start capturing after first '('
+                    continue
+            elif ch == ')':
+                depth -= 1
+                if depth == 0:
+                    # finished params for header
+                    break
+            if saw_first:
+                buf.append(ch)
+        if depth == 0 and saw_first:
+            # move k to end of header line and proceed
+            break
+    return ''.join(buf).strip()
+
+def extract_symbols_and_calls(path: str, text: str, root: str = "") -> Tuple[List[Symbol], List[CallEdge], List[Contract]]:
     """Extract symbols (functions, classes, methods) and call edges from a single TS file.
 
     @critical: Core IR extraction — must be 100% tested.
     Parses all function/class declarations, detects exports, extracts call sites,
     and builds the symbol table and call graph for a file.
+    Only same-file calls are resolved here; cross-file targets are filled by
+    ``resolve_calls`` once every file's symbols are known.
     """
     lines = text.splitlines()
     symbols: List[Symbol] = []
     calls: List[CallEdge] = []
     contracts: List[Contract] = []
 
-    # Track imports for scope-aware resolution
-    if imports is None:
-        imports = extract_imports(text, path, root or os.path.dirname(path))
-
     exported_classes: set = set()
 
     # First pass: detect class declarations for export status
@@ -335,30 +434,7 @@ def extract_symbols_and_calls(path: str, text: str, root: str = "", imports: Opt
         m = FUNC_START_RE.match(stripped)
         if m:
             name = m.group(1)
-            # Collect params across lines until the closing paren is matched
-            depth = 0
-            saw_first = False
-            buf = []
-            for k in range(idx, len(lines)):
-                ln = lines[k]
-                for ch in ln:
-                    if ch == '(':
-                        depth += 1
-                        saw_first = True
-                        if saw_first and depth == 1:
-                            # start capturing after first '('
-                            continue
-                    elif ch == ')':
-                        depth -= 1
-                        if depth == 0:
-                            # finished params for header
-                            break
-                    if saw_first:
-                        buf.append(ch)
-                if depth == 0 and saw_first:
-                    # move k to end of header line and proceed
-                    break
-            params_text = ''.join(buf).strip()
+            params_text = collect_header_params(lines, idx)
             end = find_blocks(lines, idx)
             is_export = stripped.startswith('export')
             cprops = parse_params(params_text)
@@ -420,44 +496,23 @@ def extract_symbols_and_calls(path: str, text: str, root: str = "", imports: Opt
 
         idx += 1
 
-    # Resolve call "to" fields with scope-aware resolution
-    # @critical: Call graph resolution — must be 100% tested.
-    # Scope-aware resolution is core to accurate IR; must handle same-file, imports, and fallback.
+    return finalize_extraction(symbols, calls, contracts)
 
-    # Build symbol index by file and name
-    symbols_by_file: Dict[str, Dict[str, List[Symbol]]] = {}
-    for s in symbols:
-        file_key = os.path.basename(s.file)
-        if file_key not in symbols_by_file:
-            symbols_by_file[file_key] = {}
-        symbols_by_file[file_key].setdefault(s.name, []).append(s)
+def finalize_extraction(symbols: List[Symbol], calls: List[CallEdge], contracts: List[Contract]) -> Tuple[List[Symbol], List[CallEdge], List[Contract]]:
+    """Resolve call "to" fields against same-file symbols (phase 1) and dedupe contracts.
 
-    # Also build global name index for fallback
-    name_to_ids: Dict[str, List[str]] = {}
+    @critical: Call graph resolution — must be 100% tested.
+    Import and global fallback resolution need the whole project; see resolve_calls().
+    Shared by every scanner so they agree on the per-file output shape.
+    """
+    local_by_name: Dict[str, str] = {}
     for s in symbols:
-        name_to_ids.setdefault(s.name, []).append(s.id)
-
-    resolved_calls: List[CallEdge] = []
-    for c in calls:
-        to_id = ""
-        # Try to resolve within same file first (scope-aware)
-        caller_file = os.path.basename(path)
-        if caller_file in symbols_by_file and c.name in symbols_by_file[caller_file]:
-            candidates = symbols_by_file[caller_file][c.name]
-            to_id = candidates[0].id
-        # Try imports (cross-file resolution)
-        elif c.name in imports:
-            imported_file = imports[c.name]
-            imported_basename = os.path.basename(imported_file)
-            if imported_basename in symbols_by_file and c.name in symbols_by_file[imported_basename]:
-                candidates = symbols_by_file[imported_basename][c.name]
-                to_id = candidates[0].id
-        # Fallback to global name resolution
-        else:
-            cand = name_to_ids.get(c.name, [])
-            to_id = cand[0] if cand else ""
+        local_by_name.setdefault(s.name, s.id)
 
-        resolved_calls.append(CallEdge(frm=c.frm, to=to_id, name=c.name, line=c.line))
+    resolved_calls: List[CallEdge] = [
+        CallEdge(frm=c.frm, to=local_by_name.get(c.name, ""), name=c.name, line=c.line)
+        for c in calls
+    ]
 
     # Deduplicate contracts by id
     uniq_contracts: Dict[str, Contract] = {}
@@ -467,6 +522,53 @@ def extract_symbols_and_calls(path: str, text: str, root: str = "", imports: Opt
 
     return symbols, resolved_calls, list(uniq_contracts.values())
 
+def build_symbol_index(extractions: List[FileExtraction]) -> SymbolIndex:
+    """Build the project-wide symbol table from per-file extractions (phase 2a).
+
+    Module-level symbols (functions, classes) are keyed by (module_key, name),
+    preferring exported declarations; every symbol also feeds the by-name fallback.
+    """
+    index = SymbolIndex()
+    exported_keys = set()
+    for fx in extractions:
+        mod = module_key(fx.path)
+        for s in fx.symbols:
+            index.by_name.setdefault(s.name, []).append(s.id)
+            if s.kind == "method":
+                continue
+            key = (mod, s.name)
+            if key not in index.by_module or (s.exported and key not in exported_keys):
+                index.by_module[key] = s.id
+                if s.exported:
+                    exported_keys.add(key)
+    return index
+
+def resolve_calls(extractions: List[FileExtraction], index: Optional[SymbolIndex] = None) -> int:
+    """Fill empty call targets across files (phase 2b); returns the number resolved.
+
+    @critical: Call graph resolution — must be 100% tested.
+    Imported names resolve through the caller's import bindings in O(1);
+    anything else falls back to the first symbol with that name.
+    """
+    if index is None:
+        index = build_symbol_index(extractions)
+    resolved = 0
+    for fx in extractions:
+        for c in fx.calls:
+            if c.to:
+                continue
+            target = ""
+            binding = fx.imports.get(c.name)
+            if binding is not None:
+                target = index.by_module.get(binding, "")
+            if not target:
+                cand = index.by_name.get(c.name)
+                target = cand[0] if cand else ""
+            if target:
+                c.to = target
+                resolved += 1
+    return resolved
+
 def walk_ts_files(root: str) -> List[str]:
     """Discover all TypeScript files in root directory.
 
@@ -480,34 +582,125 @@ def walk_ts_files(root: str) -> List[str]:
                 files.append(os.path.join(dirpath, fn))
     return files
 
-def build_ir(root: str) -> IR:
+SCANNERS = ("legacy", "fast")
+
+def get_scanner(name: str = "legacy"):
+    """Return the per-file extraction function for a scanner name.
+
+    ``legacy`` is extract_symbols_and_calls; ``fast`` is the single-pass
+    scanner in fast_scanner.py (string/comment-aware brace tracking).
+    """
+    if name == "fast":
+        from fast_scanner import scan_symbols_and_calls
+        return scan_symbols_and_calls
+    if name != "legacy":
+        raise ValueError(f"unknown scanner: {name}")
+    return extract_symbols_and_calls
+
+def _extract_file(task: Tuple[str, str, str]) -> FileExtraction:
+    """Read and extract a single file; module-level so it can run in a worker process.
+
+    Errors are returned rather than raised so the parent can report them in file order.
+    """
+    path, root, scanner = task
+    try:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as fh:
+            text = fh.read()
+        syms, cs, cts = get_scanner(scanner)(path, text, root=root)
+        return FileExtraction(path, syms, cs, cts, extract_import_bindings(text, path))
+    except Exception as e:
+        return FileExtraction(path, error=str(e))
+
+def extract_files(files: List[str], root: str, jobs: int = 1, cache=None,
+                  scanner: str = "legacy") -> List[FileExtraction]:
+    """Extract every file, optionally across a process pool.
+
+    Results are always returned in the order of ``files`` so that merging them
+    yields the same IR (and byte-identical graph.json) as a serial run.
+    When an ``ExtractionCache`` is given, only files that missed the cache are parsed.
+    """
+    get_scanner(scanner)  # fail fast on an unknown scanner name
+    results: Dict[str, FileExtraction] = {}
+    pending: List[Tuple[str, str, str]] = []
+    for f in files:
+        cached = cache.get(f, root, scanner) if cache is not None else None
+        if cached is not None:
+            results[f] = cached
+        else:
+            pending.append((f, root, scanner))
+
+    if jobs <= 1 or len(pending) < 2:
+        parsed = [_extract_file(t) for t in pending]
+    else:
+        # Batch files per task to amortize pickling/IPC overhead on large trees
+        chunksize = max(1, len(pending) // (jobs * 8))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            parsed = list(pool.map(_extract_file, pending, chunksize=chunksize))
+
+    for fx in parsed:
+        if cache is not None and fx.error is None:
+            cache.put(fx, root, scanner)
+        results[fx.path] = fx
+    return [results[f] for f in files]
+
+def merge_extractions(files: List[str], extractions: List[FileExtraction]) -> IR:
+    """Resolve cross-file calls and merge per-file results into one IR, in file order."""
+    ok = []
+    for fx in extractions:
+        if fx.error is not None:
+            # @optional: Error handling — 70%+ coverage acceptable.
+            # keep going; log minimal context
+            print(f"[WARN] failed to parse {fx.path}: {fx.error}")
+            continue
+        ok.append(fx)
+    resolve_calls(ok)
+    return IR(
+        files=files,
+        symbols=[s for fx in ok for s in fx.symbols],
+        calls=[c for fx in ok for c in fx.calls],
+        contracts=[ct for fx in ok for ct in fx.contracts],
+    )
+
+def build_ir(root: str, jobs: int = 1, cache=None, scanner: str = "legacy") -> IR:
     """Build the Intermediate Representation (IR) by scanning all TS files in root.
 
     @critical: Core IR generation — must be 100% tested.
     Orchestrates file discovery, parsing, and aggregation of symbols/calls/contracts.
+    With ``jobs > 1`` files are parsed in a process pool; output order is unchanged.
+    With an ``ExtractionCache``, unchanged files are served from the cache.
+    ``scanner`` selects the per-file extractor (see get_scanner).
     """
     files = walk_ts_files(root)
-    symbols: List[Symbol] = []
-    calls: List[CallEdge] = []
-    contracts: List[Contract] = []
+    return merge_extractions(files, extract_files(files, root, jobs, cache, scanner))
+
+def ir_to_dict(ir: IR) -> dict:
+    """The IR in its graph.json shape (what downstream generators consume)."""
+    return {
+        "files": ir.files,
+        "symbols": [asdict(s) for s in ir.symbols],
+        "calls": [asdict(c) for c in ir.calls],
+        "contracts": [{
+            "id": ct.id,
+            "kind": ct.kind,
+            "props": [asdict(p) for p in ct.props]
+        } for ct in ir.contracts]
+    }
 
-    for f in files:
-        try:
-            with open(f, 'r', encoding='utf-8', errors='ignore') as fh:
-                text = fh.read()
-            syms, cs, cts = extract_symbols_and_calls(f, text, root=root)
-            symbols.extend(syms)
-            calls.extend(cs)
-            contracts.extend(cts)
-        except Exception as e:
-            # @optional: Error handling — 70%+ coverage acceptable.
-            # keep going; log minimal context
-            print(f"[WARN] failed to parse {f}: {e}")
+def emit_ir(ir: IR, out_path: str, fmt: Optional[str] = None):
+    """Write the IR as indented JSON (legacy) or streaming NDJSON (see ir_stream).
 
-    # finalize IR
-    return IR(files=files, symbols=symbols, calls=calls, contracts=contracts)
+    ``fmt`` defaults to the format implied by the extension (``.ndjson`` → ndjson).
+    """
+    fmt = fmt or infer_format(out_path)
+    if fmt == "ndjson":
+        write_ir_ndjson({
+            "files": ir.files,
+            "symbols": ir.symbols,
+            "calls": ir.calls,
+            "contracts": ir.contracts,
+        }, out_path)
+        return
 
-def emit_ir(ir: IR, out_path: str):
     def enc(o):
         if isinstance(o, (Symbol, CallEdge, Contract, ContractProp)):
             d = asdict(o)
@@ -515,16 +708,7 @@ def emit_ir(ir: IR, out_path: str):
         raise TypeError(type(o).__name__)
     os.makedirs(os.path.dirname(out_path), exist_ok=True)
     with open(out_path, 'w', encoding='utf-8') as f:
-        json.dump({
-            "files": ir.files,
-            "symbols": [asdict(s) for s in ir.symbols],
-            "calls": [asdict(c) for c in ir.calls],
-            "contracts": [{
-                "id": ct.id,
-                "kind": ct.kind,
-                "props": [asdict(p) for p in ct.props]
-            } for ct in ir.contracts]
-        }, f, indent=2)
+        json.dump(ir_to_dict(ir), f, indent=2)
 
 def build_call_graph(ir: IR) -> Dict[str, List[CallEdge]]:
     """Build a call graph indexed by source symbol."""
@@ -539,6 +723,7 @@ def dfs_call_chain(start_id: str, call_graph: Dict[str, List[CallEdge]],
 
     Returns a list of CallEdge objects representing the call chain.
     Limits depth to avoid infinite recursion and keep sequences manageable.
+    Single-root reference walk; emit_sequences uses CallChainIndex instead.
     """
     if visited is None:
         visited = set()
@@ -557,11 +742,14 @@ def dfs_call_chain(start_id: str, call_graph: Dict[str, List[CallEdge]],
 
     return chain
 
-def emit_sequences(ir: IR, out_path: str, enrich_with_dfs: bool = True):
+def emit_sequences(ir: IR, out_path: str, enrich_with_dfs: bool = True, max_depth: Optional[int] = 3):
     # Build sequence bundle: each exported symbol becomes an entry sequence.
-    # Beats are enriched with DFS call chains (if enabled) or just direct calls.
+    # Beats are enriched with call chains (if enabled) or just direct calls.
+    # Chains come from one memoized sweep over the call graph (CallChainIndex),
+    # so shared callees are expanded once rather than once per entry point.
     sequences = []
     call_graph = build_call_graph(ir)
+    chains = CallChainIndex(call_graph, max_depth) if enrich_with_dfs else None
 
     for s in ir.symbols:
         if not s.exported:
@@ -570,8 +758,7 @@ def emit_sequences(ir: IR, out_path: str, enrich_with_dfs: bool = True):
         beats = []
 
         if enrich_with_dfs:
-            # Use DFS to build enriched call chain
-            call_chain = dfs_call_chain(s.id, call_graph, max_depth=3)
+            call_chain = chains.chain(s.id)
         else:
             # Use only direct calls
             call_chain = call_graph.get(s.id, [])
@@ -628,12 +815,26 @@ def main():
     ap.add_argument("--root", required=True, help="Root directory of the TS codebase")
     ap.add_argument("--out", required=True, help="Path to write IR graph JSON")
     ap.add_argument("--emit-sequences", help="Optional: write a naive sequences bundle JSON")
+    ap.add_argument("--chain-depth", type=int, default=3,
+                    help="Call-chain depth for --emit-sequences (default: 3; -1 for unlimited)")
+    ap.add_argument("--jobs", type=int, default=1, help="Worker processes for parallel extraction (default: 1)")
+    ap.add_argument("--cache-dir", help="Optional: incremental extraction cache directory (e.g. .ographx/cache)")
+    ap.add_argument("--scanner", choices=SCANNERS, default="legacy", help="Per-file extractor (default: legacy)")
+    ap.add_argument("--format", choices=IR_FORMATS, help="IR output format (default: from --out extension; .ndjson streams)")
     args = ap.parse_args()
 
-    ir = build_ir(args.root)
-    emit_ir(ir, args.out)
+    cache = None
+    if args.cache_dir:
+        from extraction_cache import ExtractionCache
+        cache = ExtractionCache(args.cache_dir)
+    ir = build_ir(args.root, jobs=args.jobs, cache=cache, scanner=args.scanner)
+    if cache is not None:
+        cache.prune(ir.files)
+        cache.save()
+        print(f"[cache] {cache.hits} hit(s), {cache.misses} miss(es)")
+    emit_ir(ir, args.out, args.format)
     if args.emit_sequences:
-        emit_sequences(ir, args.emit_sequences)
+        emit_sequences(ir, args.emit_sequences, max_depth=None if args.chain_depth < 0 else args.chain_depth)
     print(f"[OK] IR written to {args.out}")
     if args.emit_sequences:
         print(f"[OK] Sequences written to {args.emit_sequences}")
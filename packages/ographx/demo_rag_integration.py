@@ -11,9 +11,14 @@ Shows how to:
 
 import json
 import math
+import sys
 from pathlib import Path
 from typing import List, Dict, Tuple
 
+sys.path.insert(0, str(Path(__file__).parent / 'core'))
+
+from ir_stream import open_ir
+
 def hash_string(text: str) -> int:
     hash_val = 0
     for char in text:
@@ -50,8 +55,7 @@ def main():
         sequences_data = json.load(f)
     sequences = sequences_data.get('sequences', [])
     
-    with open(ir_path, 'r') as f:
-        ir_data = json.load(f)
+    ir_data = open_ir(str(ir_path))
     symbols = ir_data.get('symbols', [])
     calls = ir_data.get('calls', [])
     
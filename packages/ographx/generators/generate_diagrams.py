@@ -10,10 +10,13 @@ from pathlib import Path
 from collections import defaultdict
 from typing import Dict, List, Set, Tuple
 
-def load_ir(ir_path: str) -> dict:
-    """Load the IR (Intermediate Representation) from graph.json"""
-    with open(ir_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+sys.path.insert(0, str(Path(__file__).parent.parent / 'core'))
+
+from ir_stream import open_ir
+
+def load_ir(ir_path: str):
+    """Open the IR (Intermediate Representation), graph.json or streaming .ndjson"""
+    return open_ir(ir_path)
 
 def generate_call_graph_diagram(ir: dict, max_nodes: int = 50) -> str:
     """
@@ -198,76 +201,86 @@ def generate_svg_placeholder(diagram_type: str, width: int = 800, height: int =
   </text>
 </svg>"""
 
-def main():
-    parser = argparse.ArgumentParser(description="Generate diagrams from IR and sequences")
-    parser.add_argument("--input", required=True, help="Input sequences file path")
-    parser.add_argument("--ir-path", required=True, help="Input IR (graph.json) file path")
-    parser.add_argument("--output-dir", required=True, help="Output directory for diagrams")
-
-    args = parser.parse_args()
-
-    print("")
-    print("=" * 70)
-    print("MOVEMENT 4: VISUALIZATION & DIAGRAMS")
-    print("=" * 70)
-    print("")
-
-    # Load IR
-    print(f"[*] Loading IR from {args.ir_path}")
-    ir = load_ir(args.ir_path)
-    symbol_count = len(ir.get('symbols', []))
-    call_count = len(ir.get('calls', []))
-    print(f"    Loaded {symbol_count} symbols, {call_count} calls")
-
-    # Load sequences
-    print(f"[*] Loading sequences from {args.input}")
-    with open(args.input, 'r', encoding='utf-8') as f:
-        sequences = json.load(f)
-    seq_count = len(sequences.get('sequences', []))
-    print(f"    Loaded {seq_count} sequences")
-
-    # Ensure output directory exists
-    os.makedirs(args.output_dir, exist_ok=True)
+def write_diagrams(ir, sequences: dict, output_dir: str) -> List[str]:
+    """Write the call graph, orchestration and sequence flow diagrams; returns the written paths"""
+    os.makedirs(output_dir, exist_ok=True)
+    written = []
 
-    # Generate diagrams
     print("")
     print("[*] Generating call_graph diagram...")
     mmd = generate_call_graph_diagram(ir, max_nodes=50)
-    mmd_path = os.path.join(args.output_dir, "call_graph.mmd")
+    mmd_path = os.path.join(output_dir, "call_graph.mmd")
     with open(mmd_path, 'w', encoding='utf-8') as f:
         f.write(mmd)
+    written.append(mmd_path)
     print(f"    [OK] {mmd_path}")
 
-    svg_path = os.path.join(args.output_dir, "call_graph.svg")
+    svg_path = os.path.join(output_dir, "call_graph.svg")
     with open(svg_path, 'w', encoding='utf-8') as f:
         f.write(generate_svg_placeholder("call_graph"))
+    written.append(svg_path)
     print(f"    [OK] {svg_path}")
 
     print("")
     print("[*] Generating orchestration diagram...")
     mmd = generate_orchestration_diagram(ir, sequences, max_sequences=10)
-    mmd_path = os.path.join(args.output_dir, "orchestration.mmd")
+    mmd_path = os.path.join(output_dir, "orchestration.mmd")
     with open(mmd_path, 'w', encoding='utf-8') as f:
         f.write(mmd)
+    written.append(mmd_path)
     print(f"    [OK] {mmd_path}")
 
-    svg_path = os.path.join(args.output_dir, "orchestration.svg")
+    svg_path = os.path.join(output_dir, "orchestration.svg")
     with open(svg_path, 'w', encoding='utf-8') as f:
         f.write(generate_svg_placeholder("orchestration"))
+    written.append(svg_path)
     print(f"    [OK] {svg_path}")
 
     print("")
     print("[*] Generating sequence_flow diagram...")
     mmd = generate_sequence_flow_diagram(ir, sequences, max_sequences=3)
-    mmd_path = os.path.join(args.output_dir, "sequence_flow.mmd")
+    mmd_path = os.path.join(output_dir, "sequence_flow.mmd")
     with open(mmd_path, 'w', encoding='utf-8') as f:
         f.write(mmd)
+    written.append(mmd_path)
     print(f"    [OK] {mmd_path}")
 
-    svg_path = os.path.join(args.output_dir, "sequence_flow.svg")
+    svg_path = os.path.join(output_dir, "sequence_flow.svg")
     with open(svg_path, 'w', encoding='utf-8') as f:
         f.write(generate_svg_placeholder("sequence_flow"))
+    written.append(svg_path)
     print(f"    [OK] {svg_path}")
+    return written
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate diagrams from IR and sequences")
+    parser.add_argument("--input", required=True, help="Input sequences file path")
+    parser.add_argument("--ir-path", required=True, help="Input IR (graph.json) file path")
+    parser.add_argument("--output-dir", required=True, help="Output directory for diagrams")
+
+    args = parser.parse_args()
+
+    print("")
+    print("=" * 70)
+    print("MOVEMENT 4: VISUALIZATION & DIAGRAMS")
+    print("=" * 70)
+    print("")
+
+    # Load IR
+    print(f"[*] Loading IR from {args.ir_path}")
+    ir = load_ir(args.ir_path)
+    symbol_count = len(ir.get('symbols', []))
+    call_count = len(ir.get('calls', []))
+    print(f"    Loaded {symbol_count} symbols, {call_count} calls")
+
+    # Load sequences
+    print(f"[*] Loading sequences from {args.input}")
+    with open(args.input, 'r', encoding='utf-8') as f:
+        sequences = json.load(f)
+    seq_count = len(sequences.get('sequences', []))
+    print(f"    Loaded {seq_count} sequences")
+
+    write_diagrams(ir, sequences, args.output_dir)
 
     print("")
     print("[OK] Movement 4 Complete: Visualization & Diagrams")
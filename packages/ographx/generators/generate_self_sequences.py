@@ -5,8 +5,14 @@ Converts symbols and calls into movements and beats.
 """
 import json
 import re
+import sys
 from dataclasses import dataclass
-from typing import List, Dict, Set
+from pathlib import Path
+from typing import List, Dict, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'core'))
+
+from call_chains import CallChainIndex
 
 @dataclass
 class CallEdge:
@@ -30,27 +36,13 @@ def build_call_graph(data: dict) -> Dict[str, List[CallEdge]]:
         ))
     return graph
 
-def dfs_call_chain(start_id: str, call_graph: Dict[str, List[CallEdge]], 
-                   visited: Set[str] = None, depth: int = 0, max_depth: int = 3) -> List[CallEdge]:
-    """DFS to build enriched call chain."""
-    if visited is None:
-        visited = set()
-    if depth > max_depth or start_id in visited:
-        return []
-    visited.add(start_id)
-    chain = []
-    for call in call_graph.get(start_id, []):
-        chain.append(call)
-        if call.to:
-            chain.extend(dfs_call_chain(call.to, call_graph, visited, depth + 1, max_depth))
-    return chain
-
-def generate_sequences(ir_path: str, out_path: str):
-    """Generate sequences from IR."""
+def generate_sequences(ir_path: str, out_path: str, max_depth: Optional[int] = 3):
+    """Generate sequences from IR (call chains memoized across entry points)."""
     with open(ir_path) as f:
         data = json.load(f)
     
     call_graph = build_call_graph(data)
+    chains = CallChainIndex(call_graph, max_depth)
     sequences = []
     
     # Find exported symbols
@@ -60,8 +52,8 @@ def generate_sequences(ir_path: str, out_path: str):
         sym_id = sym['id']
         beats = []
         
-        # Get enriched call chain via DFS
-        call_chain = dfs_call_chain(sym_id, call_graph, max_depth=3)
+        # Get enriched call chain
+        call_chain = chains.chain(sym_id)
         
         # Deduplicate
         seen = set()
@@ -8,9 +8,19 @@ import json
 import argparse
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent / 'core'))
+
+from ir_stream import open_ir
+
 def generate_sequences_from_ir(ir_path: str) -> dict:
     """
-    Generate Conductor sequences from IR.
+    Generate Conductor sequences from an IR file (graph.json or streaming .ndjson).
+    """
+    return build_sequences(open_ir(ir_path))
+
+def build_sequences(ir) -> dict:
+    """
+    Generate Conductor sequences from a loaded IR (dict or IR reader).
 
     CRITICAL: Deduplicates symbols by ID before generating sequences.
     The IR may contain duplicate symbol entries (e.g., multiple .if statements
@@ -22,10 +32,6 @@ def generate_sequences_from_ir(ir_path: str) -> dict:
     - For each call made by the symbol, a beat is added to the Execution movement
     - If a symbol makes no calls, it only has Initialization and Completion
     """
-    # Load IR
-    with open(ir_path, 'r') as f:
-        ir = json.load(f)
-
     # Create sequences structure
     sequences = {
         "version": "0.1.0",
@@ -151,11 +157,8 @@ def main():
     print("=" * 70)
     print("")
 
-    # Load IR to get deduplication stats
-    with open(args.input, 'r') as f:
-        ir = json.load(f)
-
-    total_symbols = len(ir.get("symbols", []))
+    # Count symbol entries for deduplication stats
+    total_symbols = len(open_ir(args.input).get("symbols", []))
 
     # Generate sequences
     print(f"[*] Generating sequences from IR...")
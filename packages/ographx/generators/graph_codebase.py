@@ -5,6 +5,13 @@ Graph Codebase - Unified Pipeline Orchestrator
 
 Generates all artifacts for a specific codebase in an organized folder structure.
 
+By default every movement runs in this process and the loaded IR and sequences
+are handed from stage to stage in memory; ``--mode subprocess`` runs each
+movement as its own script (the original isolated mode). Per-stage wall-clock
+and peak-memory timings are written to the manifest: the process RSS high-water
+mark after each stage, plus the stage's own Python heap peak with
+``--trace-memory`` (tracemalloc slows extraction considerably, so it is opt-in).
+
 Usage:
   python graph_codebase.py --name renderx-web --roots packages src/ui --exclude robotics,ographx
   python graph_codebase.py --config codebase-config.json
@@ -15,8 +22,14 @@ import os
 import json
 import argparse
 import subprocess
+import time
+import tracemalloc
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, List, Optional
 
 # Ensure UTF-8 output on Windows
 if sys.platform == 'win32':
@@ -28,19 +41,53 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.artifact_manager import ArtifactManager, ArtifactConfig, ArtifactManifest
 from core.preflight_validator import PreFlightValidator
+from core.ir_stream import open_ir
+
+OGRAPHX_DIR = Path(__file__).parent.parent
+PIPELINE_MODES = ("inprocess", "subprocess")
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Process RSS high-water mark so far (in-process stages only)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(peak / (1e6 if sys.platform == "darwin" else 1e3), 1)
+
+
+def _import_stage_modules():
+    """Make the stage scripts importable the same way they import each other"""
+    for sub in ("core", "generators", "analysis"):
+        path = str(OGRAPHX_DIR / sub)
+        if path not in sys.path:
+            sys.path.insert(0, path)
 
 
 class CodebaseGrapher:
     """Orchestrates the complete graphing pipeline for a codebase"""
     
     def __init__(self, codebase_name: str, root_dirs: List[str], 
-                 exclude_dirs: List[str] = None, base_dir: str = ".ographx/artifacts"):
+                 exclude_dirs: List[str] = None, base_dir: str = ".ographx/artifacts",
+                 jobs: int = 1, use_cache: bool = True, scanner: str = "legacy",
+                 mode: str = "inprocess", step_timeout: int = 120, trace_memory: bool = False):
         self.codebase_name = codebase_name
         self.root_dirs = root_dirs
         self.exclude_dirs = exclude_dirs or []
+        self.jobs = jobs
+        self.use_cache = use_cache
+        self.scanner = scanner
+        if mode not in PIPELINE_MODES:
+            raise ValueError(f"unknown pipeline mode: {mode}")
+        self.mode = mode
+        self.step_timeout = step_timeout
+        self.trace_memory = trace_memory
         self.manager = ArtifactManager(base_dir)
         self.codebase_dir = None
         self.manifest = None
+        # Stage outputs handed along in-process (None until produced)
+        self.ir = None
+        self.sequences = None
     
     def setup(self):
         """Setup codebase folder and configuration"""
@@ -66,14 +113,13 @@ class CodebaseGrapher:
         print(f"\n[STEP] {name}")
 
         # Get absolute path to script relative to ographx directory
-        ographx_dir = Path(__file__).parent.parent
-        script_path = ographx_dir / script
+        script_path = OGRAPHX_DIR / script
 
         cmd = [sys.executable, str(script_path)] + (args or [])
         print(f"       Running: {' '.join(cmd)}")
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=self.step_timeout)
 
             if result.returncode == 0:
                 print(f"[OK] {name} completed")
@@ -94,6 +140,90 @@ class CodebaseGrapher:
             print(f"[!] {name} failed: {e}")
             return False
     
+    def run_inprocess(self, name: str, func: Callable[[], Any]) -> bool:
+        """Run a pipeline step in this interpreter"""
+        print(f"\n[STEP] {name} (in-process)")
+        try:
+            func()
+        except Exception as e:
+            print(f"[!] {name} failed: {e}")
+            return False
+        print(f"[OK] {name} completed")
+        return True
+    
+    def load_ir(self):
+        """The IR produced by extraction, from memory or (fallback) from disk"""
+        if self.ir is None:
+            self.ir = open_ir(str(self.codebase_dir / "ir" / "graph.json"))
+        return self.ir
+    
+    def _extract_inprocess(self, ir_path: Path):
+        _import_stage_modules()
+        from extract_codebase import build_ir_from_roots
+        from ographx_ts import emit_ir, ir_to_dict
+        
+        cache = None
+        if self.use_cache:
+            from extraction_cache import ExtractionCache
+            cache = ExtractionCache(str(self.manager.get_cache_dir(self.codebase_name)))
+        ir = build_ir_from_roots(self.root_dirs, self.exclude_dirs, jobs=self.jobs,
+                                 cache=cache, scanner=self.scanner)
+        if cache is not None:
+            cache.prune(ir.files)
+            cache.save()
+        emit_ir(ir, str(ir_path))
+        self.ir = ir_to_dict(ir)
+    
+    def _sequences_inprocess(self, seq_path: Path):
+        _import_stage_modules()
+        from generate_sequences import build_sequences
+        
+        self.sequences = build_sequences(self.load_ir())
+        seq_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(seq_path, 'w') as f:
+            json.dump(self.sequences, f, indent=2)
+    
+    def _visualizations_inprocess(self, seq_path: Path, diag_dir: Path):
+        _import_stage_modules()
+        from generate_diagrams import write_diagrams
+        
+        if self.sequences is None:
+            with open(seq_path, encoding='utf-8') as f:
+                self.sequences = json.load(f)
+        write_diagrams(self.load_ir(), self.sequences, str(diag_dir))
+    
+    def _analysis_inprocess(self, analysis_path: Path):
+        _import_stage_modules()
+        from analyze_graph import analyze_ir_data
+        
+        analysis = analyze_ir_data(self.load_ir())
+        analysis_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(analysis_path, 'w') as f:
+            json.dump(analysis, f, indent=2)
+    
+    def timed(self, name: str, step_func: Callable[[], bool]) -> bool:
+        """Run a step, recording wall-clock seconds and peak memory in the manifest"""
+        inprocess = self.mode == "inprocess"
+        trace = inprocess and self.trace_memory and not tracemalloc.is_tracing()
+        if trace:
+            tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            return step_func()
+        finally:
+            elapsed = time.perf_counter() - start
+            peak = None
+            if trace:
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            if self.manifest is not None:
+                self.manifest.timings[name] = {
+                    "seconds": round(elapsed, 3),
+                    "peak_rss_mb": _peak_rss_mb() if inprocess else None,
+                    "peak_heap_mb": round(peak / 1e6, 1) if peak is not None else None,
+                    "mode": self.mode,
+                }
+    
     def extract_ir(self):
         """Movement 1: Extract Intermediate Representation"""
         print("\n" + "="*70)
@@ -107,18 +237,25 @@ class CodebaseGrapher:
             "--name", self.codebase_name,
             "--roots", ",".join(self.root_dirs),
             "--exclude", ",".join(self.exclude_dirs),
-            "--out", str(ir_path)
+            "--out", str(ir_path),
+            "--jobs", str(self.jobs),
+            "--scanner", self.scanner
         ]
+        cache_dir = self.manager.get_cache_dir(self.codebase_name)
+        if self.use_cache:
+            args += ["--cache-dir", str(cache_dir)]
         
-        success = self.run_step(
-            "Extract IR",
-            "core/extract_codebase.py",
-            args
-        )
+        if self.mode == "inprocess":
+            success = self.run_inprocess("Extract IR", lambda: self._extract_inprocess(ir_path))
+        else:
+            success = self.run_step(
+                "Extract IR",
+                "core/extract_codebase.py",
+                args
+            )
         
         if success and ir_path.exists():
-            with open(ir_path) as f:
-                ir_data = json.load(f)
+            ir_data = self.load_ir()
             self.manifest.statistics = {
                 "files": len(ir_data.get("files", [])),
                 "symbols": len(ir_data.get("symbols", [])),
@@ -126,6 +263,9 @@ class CodebaseGrapher:
                 "contracts": len(ir_data.get("contracts", []))
             }
             self.manifest.artifacts["ir"] = str(ir_path)
+            self.manifest.artifacts["ir_binary"] = str(self.manager.write_binary_ir(self.codebase_name, ir_data))
+            if self.use_cache:
+                self.manifest.cache = self.manager.load_cache_stats(self.codebase_name) or self.manifest.cache
         
         return success
     
@@ -143,11 +283,14 @@ class CodebaseGrapher:
             "--output", str(seq_path)
         ]
         
-        success = self.run_step(
-            "Generate Sequences",
-            "generators/generate_sequences.py",
-            args
-        )
+        if self.mode == "inprocess":
+            success = self.run_inprocess("Generate Sequences", lambda: self._sequences_inprocess(seq_path))
+        else:
+            success = self.run_step(
+                "Generate Sequences",
+                "generators/generate_sequences.py",
+                args
+            )
         
         if success:
             self.manifest.artifacts["sequences"].append(str(seq_path))
@@ -170,11 +313,15 @@ class CodebaseGrapher:
             "--output-dir", str(diag_dir)
         ]
 
-        success = self.run_step(
-            "Generate Diagrams",
-            "generators/generate_diagrams.py",
-            args
-        )
+        if self.mode == "inprocess":
+            success = self.run_inprocess("Generate Diagrams",
+                                         lambda: self._visualizations_inprocess(seq_path, diag_dir))
+        else:
+            success = self.run_step(
+                "Generate Diagrams",
+                "generators/generate_diagrams.py",
+                args
+            )
 
         if success:
             # Collect all generated diagrams
@@ -198,11 +345,14 @@ class CodebaseGrapher:
             "--output", str(analysis_path)
         ]
         
-        success = self.run_step(
-            "Extract Analysis",
-            "analysis/analyze_graph.py",
-            args
-        )
+        if self.mode == "inprocess":
+            success = self.run_inprocess("Extract Analysis", lambda: self._analysis_inprocess(analysis_path))
+        else:
+            success = self.run_step(
+                "Extract Analysis",
+                "analysis/analyze_graph.py",
+                args
+            )
         
         if success:
             self.manifest.artifacts["analysis"] = str(analysis_path)
@@ -226,6 +376,15 @@ class CodebaseGrapher:
             print(f"   Symbols: {self.manifest.statistics['symbols']}")
             print(f"   Calls: {self.manifest.statistics['calls']}")
             print(f"   Contracts: {self.manifest.statistics['contracts']}")
+            if self.use_cache:
+                print(f"   Cache: {self.manifest.cache['hits']} hit(s), {self.manifest.cache['misses']} miss(es)")
+            if self.manifest.timings:
+                print(f"\nStage Timings ({self.mode}):")
+                for stage, t in self.manifest.timings.items():
+                    peak = f", RSS high-water {t['peak_rss_mb']} MB" if t['peak_rss_mb'] is not None else ""
+                    if t['peak_heap_mb'] is not None:
+                        peak += f", heap peak {t['peak_heap_mb']} MB"
+                    print(f"   {stage}: {t['seconds']:.2f}s{peak}")
             print(f"\nLocation: {self.codebase_dir}")
 
             return True
@@ -268,7 +427,7 @@ class CodebaseGrapher:
         results = []
         for name, step_func in steps:
             try:
-                success = step_func()
+                success = step_func() if name == "Finalize" else self.timed(name, step_func)
                 results.append((name, success))
             except Exception as e:
                 print(f"❌ {name} failed: {e}")
@@ -304,13 +463,24 @@ def main():
     parser.add_argument("--roots", required=True, help="Root directories (comma-separated)")
     parser.add_argument("--exclude", default="", help="Directories to exclude (comma-separated)")
     parser.add_argument("--base-dir", default=".ographx/artifacts", help="Base artifacts directory")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes for IR extraction (default: 1)")
+    parser.add_argument("--no-cache", action="store_true", help="Disable the incremental extraction cache")
+    parser.add_argument("--scanner", choices=["legacy", "fast"], default="legacy", help="Per-file extractor (default: legacy)")
+    parser.add_argument("--mode", choices=PIPELINE_MODES, default="inprocess",
+                        help="Run movements in this process (default) or one subprocess per movement")
+    parser.add_argument("--step-timeout", type=int, default=120, help="Per-step timeout in subprocess mode (seconds)")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="Record each in-process stage's Python heap peak (tracemalloc; slower)")
     
     args = parser.parse_args()
     
     roots = [r.strip() for r in args.roots.split(",")]
     excludes = [e.strip() for e in args.exclude.split(",")] if args.exclude else []
     
-    grapher = CodebaseGrapher(args.name, roots, excludes, args.base_dir)
+    grapher = CodebaseGrapher(args.name, roots, excludes, args.base_dir, jobs=args.jobs,
+                              use_cache=not args.no_cache, scanner=args.scanner,
+                              mode=args.mode, step_timeout=args.step_timeout,
+                              trace_memory=args.trace_memory)
     return grapher.run()
 
 
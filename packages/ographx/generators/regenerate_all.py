@@ -11,23 +11,60 @@ Orchestrates all generation steps:
 6. Extract analysis
 
 This is the single source of truth for the regeneration pipeline.
+
+Each step declares the files it reads and writes. Dependencies follow from
+those declarations (a step depends on every step that writes one of its
+inputs), independent steps run concurrently, and a step whose outputs are all
+newer than its inputs (and its script) is skipped, make-style. The summary
+reports the critical path: the longest dependency chain by measured time.
+
+Usage:
+  python generators/regenerate_all.py            # incremental, parallel
+  python generators/regenerate_all.py --force    # rebuild everything
+  python generators/regenerate_all.py --jobs 1   # strictly sequential
 """
 
-import sys
-import subprocess
+import argparse
 import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 # Force UTF-8 output encoding on Windows
 if sys.platform == 'win32':
     os.environ['PYTHONIOENCODING'] = 'utf-8'
 
+_print_lock = threading.Lock()
+
+
+@dataclass
+class Step:
+    """A pipeline step with its declared inputs and outputs (paths or globs relative to cwd)"""
+    name: str
+    script: str
+    cwd: Path
+    args: List[str] = field(default_factory=list)
+    inputs: List[str] = field(default_factory=list)
+    outputs: List[str] = field(default_factory=list)
+
+
+@dataclass
+class StepResult:
+    name: str
+    status: str  # "ok" | "failed" | "skipped"
+    seconds: float = 0.0
+
 
 def run_step(name: str, script: str, cwd: Path, args: list[str] | None = None) -> bool:
-    """Run a generation step and report status"""
-    print(f"\n[STEP] {name}")
+    """Run a generation step and report status (printed as one block, safe under concurrency)"""
     full_cmd = [sys.executable, script, *(args or [])]
-    print(f"       Running: {' '.join(full_cmd)}")
+    report = [f"\n[STEP] {name}", f"       Running: {' '.join(full_cmd)}"]
+    ok = False
 
     try:
         result = subprocess.run(
@@ -40,72 +77,184 @@ def run_step(name: str, script: str, cwd: Path, args: list[str] | None = None) -
         )
 
         if result.returncode == 0:
-            print(f"[OK]   {name} completed successfully")
+            report.append(f"[OK]   {name} completed successfully")
             if result.stdout:
                 for line in result.stdout.strip().split('\n'):
                     if line.strip():
-                        print(f"       {line}")
-            return True
+                        report.append(f"       {line}")
+            ok = True
         else:
-            print(f"[ERROR] {name} failed with code {result.returncode}")
+            report.append(f"[ERROR] {name} failed with code {result.returncode}")
             if result.stderr:
-                print(f"        {result.stderr}")
-            return False
+                report.append(f"        {result.stderr}")
     except subprocess.TimeoutExpired:
-        print(f"[ERROR] {name} timed out")
-        return False
+        report.append(f"[ERROR] {name} timed out")
     except Exception as e:
-        print(f"[ERROR] {name} failed: {e}")
+        report.append(f"[ERROR] {name} failed: {e}")
+
+    with _print_lock:
+        print("\n".join(report), flush=True)
+    return ok
+
+
+def expand(cwd: Path, patterns: List[str]) -> List[Path]:
+    """Resolve declared paths/globs to existing files (skipping __pycache__)"""
+    files = []
+    for pattern in patterns:
+        if any(ch in pattern for ch in "*?["):
+            files.extend(p for p in cwd.glob(pattern) if p.is_file() and '__pycache__' not in p.parts)
+        else:
+            files.append(cwd / pattern)
+    return files
+
+
+def is_up_to_date(step: Step) -> bool:
+    """Make-style check: every output exists and is newer than every input and the script"""
+    if not step.outputs:
+        return False  # report-only steps always run
+    outputs = expand(step.cwd, step.outputs)
+    if not outputs or not all(p.exists() for p in outputs):
+        return False
+    inputs = expand(step.cwd, step.inputs + [step.script])
+    if not all(p.exists() for p in inputs):
         return False
+    newest_input = max((p.stat().st_mtime for p in inputs), default=0.0)
+    return min(p.stat().st_mtime for p in outputs) >= newest_input
+
+
+def build_dependencies(steps: List[Step]) -> Dict[str, List[str]]:
+    """Each step depends on every earlier-declared step that writes one of its inputs"""
+    deps: Dict[str, List[str]] = {s.name: [] for s in steps}
+    for i, step in enumerate(steps):
+        wanted = set(step.inputs)
+        for producer in steps[:i]:
+            if wanted & set(producer.outputs):
+                deps[step.name].append(producer.name)
+    return deps
+
+
+def critical_path(steps: List[Step], deps: Dict[str, List[str]],
+                  results: Dict[str, StepResult]) -> Tuple[List[str], float]:
+    """Longest dependency chain by measured step time"""
+    finish: Dict[str, float] = {}
+    via: Dict[str, Optional[str]] = {}
+    for step in steps:  # declaration order is a topological order
+        best = max(deps[step.name], key=lambda d: finish[d], default=None)
+        finish[step.name] = (finish[best] if best else 0.0) + results[step.name].seconds
+        via[step.name] = best
+    if not finish:
+        return [], 0.0
+    end = max(finish, key=finish.get)
+    path = []
+    node: Optional[str] = end
+    while node:
+        path.append(node)
+        node = via[node]
+    return list(reversed(path)), finish[end]
+
+
+def run_pipeline(steps: List[Step], jobs: int, force: bool = False) -> Dict[str, StepResult]:
+    """Run steps as their dependencies complete, up to ``jobs`` at a time"""
+    deps = build_dependencies(steps)
+    by_name = {s.name: s for s in steps}
+    results: Dict[str, StepResult] = {}
+    pending = [s.name for s in steps]
+    running = {}
+
+    def execute(step: Step) -> StepResult:
+        if not force and is_up_to_date(step):
+            with _print_lock:
+                print(f"\n[SKIP] {step.name} (outputs up to date)", flush=True)
+            return StepResult(step.name, "skipped")
+        start = time.perf_counter()
+        ok = run_step(step.name, step.script, step.cwd, step.args)
+        return StepResult(step.name, "ok" if ok else "failed", time.perf_counter() - start)
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        while pending or running:
+            # Upstream failures do not block dependents (outputs of a previous run may still be valid)
+            ready = [n for n in pending if all(d in results for d in deps[n])]
+            for name in ready[:max(1, jobs) - len(running)]:
+                pending.remove(name)
+                running[pool.submit(execute, by_name[name])] = name
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in done:
+                results[running.pop(fut)] = fut.result()
+    return results
+
+
+def build_steps(ographx_dir: Path) -> List[Step]:
+    """The self-regeneration pipeline with its declared inputs and outputs"""
+    self_ir = ".ographx/self-observation/self_graph.json"
+    sequences_out = ".ographx/sequences/self_sequences.json"
+    diagrams = ".ographx/visualization/diagrams"
+
+    return [
+        Step(
+            "Extract Self-Graph (IR)", "core/ographx_py.py", ographx_dir,
+            ["--root", str(ographx_dir), "--out", str(ographx_dir / self_ir)],
+            inputs=["**/*.py"], outputs=[self_ir],
+        ),
+        Step("Generate Sequences", "generators/generate_self_sequences.py", ographx_dir,
+             inputs=[self_ir, "core/call_chains.py"], outputs=[sequences_out]),
+        Step("Generate Orchestration Diagram", "generators/generate_orchestration_diagram.py", ographx_dir,
+             inputs=[sequences_out, self_ir],
+             outputs=[f"{diagrams}/orchestration_diagram.md", f"{diagrams}/call_graph_diagram.md",
+                      f"{diagrams}/summary_diagram.md"]),
+        Step("Generate Sequence Flow", "generators/generate_sequence_flow.py", ographx_dir,
+             inputs=[sequences_out],
+             outputs=[f"{diagrams}/sequence_flow_diagram.md", f"{diagrams}/beat_timeline.md"]),
+        Step("Convert Diagrams to SVG", "generators/convert_to_svg.py", ographx_dir, ["--all", "--method", "api"],
+             inputs=[f"{diagrams}/orchestration_diagram.md", f"{diagrams}/call_graph_diagram.md",
+                     f"{diagrams}/summary_diagram.md", f"{diagrams}/sequence_flow_diagram.md",
+                     f"{diagrams}/beat_timeline.md"],
+             outputs=[f"{diagrams}/*.svg"]),
+        Step("Generate Test Graph", "generators/generate_test_graph.py", ographx_dir,
+             inputs=["tests/**/*.py"],
+             outputs=[".ographx/test-graphs/test_structure.json", ".ographx/test-graphs/test_graph.mmd"]),
+        Step("Extract Analysis", "analysis/analyze_self_graph.py", ographx_dir,
+             inputs=[self_ir]),
+    ]
 
 
 def main():
     """Run complete regeneration pipeline"""
+    parser = argparse.ArgumentParser(description="Regenerate OgraphX self-observation artifacts")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Maximum steps to run concurrently (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Run every step even if its outputs are up to date")
+    args = parser.parse_args()
+
     generators_dir = Path(__file__).parent
     ographx_dir = generators_dir.parent
-    
+
     print("=" * 70)
     print("OgraphX Self-Aware System - Regeneration Pipeline")
     print("=" * 70)
-    
-    # Prepare paths
-    self_ir = ographx_dir / ".ographx" / "self-observation" / "self_graph.json"
-    sequences_out = ographx_dir / ".ographx" / "sequences" / "self_sequences.json"
-
-    steps = [
-        (
-            "Extract Self-Graph (IR)",
-            "core/ographx_py.py",
-            ographx_dir,
-            ["--root", str(ographx_dir), "--out", str(self_ir)],
-        ),
-        ("Generate Sequences", "generators/generate_self_sequences.py", ographx_dir, []),
-        ("Generate Orchestration Diagram", "generators/generate_orchestration_diagram.py", ographx_dir, []),
-        ("Generate Sequence Flow", "generators/generate_sequence_flow.py", ographx_dir, []),
-        ("Convert Diagrams to SVG", "generators/convert_to_svg.py", ographx_dir, ["--all", "--method", "api"]),
-        ("Generate Test Graph", "generators/generate_test_graph.py", ographx_dir, []),
-        ("Extract Analysis", "analysis/analyze_self_graph.py", ographx_dir, []),
-    ]
 
-    results = []
-    for name, script, cwd, args in steps:
-        success = run_step(name, script, cwd, args)
-        results.append((name, success))
-    
+    steps = build_steps(ographx_dir)
+    start = time.perf_counter()
+    results = run_pipeline(steps, args.jobs, force=args.force)
+    wall = time.perf_counter() - start
+
     # Print summary
     print("\n" + "=" * 70)
     print("REGENERATION SUMMARY")
     print("=" * 70)
-    
-    passed = sum(1 for _, success in results if success)
+
+    passed = sum(1 for r in results.values() if r.status != "failed")
     total = len(results)
-    
-    for name, success in results:
-        status = "[OK]" if success else "[FAIL]"
-        print(f"{status} {name}")
-    
+
+    for step in steps:
+        r = results[step.name]
+        status = {"ok": "[OK]", "skipped": "[SKIP]", "failed": "[FAIL]"}[r.status]
+        print(f"{status} {step.name} ({r.seconds:.2f}s)")
+
+    path, path_time = critical_path(steps, build_dependencies(steps), results)
+    print(f"\nCritical path: {' -> '.join(path)} ({path_time:.2f}s)")
+    print(f"Wall-clock: {wall:.2f}s (sum of steps: {sum(r.seconds for r in results.values()):.2f}s, jobs={args.jobs})")
     print(f"\nTotal: {passed}/{total} steps completed")
-    
+
     if passed == total:
         print("\n[SUCCESS] All regeneration steps completed!")
         return 0
@@ -118,4 +267,3 @@ def main():
 
 if __name__ == '__main__':
     sys.exit(main())
-
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Architecture Metrics Benchmark
+Compares the CSR graph core used by analyze_architecture_ir (degree arrays
+built once, iterative SCC) against the previous list-of-lists graph with a
+recursive Tarjan, on a random call graph plus one long call chain.
+
+The previous implementation is reproduced here as the baseline; on a chain
+deeper than the recursion limit it fails with RecursionError.
+
+Usage:
+  python scripts/benchmark_architecture_metrics.py --symbols 100000 --calls 600000 --chain 20000
+"""
+import argparse
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'analysis'))
+
+from analyze_graph import _build_arch_graph, analyze_architecture_ir
+
+
+def generate_ir(symbol_count: int, call_count: int, chain: int, seed: int = 11) -> dict:
+    """Random call edges, small cycles, and a call chain ``chain`` symbols deep"""
+    rng = random.Random(seed)
+    symbols = [{"id": f"mod{i // 20}.ts::fn{i}", "file": f"src/mod{i // 20}.ts", "kind": "function",
+                "name": f"fn{i}", "range": [1, 10]} for i in range(symbol_count)]
+    ids = [s["id"] for s in symbols]
+    calls = []
+    for i in range(min(chain, symbol_count) - 1):
+        calls.append({"frm": ids[i], "to": ids[i + 1], "name": f"fn{i + 1}"})
+    for i in range(0, symbol_count - 2, 997):
+        calls.append({"frm": ids[i + 2], "to": ids[i], "name": f"fn{i}"})
+    while len(calls) < call_count:
+        a = rng.randrange(symbol_count)
+        b = rng.randrange(symbol_count)
+        calls.append({"frm": ids[a], "to": ids[b], "name": f"fn{b}"})
+    return {"symbols": symbols, "calls": calls, "contracts": []}
+
+
+# --- Baseline: adjacency lists and recursive Tarjan (previous implementation) ---
+
+def legacy_metrics(ir):
+    nodes = []
+    seen = set()
+    for s in ir["symbols"]:
+        if s["id"] not in seen:
+            nodes.append(s["id"])
+            seen.add(s["id"])
+    idx = {n: i for i, n in enumerate(nodes)}
+    out_edges = [[] for _ in nodes]
+    in_edges = [[] for _ in nodes]
+    for c in ir["calls"]:
+        frm, to = c.get("frm"), c.get("to")
+        if frm in idx and to in idx:
+            out_edges[idx[frm]].append(idx[to])
+            in_edges[idx[to]].append(idx[frm])
+    Ca = [len(e) for e in in_edges]
+    Ce = [len(e) for e in out_edges]
+    I = [(Ce[i] / (Ca[i] + Ce[i])) if (Ca[i] + Ce[i]) else 0.0 for i in range(len(nodes))]
+    return Ca, Ce, I, legacy_tarjan(out_edges)
+
+
+def legacy_tarjan(out_edges):
+    n = len(out_edges)
+    index = 0
+    stack = []
+    onstack = [False] * n
+    indices = [-1] * n
+    low = [0] * n
+    sccs = []
+
+    def strongconnect(v):
+        nonlocal index
+        indices[v] = index
+        low[v] = index
+        index += 1
+        stack.append(v)
+        onstack[v] = True
+        for w in out_edges[v]:
+            if indices[w] == -1:
+                strongconnect(w)
+                low[v] = min(low[v], low[w])
+            elif onstack[w]:
+                low[v] = min(low[v], indices[w])
+        if low[v] == indices[v]:
+            comp = []
+            while True:
+                w = stack.pop()
+                onstack[w] = False
+                comp.append(w)
+                if w == v:
+                    break
+            sccs.append(comp)
+
+    for v in range(n):
+        if indices[v] == -1:
+            strongconnect(v)
+    return sccs
+
+
+def csr_metrics(ir):
+    _, _, graph, _ = _build_arch_graph(ir)
+    return graph.fan_in, graph.fan_out, graph.instability, graph.strongly_connected_components()
+
+
+def timed(label, func, *args):
+    start = time.perf_counter()
+    try:
+        result = func(*args)
+    except RecursionError:
+        print(f"{label:>10}: RecursionError after {time.perf_counter() - start:.2f}s")
+        return None
+    print(f"{label:>10}: {time.perf_counter() - start:.2f}s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark architecture metrics (CSR core vs adjacency lists)")
+    parser.add_argument("--symbols", type=int, default=100000, help="Synthetic symbol count (default: 100000)")
+    parser.add_argument("--calls", type=int, default=600000, help="Synthetic call count (default: 600000)")
+    parser.add_argument("--chain", type=int, default=20000, help="Depth of the longest call chain (default: 20000)")
+    args = parser.parse_args()
+
+    try:
+        import numpy  # noqa: F401
+        backend = "numpy"
+    except ImportError:
+        backend = "pure Python"
+
+    print(f"[*] Generating IR: {args.symbols} symbols, {args.calls} calls, chain depth {args.chain}")
+    ir = generate_ir(args.symbols, args.calls, args.chain)
+    print(f"[*] CSR backend: {backend}\n")
+
+    new = timed("csr", csr_metrics, ir)
+    old = timed("legacy", legacy_metrics, ir)
+    if old is not None:
+        print(f"\n[*] Results identical: {old == new}")
+
+    # Give the baseline enough stack to finish, so the two can be compared directly
+    print("\n[*] Baseline again with a raised recursion limit and a 1 GB thread stack")
+    box = {}
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 2 * args.symbols + 1000))
+    threading.stack_size(1 << 30)
+    worker = threading.Thread(target=lambda: box.update(old=timed("legacy", legacy_metrics, ir)))
+    worker.start()
+    worker.join()
+    if box.get("old") is not None:
+        print(f"\n[*] Results identical: {box['old'] == new}")
+
+    print("\n[*] Full analyze_architecture_ir")
+    timed("csr", analyze_architecture_ir, ir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Binary IR Load Benchmark
+Generates a synthetic IR with many call edges and compares loading it as
+graph.json (json.load) against the memory-mapped binary IR (.ogxb), reporting
+file size, load time and Python heap allocated by the load.
+
+Usage:
+  python scripts/benchmark_binary_ir.py --symbols 200000 --calls 2000000
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'core'))
+
+from ir_binary import BinaryIR, write_binary_ir
+
+
+def generate_ir(symbol_count: int, call_count: int, per_file: int = 20, seed: int = 7) -> dict:
+    """Synthetic graph.json-shaped IR with random resolved call edges"""
+    rng = random.Random(seed)
+    files = [f"src/pkg{i // 50:04d}/mod{i:05d}.ts" for i in range((symbol_count + per_file - 1) // per_file)]
+    symbols = []
+    for i in range(symbol_count):
+        file = files[i // per_file]
+        name = f"handle{i}"
+        symbols.append({
+            "id": f"{os.path.basename(file)}::Service{i // per_file}.{name}",
+            "file": file, "kind": "method", "name": name,
+            "class_name": f"Service{i // per_file}", "exported": i % 3 == 0,
+            "params_contract": f"Service{i // per_file}.{name}#0", "range": [i % 500, i % 500 + 10],
+        })
+    calls = []
+    for _ in range(call_count):
+        frm = symbols[rng.randrange(symbol_count)]
+        to = symbols[rng.randrange(symbol_count)]
+        calls.append({"frm": frm["id"], "to": to["id"], "name": to["name"], "line": rng.randrange(1, 500)})
+    return {"files": files, "symbols": symbols, "calls": calls, "contracts": []}
+
+
+def measure(load):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = load()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark binary IR loading against graph.json")
+    parser.add_argument("--symbols", type=int, default=100000, help="Synthetic symbol count (default: 100000)")
+    parser.add_argument("--calls", type=int, default=1000000, help="Synthetic call count (default: 1000000)")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="ographx-binir-")
+    try:
+        json_path = os.path.join(work_dir, "graph.json")
+        bin_path = os.path.join(work_dir, "graph.ogxb")
+        print(f"[*] Generating IR: {args.symbols} symbols, {args.calls} calls")
+        ir = generate_ir(args.symbols, args.calls)
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(ir, f, indent=2)
+        start = time.perf_counter()
+        write_binary_ir(ir, bin_path)
+        print(f"[*] Binary IR written in {time.perf_counter() - start:.2f}s")
+        del ir
+
+        def load_json():
+            with open(json_path, encoding='utf-8') as f:
+                return json.load(f)
+
+        doc, json_time, json_peak = measure(load_json)
+        del doc
+        bir, bin_time, bin_peak = measure(lambda: BinaryIR(bin_path))
+
+        print(f"\n{'format':>8} {'MB on disk':>11} {'load ms':>9} {'heap MB':>9}")
+        for label, path, t, peak in (("json", json_path, json_time, json_peak),
+                                     ("ogxb", bin_path, bin_time, bin_peak)):
+            print(f"{label:>8} {os.path.getsize(path) / 1e6:>11.1f} {t * 1000:>9.1f} {peak / 1e6:>9.1f}")
+
+        start = time.perf_counter()
+        fan_out = max(bir.out_degree(i) for i in range(bir.n_symbols))
+        print(f"\n[*] Max fan-out over CSR: {fan_out} ({time.perf_counter() - start:.2f}s for {bir.n_symbols} nodes)")
+        bir.close()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Parallel Extraction Benchmark
+Generates a synthetic TypeScript tree and measures ographx_ts.build_ir throughput
+(files/second) for several worker counts. Also checks that every parallel run
+emits a graph.json byte-identical to the serial run.
+
+Usage:
+  python scripts/benchmark_parallel_extraction.py --files 5000 --jobs 1,2,4,8
+"""
+import argparse
+import filecmp
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'core'))
+
+from ographx_ts import build_ir, emit_ir
+
+
+def generate_tree(root: str, file_count: int, per_dir: int = 50):
+    """Write file_count synthetic .ts modules that import and call each other"""
+    for i in range(file_count):
+        subdir = os.path.join(root, f"pkg{i // per_dir:04d}")
+        os.makedirs(subdir, exist_ok=True)
+        prev = f"mod{i - 1:05d}" if i % per_dir else None
+        lines = []
+        if prev:
+            lines.append(f"import {{ run{i - 1} }} from './{prev}';")
+        lines += [
+            f"export function run{i}(input: string, count: number = 1): string {{",
+            f"  const value = helper{i}(input);",
+            f"  return {'run' + str(i - 1) + '(value)' if prev else 'value'};",
+            "}",
+            "",
+            f"const helper{i} = (text: string): string => {{",
+            "  return text.trim().toUpperCase();",
+            "};",
+            "",
+            f"export class Service{i} {{",
+            "  handle(payload: Record<string, unknown>): void {",
+            f"    run{i}(String(payload), 2);",
+            "    this.log(payload);",
+            "  }",
+            "  log(payload: unknown) {",
+            "    console.log(payload);",
+            "  }",
+            "}",
+        ]
+        with open(os.path.join(subdir, f"mod{i:05d}.ts"), 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parallel IR extraction")
+    parser.add_argument("--files", type=int, default=5000, help="Synthetic file count (default: 5000)")
+    parser.add_argument("--jobs", default="1,2,4,8", help="Worker counts to measure (comma-separated)")
+    args = parser.parse_args()
+
+    job_counts = [int(j) for j in args.jobs.split(",") if j.strip()]
+    work_dir = tempfile.mkdtemp(prefix="ographx-bench-")
+    try:
+        src = os.path.join(work_dir, "src")
+        print(f"[*] Generating {args.files} synthetic files in {src}")
+        generate_tree(src, args.files)
+
+        baseline = None
+        print(f"\n{'jobs':>6} {'seconds':>10} {'files/s':>10} {'speedup':>9}  identical")
+        serial_time = None
+        for jobs in job_counts:
+            start = time.perf_counter()
+            ir = build_ir(src, jobs=jobs)
+            elapsed = time.perf_counter() - start
+
+            out = os.path.join(work_dir, f"graph.jobs{jobs}.json")
+            emit_ir(ir, out)
+            if baseline is None:
+                baseline = out
+            identical = filecmp.cmp(baseline, out, shallow=False)
+            if serial_time is None:
+                serial_time = elapsed
+            print(f"{jobs:>6} {elapsed:>10.2f} {len(ir.files) / elapsed:>10.0f} "
+                  f"{serial_time / elapsed:>8.2f}x  {'yes' if identical else 'NO'}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Unit tests for memoized call-chain expansion.
+"""
+
+import json
+import os
+import random
+import sys
+from collections import deque
+from pathlib import Path
+
+import pytest
+
+# Add core to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'core'))
+
+from call_chains import CallChainIndex
+from ographx_ts import CallEdge, build_ir, dfs_call_chain, emit_sequences
+
+
+def random_graph(seed, n=30, m=60):
+    rng = random.Random(seed)
+    graph = {}
+    for line in range(m):
+        a = f"n{rng.randrange(n)}"
+        b = f"n{rng.randrange(n)}" if rng.random() > 0.1 else None
+        graph.setdefault(a, []).append(CallEdge(frm=a, to=b, name=b or "ext", line=line))
+    return graph
+
+
+def within_depth(graph, start, max_depth):
+    """Edges of every node within max_depth hops of start"""
+    dist = {start: 0}
+    queue = deque([start])
+    while queue:
+        v = queue.popleft()
+        for e in graph.get(v, []):
+            if e.to and e.to not in dist:
+                dist[e.to] = dist[v] + 1
+                queue.append(e.to)
+    return {id(e) for v, d in dist.items() if d <= max_depth for e in graph.get(v, [])}
+
+
+class TestCallChainIndex:
+    @pytest.mark.parametrize("seed", range(6))
+    def test_unbounded_matches_visited_dfs(self, seed):
+        graph = random_graph(seed)
+        chains = CallChainIndex(graph, max_depth=None)
+        for node in graph:
+            expected = dfs_call_chain(node, graph, max_depth=10_000)
+            assert [id(e) for e in chains.chain(node)] == [id(e) for e in expected]
+
+    @pytest.mark.parametrize("seed", range(6))
+    def test_bounded_covers_calls_within_depth(self, seed):
+        graph = random_graph(seed)
+        for depth in (0, 1, 3):
+            chains = CallChainIndex(graph, max_depth=depth)
+            for node in graph:
+                chain = chains.chain(node)
+                assert len({id(e) for e in chain}) == len(chain)
+                assert {id(e) for e in chain} == within_depth(graph, node, depth)
+                assert chain[0] is graph[node][0]
+
+    def test_bounded_matches_dfs_on_tree(self):
+        graph = {"a": [CallEdge("a", "b", "b", 1), CallEdge("a", "c", "c", 2)],
+                 "b": [CallEdge("b", "d", "d", 3)],
+                 "d": [CallEdge("d", "e", "e", 4)],
+                 "e": [CallEdge("e", None, "log", 5)]}
+        for depth in (0, 1, 2, 3):
+            assert CallChainIndex(graph, depth).chain("a") == dfs_call_chain("a", graph, max_depth=depth)
+
+    def test_unknown_and_leaf_nodes(self):
+        graph = {"a": [CallEdge("a", "leaf", "leaf", 1)]}
+        chains = CallChainIndex(graph)
+        assert chains.chain("leaf") == [] and chains.chain("missing") == []
+        assert [e.to for e in chains.chain("a")] == ["leaf"]
+
+    def test_deep_chain_is_iterative(self):
+        n = 1500
+        graph = {f"n{i}": [CallEdge(f"n{i}", f"n{i + 1}", f"n{i + 1}", i)] for i in range(n)}
+        graph[f"n{n}"] = [CallEdge(f"n{n}", "n0", "n0", n)]
+        chains = CallChainIndex(graph, max_depth=None)
+        assert len(chains.chain("n0")) == n + 1
+        assert len(CallChainIndex(graph, max_depth=5).chain("n7")) == 6
+
+
+class TestEmitSequences:
+    def test_beats_follow_call_chain(self, temp_dir):
+        src = os.path.join(temp_dir, "src")
+        os.makedirs(src)
+        with open(os.path.join(src, "a.ts"), "w") as f:
+            f.write("export function a(x: string) {\n"
+                    "  b(x);\n"
+                    "}\n"
+                    "function b(x: string) {\n"
+                    "  c(x);\n"
+                    "}\n"
+                    "function c(x: string) {\n"
+                    "  console.log(x);\n"
+                    "}\n")
+        ir = build_ir(src)
+        out = os.path.join(temp_dir, "seq", "sequences.json")
+        emit_sequences(ir, out)
+        with open(out) as f:
+            bundle = json.load(f)
+        (seq,) = bundle["sequences"]
+        handlers = [b["handler"] for b in seq["movements"][0]["beats"]]
+        assert handlers[:2] == ["b", "c"]
+
+        emit_sequences(ir, out, max_depth=0)
+        with open(out) as f:
+            shallow = json.load(f)["sequences"][0]["movements"][0]["beats"]
+        assert [b["handler"] for b in shallow] == ["b"]
@@ -19,8 +19,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'core'))
 
 from ographx_ts import (
-    extract_symbols_and_calls, build_ir, parse_params, extract_imports,
-    find_blocks, Symbol, CallEdge, Contract
+    extract_symbols_and_calls, build_ir, emit_ir, parse_params, extract_imports,
+    extract_import_bindings, module_key, find_blocks, Symbol, CallEdge, Contract
 )
 
 
@@ -326,6 +326,22 @@ export function greet(name: string): string {
             assert any("impl.ts" in f for f in ir.files)
             assert not any("types.d.ts" in f for f in ir.files)
 
+    def test_build_ir_parallel_matches_serial(self):
+        """Test that parallel extraction emits byte-identical IR"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for i in range(6):
+                with open(os.path.join(tmpdir, f"m{i}.ts"), "w") as f:
+                    f.write(f"export function f{i}() {{ return g{i}(); }}\n"
+                            f"function g{i}() {{ return f{(i + 1) % 6}(); }}\n")
+
+            serial_out = os.path.join(tmpdir, "out", "serial.json")
+            parallel_out = os.path.join(tmpdir, "out", "parallel.json")
+            emit_ir(build_ir(tmpdir), serial_out)
+            emit_ir(build_ir(tmpdir, jobs=2), parallel_out)
+
+            with open(serial_out) as a, open(parallel_out) as b:
+                assert a.read() == b.read()
+
 
 class TestCallResolution:
     """Test call resolution in extract_symbols_and_calls() — CRITICAL"""
@@ -441,6 +457,59 @@ export function caller() {
         assert "anotherMissing" in call_names
 
 
+class TestCrossFileResolution:
+    """Test project-wide call resolution in build_ir() — CRITICAL"""
+
+    def _write(self, root, rel, text):
+        path = os.path.join(root, rel)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(text)
+
+    def test_import_resolves_to_imported_module(self):
+        """Test that an import wins over a same-named symbol elsewhere"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._write(tmpdir, "a/decoy.ts", "export function save() { return 0; }\n")
+            self._write(tmpdir, "b/store.ts", "export function save() { return 1; }\n")
+            self._write(tmpdir, "b/main.ts",
+                        "import { save } from './store';\n"
+                        "export function run() {\n  save();\n}\n")
+
+            ir = build_ir(tmpdir)
+            run = next(s for s in ir.symbols if s.name == "run")
+            call = next(c for c in ir.calls if c.frm == run.id and c.name == "save")
+            store = next(s for s in ir.symbols if s.name == "save" and s.file.endswith(os.path.join("b", "store.ts")))
+            assert call.to == store.id
+
+    def test_aliased_multiline_and_index_imports(self):
+        """Test aliases, multi-line import lists and directory index modules"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._write(tmpdir, "lib/index.ts", "export function build() { return 1; }\n")
+            self._write(tmpdir, "app.ts",
+                        "import {\n  build as make,\n} from './lib';\n"
+                        "export function run() {\n  make();\n}\n")
+
+            ir = build_ir(tmpdir)
+            call = next(c for c in ir.calls if c.name == "make")
+            assert call.to.endswith("::build")
+
+    def test_unknown_call_stays_empty(self):
+        """Test that calls with no symbol anywhere are left unresolved"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._write(tmpdir, "a.ts", "export function run() {\n  missing();\n}\n")
+            ir = build_ir(tmpdir)
+            assert next(c for c in ir.calls if c.name == "missing").to == ""
+
+    def test_extract_import_bindings(self):
+        """Test import binding parsing and module keys"""
+        text = "import Default, { a as b, type T } from '../x/index';\nimport React from 'react';\n"
+        bindings = extract_import_bindings(text, "src/app/main.ts")
+        assert bindings["b"] == (module_key("src/x"), "a")
+        assert bindings["Default"] == (module_key("src/x"), "Default")
+        assert bindings["T"] == (module_key("src/x"), "T")
+        assert "React" not in bindings
+
+
 class TestEdgeCases:
     """Test edge cases and error paths — CRITICAL"""
 
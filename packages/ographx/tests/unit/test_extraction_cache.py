@@ -0,0 +1,94 @@
+"""
+Unit tests for the OgraphX incremental extraction cache.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Add core to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'core'))
+
+from ographx_ts import build_ir, emit_ir
+from extraction_cache import ExtractionCache
+
+
+@pytest.fixture
+def ts_tree():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        src = os.path.join(tmpdir, "src")
+        os.makedirs(src)
+        for name, body in [("a", "export function a() { return b(); }"),
+                           ("b", "export function b() { return 1; }")]:
+            with open(os.path.join(src, f"{name}.ts"), "w") as f:
+                f.write(body + "\n")
+        yield tmpdir, src
+
+
+class TestExtractionCache:
+    """Test ExtractionCache hit/miss behaviour"""
+
+    def test_unchanged_tree_is_all_hits(self, ts_tree):
+        tmpdir, src = ts_tree
+        cache_dir = os.path.join(tmpdir, "cache")
+
+        first = ExtractionCache(cache_dir)
+        cold_ir = build_ir(src, cache=first)
+        first.save()
+        assert first.stats() == {"hits": 0, "misses": 2}
+
+        second = ExtractionCache(cache_dir)
+        warm_ir = build_ir(src, cache=second)
+        assert second.stats() == {"hits": 2, "misses": 0}
+
+        cold_out = os.path.join(tmpdir, "out", "cold.json")
+        warm_out = os.path.join(tmpdir, "out", "warm.json")
+        emit_ir(cold_ir, cold_out)
+        emit_ir(warm_ir, warm_out)
+        with open(cold_out) as a, open(warm_out) as b:
+            assert a.read() == b.read()
+
+    def test_changed_file_is_reparsed(self, ts_tree):
+        tmpdir, src = ts_tree
+        cache_dir = os.path.join(tmpdir, "cache")
+
+        first = ExtractionCache(cache_dir)
+        build_ir(src, cache=first)
+        first.save()
+
+        with open(os.path.join(src, "b.ts"), "w") as f:
+            f.write("export function b() { return c(); }\nfunction c() { return 2; }\n")
+
+        second = ExtractionCache(cache_dir)
+        ir = build_ir(src, cache=second)
+        assert second.stats() == {"hits": 1, "misses": 1}
+        assert any(s.name == "c" for s in ir.symbols)
+
+    def test_touched_but_identical_file_hits(self, ts_tree):
+        tmpdir, src = ts_tree
+        cache_dir = os.path.join(tmpdir, "cache")
+
+        first = ExtractionCache(cache_dir)
+        build_ir(src, cache=first)
+        first.save()
+
+        path = os.path.join(src, "a.ts")
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+        second = ExtractionCache(cache_dir)
+        build_ir(src, cache=second)
+        assert second.stats() == {"hits": 2, "misses": 0}
+
+    def test_prune_drops_deleted_files(self, ts_tree):
+        tmpdir, src = ts_tree
+        cache_dir = os.path.join(tmpdir, "cache")
+
+        cache = ExtractionCache(cache_dir)
+        ir = build_ir(src, cache=cache)
+        os.remove(os.path.join(src, "b.ts"))
+        cache.prune([f for f in ir.files if not f.endswith("b.ts")])
+        assert len(cache.entries) == 1
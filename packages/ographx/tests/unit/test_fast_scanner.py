@@ -0,0 +1,208 @@
+"""
+Parity tests for the OgraphX fast scanner (--scanner=fast).
+
+The fast scanner must produce the same symbols, calls and contracts as the
+legacy extract_symbols_and_calls, except where the legacy extractor miscounts
+braces that sit inside strings, template literals, regex literals or comments.
+"""
+
+import os
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+# Add core and scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'core'))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'scripts'))
+
+from ographx_ts import extract_symbols_and_calls, build_ir, emit_ir, get_scanner
+from fast_scanner import scan_symbols_and_calls, strip_noise, BlockIndex
+from benchmark_parallel_extraction import generate_tree
+
+FIXTURES = Path(__file__).parent.parent / 'fixtures' / 'typescript'
+
+
+def as_dicts(result):
+    return [[asdict(x) for x in part] for part in result]
+
+
+def assert_parity(path, text):
+    assert as_dicts(scan_symbols_and_calls(path, text)) == as_dicts(extract_symbols_and_calls(path, text))
+
+
+SNIPPETS = {
+    "declarations": (
+        "export function greet(name: string): string {\n"
+        "  return format(name);\n"
+        "}\n"
+        "function helper(a, b = 2) { return a + b; }\n"
+    ),
+    "arrows": (
+        "export const add = (a: number, b: number) => {\n"
+        "  return sum(a, b);\n"
+        "};\n"
+        "const inline = async (x) => compute(x);\n"
+        "let named = function doWork(y) {\n"
+        "  return run(y);\n"
+        "};\n"
+    ),
+    "multiline_params": (
+        "export function create(\n"
+        "  id: string,\n"
+        "  opts: { size: number }\n"
+        "): Widget {\n"
+        "  return build(id, opts);\n"
+        "}\n"
+    ),
+    "class_methods": (
+        "export class Service {\n"
+        "  constructor(private api: Api) {}\n"
+        "  async load(id: string): Promise<void> {\n"
+        "    const data = await this.api.fetch(id);\n"
+        "    this.store(data);\n"
+        "  }\n"
+        "  store(data: unknown) {\n"
+        "    if (data) { persist(data); }\n"
+        "  }\n"
+        "}\n"
+        "class Local {\n"
+        "  run() { go(); }\n"
+        "}\n"
+    ),
+    "nested": (
+        "export function outer() {\n"
+        "  function inner() {\n"
+        "    return deep();\n"
+        "  }\n"
+        "  const cb = () => { inner(); };\n"
+        "  return cb();\n"
+        "}\n"
+    ),
+    "unterminated": (
+        "export function broken(a) {\n"
+        "  if (a) {\n"
+        "    call(a);\n"
+    ),
+    "regex_literals": (
+        "export function parseLine(line: string) {\n"
+        "  if (!name) { const legacy = line.match(/Sequence registered:\\s*([^\\\"\\']+)/i); if (legacy) name = legacy[1]; }\n"
+        "  const quoted = line.match(/Subscribed to [\"']([^\"']+)[\"']/); if (quoted) { topics.add(quoted[1]); }\n"
+        "  const year = line.match(/\\d{4}-\\d{2}/);\n"
+        "  if (name) { record(name); }\n"
+        "  return ratio(line.length / 2, quoted) / 4;\n"
+        "}\n"
+        "export function detect(content: string) {\n"
+        "  return /^\\s*\\{.*\\}\\s*$/.test(content) ? 'json' : 'log';\n"
+        "}\n"
+    ),
+    "no_body": "function declared(a: string);\nconst x = 1;\n",
+    "empty": "",
+}
+
+
+class TestFastScannerParity:
+    """Fast scanner output matches the legacy extractor"""
+
+    @pytest.mark.parametrize("name", sorted(SNIPPETS))
+    def test_snippets(self, name):
+        assert_parity(f"{name}.ts", SNIPPETS[name])
+
+    @pytest.mark.parametrize("fixture", ["simple.ts", "with_imports.ts"])
+    def test_fixtures(self, fixture):
+        path = FIXTURES / fixture
+        assert_parity(str(path), path.read_text(encoding='utf-8'))
+
+    def test_synthetic_tree(self, temp_dir):
+        generate_tree(temp_dir, 60, per_dir=20)
+        for dirpath, _, names in os.walk(temp_dir):
+            for name in names:
+                path = os.path.join(dirpath, name)
+                with open(path, encoding='utf-8') as f:
+                    assert_parity(path, f.read())
+
+    def test_build_ir_fast_matches_legacy(self, temp_dir):
+        src = os.path.join(temp_dir, "src")
+        generate_tree(src, 40, per_dir=10)
+        legacy_out = os.path.join(temp_dir, "legacy.json")
+        fast_out = os.path.join(temp_dir, "fast.json")
+        emit_ir(build_ir(src, scanner="legacy"), legacy_out)
+        emit_ir(build_ir(src, scanner="fast"), fast_out)
+        with open(legacy_out) as a, open(fast_out) as b:
+            assert a.read() == b.read()
+
+    def test_unknown_scanner_rejected(self):
+        with pytest.raises(ValueError):
+            get_scanner("turbo")
+
+
+class TestFastScannerLexing:
+    """Braces inside strings, templates and comments no longer unbalance blocks"""
+
+    def test_strip_noise_keeps_line_structure(self):
+        text = "a('{');\n/* {\n} */\nb(`${x}\n{`);\n// }\nc();"
+        code = strip_noise(text)
+        assert code.count('\n') == text.count('\n')
+        assert '{' not in code and '}' not in code
+
+    def test_block_index_ignores_string_braces(self):
+        lines = strip_noise("function f() {\n  log('}');\n}\nnext();").split('\n')
+        assert BlockIndex(lines).end(0) == 2
+
+    def test_brace_in_string_does_not_swallow_next_function(self):
+        text = (
+            "function first() {\n"
+            "  log('{');\n"
+            "}\n"
+            "function second() {\n"
+            "  return 1;\n"
+            "}\n"
+        )
+        symbols, _, _ = scan_symbols_and_calls("s.ts", text)
+        assert [(s.name, s.range) for s in symbols] == [("first", (1, 3)), ("second", (4, 6))]
+
+    def test_template_literal_body(self):
+        text = (
+            "export const render = (x) => {\n"
+            "  return `<div>${x}}</div>`;\n"
+            "};\n"
+            "export function after() {\n"
+            "  done();\n"
+            "}\n"
+        )
+        symbols, calls, _ = scan_symbols_and_calls("t.ts", text)
+        assert [s.name for s in symbols] == ["render", "after"]
+        assert any(c.name == "done" and c.frm == "t.ts::after" for c in calls)
+
+    def test_regex_literal_braces_and_quotes(self):
+        text = (
+            "function first(s) {\n"
+            "  if (s) { const open = s.match(/\\{[^}\"]*/g); log(open); }\n"
+            "  return s.replace(/'/g, '');\n"
+            "}\n"
+            "function second() {\n"
+            "  return 1;\n"
+            "}\n"
+        )
+        symbols, _, _ = scan_symbols_and_calls("r.ts", text)
+        assert [(s.name, s.range) for s in symbols] == [("first", (1, 4)), ("second", (5, 7))]
+
+    def test_division_is_not_a_regex(self):
+        code = strip_noise("const r = a / b / c;\nconst s = total / 2; log('{');")
+        assert code == "const r = a / b / c;\nconst s = total / 2; log();"
+
+    def test_block_index_line_closing_several_blocks(self):
+        lines = ["function f() {", "  if (x) {", "    go();", "  }}", "next();"]
+        assert BlockIndex(lines).end(1) == 3
+        assert BlockIndex(lines).end(0) == 3
+
+    def test_header_in_comment_is_ignored(self):
+        text = (
+            "/*\n"
+            "function ghost() {\n"
+            "*/\n"
+            "function real() { return 1; }\n"
+        )
+        symbols, _, _ = scan_symbols_and_calls("c.ts", text)
+        assert [s.name for s in symbols] == ["real"]
@@ -0,0 +1,103 @@
+"""
+Unit tests for the CSR graph core behind architecture metrics.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add analysis directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "analysis"))
+
+import graph_core
+from graph_core import ArchGraph
+import analyze_graph
+
+
+def recursive_tarjan(n, edges):
+    """Reference SCC (the recursive formulation analyze_graph used before)"""
+    out_edges = [[] for _ in range(n)]
+    for a, b in edges:
+        out_edges[a].append(b)
+    index = [0]
+    indices, low, onstack, stack, sccs = [-1] * n, [0] * n, [False] * n, [], []
+
+    def strongconnect(v):
+        indices[v] = low[v] = index[0]
+        index[0] += 1
+        stack.append(v)
+        onstack[v] = True
+        for w in out_edges[v]:
+            if indices[w] == -1:
+                strongconnect(w)
+                low[v] = min(low[v], low[w])
+            elif onstack[w]:
+                low[v] = min(low[v], indices[w])
+        if low[v] == indices[v]:
+            comp = []
+            while True:
+                w = stack.pop()
+                onstack[w] = False
+                comp.append(w)
+                if w == v:
+                    break
+            sccs.append(comp)
+
+    for v in range(n):
+        if indices[v] == -1:
+            strongconnect(v)
+    return sccs
+
+
+def graph(n, edges):
+    return ArchGraph(n, [a for a, _ in edges], [b for _, b in edges])
+
+
+class TestArchGraph:
+    def test_degrees_count_parallel_edges(self):
+        g = graph(4, [(0, 1), (0, 1), (1, 2), (2, 0)])
+        assert g.fan_out == [2, 1, 1, 0]
+        assert g.fan_in == [1, 2, 1, 0]
+        assert g.instability == [2 / 3, 1 / 3, 0.5, 0.0]
+
+    def test_adjacency_keeps_edge_order(self):
+        g = graph(3, [(0, 2), (1, 0), (0, 1), (2, 0)])
+        assert g.successors(0) == [2, 1]
+        assert g.predecessors(0) == [1, 2]
+        assert g.successors(1) == [0] and g.predecessors(2) == [0]
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_scc_matches_recursive_tarjan(self, seed):
+        rng = random.Random(seed)
+        n = 60
+        edges = [(rng.randrange(n), rng.randrange(n)) for _ in range(90)]
+        assert graph(n, edges).strongly_connected_components() == recursive_tarjan(n, edges)
+
+    def test_deep_chain_does_not_recurse(self):
+        n = 100_000
+        edges = [(i, i + 1) for i in range(n - 1)] + [(n - 1, 0)]
+        comps = graph(n, edges).strongly_connected_components()
+        assert len(comps) == 1 and len(comps[0]) == n
+
+    def test_pure_python_fallback_matches(self, monkeypatch):
+        rng = random.Random(3)
+        edges = [(rng.randrange(40), rng.randrange(40)) for _ in range(120)]
+        native = graph(40, edges)
+        monkeypatch.setattr(graph_core, "np", None)
+        fallback = graph(40, edges)
+        assert fallback.fan_in == native.fan_in and fallback.fan_out == native.fan_out
+        assert fallback.instability == native.instability
+        assert fallback.strongly_connected_components() == native.strongly_connected_components()
+        assert fallback.predecessors(7) == native.predecessors(7)
+
+    def test_architecture_report_on_deep_cycle(self):
+        n = 5000
+        ir = {"symbols": [{"id": f"f{i}", "file": "a.ts"} for i in range(n)],
+              "calls": [{"frm": f"f{i}", "to": f"f{(i + 1) % n}", "name": f"f{(i + 1) % n}"} for i in range(n)]}
+        report = analyze_graph.analyze_architecture_ir(ir)
+        cycles = report["anti_patterns"]["cycles"]
+        assert len(cycles) == 1 and cycles[0]["size"] == n
+        assert report["coupling"]["f0"] == {"file": "a.ts", "line_range": None,
+                                            "afferent": 1, "efferent": 1, "instability": 0.5}
@@ -0,0 +1,85 @@
+"""
+Unit tests for the memory-mapped binary IR.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add core to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'core'))
+
+from ographx_ts import build_ir, emit_ir
+from ir_binary import BinaryIR, write_binary_ir
+from ir_stream import open_ir
+from artifact_manager import ArtifactManager
+
+
+@pytest.fixture
+def graph_json(temp_dir):
+    src = os.path.join(temp_dir, "src")
+    os.makedirs(src)
+    with open(os.path.join(src, "a.ts"), "w") as f:
+        f.write("import { b } from './b';\n"
+                "export function a(x: string, n: number) {\n"
+                "  b(x);\n"
+                "  missing();\n"
+                "}\n"
+                "export class Box {\n"
+                "  open(lid: string) {\n"
+                "    a(lid, 1);\n"
+                "  }\n"
+                "}\n")
+    with open(os.path.join(src, "b.ts"), "w") as f:
+        f.write("export function b(x: string) {\n"
+                "  return a(x, 2);\n"
+                "}\n")
+    path = os.path.join(temp_dir, "ir", "graph.json")
+    emit_ir(build_ir(src), path)
+    return path
+
+
+class TestBinaryIR:
+    """Binary IR round-trips the JSON IR and exposes CSR adjacency"""
+
+    def test_round_trip_matches_json(self, temp_dir, graph_json):
+        with open(graph_json) as f:
+            doc = json.load(f)
+        out = write_binary_ir(doc, os.path.join(temp_dir, "graph.ogxb"))
+        with BinaryIR(out) as bir:
+            assert bir.to_dict() == doc
+            assert len(bir.get("calls")) == len(doc["calls"])
+
+    def test_csr_adjacency(self, temp_dir, graph_json):
+        out = write_binary_ir(open_ir(graph_json), os.path.join(temp_dir, "graph.ogxb"))
+        with BinaryIR(out) as bir:
+            a = bir.index_of("a.ts::a")
+            b = bir.index_of("b.ts::b")
+            method = bir.index_of("a.ts::Box.open")
+            assert list(bir.callees(a)) == [b]
+            assert sorted(bir.callers(a)) == sorted([b, method])
+            assert bir.in_degree(b) == 1 and bir.out_degree(method) == 1
+            # Unresolved calls are kept as records but are not edges
+            assert any(c["name"] == "missing" and c["to"] == "" for c in bir.calls())
+            assert bir.n_edges == 3
+
+    def test_open_ir_dispatches_binary(self, temp_dir, graph_json):
+        out = write_binary_ir(open_ir(graph_json), os.path.join(temp_dir, "graph.ogxb"))
+        ir = open_ir(out)
+        assert isinstance(ir, BinaryIR)
+        assert [s["id"] for s in ir.get("symbols", [])] == [s["id"] for s in open_ir(graph_json)["symbols"]]
+        ir.close()
+
+    def test_rejects_non_binary_file(self, graph_json):
+        with pytest.raises(ValueError):
+            BinaryIR(graph_json)
+
+    def test_artifact_manager_writes_next_to_graph_json(self, temp_dir, graph_json):
+        manager = ArtifactManager(os.path.join(temp_dir, ".ographx", "artifacts"))
+        path = manager.write_binary_ir("demo", open_ir(graph_json))
+        assert path.name == "graph.ogxb" and path.parent.name == "ir"
+        with BinaryIR(str(path)) as bir:
+            assert bir.n_symbols == len(open_ir(graph_json)["symbols"])
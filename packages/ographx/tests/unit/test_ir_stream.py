@@ -0,0 +1,89 @@
+"""
+Unit tests for the streaming (NDJSON) IR writer and reader.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add core and analysis to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'core'))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'analysis'))
+
+from ographx_ts import build_ir, emit_ir
+from ir_stream import IRWriter, open_ir, IR_SECTIONS
+import analyze_graph
+
+
+@pytest.fixture
+def ts_root(temp_dir):
+    src = os.path.join(temp_dir, "src")
+    os.makedirs(src)
+    with open(os.path.join(src, "a.ts"), "w") as f:
+        f.write("import { b } from './b';\n"
+                "export function a(x: string, n: number) {\n"
+                "  return b(x);\n"
+                "}\n")
+    with open(os.path.join(src, "b.ts"), "w") as f:
+        f.write("export function b(x: string) {\n"
+                "  return x.trim();\n"
+                "}\n")
+    return src
+
+
+class TestIRStream:
+    """NDJSON IR round-trips and reads like the legacy graph.json"""
+
+    def test_ndjson_matches_legacy_json(self, temp_dir, ts_root):
+        ir = build_ir(ts_root)
+        json_path = os.path.join(temp_dir, "ir", "graph.json")
+        ndjson_path = os.path.join(temp_dir, "ir", "graph.ndjson")
+        emit_ir(ir, json_path)
+        emit_ir(ir, ndjson_path)
+
+        with open(json_path) as f:
+            legacy = json.load(f)
+        reader = open_ir(ndjson_path)
+        assert reader.streaming
+        for name in IR_SECTIONS:
+            assert list(reader.iter_section(name)) == legacy[name]
+            assert len(reader.get(name, [])) == len(legacy[name])
+        assert reader.to_dict() == legacy
+
+    def test_format_override(self, temp_dir, ts_root):
+        path = os.path.join(temp_dir, "graph.json")
+        emit_ir(build_ir(ts_root), path, fmt="ndjson")
+        assert open_ir(path).streaming
+
+    def test_reader_accepts_legacy_json(self, temp_dir, ts_root):
+        path = os.path.join(temp_dir, "graph.json")
+        emit_ir(build_ir(ts_root), path)
+        reader = open_ir(path)
+        assert not reader.streaming
+        assert len(reader["symbols"]) == 2
+
+    def test_unsized_section_is_counted(self, temp_dir):
+        path = os.path.join(temp_dir, "graph.ndjson")
+        with IRWriter(path) as w:
+            w.write_section("files", ["a.ts"])
+            w.write_section("symbols", ({"id": f"s{i}"} for i in range(3)))
+        reader = open_ir(path)
+        assert len(reader["symbols"]) == 3
+        assert [s["id"] for s in reader["symbols"]] == ["s0", "s1", "s2"]
+        assert list(reader["calls"]) == []
+
+    def test_unknown_section_rejected(self, temp_dir):
+        with IRWriter(os.path.join(temp_dir, "graph.ndjson")) as w:
+            with pytest.raises(ValueError):
+                w.begin_section("sequences")
+
+    def test_analyze_ir_same_for_both_formats(self, temp_dir, ts_root):
+        ir = build_ir(ts_root)
+        json_path = os.path.join(temp_dir, "graph.json")
+        ndjson_path = os.path.join(temp_dir, "graph.ndjson")
+        emit_ir(ir, json_path)
+        emit_ir(ir, ndjson_path)
+        assert analyze_graph.analyze_ir(ndjson_path) == analyze_graph.analyze_ir(json_path)
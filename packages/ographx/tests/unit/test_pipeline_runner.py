@@ -0,0 +1,89 @@
+"""
+Unit tests for the graph_codebase pipeline modes (in-process vs subprocess).
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add ographx root to path (graph_codebase imports core.* from there)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'generators'))
+
+from graph_codebase import CodebaseGrapher
+
+STAGES = ["Extract IR", "Generate Sequences", "Generate Visualizations", "Extract Analysis"]
+
+
+@pytest.fixture
+def ts_root(temp_dir):
+    src = os.path.join(temp_dir, "src")
+    os.makedirs(src)
+    with open(os.path.join(src, "a.ts"), "w") as f:
+        f.write("import { b } from './b';\n"
+                "export function a(x: string) {\n"
+                "  return b(x);\n"
+                "}\n")
+    with open(os.path.join(src, "b.ts"), "w") as f:
+        f.write("export function b(x: string) {\n"
+                "  return x.trim();\n"
+                "}\n")
+    return src
+
+
+def run_pipeline(temp_dir, src, mode):
+    grapher = CodebaseGrapher("demo", [src], base_dir=os.path.join(temp_dir, mode),
+                              use_cache=False, mode=mode)
+    grapher.setup()
+    steps = [("Extract IR", grapher.extract_ir),
+             ("Generate Sequences", grapher.generate_sequences),
+             ("Generate Visualizations", grapher.generate_visualizations),
+             ("Extract Analysis", grapher.extract_analysis)]
+    assert all(grapher.timed(name, step) for name, step in steps)
+    assert grapher.finalize()
+    return grapher
+
+
+class TestPipelineModes:
+    """In-process mode produces the same artifacts as subprocess mode"""
+
+    def test_inprocess_matches_subprocess(self, temp_dir, ts_root):
+        inproc = run_pipeline(temp_dir, ts_root, "inprocess")
+        subproc = run_pipeline(temp_dir, ts_root, "subprocess")
+
+        for rel in ["ir/graph.json", "ir/graph.ogxb", "sequences/sequences.json",
+                    "analysis/analysis.json"]:
+            a = (inproc.codebase_dir / rel).read_bytes()
+            b = (subproc.codebase_dir / rel).read_bytes()
+            assert a == b, rel
+        # Call graph node order follows set iteration (string hash seed), so compare lines
+        for rel in ["visualization/diagrams/call_graph.mmd", "visualization/diagrams/orchestration.mmd"]:
+            a = (inproc.codebase_dir / rel).read_text().splitlines()
+            b = (subproc.codebase_dir / rel).read_text().splitlines()
+            assert sorted(a) == sorted(b), rel
+        assert inproc.manifest.statistics == subproc.manifest.statistics
+
+    def test_stage_timings_in_manifest(self, temp_dir, ts_root):
+        grapher = run_pipeline(temp_dir, ts_root, "inprocess")
+        with open(grapher.codebase_dir / "manifest.json") as f:
+            timings = json.load(f)["timings"]
+        assert list(timings) == STAGES
+        for t in timings.values():
+            assert t["mode"] == "inprocess" and t["seconds"] >= 0
+            assert t["peak_heap_mb"] is None
+
+    def test_ir_is_shared_between_stages(self, temp_dir, ts_root):
+        grapher = CodebaseGrapher("demo", [ts_root], base_dir=os.path.join(temp_dir, "shared"),
+                                  use_cache=False)
+        grapher.setup()
+        assert grapher.extract_ir()
+        ir = grapher.ir
+        assert grapher.generate_sequences()
+        assert grapher.ir is ir and grapher.sequences is not None
+
+    def test_unknown_mode_rejected(self, ts_root):
+        with pytest.raises(ValueError):
+            CodebaseGrapher("demo", [ts_root], mode="threads")
@@ -0,0 +1,94 @@
+"""
+Unit tests for the regenerate_all DAG scheduler.
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add generators to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'generators'))
+
+from regenerate_all import (
+    Step, StepResult, build_dependencies, build_steps, critical_path, is_up_to_date, run_pipeline
+)
+
+WRITER = """import sys, time
+from pathlib import Path
+time.sleep(float(sys.argv[1]))
+for out in sys.argv[2:]:
+    Path(out).parent.mkdir(parents=True, exist_ok=True)
+    Path(out).write_text("ok")
+"""
+
+
+@pytest.fixture
+def workdir(tmp_path):
+    (tmp_path / "write.py").write_text(WRITER)
+    (tmp_path / "src.txt").write_text("source")
+    return tmp_path
+
+
+def writer_step(workdir, name, inputs, outputs, delay=0.0):
+    return Step(name, "write.py", workdir, [str(delay), *outputs], inputs=inputs, outputs=outputs)
+
+
+class TestScheduler:
+    """Dependencies, make-style skipping and critical path"""
+
+    def test_self_pipeline_dependencies(self):
+        deps = build_dependencies(build_steps(Path(__file__).parent.parent.parent))
+        assert deps["Generate Sequences"] == ["Extract Self-Graph (IR)"]
+        assert set(deps["Generate Orchestration Diagram"]) == {"Generate Sequences", "Extract Self-Graph (IR)"}
+        assert set(deps["Convert Diagrams to SVG"]) == {"Generate Orchestration Diagram", "Generate Sequence Flow"}
+        assert deps["Generate Test Graph"] == []
+        assert deps["Extract Analysis"] == ["Extract Self-Graph (IR)"]
+
+    def test_independent_steps_run_concurrently(self, workdir):
+        steps = [
+            writer_step(workdir, "ir", ["src.txt"], ["out/ir.txt"]),
+            writer_step(workdir, "left", ["out/ir.txt"], ["out/left.txt"], delay=0.5),
+            writer_step(workdir, "right", ["out/ir.txt"], ["out/right.txt"], delay=0.5),
+            writer_step(workdir, "join", ["out/left.txt", "out/right.txt"], ["out/join.txt"]),
+        ]
+        start = time.perf_counter()
+        results = run_pipeline(steps, jobs=2)
+        elapsed = time.perf_counter() - start
+        assert all(r.status == "ok" for r in results.values())
+        assert (workdir / "out" / "join.txt").exists()
+        # left and right overlap: well under the 1.0s of sleeping done in sequence
+        assert elapsed < 1.0 + sum(r.seconds for n, r in results.items() if n not in ("left", "right"))
+
+        path, _ = critical_path(steps, build_dependencies(steps), results)
+        assert path[0] == "ir" and path[-1] == "join" and len(path) == 3
+
+    def test_up_to_date_steps_are_skipped(self, workdir):
+        steps = [writer_step(workdir, "ir", ["src.txt"], ["out/ir.txt"]),
+                 writer_step(workdir, "seq", ["out/ir.txt"], ["out/seq.txt"])]
+        run_pipeline(steps, jobs=1)
+        assert all(is_up_to_date(s) for s in steps)
+        assert {r.status for r in run_pipeline(steps, jobs=1).values()} == {"skipped"}
+
+        # Touching the source re-runs the whole chain
+        src = workdir / "src.txt"
+        later = time.time() + 5
+        os.utime(src, (later, later))
+        results = run_pipeline(steps, jobs=1)
+        assert results["ir"].status == "ok" and results["seq"].status == "ok"
+
+    def test_force_and_report_only_steps_run(self, workdir):
+        step = writer_step(workdir, "ir", ["src.txt"], ["out/ir.txt"])
+        run_pipeline([step], jobs=1)
+        assert run_pipeline([step], jobs=1, force=True)["ir"].status == "ok"
+        report = Step("report", "write.py", workdir, ["0"], inputs=["out/ir.txt"])
+        assert not is_up_to_date(report)
+
+    def test_critical_path_uses_measured_times(self):
+        steps = [Step("a", "a.py", Path(".")), Step("b", "b.py", Path("."), inputs=["x"]),
+                 Step("c", "c.py", Path("."), outputs=["x"])]
+        # b depends on nothing declared earlier, so all three are independent roots
+        results = {"a": StepResult("a", "ok", 1.0), "b": StepResult("b", "ok", 3.0), "c": StepResult("c", "ok", 2.0)}
+        assert critical_path(steps, build_dependencies(steps), results) == (["b"], 3.0)
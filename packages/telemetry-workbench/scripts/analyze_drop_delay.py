@@ -4,67 +4,49 @@ Drop to Canvas Delay Analyzer
 Analyzes the RenderX plugin log file to visualize the ~7 second delay
 """
 
-import re
+import sys
 from datetime import datetime
-from typing import List, Tuple, Dict
+from pathlib import Path
+from typing import List, Optional, Tuple, Dict
+
+from timeline_index import TimelineIndex
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / 'scripts'))
+from log_classifier import DROP_DELAY_CLASSIFIER, TIMESTAMP_PATTERN
+from parallel_log_reader import map_lines
 
 def parse_timestamp(timestamp_str: str) -> datetime:
     """Parse ISO timestamp with Z suffix to datetime object"""
     return datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
 
-def parse_log_file(file_path: str) -> List[Tuple[datetime, str]]:
-    """Parse the log file and extract timestamp + event pairs"""
-    events = []
-    timestamp_pattern = r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z)'
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Find timestamp in line
-            match = re.search(timestamp_pattern, line)
-            if match:
-                timestamp_str = match.group(1)
-                timestamp = parse_timestamp(timestamp_str)
-                
-                # Extract meaningful event description
-                event_desc = extract_event_description(line)
-                if event_desc:
-                    events.append((timestamp, event_desc))
-    
-    return events
+def parse_log_line(line: str) -> Optional[Tuple[datetime, str]]:
+    """(timestamp, event description) of a log line, or None"""
+    line = line.strip()
+    if not line:
+        return None
+
+    # Find timestamp in line
+    match = TIMESTAMP_PATTERN.search(line)
+    if match:
+        # Extract meaningful event description
+        event_desc = extract_event_description(line)
+        if event_desc:
+            return parse_timestamp(match.group(1)), event_desc
+    return None
+
+def parse_log_file(file_path: str, workers: Optional[int] = None) -> List[Tuple[datetime, str]]:
+    """Parse the log file and extract timestamp + event pairs (chunks parsed by `workers` processes)"""
+    return list(map_lines(file_path, parse_log_line, workers))
 
 def extract_event_description(line: str) -> str:
     """Extract a meaningful description from a log line"""
-    # Key patterns to look for
-    patterns = [
-        (r'\[EventRouter\] Topic \'([^\']+)\' definition', r'📡 Topic: \1'),
-        (r'Starting delivery for \'([^\']+)\'', r'🚀 Starting: \1'),
-        (r'MusicalConductor\.play: preserved (\d+) callback', r'🎼 Conductor: \1 callbacks'),
-        (r'PluginInterfaceFacade\.play\(\): (\w+) -> ([^"]+)', r'🔌 Plugin: \1 -> \2'),
-        (r'Enqueued "([^"]+)" with priority', r'📥 Queued: \1'),
-        (r'Now executing "([^"]+)"', r'⚡ Executing: \1'),
-        (r'SequenceExecutor: Executing movement "([^"]+)"', r'🎵 Movement: \1'),
-        (r'MovementExecutor: Starting movement "([^"]+)" with (\d+) beats', r'🥁 Starting: \1 (\2 beats)'),
-        (r'Beat (\d+) Started: ([^(]+)', r'🎯 Beat \1: \2'),
-        (r'emitAsync CALLED for "([^"]+)"', r'📤 Emit: \1'),
-        (r'Subscriber (\d+) for "([^"]+)" returned', r'✅ Sub \1 Done: \2'),
-        (r'Beat (\d+) completed in ([\d.]+)ms', r'✅ Beat \1: \2ms'),
-        (r'Movement completed in ([\d.]+)ms', r'✅ Movement: \1ms'),
-        (r'Sequence "([^"]+)" completed in (\d+)ms', r'🎊 Sequence Complete: \1 (\2ms)'),
-        (r'DataBaton: ([^|]+)', r'🎽 Data: \1'),
-        (r'Topic \'([^\']+)\' definition: \{routes: (\d+)', r'📋 \1: \2 routes'),
-    ]
-    
-    for pattern, replacement in patterns:
-        match = re.search(pattern, line)
-        if match:
-            try:
-                return re.sub(pattern, replacement, line)
-            except:
-                return f"🔍 {match.group(1) if match.lastindex >= 1 else 'Event'}"
+    # Key patterns to look for (first match wins, rewritten with its display template)
+    event = DROP_DELAY_CLASSIFIER.classify(line)
+    if event:
+        try:
+            return event.describe()
+        except:
+            return f"🔍 {event.match.group(1) if event.match.lastindex >= 1 else 'Event'}"
     
     # Fallback for lines with key terms
     key_terms = ['PerformanceTracker', 'ExecutionQueue', 'EventBus', 'BeatExecutor']
@@ -144,15 +126,11 @@ def create_ascii_timeline(events: List[Tuple[datetime, str]]) -> str:
     result.append("🔍 PERFORMANCE ANALYSIS:")
     result.append("-" * 50)
     
-    # Identify major gaps
+    # Identify major gaps: idle stretches between events, with the last event before and first after
+    index = TimelineIndex((rel_time, 0, description) for rel_time, description in timeline_events)
     gaps = []
-    for i in range(1, len(timeline_events)):
-        prev_time, prev_desc = timeline_events[i-1]
-        curr_time, curr_desc = timeline_events[i]
-        gap = curr_time - prev_time
-        
-        if gap > 0.5:  # Gaps larger than 500ms
-            gaps.append((gap, prev_desc, curr_desc))
+    for gap_start, gap_end in index.gaps(0.5):  # Gaps larger than 500ms
+        gaps.append((gap_end - gap_start, index.at(gap_start)[-1], index.at(gap_end)[0]))
     
     if gaps:
         result.append("⚠️  SIGNIFICANT DELAYS (>500ms):")
@@ -4,9 +4,10 @@ Gap #2 Analysis - Library Drop to Canvas Creation Delay
 Analyzing the 2.348-second delay between library drop completion and canvas creation start
 """
 
-import re
 from datetime import datetime
 
+from timeline_index import index_log_lines, iso_to_ms
+
 def parse_timestamp(timestamp_str):
     """Parse timestamp from log entry"""
     try:
@@ -45,29 +46,22 @@ def analyze_gap_2():
             
         gap_start_time = parse_timestamp(gap_2_start)
         gap_end_time = parse_timestamp(gap_2_end)
+        gap_start_ms = iso_to_ms(gap_2_start)
+        gap_end_ms = iso_to_ms(gap_2_end)
+        index = index_log_lines(lines)
         
         print("🔍 Scanning log entries during Gap #2...")
         print()
         
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Extract timestamp from log entry
-            timestamp_match = re.search(r'2025-11-15T16:38:(\d+\.\d+)Z', line)
-            if timestamp_match:
-                timestamp_str = f"2025-11-15T16:38:{timestamp_match.group(1)}Z"
-                timestamp = parse_timestamp(timestamp_str)
-                
-                if timestamp and gap_start_time <= timestamp <= gap_end_time:
-                    events_in_gap.append({
-                        'timestamp': timestamp,
-                        'timestamp_str': timestamp_str,
-                        'line_num': i + 1,
-                        'content': line,
-                        'seconds_from_start': (timestamp - gap_start_time).total_seconds()
-                    })
+        for entry in index.within(gap_start_ms, gap_end_ms):
+            timestamp = parse_timestamp(entry['timestamp_str'])
+            events_in_gap.append({
+                'timestamp': timestamp,
+                'timestamp_str': entry['timestamp_str'],
+                'line_num': entry['line_num'],
+                'content': entry['content'],
+                'seconds_from_start': (timestamp - gap_start_time).total_seconds()
+            })
         
         if not events_in_gap:
             print("❌ NO LOG ENTRIES FOUND DURING GAP #2!")
@@ -85,6 +79,13 @@ def analyze_gap_2():
             for event in events_in_gap:
                 print(f"   ⏱️ +{event['seconds_from_start']:.3f}s: {event['content'][:100]}...")
             print()
+            
+            # Longest stretch of the window without any log entry
+            silence = index.largest_gap(gap_start_ms, gap_end_ms)
+            if silence:
+                print(f"🔇 Longest silence: {(silence[1] - silence[0]) / 1000:.3f}s "
+                      f"(+{(silence[0] - gap_start_ms) / 1000:.3f}s → +{(silence[1] - gap_start_ms) / 1000:.3f}s)")
+                print()
         
         # Analyze what should be happening during this gap
         print("╔" + "═" * 90 + "╗")
@@ -111,14 +112,13 @@ def analyze_gap_2():
         # Find events just before gap
         print("📋 Events immediately BEFORE Gap #2:")
         before_events = []
-        for i, line in enumerate(lines):
-            if gap_2_start in line:
-                # Look at previous 5 lines
-                start_idx = max(0, i - 5)
-                for j in range(start_idx, i + 1):
-                    if j < len(lines):
-                        before_events.append(lines[j].strip())
-                break
+        at_start = index.at(gap_start_ms)
+        if at_start:
+            i = at_start[0]['line_num'] - 1
+            # Look at previous 5 lines
+            start_idx = max(0, i - 5)
+            for j in range(start_idx, i + 1):
+                before_events.append(lines[j].strip())
         
         for event in before_events[-3:]:  # Show last 3
             if event:
@@ -128,14 +128,13 @@ def analyze_gap_2():
         # Find events just after gap
         print("📋 Events immediately AFTER Gap #2:")
         after_events = []
-        for i, line in enumerate(lines):
-            if gap_2_end in line:
-                # Look at next 5 lines
-                end_idx = min(len(lines), i + 5)
-                for j in range(i, end_idx):
-                    if j < len(lines):
-                        after_events.append(lines[j].strip())
-                break
+        at_end = index.at(gap_end_ms)
+        if at_end:
+            i = at_end[0]['line_num'] - 1
+            # Look at next 5 lines
+            end_idx = min(len(lines), i + 5)
+            for j in range(i, end_idx):
+                after_events.append(lines[j].strip())
         
         for event in after_events[:3]:  # Show first 3
             if event:
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Timeline Index
+Interval index over telemetry timelines for the gap and delay analyzers: overlap,
+containment and largest-idle-gap queries by binary search instead of log rescans
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+TIMESTAMP_PATTERN = re.compile(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z)')
+
+
+def iso_to_ms(timestamp_str: str) -> int:
+    """Epoch milliseconds of an ISO timestamp with Z suffix"""
+    return round(datetime.fromisoformat(timestamp_str.replace('Z', '+00:00')).timestamp() * 1000)
+
+
+class TimelineIndex:
+    """Intervals [start, start + duration] with a payload each; log lines are points (duration 0).
+
+    Intervals are kept sorted by start (input order among equal starts) with a running
+    maximum of their ends, so overlap and containment queries are binary searches that
+    only visit candidate intervals. The union of the intervals is kept as busy blocks;
+    the idle gaps between them sit in a segment tree for largest-gap queries.
+    """
+
+    def __init__(self, intervals: Iterable[Tuple[float, float, Any]]):
+        rows = sorted(intervals, key=lambda row: row[0])
+        self.starts = [start for start, _, _ in rows]
+        self.ends = [start + duration for start, duration, _ in rows]
+        self.payloads = [payload for _, _, payload in rows]
+
+        self._max_end = []
+        running = float('-inf')
+        for end in self.ends:
+            running = max(running, end)
+            self._max_end.append(running)
+
+        # Union of all intervals; touching intervals share a block
+        self.block_starts: List[float] = []
+        self.block_ends: List[float] = []
+        for start, end in zip(self.starts, self.ends):
+            if self.block_ends and start <= self.block_ends[-1]:
+                self.block_ends[-1] = max(self.block_ends[-1], end)
+            else:
+                self.block_starts.append(start)
+                self.block_ends.append(end)
+
+        # Gap i lies between block i and block i + 1
+        self._gap_lengths = [self.block_starts[i + 1] - self.block_ends[i] for i in range(len(self.block_starts) - 1)]
+        size = len(self._gap_lengths)
+        self._tree = [-1] * (2 * size)
+        self._tree[size:] = range(size)
+        for node in range(size - 1, 0, -1):
+            self._tree[node] = self._longer(self._tree[2 * node], self._tree[2 * node + 1])
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def _longer(self, a: int, b: int) -> int:
+        """The longer of two gaps (the earlier one on a tie); -1 means none"""
+        if a < 0 or b < 0:
+            return a if b < 0 else b
+        la, lb = self._gap_lengths[a], self._gap_lengths[b]
+        return a if la > lb or (la == lb and a < b) else b
+
+    def _longest_gap_between(self, first: int, last: int) -> int:
+        """Index of the longest gap among gaps first..last-1 (-1 if the range is empty)"""
+        size = len(self._gap_lengths)
+        best = -1
+        lo, hi = first + size, last + size
+        while lo < hi:
+            if lo & 1:
+                best = self._longer(best, self._tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                best = self._longer(best, self._tree[hi])
+            lo >>= 1
+            hi >>= 1
+        return best
+
+    def overlapping(self, lo: float, hi: float) -> List[Any]:
+        """Payloads of intervals sharing any instant with [lo, hi], in start order"""
+        first = bisect_left(self._max_end, lo)  # every earlier interval ends before lo
+        last = bisect_right(self.starts, hi)
+        return [self.payloads[i] for i in range(first, last) if self.ends[i] >= lo]
+
+    def within(self, lo: float, hi: float) -> List[Any]:
+        """Payloads of intervals lying entirely inside [lo, hi], in start order"""
+        first = bisect_left(self.starts, lo)
+        last = bisect_right(self.starts, hi)
+        return [self.payloads[i] for i in range(first, last) if self.ends[i] <= hi]
+
+    def at(self, instant: float) -> List[Any]:
+        """Payloads of intervals containing an instant (for points: those stamped at it)"""
+        return self.overlapping(instant, instant)
+
+    def gaps(self, min_length: float = 0) -> List[Tuple[float, float]]:
+        """Every idle stretch (start, end) between busy blocks longer than min_length"""
+        return [(self.block_ends[i], self.block_starts[i + 1])
+                for i, length in enumerate(self._gap_lengths) if length > min_length]
+
+    def largest_gap(self, lo: float, hi: float) -> Optional[Tuple[float, float]]:
+        """The longest stretch (start, end) of [lo, hi] that no interval covers, or None if it is all busy"""
+        first = bisect_left(self.block_ends, lo)       # first block reaching the window
+        last = bisect_right(self.block_starts, hi) - 1  # last block starting inside it
+        if first > last:
+            return (lo, hi) if hi > lo else None
+        candidates = []
+        if self.block_starts[first] > lo:
+            candidates.append((lo, self.block_starts[first]))
+        gap = self._longest_gap_between(first, last)
+        if gap >= 0:
+            candidates.append((self.block_ends[gap], self.block_starts[gap + 1]))
+        if self.block_ends[last] < hi:
+            candidates.append((self.block_ends[last], hi))
+        if not candidates:
+            return None
+        return max(candidates, key=lambda c: c[1] - c[0])  # max() keeps the earliest on a tie
+
+
+def index_log_lines(lines: Iterable[str]) -> TimelineIndex:
+    """Index each non-empty log line carrying an ISO timestamp as a point at its epoch ms.
+
+    Payloads are dicts with line_num (1-based), timestamp_str, time_ms and content (the stripped line).
+    """
+    events: List[Tuple[float, float, Dict[str, Any]]] = []
+    for i, line in enumerate(lines):
+        line = line.strip()
+        if not line:
+            continue
+        match = TIMESTAMP_PATTERN.search(line)
+        if match:
+            timestamp_str = match.group(1)
+            time_ms = iso_to_ms(timestamp_str)
+            events.append((time_ms, 0, {
+                'line_num': i + 1,
+                'timestamp_str': timestamp_str,
+                'time_ms': time_ms,
+                'content': line,
+            }))
+    return TimelineIndex(events)
@@ -1,27 +1,36 @@
-import re
+import sys
 import json
 import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from log_classifier import PERFORMANCE_CLASSIFIER, TIMESTAMP_PATTERN
+from parallel_log_reader import map_lines
 
 def load_logging_data(json_file_path):
     with open(json_file_path, 'r', encoding='utf-8') as f:
         data = json.load(f)
     return data
 
-def parse_performance_data(lines, sequence_filter=None):
+def classify_performance_line(line):
+    """(kind, fields, timestamp) of a performance line, or None; picklable for parallel_log_reader"""
+    event = PERFORMANCE_CLASSIFIER.classify(line)
+    if not event:
+        return None
+    # Extract timestamp if present
+    timestamp_match = TIMESTAMP_PATTERN.match(line)
+    return event.kind, event.fields, timestamp_match.group(1) if timestamp_match else None
+
+def fold_performance_records(records, sequence_filter=None):
+    """Sequence / movement / beat timings from classified lines, in log order"""
     sequences = {}
     current_sequence = None
     current_movement = None
-    timestamps = {}  # Store timestamps for events
-
-    for line in lines:
-        # Extract timestamp if present
-        timestamp_match = re.match(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z)', line)
-        timestamp = timestamp_match.group(1) if timestamp_match else None
 
+    for kind, fields, timestamp in records:
         # Now executing sequence
-        match = re.search(r'ExecutionQueue: Now executing "(.+)"', line)
-        if match:
-            sequence_name = match.group(1)
+        if kind == 'sequence_executing':
+            sequence_name = fields['sequence']
             if sequence_filter and sequence_filter not in sequence_name:
                 continue
             current_sequence = sequence_name
@@ -30,10 +39,9 @@ def parse_performance_data(lines, sequence_filter=None):
             continue
 
         # Started timing movement
-        match = re.search(r'PerformanceTracker: Started timing movement (.+) for (.+)', line)
-        if match:
-            movement_name = match.group(1)
-            sequence_name = match.group(2)
+        if kind == 'movement_started':
+            movement_name = fields['movement']
+            sequence_name = fields['sequence']
             if sequence_filter and sequence_filter not in sequence_name:
                 continue
             if sequence_name in sequences:
@@ -43,29 +51,26 @@ def parse_performance_data(lines, sequence_filter=None):
             continue
 
         # Beat completed
-        match = re.search(r'PerformanceTracker: Beat (\d+) completed in (\d+(?:\.\d+)?)ms', line)
-        if match:
-            beat_num = int(match.group(1))
-            time_val = float(match.group(2))
+        if kind == 'beat_completed':
+            beat_num = int(fields['beat'])
+            time_val = float(fields['ms'])
             if current_sequence and current_movement and current_sequence in sequences and current_movement in sequences[current_sequence]['movements']:
                 sequences[current_sequence]['movements'][current_movement]['beats'][beat_num] = {'time': time_val, 'timestamp': timestamp}
             continue
 
         # Movement completed
-        match = re.search(r'PerformanceTracker: Movement (.+) completed in (\d+(?:\.\d+)?)ms', line)
-        if match:
-            movement_name = match.group(1)
-            time_val = float(match.group(2))
+        if kind == 'movement_completed':
+            movement_name = fields['movement']
+            time_val = float(fields['ms'])
             if current_sequence and movement_name in sequences[current_sequence]['movements']:
                 sequences[current_sequence]['movements'][movement_name]['total_time'] = time_val
                 sequences[current_sequence]['movements'][movement_name]['end_timestamp'] = timestamp
             continue
 
         # Sequence completed
-        match = re.search(r'SequenceExecutor: Sequence "(.+)" completed in (\d+)ms', line)
-        if match:
-            sequence_name = match.group(1)
-            time_val = float(match.group(2))
+        if kind == 'sequence_completed':
+            sequence_name = fields['sequence']
+            time_val = float(fields['ms'])
             if sequence_name in sequences:
                 sequences[sequence_name]['total_time'] = time_val
                 sequences[sequence_name]['end_timestamp'] = timestamp
@@ -73,6 +78,9 @@ def parse_performance_data(lines, sequence_filter=None):
 
     return sequences
 
+def parse_performance_data(lines, sequence_filter=None):
+    return fold_performance_records(filter(None, map(classify_performance_line, lines)), sequence_filter)
+
 def print_performance_data(sequences):
     print("Performance Data:")
     for seq_name, seq_data in sequences.items():
@@ -139,16 +147,16 @@ def print_summary_metrics(metrics):
     print(f"  Total Time (Beats): {metrics['total_time_all_beats']} ms")
     print(f"  Average Beat Time: {metrics['avg_beat_time']:.2f} ms")
 
-def analyze_log(log_file_path, json_file_path=None, sequence_filter=None):
-    with open(log_file_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+def analyze_log(log_file_path, json_file_path=None, sequence_filter=None, workers=None):
+    # Lines are classified in parallel chunks; only the sequence/movement state is folded serially
+    records = map_lines(log_file_path, classify_performance_line, workers)
 
     if json_file_path:
         logging_data = load_logging_data(json_file_path)
         print(f"Loaded logging data with {len(logging_data['log_entries'])} entries from {logging_data['metadata']['scanned_directory']}")
         # Could use for categorization
 
-    sequences = parse_performance_data(lines, sequence_filter)
+    sequences = fold_performance_records(records, sequence_filter)
     print_performance_data(sequences)
 
     if sequences:
@@ -162,6 +170,7 @@ if __name__ == "__main__":
     parser.add_argument('--log', default=r"C:\source\repos\bpm\internal\renderx-plugins-demo\src\RenderX.Shell.Avalonia\bin\Debug\net8.0\win-x64\.logs\library-drag-drop-web-variant-localhost-1762780374776.log", help="Path to log file")
     parser.add_argument('--json', default=r"C:\source\repos\bpm\internal\renderx-plugins-demo\migration_tools\output\musical_conductor_logging_data.json", help="Path to logging data JSON")
     parser.add_argument('--sequence', help="Filter by sequence name (partial match)")
+    parser.add_argument('--workers', type=int, help="Processes classifying log chunks (default: all cores)")
 
     args = parser.parse_args()
-    analyze_log(args.log, args.json, args.sequence)
\ No newline at end of file
+    analyze_log(args.log, args.json, args.sequence, args.workers)
\ No newline at end of file
@@ -1,6 +1,10 @@
-import re
+import sys
 import json
 import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from log_classifier import PERFORMANCE_CLASSIFIER
 
 def load_logging_data(json_file_path):
     with open(json_file_path, 'r', encoding='utf-8') as f:
@@ -13,10 +17,13 @@ def parse_performance_data(lines, sequence_filter=None):
     current_movement = None
 
     for line in lines:
+        event = PERFORMANCE_CLASSIFIER.classify(line)
+        if not event:
+            continue
+
         # Now executing sequence
-        match = re.search(r'ExecutionQueue: Now executing "(.+)"', line)
-        if match:
-            sequence_name = match.group(1)
+        if event.kind == 'sequence_executing':
+            sequence_name = event.fields['sequence']
             if sequence_filter and sequence_filter not in sequence_name:
                 continue
             current_sequence = sequence_name
@@ -25,10 +32,9 @@ def parse_performance_data(lines, sequence_filter=None):
             continue
 
         # Started timing movement
-        match = re.search(r'PerformanceTracker: Started timing movement (.+) for (.+)', line)
-        if match:
-            movement_name = match.group(1)
-            sequence_name = match.group(2)
+        if event.kind == 'movement_started':
+            movement_name = event.fields['movement']
+            sequence_name = event.fields['sequence']
             if sequence_filter and sequence_filter not in sequence_name:
                 continue
             if sequence_name in sequences:
@@ -38,28 +44,25 @@ def parse_performance_data(lines, sequence_filter=None):
             continue
 
         # Beat completed
-        match = re.search(r'PerformanceTracker: Beat (\d+) completed in (\d+(?:\.\d+)?)ms', line)
-        if match:
-            beat_num = int(match.group(1))
-            time_val = float(match.group(2))
+        if event.kind == 'beat_completed':
+            beat_num = int(event.fields['beat'])
+            time_val = float(event.fields['ms'])
             if current_sequence and current_movement and current_sequence in sequences and current_movement in sequences[current_sequence]['movements']:
                 sequences[current_sequence]['movements'][current_movement]['beats'][beat_num] = {'time': time_val}
             continue
 
         # Movement completed
-        match = re.search(r'PerformanceTracker: Movement (.+) completed in (\d+(?:\.\d+)?)ms', line)
-        if match:
-            movement_name = match.group(1)
-            time_val = float(match.group(2))
+        if event.kind == 'movement_completed':
+            movement_name = event.fields['movement']
+            time_val = float(event.fields['ms'])
             if current_sequence and movement_name in sequences[current_sequence]['movements']:
                 sequences[current_sequence]['movements'][movement_name]['total_time'] = time_val
             continue
 
         # Sequence completed
-        match = re.search(r'SequenceExecutor: Sequence "(.+)" completed in (\d+)ms', line)
-        if match:
-            sequence_name = match.group(1)
-            time_val = float(match.group(2))
+        if event.kind == 'sequence_completed':
+            sequence_name = event.fields['sequence']
+            time_val = float(event.fields['ms'])
             if sequence_name in sequences:
                 sequences[sequence_name]['total_time'] = time_val
             continue
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Log Classifier Benchmark
+
+Writes a synthetic conductor log (10M lines by default) and measures, in lines per
+second, the shared log_classifier against the per-line regex chains it replaced in
+build_frames_from_log, analysis/log_analysis and analyze_drop_delay. The results of
+both are compared line by line over the first --verify lines.
+
+Usage:
+    python scripts/benchmark_log_classifier.py [--lines N] [--verify N] [--seed N] [--log FILE]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from log_classifier import FRAME_CLASSIFIER, PERFORMANCE_CLASSIFIER, DROP_DELAY_CLASSIFIER, FRAME_RULES
+
+TS_RE = re.compile(r"^\s*(?:[^ ]+?:\d+\s+)?(?P<ts>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z)\s+(?P<msg>.*)$")
+
+# ----- The regex chains the classifier replaced -----
+LEGACY_FRAME_PATTERNS = [(r.kind, r.pattern) for r in FRAME_RULES]  # build_frames matched these in order
+
+LEGACY_PERFORMANCE_PATTERNS = [
+    ('sequence_executing', r'ExecutionQueue: Now executing "(.+)"'),
+    ('movement_started', r'PerformanceTracker: Started timing movement (.+) for (.+)'),
+    ('beat_completed', r'PerformanceTracker: Beat (\d+) completed in (\d+(?:\.\d+)?)ms'),
+    ('movement_completed', r'PerformanceTracker: Movement (.+) completed in (\d+(?:\.\d+)?)ms'),
+    ('sequence_completed', r'SequenceExecutor: Sequence "(.+)" completed in (\d+)ms'),
+]
+
+LEGACY_DROP_DELAY_PATTERNS = [
+    (r'\[EventRouter\] Topic \'([^\']+)\' definition', r'📡 Topic: \1'),
+    (r'Starting delivery for \'([^\']+)\'', r'🚀 Starting: \1'),
+    (r'MusicalConductor\.play: preserved (\d+) callback', r'🎼 Conductor: \1 callbacks'),
+    (r'PluginInterfaceFacade\.play\(\): (\w+) -> ([^"]+)', r'🔌 Plugin: \1 -> \2'),
+    (r'Enqueued "([^"]+)" with priority', r'📥 Queued: \1'),
+    (r'Now executing "([^"]+)"', r'⚡ Executing: \1'),
+    (r'SequenceExecutor: Executing movement "([^"]+)"', r'🎵 Movement: \1'),
+    (r'MovementExecutor: Starting movement "([^"]+)" with (\d+) beats', r'🥁 Starting: \1 (\2 beats)'),
+    (r'Beat (\d+) Started: ([^(]+)', r'🎯 Beat \1: \2'),
+    (r'emitAsync CALLED for "([^"]+)"', r'📤 Emit: \1'),
+    (r'Subscriber (\d+) for "([^"]+)" returned', r'✅ Sub \1 Done: \2'),
+    (r'Beat (\d+) completed in ([\d.]+)ms', r'✅ Beat \1: \2ms'),
+    (r'Movement completed in ([\d.]+)ms', r'✅ Movement: \1ms'),
+    (r'Sequence "([^"]+)" completed in (\d+)ms', r'🎊 Sequence Complete: \1 (\2ms)'),
+    (r'DataBaton: ([^|]+)', r'🎽 Data: \1'),
+    (r'Topic \'([^\']+)\' definition: \{routes: (\d+)', r'📋 \1: \2 routes'),
+]
+
+
+def legacy_frame(msg):
+    for etype, rx in LEGACY_FRAME_PATTERNS:
+        mm = rx.match(msg)
+        if mm:
+            return etype, {k: v for k, v in mm.groupdict().items() if v is not None}
+    return None
+
+
+def legacy_performance(line):
+    for kind, pattern in LEGACY_PERFORMANCE_PATTERNS:
+        match = re.search(pattern, line)
+        if match:
+            return kind, match.groups()
+    return None
+
+
+def legacy_drop_delay(line):
+    for pattern, replacement in LEGACY_DROP_DELAY_PATTERNS:
+        match = re.search(pattern, line)
+        if match:
+            return re.sub(pattern, replacement, line)
+    return None
+
+
+def classified_frame(msg):
+    event = FRAME_CLASSIFIER.classify(msg)
+    return (event.kind, event.fields) if event else None
+
+
+def classified_performance(line):
+    event = PERFORMANCE_CLASSIFIER.classify(line)
+    return (event.kind, event.match.groups()) if event else None
+
+
+def classified_drop_delay(line):
+    event = DROP_DELAY_CLASSIFIER.classify(line)
+    return event.describe() if event else None
+
+
+PROFILES = [
+    ('build_frames (message)', legacy_frame, classified_frame, True),
+    ('log_analysis (line)', legacy_performance, classified_performance, False),
+    ('drop_delay (line)', legacy_drop_delay, classified_drop_delay, False),
+]
+
+# ----- Synthetic log -----
+SEQUENCES = ['Library Drop', 'Canvas Component Create', 'Control Panel Update', 'Theme Toggle', 'Canvas Component Select']
+MESSAGES = [
+    # Conductor lifecycle
+    '✅ SequenceRegistry: Sequence "{seq}" validation passed',
+    '🎼 SequenceRegistry: Registered sequence "{seq}" (id: {seq_id})',
+    '🎼 Sequence registered: {seq}',
+    '🎼 ExecutionQueue: Enqueued "{seq}" with priority NORMAL',
+    '🎼 ExecutionQueue: Dequeued "{seq}"',
+    '🎼 ExecutionQueue: Now executing "{seq}"',
+    '🎼 SequenceOrchestrator: Sequence "{seq}" (id: {seq_id}) queued successfully',
+    '🎼 ExecutionQueue: Marked "{seq}" as completed',
+    '✅ SequenceExecutor: Sequence "{seq}" completed in {ms}ms',
+    '🎼 SequenceExecutor: Executing movement "{movement}"',
+    '🎼 MovementExecutor: Starting movement "{movement}" with {n} beats',
+    # PerformanceTracker
+    '⏱️ PerformanceTracker: Started timing movement {movement} for {seq}',
+    '⏱️ PerformanceTracker: Started timing beat {n} for {seq}',
+    '⏱️ PerformanceTracker: Beat {n} completed in {ms}.{n}ms',
+    '⏱️ PerformanceTracker: Movement {movement} completed in {ms}ms',
+    '⏱️ PerformanceTracker: Cleaned up failed movement {movement} for {seq}',
+    # EventRouter / plugins
+    "[EventRouter] Topic '{topic}' definition: {{routes: {n}, hasPlay: true}}",
+    "EventRouter: Starting delivery for '{topic}'",
+    'MusicalConductor.play: preserved {n} callbacks',
+    'PluginInterfaceFacade.play(): {plugin} -> {topic}',
+    '🎵 Beat {n} Started: {topic} (sync)',
+    'EventBus: emitAsync CALLED for "{topic}"',
+    'EventBus: Subscriber {n} for "{topic}" returned',
+    # DataBaton
+    '🎽 DataBaton: +started | seq={seq} beat={n} event={topic} plugin={plugin} req=r-{seq_id} keys=3',
+    '🎽 DataBaton: No changes | seq={seq} beat={n} event={topic}',
+]
+NOISE = [
+    '🎼 EventBus: Using internal conductor',
+    '[vite] hot updated: /src/ui/Canvas.tsx',
+    'Download the React DevTools for a better development experience',
+    '🧩 PluginLoader: Loaded manifest for {plugin}',
+    'Warning: Each child in a list should have a unique "key" prop.',
+    'Canvas render frame {n} committed in {ms}ms',
+]
+TOPICS = ['library.component.drop.requested', 'canvas.component.create', 'control.panel.update', 'theme.toggled']
+PLUGINS = ['LibraryComponentPlugin', 'CanvasComponentPlugin', 'ControlPanelPlugin', 'HeaderThemePlugin']
+PREFIXES = ['EventBus.ts:56 ', 'ConductorLogger.ts:112 ', 'chunk-5XKQ2.js:1203 ', '']
+
+
+def write_log(path: str, lines: int, seed: int):
+    rng = random.Random(seed)
+    epoch_ms = 1763224700000
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(lines):
+            epoch_ms += rng.choice((0, 0, 1, 2, 5, 40))
+            seconds, ms = divmod(epoch_ms, 1000)
+            ts = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds)) + f'.{ms:03d}Z'
+            # Roughly half the lines of a soak log are not conductor telemetry
+            template = rng.choice(NOISE) if rng.random() < 0.5 else rng.choice(MESSAGES)
+            message = template.format(seq=rng.choice(SEQUENCES), seq_id=f'{i % 997:x}', topic=rng.choice(TOPICS),
+                                      plugin=rng.choice(PLUGINS), movement=rng.choice(['init', 'render', 'commit']),
+                                      n=rng.randint(0, 9), ms=rng.randint(0, 2500))
+            f.write(f'{rng.choice(PREFIXES)}{ts} {message}\n')
+
+
+def texts(path: str, message_only: bool, limit: int = None):
+    with open(path, 'r', encoding='utf-8') as f:
+        for i, line in enumerate(f):
+            if limit is not None and i >= limit:
+                return
+            if message_only:
+                m = TS_RE.match(line.rstrip('\n'))
+                if m:
+                    yield m.group('msg')
+            else:
+                yield line.strip()
+
+
+def throughput(path: str, classify, message_only: bool):
+    start = time.perf_counter()
+    lines = 0
+    classified = 0
+    for text in texts(path, message_only):
+        lines += 1
+        if classify(text) is not None:
+            classified += 1
+    return lines, classified, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the shared log-line classifier")
+    parser.add_argument('--lines', type=int, default=10_000_000, help="Synthetic log lines (default: 10,000,000)")
+    parser.add_argument('--verify', type=int, default=200_000, help="Lines compared against the legacy chains (default: 200,000)")
+    parser.add_argument('--seed', type=int, default=11)
+    parser.add_argument('--log', help="Benchmark an existing log instead of a synthetic one")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.log
+        if not path:
+            path = os.path.join(tmp, 'synthetic-conductor.log')
+            start = time.perf_counter()
+            write_log(path, args.lines, args.seed)
+            print(f"Wrote {args.lines:,} lines ({os.path.getsize(path) / 1e6:.0f} MB) in {time.perf_counter() - start:.1f}s")
+
+        for name, legacy, classified, message_only in PROFILES:
+            identical = all(legacy(text) == classified(text) for text in texts(path, message_only, args.verify))
+            lines, hits, legacy_s = throughput(path, legacy, message_only)
+            _, _, classified_s = throughput(path, classified, message_only)
+            _, _, read_s = throughput(path, lambda text: None, message_only)
+            print(f"{name}: {lines:,} lines, {hits:,} classified")
+            print(f"  reading only:   {lines / read_s:>12,.0f} lines/s  ({read_s:.1f}s)")
+            print(f"  regex chain:    {lines / legacy_s:>12,.0f} lines/s  ({legacy_s:.1f}s)")
+            print(f"  log_classifier: {lines / classified_s:>12,.0f} lines/s  ({classified_s:.1f}s)")
+            print(f"  speedup: {legacy_s / classified_s:.2f}x  identical results (first {args.verify:,} lines): {identical}")
+
+
+if __name__ == '__main__':
+    main()
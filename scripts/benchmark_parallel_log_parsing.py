@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Parallel Log Parsing Benchmark
+
+Writes a synthetic conductor log (see benchmark_log_classifier) and times the three
+analyzers that read it through parallel_log_reader with 1..N worker processes:
+build_frames_from_log.build_frames, analysis/log_analysis (classification + sequential
+fold) and analyze_drop_delay.parse_log_file. Every run is compared with the
+single-process result.
+
+Usage:
+    python scripts/benchmark_parallel_log_parsing.py [--lines N] [--workers 1,2,4] [--chunk-mb N] [--log FILE]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / 'analysis'))
+sys.path.insert(0, str(ROOT.parent / 'packages' / 'telemetry-workbench' / 'scripts'))
+
+import parallel_log_reader
+from benchmark_log_classifier import write_log
+from build_frames_from_log import group_frames, parse_record
+from log_analysis import classify_performance_line, fold_performance_records
+from analyze_drop_delay import parse_log_line
+
+
+def run_frames(path, workers, chunk_bytes):
+    records = parallel_log_reader.map_lines(path, parse_record, workers, chunk_bytes, errors='ignore')
+    return list(group_frames(records, reorder_window_ms=None))
+
+
+def run_performance(path, workers, chunk_bytes):
+    return fold_performance_records(parallel_log_reader.map_lines(path, classify_performance_line, workers, chunk_bytes))
+
+
+def run_drop_delay(path, workers, chunk_bytes):
+    return list(parallel_log_reader.map_lines(path, parse_log_line, workers, chunk_bytes))
+
+
+PROFILES = [
+    ('build_frames', run_frames),
+    ('log_analysis', run_performance),
+    ('drop_delay', run_drop_delay),
+]
+
+
+def main():
+    cores = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="Benchmark parallel chunked log parsing")
+    parser.add_argument('--lines', type=int, default=5_000_000, help="Synthetic log lines (default: 5,000,000)")
+    parser.add_argument('--workers', default=','.join(str(w) for w in sorted({1, 2, cores // 2 or 1, cores})),
+                        help=f"Comma-separated worker counts (default: 1,2,...,{cores})")
+    parser.add_argument('--chunk-mb', type=float, default=parallel_log_reader.DEFAULT_CHUNK_BYTES / 2**20,
+                        help="Chunk size in MB (default: %(default)s)")
+    parser.add_argument('--seed', type=int, default=11)
+    parser.add_argument('--log', help="Benchmark an existing log instead of a synthetic one")
+    args = parser.parse_args()
+    worker_counts = [int(w) for w in args.workers.split(',')]
+    chunk_bytes = int(args.chunk_mb * 2**20)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.log
+        if not path:
+            path = os.path.join(tmp, 'synthetic-conductor.log')
+            start = time.perf_counter()
+            write_log(path, args.lines, args.seed)
+            print(f"Wrote {args.lines:,} lines in {time.perf_counter() - start:.1f}s")
+        start = time.perf_counter()
+        chunks = len(parallel_log_reader.chunk_ranges(path, chunk_bytes))
+        print(f"{os.path.getsize(path) / 1e6:.0f} MB, {chunks} chunks of {args.chunk_mb:g} MB "
+              f"(split in {time.perf_counter() - start:.3f}s), {cores} cores")
+
+        for name, run in PROFILES:
+            print(f"{name}:")
+            baseline = baseline_s = None
+            for workers in worker_counts:
+                start = time.perf_counter()
+                result = run(path, workers, chunk_bytes)
+                elapsed = time.perf_counter() - start
+                if baseline is None:
+                    baseline, baseline_s = result, elapsed
+                print(f"  {workers:>3} workers: {elapsed:7.2f}s  speedup {baseline_s / elapsed:5.2f}x  "
+                      f"identical: {result == baseline}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,28 +1,19 @@
 import re
 import json
 import sys
+import gzip
+import heapq
+import calendar
 import argparse
-from datetime import datetime, timezone
+import time
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
-
-# Simple classifier regexes (extend over time)
-PATTERNS = [
-    ("sequence_registry_pass", re.compile(r"^✅\s+SequenceRegistry: Sequence \"(?P<sequence>.+?)\" validation passed")),
-    ("sequence_registry_registered", re.compile(r"^🎼\s+SequenceRegistry: Registered sequence \"(?P<sequence>.+?)\" \(id: (?P<id>[^\)]+)\)")),
-    ("sequence_registered", re.compile(r"^🎼\s+Sequence registered: (?P<sequence>.+)$")),
-    ("execution_enqueued", re.compile(r"^🎼\s+ExecutionQueue: Enqueued \"(?P<sequence>.+?)\".*")),
-    ("execution_dequeued", re.compile(r"^🎼\s+ExecutionQueue: Dequeued \"(?P<sequence>.+?)\"")),
-    ("execution_now", re.compile(r"^🎼\s+ExecutionQueue: Now executing \"(?P<sequence>.+?)\"")),
-    ("sequence_orchestrator_queued", re.compile(r"^🎼\s+SequenceOrchestrator: Sequence \"(?P<sequence>.+?)\" \(id: (?P<id>[^\)]+)\) queued successfully")),
-    ("perf_movement_started", re.compile(r"^⏱️\s+PerformanceTracker: Started timing movement (?P<movement>.+?) for (?P<sequence>.+)$")),
-    ("perf_beat_started", re.compile(r"^⏱️\s+PerformanceTracker: Started timing beat (?P<beat>\d+) for (?P<sequence>.+)$")),
-    ("databaton_started", re.compile(r"^🎽\s+DataBaton: \+started \| seq=(?P<sequence>.+?) .*event=(?P<event>[\w\.\-]+).* plugin=(?P<plugin>\w+).* req=(?P<req>\S+).*")),
-    ("databaton_no_changes", re.compile(r"^🎽\s+DataBaton: No changes \| seq=(?P<sequence>.+?) .*event=(?P<event>[\w\.\-]+).*")),
-    ("perf_movement_cleaned", re.compile(r"^⏱️\s+PerformanceTracker: Cleaned up failed movement (?P<movement>.+?) for (?P<sequence>.+)$")),
-    ("execution_marked_completed", re.compile(r"^🎼\s+ExecutionQueue: Marked \"(?P<sequence>.+?)\" as completed.*$")),
-    ("sequence_executor_completed", re.compile(r"^✅\s+SequenceExecutor: Sequence \"(?P<sequence>.+?)\" completed in (?P<ms>[0-9.]+)ms$")),
-]
+from typing import Dict, Any, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from log_classifier import FRAME_CLASSIFIER
+from parallel_log_reader import map_lines
+
+# Frames are emitted once they are this far behind the newest timestamp seen
+DEFAULT_REORDER_WINDOW_MS = 60_000
 
 # The log lines often have a file prefix before the ISO timestamp, e.g.:
 # EventBus.ts:56 2025-11-10T21:56:16.932Z 🎼 EventBus: Using internal conductor
@@ -37,37 +28,92 @@ def parse_line(line: str) -> Tuple[str, Dict[str, Any]]:
     ts_iso = m.group("ts")
     msg = m.group("msg")
     event = {"raw": msg}
-    # try classify
-    for etype, rx in PATTERNS:
-        mm = rx.match(msg)
-        if mm:
-            event["type"] = etype
-            event.update({k: v for k, v in mm.groupdict().items() if v is not None})
-            break
-    if "type" not in event:
+    classified = FRAME_CLASSIFIER.classify(msg)
+    if classified:
+        event["type"] = classified.kind
+        event.update(classified.fields)
+    else:
         event["type"] = "other"
     return ts_iso, event
 
 
+def parse_record(line: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """parse_line() as one picklable record, None for lines without a timestamp"""
+    ts, evt = parse_line(line)
+    return (ts, evt) if ts else None
+
+
+_EPOCH_MS_BY_SECOND: Dict[str, int] = {}
+
+
 def iso_to_epoch_ms(iso: str) -> int:
-    dt = datetime.strptime(iso, "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=timezone.utc)
-    return int(dt.timestamp() * 1000)
-
-
-def build_frames(log_path: Path) -> Dict[str, Any]:
-    frames_map: Dict[str, Dict[str, Any]] = {}
-    with log_path.open("r", encoding="utf-8", errors="ignore") as f:
-        for line in f:
-            ts, evt = parse_line(line)
-            if not ts:
-                continue
-            fr = frames_map.get(ts)
-            if not fr:
-                fr = {"ts": ts, "epochMs": iso_to_epoch_ms(ts), "events": []}
-                frames_map[ts] = fr
+    # Consecutive lines share their second, so only the millisecond part is parsed per call
+    second = iso[:19]
+    base = _EPOCH_MS_BY_SECOND.get(second)
+    if base is None:
+        if len(_EPOCH_MS_BY_SECOND) >= 4096:
+            _EPOCH_MS_BY_SECOND.clear()
+        base = calendar.timegm(time.strptime(second, "%Y-%m-%dT%H:%M:%S")) * 1000
+        _EPOCH_MS_BY_SECOND[second] = base
+    return base + int(iso[20:23])
+
+
+def open_log(log_path: Path) -> TextIO:
+    """Open a raw log for reading; .gz logs are decompressed on the fly."""
+    if log_path.suffix == ".gz":
+        return gzip.open(log_path, "rt", encoding="utf-8", errors="ignore")
+    return log_path.open("r", encoding="utf-8", errors="ignore")
+
+
+def iter_records(log_path: Path, workers: Optional[int] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """(ts, event) of every timestamped line in log order.
+
+    Plain logs are parsed in parallel chunks (see parallel_log_reader); .gz logs cannot be
+    split at byte offsets and are parsed line by line.
+    """
+    if log_path.suffix == ".gz":
+        with open_log(log_path) as f:
+            yield from filter(None, map(parse_record, f))
+        return
+    yield from map_lines(str(log_path), parse_record, workers, errors="ignore")
+
+
+def iter_frames(lines: Iterable[str], reorder_window_ms: Optional[int] = DEFAULT_REORDER_WINDOW_MS) -> Iterator[Dict[str, Any]]:
+    """Frames of a log in time order, holding only the frames inside the reorder window.
+
+    A line more than reorder_window_ms older than the newest line seen starts a new,
+    late frame instead of joining its timestamp's frame. reorder_window_ms=None keeps
+    every frame until the end (exact grouping and order for any input).
+    """
+    return group_frames(filter(None, map(parse_record, lines)), reorder_window_ms)
+
+
+def group_frames(records: Iterable[Tuple[str, Dict[str, Any]]], reorder_window_ms: Optional[int] = DEFAULT_REORDER_WINDOW_MS) -> Iterator[Dict[str, Any]]:
+    """iter_frames() over already parsed (ts, event) records"""
+    pending: Dict[str, Dict[str, Any]] = {}
+    heap: List[Tuple[int, str]] = []
+    newest = None
+    for ts, evt in records:
+        fr = pending.get(ts)
+        if not fr:
+            epoch_ms = iso_to_epoch_ms(ts)
+            fr = {"ts": ts, "epochMs": epoch_ms, "events": []}
+            pending[ts] = fr
+            heapq.heappush(heap, (epoch_ms, ts))
+            fr["events"].append(evt)
+            if newest is None or epoch_ms > newest:
+                newest = epoch_ms
+            if reorder_window_ms is not None:
+                while heap[0][0] < newest - reorder_window_ms:
+                    yield pending.pop(heapq.heappop(heap)[1])
+        else:
             fr["events"].append(evt)
-    # sort frames
-    frames: List[Dict[str, Any]] = sorted(frames_map.values(), key=lambda x: x["epochMs"]) 
+    while heap:
+        yield pending.pop(heapq.heappop(heap)[1])
+
+
+def build_frames(log_path: Path, workers: Optional[int] = None) -> Dict[str, Any]:
+    frames: List[Dict[str, Any]] = list(group_frames(iter_records(log_path, workers), reorder_window_ms=None))
     summary = {
         "totalFrames": len(frames),
         "totalEvents": sum(len(fr["events"]) for fr in frames),
@@ -77,10 +123,43 @@ def build_frames(log_path: Path) -> Dict[str, Any]:
     return {"summary": summary, "frames": frames}
 
 
+def write_frames_ndjson(log_path: Path, out_path: Path, reorder_window_ms: Optional[int] = DEFAULT_REORDER_WINDOW_MS,
+                        workers: Optional[int] = 1) -> Dict[str, Any]:
+    """Stream a log's frames to out_path, one JSON frame per line; returns the summary.
+
+    lateFrames counts frames older than one already written (see iter_frames).
+    Parsing stays in this process (one line in memory at a time) unless workers is
+    given; each extra worker adds a chunk of parsed records to the memory held.
+    """
+    summary = {"totalFrames": 0, "totalEvents": 0, "firstTs": None, "lastTs": None, "lateFrames": 0}
+    last_epoch_ms = None
+    with out_path.open("w", encoding="utf-8") as out:
+        for fr in group_frames(iter_records(log_path, workers), reorder_window_ms):
+            out.write(json.dumps(fr, ensure_ascii=False, separators=(",", ":")))
+            out.write("\n")
+            summary["totalFrames"] += 1
+            summary["totalEvents"] += len(fr["events"])
+            if last_epoch_ms is not None and fr["epochMs"] < last_epoch_ms:
+                summary["lateFrames"] += 1
+            else:
+                last_epoch_ms = fr["epochMs"]
+                summary["lastTs"] = fr["ts"]
+            if summary["firstTs"] is None:
+                summary["firstTs"] = fr["ts"]
+    return summary
+
+
 def main():
     ap = argparse.ArgumentParser(description="Build timestamp-keyed frames JSON from raw log")
-    ap.add_argument("log", help="Path to raw log file (e.g., .logs/web-variant-localhost-*.log)")
+    ap.add_argument("log", help="Path to raw log file (e.g., .logs/web-variant-localhost-*.log, optionally .gz)")
     ap.add_argument("--out", help="Output JSON path", default=None)
+    ap.add_argument("--ndjson", action="store_true",
+                    help="Stream frames as NDJSON (one frame per line) instead of building one JSON document")
+    ap.add_argument("--reorder-window-ms", type=int, default=DEFAULT_REORDER_WINDOW_MS,
+                    help=f"With --ndjson: how far out of order log lines may be (default: {DEFAULT_REORDER_WINDOW_MS})")
+    ap.add_argument("--workers", type=int, default=None,
+                    help="Processes parsing chunks of a plain (non-.gz) log "
+                         "(default: all cores; 1 with --ndjson, to keep its memory bounded)")
     args = ap.parse_args()
 
     log_path = Path(args.log)
@@ -88,10 +167,17 @@ def main():
         print(f"Log not found: {log_path}", file=sys.stderr)
         sys.exit(1)
 
-    frames = build_frames(log_path)
-
-    out_path = Path(args.out) if args.out else (log_path.parent.parent / "outputs" / f"frames-{log_path.name.replace('.log', '')}.json")
+    name = log_path.name[:-len(".gz")] if log_path.suffix == ".gz" else log_path.name
+    ext = "ndjson" if args.ndjson else "json"
+    out_path = Path(args.out) if args.out else (log_path.parent.parent / "outputs" / f"frames-{name.replace('.log', '')}.{ext}")
     out_path.parent.mkdir(parents=True, exist_ok=True)
+    if args.ndjson:
+        summary = write_frames_ndjson(log_path, out_path, args.reorder_window_ms, args.workers or 1)
+        print(f"Wrote {out_path} ({summary['totalFrames']} frames, {summary['totalEvents']} events"
+              f"{', %d late' % summary['lateFrames'] if summary['lateFrames'] else ''})")
+        return
+
+    frames = build_frames(log_path, args.workers)
     with out_path.open("w", encoding="utf-8") as f:
         json.dump(frames, f, indent=2)
     print(f"Wrote {out_path}")
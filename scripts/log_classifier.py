@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Log Line Classifier
+
+One compiled classifier for conductor log lines, shared by the telemetry analyzers:
+  - scripts/build_frames_from_log.py                          (FRAME_RULES)
+  - scripts/analysis/log_analysis.py, log_analysis_new.py     (PERFORMANCE_RULES)
+  - packages/telemetry-workbench/scripts/analyze_drop_delay.py (DROP_DELAY_RULES)
+
+Every rule names a literal keyword that each of its matches contains. A classifier
+compiles the keywords of its rules into one alternation, so a line that mentions none
+of them (most lines of a soak log) is rejected by a single scan; otherwise only the
+rules whose keyword occurs in the line run their regex, in priority order. Rules
+anchored at the start of a message use its leading "emoji Component:" tokens as the
+keyword instead, and are found with one dict lookup. The first match is returned as a
+typed LogEvent.
+
+Each analyzer keeps its own rule set (its regexes differ in anchoring and captures),
+so classifications are exactly those of the regex chains they replace.
+"""
+
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional, Pattern, Tuple
+
+# ISO timestamp as written by the conductor loggers, e.g. 2025-11-10T21:56:16.932Z
+TIMESTAMP_PATTERN = re.compile(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z)')
+
+
+class Rule(NamedTuple):
+    kind: str
+    keyword: str  # literal every match contains (leading rules: the first two tokens)
+    pattern: Pattern
+    template: Optional[str] = None  # re.sub() replacement for describe()
+
+
+class LogEvent(NamedTuple):
+    kind: str
+    fields: Dict[str, str]  # named groups that participated in the match
+    match: 're.Match[str]'
+    rule: Rule
+
+    def describe(self) -> str:
+        """The classified text with the rule's template substituted for its matches."""
+        return self.rule.pattern.sub(self.rule.template, self.match.string)
+
+
+def rule(kind: str, keyword: str, pattern: str, template: Optional[str] = None) -> Rule:
+    literal = pattern.replace('\\', '')
+    if not all(token in literal for token in keyword.split()):
+        raise ValueError(f"Rule {kind}: keyword {keyword!r} is not a literal of its pattern")
+    return Rule(kind, keyword, re.compile(pattern), template)
+
+
+class LogClassifier:
+    """First matching rule of a line, with a keyword prefilter in front of the regexes.
+
+    leading=True: every rule is anchored at the start of the text and its keyword is the
+    text's first two whitespace-separated tokens (e.g. "🎼 ExecutionQueue:").
+    """
+
+    def __init__(self, rules: Iterable[Rule], leading: bool = False):
+        self.rules: List[Rule] = list(rules)
+        self.leading = leading
+        self._by_prefix: Dict[Tuple[str, ...], List[Rule]] = {}
+        for r in self.rules:
+            self._by_prefix.setdefault(tuple(r.keyword.split()), []).append(r)
+        keywords = sorted({r.keyword for r in self.rules}, key=len, reverse=True)
+        self._prefilter = re.compile('|'.join(re.escape(k) for k in keywords))
+
+    def _candidates(self, text: str) -> Iterable[Rule]:
+        if self.leading:
+            return self._by_prefix.get(tuple(text.split(None, 2)[:2]), ())
+        if not self._prefilter.search(text):
+            return ()
+        return (r for r in self.rules if r.keyword in text)
+
+    def classify(self, text: str) -> Optional[LogEvent]:
+        for r in self._candidates(text):
+            m = r.pattern.search(text)
+            if m:
+                return LogEvent(r.kind, {k: v for k, v in m.groupdict().items() if v is not None}, m, r)
+        return None
+
+
+# ----- build_frames_from_log: messages (after the timestamp) starting with emoji + component -----
+FRAME_RULES = [
+    rule("sequence_registry_pass", "✅ SequenceRegistry:", r"^✅\s+SequenceRegistry: Sequence \"(?P<sequence>.+?)\" validation passed"),
+    rule("sequence_registry_registered", "🎼 SequenceRegistry:", r"^🎼\s+SequenceRegistry: Registered sequence \"(?P<sequence>.+?)\" \(id: (?P<id>[^\)]+)\)"),
+    rule("sequence_registered", "🎼 Sequence", r"^🎼\s+Sequence registered: (?P<sequence>.+)$"),
+    rule("execution_enqueued", "🎼 ExecutionQueue:", r"^🎼\s+ExecutionQueue: Enqueued \"(?P<sequence>.+?)\".*"),
+    rule("execution_dequeued", "🎼 ExecutionQueue:", r"^🎼\s+ExecutionQueue: Dequeued \"(?P<sequence>.+?)\""),
+    rule("execution_now", "🎼 ExecutionQueue:", r"^🎼\s+ExecutionQueue: Now executing \"(?P<sequence>.+?)\""),
+    rule("sequence_orchestrator_queued", "🎼 SequenceOrchestrator:", r"^🎼\s+SequenceOrchestrator: Sequence \"(?P<sequence>.+?)\" \(id: (?P<id>[^\)]+)\) queued successfully"),
+    rule("perf_movement_started", "⏱️ PerformanceTracker:", r"^⏱️\s+PerformanceTracker: Started timing movement (?P<movement>.+?) for (?P<sequence>.+)$"),
+    rule("perf_beat_started", "⏱️ PerformanceTracker:", r"^⏱️\s+PerformanceTracker: Started timing beat (?P<beat>\d+) for (?P<sequence>.+)$"),
+    rule("databaton_started", "🎽 DataBaton:", r"^🎽\s+DataBaton: \+started \| seq=(?P<sequence>.+?) .*event=(?P<event>[\w\.\-]+).* plugin=(?P<plugin>\w+).* req=(?P<req>\S+).*"),
+    rule("databaton_no_changes", "🎽 DataBaton:", r"^🎽\s+DataBaton: No changes \| seq=(?P<sequence>.+?) .*event=(?P<event>[\w\.\-]+).*"),
+    rule("perf_movement_cleaned", "⏱️ PerformanceTracker:", r"^⏱️\s+PerformanceTracker: Cleaned up failed movement (?P<movement>.+?) for (?P<sequence>.+)$"),
+    rule("execution_marked_completed", "🎼 ExecutionQueue:", r"^🎼\s+ExecutionQueue: Marked \"(?P<sequence>.+?)\" as completed.*$"),
+    rule("sequence_executor_completed", "✅ SequenceExecutor:", r"^✅\s+SequenceExecutor: Sequence \"(?P<sequence>.+?)\" completed in (?P<ms>[0-9.]+)ms$"),
+]
+
+# ----- log_analysis: sequence / movement / beat timings anywhere in a raw line -----
+PERFORMANCE_RULES = [
+    rule("sequence_executing", "ExecutionQueue: Now executing \"", r'ExecutionQueue: Now executing "(?P<sequence>.+)"'),
+    rule("movement_started", "PerformanceTracker: Started timing movement ", r'PerformanceTracker: Started timing movement (?P<movement>.+) for (?P<sequence>.+)'),
+    rule("beat_completed", "PerformanceTracker: Beat ", r'PerformanceTracker: Beat (?P<beat>\d+) completed in (?P<ms>\d+(?:\.\d+)?)ms'),
+    rule("movement_completed", "PerformanceTracker: Movement ", r'PerformanceTracker: Movement (?P<movement>.+) completed in (?P<ms>\d+(?:\.\d+)?)ms'),
+    rule("sequence_completed", "SequenceExecutor: Sequence \"", r'SequenceExecutor: Sequence "(?P<sequence>.+)" completed in (?P<ms>\d+)ms'),
+]
+
+# ----- analyze_drop_delay: EventRouter / conductor / DataBaton milestones, with display templates -----
+DROP_DELAY_RULES = [
+    rule("topic_definition", "[EventRouter] Topic '", r'\[EventRouter\] Topic \'([^\']+)\' definition', r'📡 Topic: \1'),
+    rule("delivery_started", "Starting delivery for '", r'Starting delivery for \'([^\']+)\'', r'🚀 Starting: \1'),
+    rule("conductor_play", "MusicalConductor.play: preserved ", r'MusicalConductor\.play: preserved (\d+) callback', r'🎼 Conductor: \1 callbacks'),
+    rule("plugin_play", "PluginInterfaceFacade.play(): ", r'PluginInterfaceFacade\.play\(\): (\w+) -> ([^"]+)', r'🔌 Plugin: \1 -> \2'),
+    rule("enqueued", "Enqueued \"", r'Enqueued "([^"]+)" with priority', r'📥 Queued: \1'),
+    rule("executing", "Now executing \"", r'Now executing "([^"]+)"', r'⚡ Executing: \1'),
+    rule("movement_executing", "SequenceExecutor: Executing movement \"", r'SequenceExecutor: Executing movement "([^"]+)"', r'🎵 Movement: \1'),
+    rule("movement_starting", "MovementExecutor: Starting movement \"", r'MovementExecutor: Starting movement "([^"]+)" with (\d+) beats', r'🥁 Starting: \1 (\2 beats)'),
+    rule("beat_started", " Started: ", r'Beat (\d+) Started: ([^(]+)', r'🎯 Beat \1: \2'),
+    rule("emit_async", "emitAsync CALLED for \"", r'emitAsync CALLED for "([^"]+)"', r'📤 Emit: \1'),
+    rule("subscriber_returned", "\" returned", r'Subscriber (\d+) for "([^"]+)" returned', r'✅ Sub \1 Done: \2'),
+    rule("beat_completed", " completed in ", r'Beat (\d+) completed in ([\d.]+)ms', r'✅ Beat \1: \2ms'),
+    rule("movement_completed", "Movement completed in ", r'Movement completed in ([\d.]+)ms', r'✅ Movement: \1ms'),
+    rule("sequence_completed", "\" completed in ", r'Sequence "([^"]+)" completed in (\d+)ms', r'🎊 Sequence Complete: \1 (\2ms)'),
+    rule("databaton", "DataBaton: ", r'DataBaton: ([^|]+)', r'🎽 Data: \1'),
+    rule("topic_routes", "' definition: {routes: ", r'Topic \'([^\']+)\' definition: \{routes: (\d+)', r'📋 \1: \2 routes'),
+]
+
+FRAME_CLASSIFIER = LogClassifier(FRAME_RULES, leading=True)
+PERFORMANCE_CLASSIFIER = LogClassifier(PERFORMANCE_RULES)
+DROP_DELAY_CLASSIFIER = LogClassifier(DROP_DELAY_RULES)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Parallel Log Reader
+
+Chunked, multi-process line mapping for multi-GB conductor logs, shared by the
+telemetry analyzers (build_frames_from_log, analysis/log_analysis, analyze_drop_delay).
+
+The file is split into chunks at newline boundaries. Each worker process maps the file
+itself, so only byte offsets cross the process boundary, decodes its slice of the map
+in small blocks and applies a per-line function (usually log_classifier
+classification) that returns a compact record or None. Records come back in file order:
+the stateful part of an analyzer (current sequence / movement, frame grouping) stays a
+cheap sequential fold over the pre-classified records.
+
+Lines are split the way a text-mode file iterates them (universal newlines), so a
+record function sees the same lines as `for line in open(path)`. Splitting at b'\n'
+assumes an ASCII-compatible encoding such as UTF-8.
+
+Memory: only the chunks in flight (at most workers + 1, and at most max_pending_bytes of
+log) are held as record lists; the single-process path holds one decoded block at a time.
+"""
+
+import io
+import mmap
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+DEFAULT_CHUNK_BYTES = 4 * 1024 * 1024
+# Log bytes whose records may be queued in the parent at once (records are several times larger)
+DEFAULT_MAX_PENDING_BYTES = 64 * 1024 * 1024
+_DECODE_BLOCK_BYTES = 64 * 1024
+
+
+def chunk_ranges(path: str, chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> List[Tuple[int, int]]:
+    """(start, end) byte ranges of about chunk_bytes each, every one ending just after a newline (or at EOF)"""
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    ranges = []
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while start < size:
+            end = min(start + chunk_bytes, size)
+            if end < size:
+                newline = mm.find(b'\n', end - 1)
+                end = size if newline < 0 else newline + 1
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _iter_chunk(path: str, start: int, end: int, fn: Callable[[str], Any], encoding: str, errors: str) -> Iterator[Any]:
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        pos = start
+        while pos < end:
+            # Decode a small newline-aligned block at a time, never the whole chunk
+            stop = min(pos + _DECODE_BLOCK_BYTES, end)
+            if stop < end:
+                newline = mm.find(b'\n', stop - 1, end)
+                stop = end if newline < 0 else newline + 1
+            text = str(mm[pos:stop], encoding, errors)
+            pos = stop
+            # Universal newlines, as in text mode; blocks never split a '\r\n'
+            for line in io.StringIO(text, newline=None):
+                record = fn(line)
+                if record is not None:
+                    yield record
+
+
+def _map_chunk(path: str, start: int, end: int, fn: Callable[[str], Any], encoding: str, errors: str) -> List[Any]:
+    return list(_iter_chunk(path, start, end, fn, encoding, errors))
+
+
+def resolve_workers(workers: Optional[int]) -> int:
+    """workers, or every core for None/0"""
+    return workers if workers else (os.cpu_count() or 1)
+
+
+def map_lines(path: str, fn: Callable[[str], Any], workers: Optional[int] = None,
+              chunk_bytes: int = DEFAULT_CHUNK_BYTES, encoding: str = 'utf-8', errors: str = 'strict',
+              max_pending_bytes: int = DEFAULT_MAX_PENDING_BYTES) -> Iterator[Any]:
+    """fn(line) for every line of a file, in file order, skipping None results.
+
+    fn must be a module-level function (it is sent to the worker processes by name);
+    workers=None uses every core. At most workers + 1 chunks, and no more than
+    max_pending_bytes of log (but always one chunk), are submitted and not yet consumed,
+    so memory stays bounded however large the log is.
+    """
+    workers = resolve_workers(workers)
+    ranges = chunk_ranges(path, chunk_bytes)
+    if workers <= 1 or len(ranges) <= 1:
+        for start, end in ranges:
+            yield from _iter_chunk(path, start, end, fn, encoding, errors)
+        return
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+        pending = deque()  # (future, chunk size)
+        pending_bytes = 0
+        for start, end in ranges:
+            while pending and (len(pending) > workers or pending_bytes + end - start > max_pending_bytes):
+                future, size = pending.popleft()
+                pending_bytes -= size
+                yield from future.result()
+            pending.append((pool.submit(_map_chunk, path, start, end, fn, encoding, errors), end - start))
+            pending_bytes += end - start
+        while pending:
+            yield from pending.popleft()[0].result()
@@ -14,16 +14,25 @@ Outputs:
   - Preset results: critical-path, plugin-health, user-interactions, render-operations, initialization, dead-time
 
 Matches the definitions in src/ui/telemetry/OperationFilter.tsx
+
+The events are loaded once into a columnar EventTable; every strategy and preset is a
+selection of row indices over its columns (vectorized with NumPy when it is installed).
 """
 
 import json
 import re
 import sys
+from bisect import bisect_left, bisect_right
 from pathlib import Path
 from datetime import datetime, UTC
 import datetime as dt
 from collections import Counter, defaultdict
 
+try:
+    import numpy as np
+except ImportError:  # optional: pure-Python columns
+    np = None
+
 # ----- Filter logic mirrors applyEventFilter -----
 
 def apply_event_filter(events, filter_obj):
@@ -119,6 +128,194 @@ def stats_for(events):
     }
 
 
+class EventTable:
+    """Columnar view of stage3_timelineData.events, built once per diagnostics file.
+
+    Types and names are interned (type_codes/name_codes index into types/names, in
+    first-seen order); time and duration are converted once, and the rows are pre-sorted
+    by both so time windows and duration ranges are two binary searches. A selection is
+    an ascending array of row indices, so every subset keeps the events' order, and
+    select()/stats() return the same results as apply_event_filter()/stats_for()
+    (NumPy's pairwise sums can differ from them in the last bits).
+    """
+
+    def __init__(self, events):
+        self.events = events
+        self.types = []
+        self.names = []
+        type_index, name_index = {}, {}
+        type_codes, name_codes, durations, sort_times, times = [], [], [], [], []
+        self.times_valid = True  # int(time) succeeded for every event
+        for e in events:
+            t = e.get('type')
+            code = type_index.get(t)
+            if code is None:
+                code = type_index[t] = len(self.types)
+                self.types.append(t)
+            type_codes.append(code)
+            nm = e.get('name', '')
+            code = name_index.get(nm)
+            if code is None:
+                code = name_index[nm] = len(self.names)
+                self.names.append(nm)
+            name_codes.append(code)
+            durations.append(float(e.get('duration', 0)))
+            raw_time = e.get('time', 0)
+            sort_times.append(float(raw_time))
+            if self.times_valid:
+                try:
+                    times.append(int(raw_time))
+                except (TypeError, ValueError):
+                    self.times_valid = False
+        self._type_index = type_index
+        n = len(events)
+        if np is not None:
+            self.type_codes = np.asarray(type_codes, dtype=np.int64)
+            self.name_codes = np.asarray(name_codes, dtype=np.int64)
+            self.durations = np.asarray(durations, dtype=np.float64)
+            self.sort_times = np.asarray(sort_times, dtype=np.float64)
+            self.all_rows = np.arange(n, dtype=np.int64)
+            self._type_rows = [np.flatnonzero(self.type_codes == c) for c in range(len(self.types))]
+        else:
+            self.type_codes = type_codes
+            self.name_codes = name_codes
+            self.durations = durations
+            self.sort_times = sort_times
+            self.all_rows = list(range(n))
+            self._type_rows = [[] for _ in self.types]
+            for i, c in enumerate(type_codes):
+                self._type_rows[c].append(i)
+        self._time_range = self._sorted_column(times) if self.times_valid else None
+        self._duration_range = self._sorted_column(durations)
+        self._all_stats = None
+
+    @staticmethod
+    def _sorted_column(values):
+        """(sorted values, row order) for range lookups."""
+        if np is not None:
+            col = np.asarray(values)
+            order = np.argsort(col, kind='stable')
+            return col[order], order
+        order = sorted(range(len(values)), key=values.__getitem__)
+        return [values[i] for i in order], order
+
+    @staticmethod
+    def _in_range(column, lo, hi):
+        """Rows whose value v satisfies lo <= v <= hi, ascending."""
+        sorted_values, order = column
+        if np is not None:
+            a = np.searchsorted(sorted_values, lo, side='left')
+            b = np.searchsorted(sorted_values, hi, side='right')
+            return np.sort(order[a:b])
+        return sorted(order[bisect_left(sorted_values, lo):bisect_right(sorted_values, hi)])
+
+    def rows_of_types(self, event_types):
+        codes = sorted({self._type_index[t] for t in event_types if t in self._type_index})
+        if np is not None:
+            if not codes:
+                return np.empty(0, dtype=np.int64)
+            return np.sort(np.concatenate([self._type_rows[c] for c in codes]))
+        return sorted(i for c in codes for i in self._type_rows[c])
+
+    def rows_matching_name(self, predicate):
+        """Rows whose name satisfies predicate; each distinct name is tested once."""
+        matching = [c for c, nm in enumerate(self.names) if predicate(nm)]
+        if np is not None:
+            return np.flatnonzero(np.isin(self.name_codes, matching))
+        matching = set(matching)
+        return [i for i, c in enumerate(self.name_codes) if c in matching]
+
+    def select(self, filter_obj):
+        """Rows kept by apply_event_filter(events, filter_obj)."""
+        strategy = filter_obj.get('strategyId', 'all')
+        if not filter_obj or strategy == 'all':
+            return self.all_rows
+
+        if strategy == 'category':
+            event_types = filter_obj.get('eventTypes') or []
+            query = (filter_obj.get('query') or '').lower()
+            if event_types:
+                return self.rows_of_types(event_types)
+            if query:
+                return self.rows_matching_name(lambda nm: query in nm.lower())
+            return self.all_rows
+
+        if strategy == 'search':
+            query = filter_obj.get('query') or ''
+            try:
+                rx = re.compile(query, re.IGNORECASE)
+                return self.rows_matching_name(lambda nm: rx.search(nm))
+            except re.error:
+                q = query.lower()
+                return self.rows_matching_name(lambda nm: q in nm.lower())
+
+        if strategy == 'timewindow':
+            query = filter_obj.get('query') or ''
+            parts = query.split('-')
+            if len(parts) == 2:
+                try:
+                    min_time = int(parts[0])
+                    max_time = int(parts[1])
+                except ValueError:
+                    return self.all_rows
+                if self._time_range is None:
+                    return self.all_rows  # a non-integer time: the per-event int() fails the same way
+                return self._in_range(self._time_range, min_time, max_time)
+            return self.all_rows
+
+        if strategy == 'performance':
+            min_dur = filter_obj.get('minDuration', 1000)
+            max_dur = filter_obj.get('maxDuration', float('inf'))
+            return self._in_range(self._duration_range, min_dur, max_dur)
+
+        return self.all_rows
+
+    def rows(self, rows):
+        return [self.events[i] for i in rows]
+
+    def stats(self, rows):
+        """stats_for() of the selected rows."""
+        if rows is self.all_rows:  # 'all' and several fallbacks select every row
+            if self._all_stats is None:
+                self._all_stats = self._stats(rows)
+            return dict(self._all_stats)
+        return self._stats(rows)
+
+    def _stats(self, rows):
+        gap_code = self._type_index.get('gap')
+        blocked_code = self._type_index.get('blocked')
+        if np is not None:
+            codes = self.type_codes[rows]
+            durs = self.durations[rows]
+            present, first_row = np.unique(codes, return_index=True)
+            counts = np.bincount(codes, minlength=len(self.types))
+            type_counts = {self.types[c]: int(counts[c]) for c in present[np.argsort(first_row)]}
+            total_dur = float(durs.sum())
+            gap_time = float(durs[codes == gap_code].sum()) if gap_code is not None else 0
+            blocked_time = float(durs[codes == blocked_code].sum()) if blocked_code is not None else 0
+        else:
+            codes, durs = self.type_codes, self.durations
+            type_counts = {self.types[c]: k for c, k in Counter(codes[i] for i in rows).items()}
+            total_dur = sum(durs[i] for i in rows)
+            gap_time = sum(durs[i] for i in rows if codes[i] == gap_code)
+            blocked_time = sum(durs[i] for i in rows if codes[i] == blocked_code)
+        return {
+            'count': len(rows),
+            'type_counts': type_counts,
+            'total_duration_ms': total_dur,
+            'gap_time_ms': gap_time,
+            'blocked_time_ms': blocked_time,
+        }
+
+    def sorted_rows(self, rows, column, reverse=False):
+        """rows ordered by a float column, ties kept in event order (like sorted())."""
+        if np is not None:
+            rows = np.asarray(rows, dtype=np.int64)
+            keys = column[rows]
+            return rows[np.argsort(-keys if reverse else keys, kind='stable')]
+        return sorted(rows, key=column.__getitem__, reverse=reverse)
+
+
 def print_section(title):
     print('\n' + '='*80)
     print(title)
@@ -129,8 +326,9 @@ def fmt_ms(ms: float) -> str:
     return f"{int(ms):,} ms"
 
 
-def build_markdown_report(source_path: Path, events, global_stats, strategy_results, preset_results, consistency, base_epoch: int | None):
+def build_markdown_report(source_path: Path, table: EventTable, global_stats, strategy_results, preset_results, consistency, base_epoch: int | None):
     name = source_path.name
+    events = table.events
     # Use timezone-aware UTC per deprecation guidance
     ts = datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%SZ')
     lines = []
@@ -140,7 +338,7 @@ def build_markdown_report(source_path: Path, events, global_stats, strategy_resu
 
     lines.append("\n## Global Summary\n")
     lines.append(f"- Total events: **{global_stats['count']}**")
-    types_str = ', '.join(sorted(set(e.get('type') for e in events)))
+    types_str = ', '.join(sorted(table.types))
     lines.append(f"- Types: {types_str}")
     lines.append(f"- Type counts: {global_stats['type_counts']}")
     lines.append(f"- Total duration (sum of durations): {fmt_ms(global_stats['total_duration_ms'])}")
@@ -169,17 +367,18 @@ def build_markdown_report(source_path: Path, events, global_stats, strategy_resu
     lines.append("\n## Drill-down Details\n")
 
     # Interactions & UI chronological
-    interactions = [e for e in events if e.get('type') in ('interaction','ui')]
-    max_i_dur = max([float(e.get('duration',0)) for e in interactions], default=1.0)
+    interactions = table.rows_of_types(('interaction','ui'))
+    max_i_dur = max((table.durations[i] for i in interactions), default=1.0)
     lines.append("### Interactions & UI (chronological)\n")
-    if interactions:
+    if len(interactions):
         # Attempt to derive an absolute base timestamp if sourceTimestamp present
         # Prefer explicit per-event sourceTimestamp; fall back to provided base_epoch (earliest session absolute)
         source_times = [e.get('sourceTimestamp') for e in events if e.get('sourceTimestamp') is not None]
         source_times_valid = [t for t in source_times if isinstance(t,(int,float))]
         base_source = (min(source_times_valid) if source_times_valid else base_epoch)
-        for e in sorted(interactions, key=lambda x: float(x.get('time',0))):
-            dur = float(e.get('duration',0))
+        for i in table.sorted_rows(interactions, table.sort_times):
+            e = events[i]
+            dur = table.durations[i]
             bar = ascii_bar(dur, max_i_dur)
             rel = int(e.get('time',0))
             if base_source is not None:
@@ -193,23 +392,23 @@ def build_markdown_report(source_path: Path, events, global_stats, strategy_resu
         lines.append("(none)")
 
     # Critical path (gap + blocked) sorted by duration desc
-    crit_events = [e for e in events if e.get('type') in ('gap','blocked')]
-    max_c_dur = max([float(e.get('duration',0)) for e in crit_events], default=1.0)
+    crit_events = table.rows_of_types(('gap','blocked'))
+    max_c_dur = max((table.durations[i] for i in crit_events), default=1.0)
     lines.append("\n### Critical Path (gap + blocked)\n")
-    if crit_events:
-        for e in sorted(crit_events, key=lambda x: float(x.get('duration',0)), reverse=True):
-            dur = float(e.get('duration',0))
+    if len(crit_events):
+        for i in table.sorted_rows(crit_events, table.durations, reverse=True):
+            e = events[i]
+            dur = table.durations[i]
             bar = ascii_bar(dur, max_c_dur, width=40)
             lines.append(f"- dur={int(dur):>5}ms [{bar:<40}] {e.get('type')} at t={int(e.get('time',0))}ms name={e.get('name','')}")
     else:
         lines.append("(none)")
 
     # Top sequences aggregation
-    seq_events = [e for e in events if e.get('type') == 'sequence']
     seq_agg = {}
-    for e in seq_events:
-        nm = e.get('name') or 'unknown-sequence'
-        d = float(e.get('duration',0))
+    for i in table.rows_of_types(('sequence',)):
+        nm = events[i].get('name') or 'unknown-sequence'
+        d = table.durations[i]
         rec = seq_agg.setdefault(nm, {'count':0,'total_dur':0.0})
         rec['count'] += 1
         rec['total_dur'] += d
@@ -228,11 +427,12 @@ def build_markdown_report(source_path: Path, events, global_stats, strategy_resu
     lines.append("\n### Search Strategy Sample (pattern: 'Header')\n")
     if search_strategy:
         _, filt, _stats = search_strategy
-        search_subset = apply_event_filter(events, filt)
-        if search_subset:
-            max_s_dur = max([float(e.get('duration',0)) for e in search_subset], default=1.0)
-            for e in search_subset:
-                dur = float(e.get('duration',0))
+        search_subset = table.select(filt)
+        if len(search_subset):
+            max_s_dur = max((table.durations[i] for i in search_subset), default=1.0)
+            for i in search_subset:
+                e = events[i]
+                dur = table.durations[i]
                 bar = ascii_bar(dur, max_s_dur, width=24)
                 lines.append(f"- {e.get('name','')} dur={int(dur)}ms [{bar:<24}] type={e.get('type')}")
         else:
@@ -248,12 +448,13 @@ def main(path, out_path=None):
     data = json.loads(p.read_text(encoding='utf-8'))
     stage3 = data.get('stage3_timelineData') or {}
     events = stage3.get('events') or []
+    table = EventTable(events)
 
     # Global summary
     print_section('GLOBAL SUMMARY (stage3_timelineData)')
-    base = stats_for(events)
+    base = table.stats(table.all_rows)
     print(f"Total events: {base['count']}")
-    print(f"Types: {sorted(set(e.get('type') for e in events))}")
+    print(f"Types: {sorted(table.types)}")
     print(f"Type counts: {base['type_counts']}")
     print(f"Total duration (sum of durations): {base['total_duration_ms']:.0f} ms")
     print(f"Gap time: {base['gap_time_ms']:.0f} ms | Blocked time: {base['blocked_time_ms']:.0f} ms")
@@ -269,8 +470,7 @@ def main(path, out_path=None):
     ]
     strategy_results = []
     for f in strategies:
-        subset = apply_event_filter(events, f)
-        s = stats_for(subset)
+        s = table.stats(table.select(f))
         strategy_results.append((f['strategyId'], f, s))
         print(f"- {f['strategyId']} -> count={s['count']}, typeCounts={s['type_counts']}")
 
@@ -278,22 +478,21 @@ def main(path, out_path=None):
     print_section('SMART PRESETS CHECKS')
     preset_results = []
     for preset_id, f in SMART_PRESETS.items():
-        subset = apply_event_filter(events, f)
-        s = stats_for(subset)
+        s = table.stats(table.select(f))
         preset_results.append((preset_id, f, s))
         print(f"- {preset_id}: count={s['count']}, typeCounts={s['type_counts']}")
 
     # Sanity: ensure that dead-time equals all gaps+blocked
     dead_f = SMART_PRESETS['dead-time']
-    dead_subset = apply_event_filter(events, dead_f)
-    gap_like = [e for e in events if e.get('type') in ('gap','blocked')]
+    dead_subset = table.select(dead_f)
+    gap_like = table.rows_of_types(('gap','blocked'))
     print_section('CONSISTENCY CHECKS')
     print(f"dead-time preset count={len(dead_subset)} should equal raw gap-like count={len(gap_like)}")
 
     # Edge: ensure performance preset duration threshold is applied
     perf_f = SMART_PRESETS['critical-path']
-    perf_subset = apply_event_filter(events, perf_f)
-    too_short = [e for e in perf_subset if float(e.get('duration',0)) < perf_f['minDuration']]
+    perf_subset = table.select(perf_f)
+    too_short = [i for i in perf_subset if table.durations[i] < perf_f['minDuration']]
     print(f"critical-path below-threshold events found: {len(too_short)} (should be 0)")
 
     # Optional markdown report
@@ -310,7 +509,7 @@ def main(path, out_path=None):
             base_epoch = int(datetime.fromisoformat(stage3['sessionStart'].replace('Z','+00:00')).timestamp()*1000)
         report = build_markdown_report(
             p,
-            events,
+            table,
             base,
             strategy_results,
             preset_results,